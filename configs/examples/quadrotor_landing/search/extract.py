@@ -24,8 +24,7 @@ from robovast.search.extractor import (Extractor, ExtractResult,
                                        completed_run_dirs)
 
 
-def _metrics_row(run_dir: Path, metrics_file: str) -> dict | None:
-    path = run_dir / metrics_file
+def _metrics_row(path: Path) -> dict | None:
     if not path.exists():
         return None
     with open(path, newline="") as f:
@@ -43,7 +42,8 @@ class QuadExtract(Extractor):
         failures = sum(1 for r in runs if not read_test_result(r)["success"])
         failure_rate = failures / len(runs) if runs else 0.0
 
-        per_run = [m for m in (_metrics_row(r, metrics_file) for r in runs) if m]
+        rows = (self.run_cache.load(r / metrics_file, _metrics_row) for r in runs)
+        per_run = [m for m in rows if m]
         if per_run:
             keys = per_run[0].keys()
             measures = {k: sum(m[k] for m in per_run) / len(per_run) for k in keys}
@@ -51,3 +51,7 @@ class QuadExtract(Extractor):
             measures = {"max_tilt": 0.0, "drift_dist": 0.0,
                         "landing_speed": 0.0, "control_effort": 0.0}
         return ExtractResult(objectives={"failure_rate": failure_rate}, measures=measures)
+
+    def run_objectives(self, run_dir: Path) -> dict[str, float]:
+        # Per-run failure indicator; lets search.racing bound failure_rate.
+        return {"failure_rate": 0.0 if read_test_result(run_dir)["success"] else 1.0}
@@ -11,10 +11,12 @@ from .execution import (COMPAT_VERSION, create_execution_yaml,
                         get_campaign_timestamp, get_execution_env_variables,
                         is_campaign_dir, prepare_campaign_configs)
 from .file_cache import FileCache
-from .progress import ProgressBar, fmt_size, make_download_progress_callback
+from .progress import (ProgressBar, fmt_rate, fmt_size,
+                       make_download_progress_callback)
 
 __all__ = [
     'ProgressBar',
+    'fmt_rate',
     'fmt_size',
     'make_download_progress_callback',
     'FileCache',
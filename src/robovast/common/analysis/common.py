@@ -15,14 +15,20 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
 import os
-import xml.etree.ElementTree as ET
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional, Union
 
+import numpy as np
 import pandas as pd
 import yaml
 
+from robovast.common.file_cache2 import CacheKey, FileCache2
+from robovast.common.run_summary import read_run_summaries, read_run_summary
+
 
 def get_scenario_parameter(data_dir: str, parameter_name: str):
     """
@@ -48,14 +54,86 @@ def get_scenario_parameter(data_dir: str, parameter_name: str):
         return config_content.get(parameter_name, None)
 
 
-def read_output_files(data_dir: str, reader_func: Callable[[Path], pd.DataFrame], debug: bool = False) -> pd.DataFrame:
+_CATEGORICAL_ATTR = "robovast_categorical_columns"
+
+
+def _read_scenario_parameters(config_dir: Path, debug: bool = False) -> dict:
+    """Scenario parameters of a config (``_config/scenario.config``), YAML-dumping dict/list values."""
+    scenario_config_path = config_dir / "_config" / "scenario.config"
+    config_parameters = {}
+    try:
+        with open(scenario_config_path, 'r') as f:
+            config_content = yaml.safe_load(f)
+
+            # skip scenario-name
+            if isinstance(config_content, dict) and len(config_content) == 1:
+                config_parameters = next(iter(config_content.values()))
+    except Exception as e:
+        if debug:
+            print(f"Could not read scenario.config: {e}\n")
+    return {
+        name: yaml.safe_dump(value) if isinstance(value, (dict, list)) else value
+        for name, value in config_parameters.items()
+    }
+
+
+def _call_reader(reader_func: Callable[[Path], pd.DataFrame], run_dir: Path):
+    """Run *reader_func* on one run; returns ``(DataFrame, None)`` or ``(None, error)``."""
+    try:
+        return (reader_func(run_dir) if reader_func else pd.DataFrame()), None
+    except Exception as e:
+        return None, f"{run_dir}: {e}"
+
+
+def _output_files_cache_key(data_path: Path, run_dirs: list, cache_key: str):
+    """CacheKey over the stats of every file in the runs and their scenario.config."""
+    key = CacheKey().add("reader", cache_key)
+    files = []
+    for directory in sorted(set(run_dirs) | {d.parent / "_config" for d in run_dirs}):
+        for root, dirs, names in os.walk(directory):
+            dirs[:] = [d for d in dirs if d != ".cache"]
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                files.append((os.path.relpath(path, data_path), st.st_mtime_ns, st.st_size))
+    return key.add("files", sorted(files))
+
+
+def _categorical(values: list, codes, lengths) -> pd.Categorical:
+    """Categorical column with one value per run repeated over that run's rows."""
+    categories = pd.Index(pd.Series(values).dropna().unique())
+    try:
+        categories = categories.sort_values()
+    except TypeError:
+        pass
+    value_codes = np.array([-1 if pd.isna(v) else categories.get_loc(v) for v in values], dtype=np.int64) \
+        if len(values) else np.empty(0, dtype=np.int64)
+    return pd.Categorical.from_codes(np.repeat(value_codes[codes], lengths), categories=categories)
+
+
+def read_output_files(data_dir: str, reader_func: Callable[[Path], pd.DataFrame], debug: bool = False,
+                      workers: Optional[int] = None, executor: str = "thread",
+                      cache_key: Optional[str] = None) -> pd.DataFrame:
     """
     Reads and combines output data from all run subdirectories within data_dir.
 
+    Runs are read in parallel. ``scenario.config`` is parsed once per
+    configuration, and the ``run``, ``config`` and scenario parameter columns
+    are built directly as categoricals instead of being assigned per run.
+
     Args:
         data_dir (str): Path to the directory containing run subdirectories.
         reader_func (Callable[[Path], pd.DataFrame]): Function that reads run data from a directory and returns a DataFrame.
         debug (bool, optional): If True, prints debug information. Defaults to False.
+        workers (int, optional): Number of parallel readers (default: CPU count + 4, at most 32; 1 reads serially).
+        executor (str, optional): ``"thread"`` (default) or ``"process"``. Process pools need a picklable
+            *reader_func* (a module-level function, not a lambda); otherwise threads are used.
+        cache_key (str, optional): If given, the combined frame is cached as Parquet in ``<data_dir>/.cache``,
+            keyed by this name and the mtime/size of every file in the runs. Requires a Parquet engine
+            (e.g. ``pyarrow``); without one the frame is simply not cached.
 
     Returns:
         pd.DataFrame: Combined DataFrame containing all run data, with additional columns for run, config, and scenario parameters.
@@ -63,63 +141,70 @@ def read_output_files(data_dir: str, reader_func: Callable[[Path], pd.DataFrame]
     Raises:
         ValueError: If data_dir does not exist, no test.xml files are found, or no valid run data could be read.
     """
+    if executor not in ("thread", "process"):
+        raise ValueError(f"Unknown executor '{executor}' (use 'thread' or 'process')")
     data_path = Path(data_dir)
 
     if not data_path.exists():
         raise ValueError(f"Data directory does not exist: {data_dir}")
 
-    all_dataframes = []
-    skipped_warnings = []
-
     # Find all test.xml files in subdirectories
-    run_xml_files = list(data_path.rglob("test.xml"))
+    run_dirs = [run_xml.parent for run_xml in data_path.rglob("test.xml")]
 
-    if not run_xml_files:
+    if not run_dirs:
         raise ValueError(f"No test.xml files found in subdirectories of {data_dir}")
 
     if debug:
-        print(f"Found {len(run_xml_files)} run directories")
-
-    category_names = set({'run', 'config'})
-    for run_xml in run_xml_files:
-        if debug:
-            print(f"Reading data from: {run_xml}")
-        run_dir = run_xml.parent
-        run_name = run_dir.name
+        print(f"Found {len(run_dirs)} run directories")
 
+    cache = key = None
+    if cache_key is not None:
         try:
-            # Call the user-provided reader function
-            if reader_func:
-                df = reader_func(run_dir)
-            else:
-                df = pd.DataFrame()
-            scenario_config_path = run_dir.parent / "_config" / "scenario.config"
-            config_parameters = {}
-            try:
-                with open(scenario_config_path, 'r') as f:
-                    config_content = yaml.safe_load(f)
-
-                    # skip scenario-name
-                    if isinstance(config_content, dict) and len(config_content) == 1:
-                        config_parameters = next(iter(config_content.values()))
-            except Exception as e:
+            cache = FileCache2(str(data_path), "read_output_files_", suffix=".parquet")
+            key = _output_files_cache_key(data_path, run_dirs, cache_key)
+            cached_path = cache.get(key, content=False)
+            if cached_path:
                 if debug:
-                    print(f"Could not read scenario.config: {e}\n")
-
-            df['run'] = str(run_name)
-            df['config'] = str(os.path.basename(run_dir.parent))
-            category_names.update(config_parameters.keys())
-            for param_name, param_value in config_parameters.items():
-                if isinstance(param_value, (dict, list)):
-                    df[param_name] = yaml.safe_dump(param_value)
-                else:
-                    df[param_name] = param_value
-
-            all_dataframes.append(df)
+                    print(f"Loading cached dataframe: {cached_path}")
+                cached_df = pd.read_parquet(cached_path)
+                # Parquet stores non-string categoricals as plain columns; restore them.
+                categorical = cached_df.attrs.pop(_CATEGORICAL_ATTR, [])
+                return cached_df.astype({col: 'category' for col in categorical})
+        except (OSError, ImportError, ValueError) as e:
+            if debug:
+                print(f"Output file cache unavailable: {e}")
+            cache = None
+
+    n_workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    if executor == "process":
+        try:
+            pickle.dumps(reader_func)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            if debug:
+                print("reader_func cannot be pickled; using threads instead of processes")
+            executor = "thread"
+    read_run = functools.partial(_call_reader, reader_func)
+    if n_workers <= 1 or len(run_dirs) == 1:
+        results = [read_run(run_dir) for run_dir in run_dirs]
+    else:
+        pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_cls(max_workers=min(n_workers, len(run_dirs))) as pool:
+            results = list(pool.map(read_run, run_dirs))
 
-        except Exception as e:
-            skipped_warnings.append(f"{run_dir}: {e}")
+    config_dirs: list[Path] = []
+    config_index: dict[Path, int] = {}
+    all_dataframes = []
+    read_runs = []
+    skipped_warnings = []
+    for run_dir, (df, error) in zip(run_dirs, results):
+        if error is not None:
+            skipped_warnings.append(error)
             continue
+        if run_dir.parent not in config_index:
+            config_index[run_dir.parent] = len(config_dirs)
+            config_dirs.append(run_dir.parent)
+        all_dataframes.append(df)
+        read_runs.append(run_dir)
 
     if skipped_warnings and debug:
         print(f"Warning: Could not read data from {len(skipped_warnings)} run(s): " +
@@ -128,17 +213,39 @@ def read_output_files(data_dir: str, reader_func: Callable[[Path], pd.DataFrame]
     if debug and not all_dataframes:
         raise ValueError(f"No valid run data could be read from {data_dir}")
 
+    config_parameters = [_read_scenario_parameters(d, debug) for d in config_dirs]
+    param_names = list(dict.fromkeys(name for params in config_parameters for name in params))
+
     # Combine all dataframes
     combined_df = pd.concat(all_dataframes, ignore_index=True)
-
-    for category in category_names:
-        combined_df[category] = combined_df[category].astype('category')
+    combined_df = combined_df.drop(columns=[c for c in ['run', 'config', *param_names] if c in combined_df.columns])
+
+    lengths = np.array([len(df) for df in all_dataframes], dtype=np.int64)
+    run_positions = np.arange(len(read_runs))
+    config_codes = np.array([config_index[d.parent] for d in read_runs], dtype=np.int64)
+    new_columns = {
+        'run': _categorical([str(d.name) for d in read_runs], run_positions, lengths),
+        'config': _categorical([str(d.name) for d in config_dirs], config_codes, lengths),
+    }
+    for name in param_names:
+        new_columns[name] = _categorical([params.get(name) for params in config_parameters], config_codes, lengths)
+    combined_df = pd.concat([combined_df, pd.DataFrame(new_columns, index=combined_df.index)], axis=1)
 
     if debug:
         print(f"Combined dataframe shape: {combined_df.shape}")
         print(f"Columns: {list(combined_df.columns)}")
         print(f"Number of unique runs: {combined_df['run'].nunique()}")
 
+    if cache is not None:
+        try:
+            to_cache = combined_df.copy(deep=False)
+            to_cache.attrs[_CATEGORICAL_ATTR] = list(new_columns)
+            to_cache.to_parquet(cache.get_path(key))
+            cache.set_from_path(key)
+        except (OSError, ImportError, TypeError, ValueError) as e:
+            if debug:
+                print(f"Could not cache dataframe: {e}")
+
     return combined_df
 
 
@@ -221,38 +328,6 @@ def read_output_yaml_list(
     return pd.DataFrame(items)
 
 
-def _get_failure_text(root) -> str:
-    """Get failure element text from a parsed test.xml root element."""
-    for testcase in root.iter('testcase'):
-        failure = testcase.find('failure')
-        if failure is not None:
-            return failure.text or failure.get('message', '') or ''
-    return ''
-
-
-def _extract_failure_summary(failure_text: str) -> Optional[str]:
-    """Extract a short summary from a failure message.
-
-    Algorithm: last '[✕] -- ' -> text after on that line;
-    else last '[✓] -- ' -> text after on that line;
-    if single-line message and no marker found -> take it completely.
-    """
-    if not failure_text:
-        return None
-    for marker in ("[✕] -- ", "[✓] -- "):
-        idx = failure_text.rfind(marker)
-        if idx >= 0:
-            start = idx + len(marker)
-            end = failure_text.find("\n", start)
-            rest = failure_text[start:end] if end >= 0 else failure_text[start:]
-            s = rest.strip()
-            return s if s else None
-    if "\n" not in failure_text:
-        s = failure_text.strip()
-        return s if s else None
-    return None
-
-
 def get_run_status(run_dir: Union[str, Path]) -> tuple:
     """Get the pass/fail status of a single run from its test.xml file.
 
@@ -264,24 +339,10 @@ def get_run_status(run_dir: Union[str, Path]) -> tuple:
         ``'failed'``, or ``'unknown'``, and *summary* is a short descriptive
         string taken from the failure message (or ``None`` when not applicable).
     """
-    run_xml_path = Path(run_dir) / "test.xml"
-    if not run_xml_path.exists():
+    result = read_run_summary(Path(run_dir))
+    if result is None:
         return "unknown", None
-    try:
-        tree = ET.parse(run_xml_path)
-        root = tree.getroot()
-        testsuite = root if root.tag == 'testsuite' else root.find('testsuite')
-        if testsuite is not None:
-            errors = int(testsuite.get('errors', 0))
-            failures = int(testsuite.get('failures', 0))
-            status = "passed" if (errors == 0 and failures == 0) else "failed"
-            summary = None
-            if status == "failed":
-                summary = _extract_failure_summary(_get_failure_text(root))
-            return status, summary
-    except Exception:
-        pass
-    return "unknown", None
+    return result["status"], result["summary"]
 
 
 def read_run_statuses(data_dir: str) -> pd.DataFrame:
@@ -303,14 +364,13 @@ def read_run_statuses(data_dir: str) -> pd.DataFrame:
         raise ValueError(f"Data directory does not exist: {data_dir}")
 
     rows = []
-    for run_xml in sorted(data_path.rglob("test.xml")):
-        run_dir = run_xml.parent
-        status, summary = get_run_status(run_dir)
+    run_dirs = [run_xml.parent for run_xml in sorted(data_path.rglob("test.xml"))]
+    for run_dir, result in read_run_summaries(run_dirs).items():
         rows.append({
             'run': run_dir.name,
             'config': os.path.basename(run_dir.parent),
-            'status': status,
-            'summary': summary,
+            'status': result["status"] if result else "unknown",
+            'summary': result["summary"] if result else None,
         })
 
     return pd.DataFrame(rows)
@@ -20,13 +20,41 @@ These functions provide a common interface for reading campaign data,
 used by both MCP plugins and the FAIR metadata generator.
 """
 
-import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
+import json
+import logging
+import mmap
+import os
+import struct
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from .run_summary import read_run_summaries, read_run_summary
+
+logger = logging.getLogger(__name__)
+
+CONFIGURATIONS_FILENAME = "configurations.yaml"
+CONFIGURATIONS_JSONL_FILENAME = "configurations.jsonl"
+CONFIGURATIONS_INDEX_FILENAME = "configurations.idx"
+
+_TEST_RESULT_KEYS = ("success", "duration_sec", "start_time", "errors", "failures",
+                     "tests", "failure_message")
+
+# configurations.idx layout (little endian):
+#   header: magic, version, source yaml mtime_ns, source yaml size, entry count
+#   entries: offset (u64) and length (u32) of the config's line in
+#            configurations.jsonl, name length (u16), followed by the utf-8 name
+# Line 0 of configurations.jsonl holds the campaign-level keys (everything but
+# ``configs``); every further line is one config.
+_INDEX_MAGIC = b"RVCI"
+_INDEX_VERSION = 1
+_INDEX_HEADER = struct.Struct("<4sIQQI")
+_INDEX_ENTRY = struct.Struct("<QIH")
+
+# index path -> ((index mtime_ns, size), (yaml mtime_ns, size), {config name: (offset, length)})
+_index_cache: dict[str, tuple[tuple[int, int], tuple[int, int], dict[str, tuple[int, int]]]] = {}
+
 
 def read_execution_metadata(campaign_dir: Path) -> dict[str, Any]:
     """Read execution metadata from ``_execution/execution.yaml``.
@@ -80,6 +108,10 @@ def read_scenario_config(config_dir: Path) -> dict[str, Any]:
 def read_test_result(run_dir: Path) -> dict[str, Any]:
     """Parse JUnit test result from ``test.xml``.
 
+    Served from the campaign's run summary cache
+    (:func:`~robovast.common.run_summary.read_run_summaries`); the XML is
+    only parsed when the file is new or changed.
+
     Args:
         run_dir: Path to the run directory (e.g. ``campaign-<id>/<config>/0``).
 
@@ -89,48 +121,14 @@ def read_test_result(run_dir: Path) -> dict[str, Any]:
 
     Raises:
         FileNotFoundError: If test.xml does not exist.
+        ValueError: If test.xml cannot be parsed.
     """
-    path = run_dir / "test.xml"
-    if not path.exists():
+    summary = read_run_summary(run_dir)
+    if summary is None:
         raise FileNotFoundError(f"test.xml not found in {run_dir}")
-
-    tree = ET.parse(path)
-    root = tree.getroot()
-
-    errors = int(root.get("errors", "0"))
-    failures = int(root.get("failures", "0"))
-    tests = int(root.get("tests", "0"))
-
-    testcase = root.find("testcase")
-    duration = float(testcase.get("time", "0")) if testcase is not None else 0.0
-
-    # Extract start_time from properties
-    start_time_iso = None
-    if testcase is not None:
-        properties = testcase.find("properties")
-        if properties is not None:
-            for prop in properties.findall("property"):
-                if prop.get("name") == "start_time":
-                    ts = float(prop.get("value", "0"))
-                    start_time_iso = datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
-                    break
-
-    # Extract failure message if present
-    failure_message = None
-    if testcase is not None:
-        failure_elem = testcase.find("failure")
-        if failure_elem is not None:
-            failure_message = failure_elem.get("message") or failure_elem.text
-
-    return {
-        "success": errors == 0 and failures == 0,
-        "duration_sec": duration,
-        "start_time": start_time_iso,
-        "errors": errors,
-        "failures": failures,
-        "tests": tests,
-        "failure_message": failure_message,
-    }
+    if summary["parse_error"]:
+        raise ValueError(f"Invalid test.xml in {run_dir}: {summary['parse_error']}")
+    return {key: summary[key] for key in _TEST_RESULT_KEYS}
 
 
 def read_sysinfo(run_dir: Path) -> dict[str, Any]:
@@ -165,13 +163,180 @@ def read_resolved_configurations(campaign_dir: Path) -> dict[str, Any]:
     Raises:
         FileNotFoundError: If configurations.yaml does not exist.
     """
-    path = campaign_dir / "_transient" / "configurations.yaml"
+    path = campaign_dir / "_transient" / CONFIGURATIONS_FILENAME
     if not path.exists():
         raise FileNotFoundError(f"configurations.yaml not found in {campaign_dir}")
     with open(path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
 
+def write_configurations_index(campaign_dir: Path, configurations: dict[str, Any] | None = None) -> Path:
+    """Write the per-config index next to ``_transient/configurations.yaml``.
+
+    Produces ``configurations.jsonl`` (one JSON document per config) and the
+    binary ``configurations.idx`` with each config's byte offset into it, so
+    :func:`read_resolved_configuration` can fetch a single config without parsing
+    the whole YAML (which embeds paths and obstacle lists of every config).
+
+    Args:
+        campaign_dir: Path to the ``campaign-<id>`` directory.
+        configurations: The document just written to configurations.yaml; read
+            from the file when omitted.
+
+    Both files are written to temporaries and moved into place, the JSONL
+    first, so a reader never pairs an index with a half-written JSONL.
+
+    Returns:
+        Path to the written index file.
+
+    Raises:
+        FileNotFoundError: If configurations.yaml does not exist.
+        ValueError: If a config holds a value JSON cannot represent (a lossy
+            string fallback would make single-config reads differ from the YAML).
+    """
+    transient = Path(campaign_dir) / "_transient"
+    yaml_path = transient / CONFIGURATIONS_FILENAME
+    if configurations is None:
+        configurations = read_resolved_configurations(Path(campaign_dir))
+    configurations = configurations or {}
+    stat = yaml_path.stat()
+
+    jsonl_path = transient / CONFIGURATIONS_JSONL_FILENAME
+    index_path = transient / CONFIGURATIONS_INDEX_FILENAME
+    header = {k: v for k, v in configurations.items() if k != "configs"}
+    entries = []
+    tmp_jsonl = jsonl_path.with_name(jsonl_path.name + ".tmp")
+    try:
+        with open(tmp_jsonl, "wb") as f:
+            f.write(_json_line(header, "the header") + b"\n")
+            for cfg in configurations.get("configs") or []:
+                line = _json_line(cfg, f"config {cfg.get('name')!r}")
+                entries.append((str(cfg.get("name", "")).encode("utf-8"), f.tell(), len(line)))
+                f.write(line + b"\n")
+    except BaseException:
+        tmp_jsonl.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_jsonl, jsonl_path)
+
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, stat.st_mtime_ns, stat.st_size, len(entries)))
+        for name, offset, length in entries:
+            f.write(_INDEX_ENTRY.pack(offset, length, len(name)))
+            f.write(name)
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+def _json_line(doc: Any, what: str) -> bytes:
+    """One JSONL record of configurations.jsonl; raises ValueError for non-JSON values."""
+    try:
+        return json.dumps(doc).encode("utf-8")
+    except TypeError as e:
+        raise ValueError(f"Cannot index configurations.yaml: {what} is not JSON-serializable ({e})") from e
+
+
+def _parse_configurations_index(index_path: Path) -> tuple[tuple[int, int], dict[str, tuple[int, int]]]:
+    """Parse configurations.idx into ``((yaml mtime_ns, yaml size), {name: (offset, length)})``."""
+    with open(index_path, "rb") as f:
+        data = f.read()
+    magic, version, mtime_ns, size, count = _INDEX_HEADER.unpack_from(data, 0)
+    if magic != _INDEX_MAGIC or version != _INDEX_VERSION:
+        raise ValueError(f"Unsupported configurations index: {index_path}")
+    pos = _INDEX_HEADER.size
+    entries = {}
+    for _ in range(count):
+        offset, length, name_len = _INDEX_ENTRY.unpack_from(data, pos)
+        pos += _INDEX_ENTRY.size
+        entries[data[pos:pos + name_len].decode("utf-8")] = (offset, length)
+        pos += name_len
+    return (mtime_ns, size), entries
+
+
+def _load_configurations_index(campaign_dir: Path) -> dict[str, tuple[int, int]] | None:
+    """Return the ``{name: (offset, length)}`` index, rebuilding it when stale.
+
+    The index is stale when configurations.yaml changed since it was written.
+    Parsed indices are cached per file until the index itself changes. Returns
+    ``None`` when no up-to-date index exists and none can be written.
+    """
+    transient = campaign_dir / "_transient"
+    yaml_path = transient / CONFIGURATIONS_FILENAME
+    index_path = transient / CONFIGURATIONS_INDEX_FILENAME
+    if not yaml_path.exists():
+        raise FileNotFoundError(f"configurations.yaml not found in {campaign_dir}")
+    yaml_stat = yaml_path.stat()
+
+    for attempt in range(2):
+        try:
+            index_stat = index_path.stat()
+            key = (index_stat.st_mtime_ns, index_stat.st_size)
+            cached = _index_cache.get(str(index_path))
+            if cached is None or cached[0] != key:
+                cached = (key, *_parse_configurations_index(index_path))
+                _index_cache[str(index_path)] = cached
+            _, stamp, entries = cached
+            if stamp == (yaml_stat.st_mtime_ns, yaml_stat.st_size) and \
+                    (transient / CONFIGURATIONS_JSONL_FILENAME).exists():
+                return entries
+        except (OSError, ValueError, struct.error):
+            pass
+        if attempt == 0:
+            try:
+                write_configurations_index(campaign_dir)
+            except OSError:
+                return None
+            except ValueError as e:
+                logger.warning("%s; reading configurations.yaml in full instead", e)
+                return None
+    return None
+
+
+def read_resolved_configuration(campaign_dir: Path, name: str) -> dict[str, Any] | None:
+    """Read a single resolved config by name without loading configurations.yaml.
+
+    Uses the ``configurations.idx`` / ``configurations.jsonl`` pair written by
+    :func:`write_configurations_index` (built on first use for older campaigns)
+    and decodes only the requested config from a memory map. Falls back to the
+    full YAML when no index can be written (e.g. read-only results).
+
+    Args:
+        campaign_dir: Path to the ``campaign-<id>`` directory.
+        name: Config name (the config directory name).
+
+    Returns:
+        The config dict, or ``None`` if no config has this name.
+
+    Raises:
+        FileNotFoundError: If configurations.yaml does not exist.
+    """
+    entries = _load_configurations_index(Path(campaign_dir))
+    if entries is None:
+        for cfg in read_resolved_configurations(Path(campaign_dir)).get("configs", []):
+            if cfg.get("name") == name:
+                return cfg
+        return None
+    entry = entries.get(name)
+    if entry is None:
+        return None
+    offset, length = entry
+    jsonl_path = Path(campaign_dir) / "_transient" / CONFIGURATIONS_JSONL_FILENAME
+    with open(jsonl_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return json.loads(mm[offset:offset + length])
+
+
+def list_resolved_configuration_names(campaign_dir: Path) -> list[str]:
+    """Names of all resolved configs, in configurations.yaml order.
+
+    Raises:
+        FileNotFoundError: If configurations.yaml does not exist.
+    """
+    entries = _load_configurations_index(Path(campaign_dir))
+    if entries is None:
+        return [c.get("name") for c in read_resolved_configurations(Path(campaign_dir)).get("configs", [])]
+    return list(entries)
+
+
 def get_vast_configuration_info(
     campaign_dir: Path,
     config_dirs: list[Path] | None = None,
@@ -244,20 +409,18 @@ def get_vast_configuration_info(
         config_errors = 0
         config_duration = 0.0
 
-        for run_dir in run_dirs:
-            try:
-                result = read_test_result(run_dir)
-                if result["success"]:
-                    config_passed += 1
-                else:
-                    if result["errors"] > 0:
-                        config_errors += 1
-                    if result["failures"] > 0:
-                        config_failed += 1
-                config_duration += result.get("duration_sec", 0.0)
-            except FileNotFoundError:
+        for result in read_run_summaries(run_dirs).values():
+            if result is None or result["parse_error"]:
                 # Run may not have completed
-                pass
+                continue
+            if result["success"]:
+                config_passed += 1
+            else:
+                if result["errors"] > 0:
+                    config_errors += 1
+                if result["failures"] > 0:
+                    config_failed += 1
+            config_duration += result.get("duration_sec", 0.0)
 
         configs_info.append({
             "name": config_name,
@@ -321,13 +484,11 @@ def aggregate_run_status(run_dirs: list[Path]) -> str:
 
     Returns ``passed`` (all runs passed), ``failed`` (none passed), ``mixed``
     (some of each), or ``no_runs`` (no runs present). A run missing ``test.xml``
-    counts against the config.
+    counts against the config, as does one whose ``test.xml`` cannot be parsed.
     """
     passed = failed = 0
-    for run_dir in run_dirs:
-        try:
-            result = read_test_result(run_dir)
-        except FileNotFoundError:
+    for result in read_run_summaries(run_dirs).values():
+        if result is None or result["parse_error"]:
             failed += 1
             continue
         if result["success"]:
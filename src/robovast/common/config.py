@@ -176,6 +176,19 @@ class ExecutionConfig(BaseModel):
     # Results stay keyed by configuration name / run number regardless, so packing
     # is invisible to downstream processing.
     runs_per_job: int = 1
+    # Duration-aware packing: target seconds per job. Runs are packed longest
+    # first into jobs of about this duration, using each config's run time
+    # observed in earlier campaigns of the results directory (or predicted from
+    # ``_path_length``); ``runs_per_job`` > 1 then caps the runs per job.
+    job_duration: Optional[float] = None
+    # Warm-pool execution (cluster only): run each batch on this many long-lived
+    # worker pods that pay the container / simulator bring-up once and then pull
+    # packed jobs from the controller until the batch is done, instead of one
+    # Kubernetes Job per packed job. Per-run startup / teardown latency is
+    # written to ``_execution/warm_pool/<batch>.csv``. Requires ``timeout``: a
+    # unit's lease is derived from it, and without one a live but slow worker
+    # could not be told apart from a dead one.
+    warm_pool: Optional[int] = None
 
     @field_validator('env')
     @classmethod
@@ -212,6 +225,27 @@ class ExecutionConfig(BaseModel):
             raise ValueError(f"execution.runs_per_job must be >= 1, got {v}")
         return v
 
+    @field_validator('job_duration')
+    @classmethod
+    def validate_job_duration(cls, v: Optional[float]) -> Optional[float]:
+        if v is not None and v <= 0:
+            raise ValueError(f"execution.job_duration must be > 0, got {v}")
+        return v
+
+    @field_validator('warm_pool')
+    @classmethod
+    def validate_warm_pool(cls, v: Optional[int]) -> Optional[int]:
+        if v is not None and v < 1:
+            raise ValueError(f"execution.warm_pool must be >= 1, got {v}")
+        return v
+
+    @model_validator(mode='after')
+    def _check_warm_pool_timeout(self):
+        if self.warm_pool and not self.timeout:
+            raise ValueError("execution.warm_pool requires execution.timeout (the per-run "
+                             "timeout bounds how long a worker may hold a job)")
+        return self
+
 
 class ResultsConfig(BaseModel):
     postprocessing: Optional[list[str | dict[str, Any]]] = None
@@ -389,6 +423,9 @@ class ExtractConfig(BaseModel):
     model_config = ConfigDict(extra='forbid')
     plugin: str
     params: dict[str, Any] = {}
+    # Configs of a batch scored concurrently (threads); None picks
+    # min(8, cpu count), 1 scores serially (for non-thread-safe extractors).
+    workers: Optional[int] = Field(default=None, ge=1)
 
 
 class ObjectiveSpec(BaseModel):
@@ -399,6 +436,44 @@ class ObjectiveSpec(BaseModel):
     direction: Literal['maximize', 'minimize'] = 'maximize'
 
 
+class RacingConfig(BaseModel):
+    """Adaptive replicate allocation for noisy objectives (``search.racing``).
+
+    Each proposed parameter set first runs ``initial_reps`` repetitions. While
+    the ``confidence`` interval of its objective still contains the incumbent
+    (best value so far) or ``threshold``, ``step`` more repetitions are run, up
+    to ``max_reps`` (default: ``execution.runs``).
+    """
+    model_config = ConfigDict(extra='forbid')
+    initial_reps: int = 2
+    step: int = 2
+    max_reps: Optional[int] = None
+    confidence: float = 0.95
+    threshold: Optional[float] = None
+
+    @field_validator('initial_reps', 'step')
+    @classmethod
+    def _positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError(f"racing repetition counts must be >= 1, got {v}")
+        return v
+
+    @field_validator('confidence')
+    @classmethod
+    def _probability(cls, v: float) -> float:
+        if not 0.0 < v < 1.0:
+            raise ValueError(f"racing.confidence must be in (0, 1), got {v}")
+        return v
+
+    @model_validator(mode='after')
+    def _max_covers_initial(self):
+        if self.max_reps is not None and self.max_reps < self.initial_reps:
+            raise ValueError(
+                f"racing.max_reps ({self.max_reps}) must be >= initial_reps "
+                f"({self.initial_reps})")
+        return self
+
+
 class SearchConfig(BaseModel):
     """Closed-loop search over a typed parameter space.
 
@@ -420,6 +495,20 @@ class SearchConfig(BaseModel):
     extract: ExtractConfig
     objectives: list[ObjectiveSpec]
     per_batch: int
+    # 'generational' runs ask -> execute -> tell in lock-step batches; 'async'
+    # keeps up to max_in_flight (default per_batch) parameter sets executing and
+    # refills a slot as soon as one is scored (steady-state). per_batch then
+    # only sets the size of the bookkeeping batches budgets/stopping count.
+    scheduling: Literal['generational', 'async'] = 'generational'
+    max_in_flight: Optional[int] = None
+    # Reuse of evaluations for a re-proposed parameter set (same ParamSet.id,
+    # same .vast and input file content): 'off', within this 'campaign', or
+    # across 'all' campaigns in the results directory (opt-in). Extra
+    # repetitions are topped up within the campaign.
+    memoize: Literal['off', 'campaign', 'all'] = 'campaign'
+    # Sequential sampling: start with few repetitions per parameter set and add
+    # more only while the objective's confidence interval is undecided.
+    racing: Optional[RacingConfig] = None
     # Resource caps and convergence early-exits: two parallel typed-criteria
     # lists, all OR-combined and evaluated by the controller after each batch. At
     # least one criterion across the two is required (a search needs a way to end).
@@ -500,6 +589,13 @@ class SearchConfig(BaseModel):
             raise ValueError(f"search.per_batch must be >= 1, got {v}")
         return v
 
+    @field_validator('max_in_flight')
+    @classmethod
+    def _positive_max_in_flight(cls, v: Optional[int]) -> Optional[int]:
+        if v is not None and v < 1:
+            raise ValueError(f"search.max_in_flight must be >= 1, got {v}")
+        return v
+
     @model_validator(mode='after')
     def _validate_stopping(self):
         # A search needs at least one way to end: a budget cap or a stopping
@@ -510,6 +606,11 @@ class SearchConfig(BaseModel):
                 "criterion (e.g. budget: [{type: batches, value: 20}])")
         # target_objective / no_improvement compare the single objective, so they
         # require a single-objective search (matches SearchStrategy.single_objective).
+        if self.racing is not None:
+            if len(self.objectives) != 1:
+                raise ValueError("search.racing requires a single objective")
+            if self.scheduling != 'generational':
+                raise ValueError("search.racing requires scheduling: generational")
         single_only = {'target_objective', 'no_improvement'}
         for crit in (self.stopping or []):
             if crit.type in single_only and len(self.objectives) != 1:
@@ -16,14 +16,17 @@
 
 import copy
 import fnmatch
+import functools
 import logging
 import os
 import re
 import ssl
 import tarfile
 import tempfile
+import threading
 import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from importlib.metadata import entry_points
 from pprint import pformat
@@ -248,23 +251,8 @@ def _match_recursive_pattern(path, pattern):
         return fnmatch.fnmatch(path, pattern)
 
 
-def _get_variation_classes(scenario_config, vast_dir=""):
-    """
-    Read variation class names scenario
-
-    A variation is named either by an installed ``robovast.variation_types``
-    entry point or by a local ``<path>.py:<Class>`` file reference resolved
-    relative to ``vast_dir`` (parity with search strategies/extractors and
-    results postprocessing).
-    """
-
-    # Get the variation list from settings
-    variation_list = scenario_config.get('variations', [])
-
-    if not variation_list or not isinstance(variation_list, list):
-        return []
-
-    # Dynamically discover available variation classes from entry points
+def _load_variation_entry_points():
+    """Load every ``robovast.variation_types`` entry point as ``{name: class}``."""
     available_classes = {}
 
     # Load variation types from robovast.variation_types entry point
@@ -290,6 +278,30 @@ def _get_variation_classes(scenario_config, vast_dir=""):
         logger.error(f"Failed to load variation types from entry points: {e}")
         print(f"Warning: Failed to load variation types from entry points: {e}")
 
+    return available_classes
+
+
+def _get_variation_classes(scenario_config, vast_dir="", available_classes=None):
+    """
+    Read variation class names scenario
+
+    A variation is named either by an installed ``robovast.variation_types``
+    entry point or by a local ``<path>.py:<Class>`` file reference resolved
+    relative to ``vast_dir`` (parity with search strategies/extractors and
+    results postprocessing). ``available_classes`` may carry the result of
+    :func:`_load_variation_entry_points` so repeated calls skip the discovery.
+    """
+
+    # Get the variation list from settings
+    variation_list = scenario_config.get('variations', [])
+
+    if not variation_list or not isinstance(variation_list, list):
+        return []
+
+    # Dynamically discover available variation classes from entry points
+    if available_classes is None:
+        available_classes = _load_variation_entry_points()
+
     # Extract variation class names from the list
     variation_classes = []
     for item in variation_list:
@@ -503,6 +515,305 @@ def _rebuild_variation_gui_classes(configurations: list, vast_dir="") -> dict:
     return gui_classes
 
 
+class GenerationContext:
+    """Per-``.vast`` inputs of config generation, resolved once.
+
+    Everything :func:`generate_scenario_variations` derives from a parsed
+    ``.vast`` before any variation runs — matched ``run_files``, the scenario
+    file, analysis inputs and (lazily, on first use) the parameters the
+    scenario declares. A caller that generates many config sets from the same
+    base (the search loop composing one batch after another) builds it once
+    and passes it to :func:`generate_configs` for every batch.
+    """
+
+    def __init__(self, variation_file, parameters, progress_update_callback=None):
+        if not progress_update_callback:
+            progress_update_callback = logger.debug
+        self.variation_file = variation_file
+        self.parameters = parameters
+        self.progress_update_callback = progress_update_callback
+        self.base_dir = os.path.dirname(variation_file)
+        self.vast_dir = os.path.abspath(self.base_dir)
+        self.general_parameters = parameters.get('general', {})
+
+        self.run_files = []
+        # Get run_files patterns from config
+        run_files_patterns = parameters.get("execution", {}).get("run_files", [])
+        if run_files_patterns:
+            additional_run_files = collect_filtered_files(run_files_patterns, self.base_dir)
+            progress_update_callback(f"Loaded {len(run_files_patterns)} run_files patterns (found {len(additional_run_files)} files).")
+            for pattern in run_files_patterns:
+                if not collect_filtered_files([pattern], self.base_dir):
+                    logger.warning(
+                        "execution.run_files pattern '%s' did not match any files. "
+                        "Check the pattern or whether the files exist.",
+                        pattern,
+                    )
+            self.run_files.extend(additional_run_files)
+
+        # Get scenario_file from execution section (resolved early for cache key)
+        execution_scenario_file_name = parameters.get('execution', {}).get('scenario_file')
+
+        # Validate scenario_file path
+        if execution_scenario_file_name:
+            _validate_relative_path(execution_scenario_file_name, "execution.scenario_file")
+
+        self.scenario_file = os.path.join(self.base_dir, execution_scenario_file_name) if execution_scenario_file_name else None
+
+        if self.scenario_file is None:
+            raise ValueError("No scenario_file specified in execution section of the variation file. Please add 'scenario_file' to the execution section.")
+
+        # Collect analysis notebook files (resolved early for cache key)
+        self.analysis_files = _collect_analysis_input_files(parameters, base_dir=self.base_dir)
+        for af in self.analysis_files:
+            _validate_relative_path(af, "analysis file")
+
+        self._scenario_parameters = None
+        self._variation_entry_points = None
+        self._lock = threading.Lock()
+
+    def scenario_parameters(self):
+        """Parameters declared by the scenario (parsed on first use)."""
+        with self._lock:
+            if self._scenario_parameters is None:
+                scenario_param_dict = get_scenario_parameters(self.scenario_file)
+                self._scenario_parameters = next(iter(scenario_param_dict.values())) if scenario_param_dict else []
+            return self._scenario_parameters
+
+    def variation_entry_points(self):
+        """Installed variation plugins as ``{name: class}`` (discovered on first use)."""
+        with self._lock:
+            if self._variation_entry_points is None:
+                self._variation_entry_points = _load_variation_entry_points()
+            return self._variation_entry_points
+
+
+def generate_block_configs(context, config, output_dir, step_runner=None):
+    """Run one ``configuration`` block through its variation chain.
+
+    Returns ``(configs, variation_gui_classes, input_files, transient_files)``.
+
+    ``step_runner``, if given, wraps every variation step: it is called as
+    ``step_runner(variation_class, variation_parameters, current_configs,
+    output_dir, execute)`` and must return what ``execute()`` returns (the
+    4-tuple of :func:`execute_variation`). Search composition uses it to reuse
+    step outputs across batches.
+    """
+    progress_update_callback = context.progress_update_callback
+    variation_classes_and_parameters = _get_variation_classes(
+        config, context.vast_dir, context.variation_entry_points() if config.get('variations') else None)
+    variation_gui_classes = {}
+    input_files = []
+    transient_files = []
+
+    # Initialize config dict with scenario parameters if they exist
+    config_dict = {}
+
+    scenario_parameters = config.get('parameters', [])
+    if scenario_parameters:
+        # Convert list of single-key dicts to a single dict
+        for param in scenario_parameters:
+            if isinstance(param, dict):
+                config_dict.update(param)
+
+        # Validate that all specified parameters exist in the scenario
+        existing_scenario_parameters = context.scenario_parameters()
+        if existing_scenario_parameters:
+            # Extract parameter names from the scenario (each entry has a 'name' field)
+            valid_param_names = [p.get('name') for p in existing_scenario_parameters if isinstance(p, dict) and 'name' in p]
+
+            # Check each parameter in config_dict
+            invalid_params = [p for p in config_dict if p not in valid_param_names]
+            if invalid_params:
+                raise ValueError(
+                    f"Invalid parameters in scenario '{config['name']}': {invalid_params}. "
+                    f"Valid parameters are: {valid_param_names}"
+                )
+
+    current_configs = [{
+        'name': config['name'],
+        'config': config_dict}]
+
+    def _execute(variation_class, variation_parameters, configs):
+        # Auxiliary container: if the plugin declares one, the active backend
+        # (local docker or cluster sidecar) provides a runner for its use.
+        container_spec = variation_class.get_required_container(variation_parameters)
+        container_runner = _make_container_runner(container_spec)
+        try:
+            return execute_variation(context.base_dir, configs, variation_class,
+                                     variation_parameters, context.general_parameters, progress_update_callback,
+                                     context.scenario_file, output_dir, container_runner=container_runner)
+        finally:
+            if container_runner is not None:
+                container_runner.close()
+
+    for variation_class, variation_parameters in variation_classes_and_parameters:
+        variation_gui_class = None
+        if hasattr(variation_class, 'GUI_CLASS'):
+            if variation_class.GUI_CLASS is not None:
+                variation_gui_class = variation_class.GUI_CLASS
+        if variation_gui_class:
+            if variation_gui_class not in variation_gui_classes:
+                variation_gui_classes[variation_gui_class] = []
+        variation_gui_renderer_class = None
+        if hasattr(variation_class, 'GUI_RENDERER_CLASS'):
+            variation_gui_renderer_class = variation_class.GUI_RENDERER_CLASS
+            if variation_gui_renderer_class is not None:
+                if variation_gui_class is None:
+                    raise ValueError(f"Variation class {variation_class.__name__} has GUI_RENDERER_CLASS defined but no GUI_CLASS.")
+                variation_gui_classes[variation_gui_class].append(variation_gui_renderer_class)
+
+        execute = functools.partial(_execute, variation_class, variation_parameters, current_configs)
+        started_at = datetime.now(timezone.utc).isoformat()
+        t0 = time.monotonic()
+        if step_runner is not None:
+            result, var_input_files, var_campaign_transient, _ = step_runner(
+                variation_class, variation_parameters, current_configs, output_dir, execute)
+        else:
+            result, var_input_files, var_campaign_transient, _ = execute()
+        duration = round(time.monotonic() - t0, 3)
+
+        # Validate and collect variation input files
+        for vf in var_input_files:
+            _validate_relative_path(vf, f"variation {variation_class.__name__} input file")
+        input_files.extend(var_input_files)
+
+        # Collect transient files from this variation step
+        transient_files.extend(var_campaign_transient)
+
+        if result is None or len(result) == 0:
+            # If a variation step fails or produces no results, stop the pipeline
+            progress_update_callback(f"Variation pipeline stopped at {variation_class.__name__} - no configs to process")
+            current_configs = []
+            break
+        else:
+            logger.debug(f"Variation result after {variation_class.__name__}: \n{pformat(result)}")
+
+        # Record variation execution data on each resulting config
+        variation_entry = {
+            "name": variation_class.__name__,
+            "started_at": started_at,
+            "duration": duration,
+        }
+        for c in result:
+            if "_variations" not in c:
+                c["_variations"] = []
+            entry = dict(variation_entry)
+            # Let variation plugins add extra fields to the _variations entry
+            extras = c.pop("_variation_entry_extras", None)
+            if extras and isinstance(extras, dict):
+                entry.update(extras)
+            c["_variations"].append(entry)
+
+        current_configs = result
+
+    for c in current_configs:
+        c["_config_name"] = config.get("name")
+        c["_config_block"] = config
+
+    return current_configs, variation_gui_classes, input_files, transient_files
+
+
+def generate_configs(context, configurations, output_dir=None, max_workers=1, step_runner=None):
+    """Generate the configs of *configurations* and assemble ``campaign_data``.
+
+    The uncached core of :func:`generate_scenario_variations`, working on an
+    already-parsed :class:`GenerationContext` instead of a ``.vast`` file.
+    Configuration blocks are independent, so up to *max_workers* of them run
+    on a thread pool; output order follows *configurations*. ``step_runner``
+    is passed to :func:`generate_block_configs`.
+
+    Returns ``(campaign_data, variation_gui_classes)``.
+    """
+    _maybe_disable_ssl_verification()
+
+    parameters = context.parameters
+    configs = []
+    variation_gui_classes = {}
+    campaign_input_files = []
+    campaign_transient_files = []
+
+    if output_dir is None:
+        temp_path = tempfile.TemporaryDirectory(prefix="robovast_variation_")
+        output_dir = temp_path.name
+
+    campaign_input_files.extend(context.analysis_files)
+
+    def _generate(config):
+        return generate_block_configs(context, config, output_dir, step_runner=step_runner)
+
+    if max_workers > 1 and len(configurations) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(configurations))) as pool:
+            blocks = list(pool.map(_generate, configurations))
+    else:
+        blocks = [_generate(config) for config in configurations]
+
+    for block_configs, block_gui_classes, block_input_files, block_transient_files in blocks:
+        configs.extend(block_configs)
+        for gui_class, renderer_classes in block_gui_classes.items():
+            variation_gui_classes.setdefault(gui_class, []).extend(renderer_classes)
+        campaign_input_files.extend(block_input_files)
+        campaign_transient_files.extend(block_transient_files)
+
+    # Normalize _config_files and _config_transient_files: convert artifact absolute
+    # paths (those inside output_dir) to paths relative to output_dir.  This makes
+    # cached and non-cached results structurally identical, and lets execution.py
+    # resolve paths via campaign_data["_output_dir"] instead of relying on
+    # whichever absolute path happened to be used during generation.
+    _abs_output = os.path.abspath(output_dir)
+    _norm_prefix = _abs_output + os.sep
+    for cfg in configs:
+        for field in ("_config_files", "_config_transient_files"):
+            entries = cfg.get(field)
+            if not entries:
+                continue
+            normalized = []
+            for rel, path in entries:
+                abs_path = os.path.abspath(path)
+                if abs_path.startswith(_norm_prefix):
+                    path = os.path.relpath(abs_path, _abs_output)
+                else:
+                    # Source file – keep absolute for portability
+                    path = abs_path
+                normalized.append((rel, path))
+            cfg[field] = normalized
+
+    # Extract execution parameters from execution section
+    execution_section = parameters.get('execution', {})
+    execution_params = {
+        "env": execution_section.get('env'),
+        "run_as_user": execution_section.get('run_as_user'),
+        "image": execution_section.get('image'),
+        "resources": execution_section.get('resources'),
+        "secondary_containers": execution_section.get('secondary_containers'),
+        "local": execution_section.get('local'),
+        "runs_per_job": execution_section.get('runs_per_job', 1),
+        "job_duration": execution_section.get('job_duration'),
+        "warm_pool": execution_section.get('warm_pool'),
+        "simulation": execution_section.get('simulation'),
+    }
+
+    # Build result dictionary
+    result = {
+        "vast": context.variation_file,
+        "scenario_file": context.scenario_file,
+        "configs": configs,
+        "_run_files": context.run_files,
+        "_input_files": campaign_input_files,
+        "_transient_files": campaign_transient_files,
+        "_output_dir": os.path.abspath(output_dir),
+        "execution": execution_params,
+        "created_at": datetime.now().isoformat()
+    }
+
+    # Add metadata if it exists
+    metadata = parameters.get('metadata')
+    if metadata:
+        result["metadata"] = metadata
+
+    return result, variation_gui_classes
+
+
 def generate_scenario_variations(variation_file, progress_update_callback=None, variation_classes=None, output_dir=None, use_cache=True):
     """Generate all scenario variation configs from a .vast file.
 
@@ -529,39 +840,11 @@ def generate_scenario_variations(variation_file, progress_update_callback=None,
     # Get scenario file from configuration section
     configurations = parameters.get('configuration', [])
 
-    run_files = []
-    # Get run_files patterns from config
-    run_files_patterns = parameters.get("execution", {}).get("run_files", [])
-    if run_files_patterns:
-        additional_run_files = collect_filtered_files(run_files_patterns, os.path.dirname(variation_file))
-        progress_update_callback(f"Loaded {len(run_files_patterns)} run_files patterns (found {len(additional_run_files)} files).")
-        for pattern in run_files_patterns:
-            if not collect_filtered_files([pattern], os.path.dirname(variation_file)):
-                logger.warning(
-                    "execution.run_files pattern '%s' did not match any files. "
-                    "Check the pattern or whether the files exist.",
-                    pattern,
-                )
-        run_files.extend(additional_run_files)
-
-    vast_dir = os.path.abspath(os.path.dirname(variation_file))
-
-    # Get scenario_file from execution section (resolved early for cache key)
-    execution_scenario_file_name = parameters.get('execution', {}).get('scenario_file')
-
-    # Validate scenario_file path
-    if execution_scenario_file_name:
-        _validate_relative_path(execution_scenario_file_name, "execution.scenario_file")
-
-    scenario_file = os.path.join(os.path.dirname(variation_file), execution_scenario_file_name) if execution_scenario_file_name else None
-
-    if scenario_file is None:
-        raise ValueError("No scenario_file specified in execution section of the variation file. Please add 'scenario_file' to the execution section.")
-
-    # Collect analysis notebook files (resolved early for cache key)
-    analysis_files = _collect_analysis_input_files(parameters, base_dir=os.path.dirname(variation_file))
-    for af in analysis_files:
-        _validate_relative_path(af, "analysis file")
+    context = GenerationContext(variation_file, parameters, progress_update_callback)
+    vast_dir = context.vast_dir
+    scenario_file = context.scenario_file
+    run_files = context.run_files
+    analysis_files = context.analysis_files
 
     # --- Cache check ---
     # Cache is active for all flows when use_cache=True and variation_classes is None.
@@ -621,182 +904,15 @@ def generate_scenario_variations(variation_file, progress_update_callback=None,
         _cache_artifacts = None
         _cache_key = None
 
-    configs = []
-    variation_gui_classes = {}
-    campaign_input_files = []
-    campaign_transient_files = []
-    config_transient_files = []
+    if variation_classes is not None and configurations:
+        raise NotImplementedError("Passing variation_classes is not implemented yet")
 
     if output_dir is None:
+        # Kept alive until the artifact tarball below has been written.
         temp_path = tempfile.TemporaryDirectory(prefix="robovast_variation_")
         output_dir = temp_path.name
 
-    general_parameters = parameters.get('general', {})
-
-    # Get scenario parameters once (same for all configurations)
-    scenario_param_dict = get_scenario_parameters(scenario_file)
-    existing_scenario_parameters = next(iter(scenario_param_dict.values())) if scenario_param_dict else []
-
-    campaign_input_files.extend(analysis_files)
-
-    for config in configurations:
-        if variation_classes is None:
-            # Read variation classes from the variation file
-            variation_classes_and_parameters = _get_variation_classes(config, vast_dir)
-        else:
-            raise NotImplementedError("Passing variation_classes is not implemented yet")
-
-        # Initialize config dict with scenario parameters if they exist
-        config_dict = {}
-
-        scenario_parameters = config.get('parameters', [])
-        if scenario_parameters:
-            # Convert list of single-key dicts to a single dict
-            for param in scenario_parameters:
-                if isinstance(param, dict):
-                    config_dict.update(param)
-
-            # Validate that all specified parameters exist in the scenario
-            if existing_scenario_parameters:
-                # Extract parameter names from the scenario (each entry has a 'name' field)
-                valid_param_names = [p.get('name') for p in existing_scenario_parameters if isinstance(p, dict) and 'name' in p]
-
-                # Check each parameter in config_dict
-                invalid_params = [p for p in config_dict if p not in valid_param_names]
-                if invalid_params:
-                    raise ValueError(
-                        f"Invalid parameters in scenario '{config['name']}': {invalid_params}. "
-                        f"Valid parameters are: {valid_param_names}"
-                    )
-
-        current_configs = [{
-            'name': config['name'],
-            'config': config_dict}]
-
-        for variation_class, variation_parameters in variation_classes_and_parameters:
-            variation_gui_class = None
-            if hasattr(variation_class, 'GUI_CLASS'):
-                if variation_class.GUI_CLASS is not None:
-                    variation_gui_class = variation_class.GUI_CLASS
-            if variation_gui_class:
-                if variation_gui_class not in variation_gui_classes:
-                    variation_gui_classes[variation_gui_class] = []
-            variation_gui_renderer_class = None
-            if hasattr(variation_class, 'GUI_RENDERER_CLASS'):
-                variation_gui_renderer_class = variation_class.GUI_RENDERER_CLASS
-                if variation_gui_renderer_class is not None:
-                    if variation_gui_class is None:
-                        raise ValueError(f"Variation class {variation_class.__name__} has GUI_RENDERER_CLASS defined but no GUI_CLASS.")
-                    variation_gui_classes[variation_gui_class].append(variation_gui_renderer_class)
-            started_at = datetime.now(timezone.utc).isoformat()
-            t0 = time.monotonic()
-            # Auxiliary container: if the plugin declares one, the active backend
-            # (local docker or cluster sidecar) provides a runner for its use.
-            container_spec = variation_class.get_required_container(variation_parameters)
-            container_runner = _make_container_runner(container_spec)
-            try:
-                result, var_input_files, var_campaign_transient, var_config_transient = execute_variation(os.path.dirname(variation_file), current_configs, variation_class,
-                                                                                                          variation_parameters, general_parameters, progress_update_callback, scenario_file, output_dir,
-                                                                                                          container_runner=container_runner)
-            finally:
-                if container_runner is not None:
-                    container_runner.close()
-            duration = round(time.monotonic() - t0, 3)
-
-            # Validate and collect variation input files
-            for vf in var_input_files:
-                _validate_relative_path(vf, f"variation {variation_class.__name__} input file")
-            campaign_input_files.extend(var_input_files)
-
-            # Collect transient files from this variation step
-            campaign_transient_files.extend(var_campaign_transient)
-            config_transient_files.extend(var_config_transient)
-
-            if result is None or len(result) == 0:
-                # If a variation step fails or produces no results, stop the pipeline
-                progress_update_callback(f"Variation pipeline stopped at {variation_class.__name__} - no configs to process")
-                current_configs = []
-                break
-            else:
-                logger.debug(f"Variation result after {variation_class.__name__}: \n{pformat(result)}")
-
-            # Record variation execution data on each resulting config
-            variation_entry = {
-                "name": variation_class.__name__,
-                "started_at": started_at,
-                "duration": duration,
-            }
-            for c in result:
-                if "_variations" not in c:
-                    c["_variations"] = []
-                entry = dict(variation_entry)
-                # Let variation plugins add extra fields to the _variations entry
-                extras = c.pop("_variation_entry_extras", None)
-                if extras and isinstance(extras, dict):
-                    entry.update(extras)
-                c["_variations"].append(entry)
-
-            current_configs = result
-
-        for c in current_configs:
-            c["_config_name"] = config.get("name")
-            c["_config_block"] = config
-
-        configs.extend(current_configs)
-
-    # Normalize _config_files and _config_transient_files: convert artifact absolute
-    # paths (those inside output_dir) to paths relative to output_dir.  This makes
-    # cached and non-cached results structurally identical, and lets execution.py
-    # resolve paths via campaign_data["_output_dir"] instead of relying on
-    # whichever absolute path happened to be used during generation.
-    _abs_output = os.path.abspath(output_dir)
-    _norm_prefix = _abs_output + os.sep
-    for cfg in configs:
-        for field in ("_config_files", "_config_transient_files"):
-            entries = cfg.get(field)
-            if not entries:
-                continue
-            normalized = []
-            for rel, path in entries:
-                abs_path = os.path.abspath(path)
-                if abs_path.startswith(_norm_prefix):
-                    path = os.path.relpath(abs_path, _abs_output)
-                else:
-                    # Source file – keep absolute for portability
-                    path = abs_path
-                normalized.append((rel, path))
-            cfg[field] = normalized
-
-    # Extract execution parameters from execution section
-    execution_section = parameters.get('execution', {})
-    execution_params = {
-        "env": execution_section.get('env'),
-        "run_as_user": execution_section.get('run_as_user'),
-        "image": execution_section.get('image'),
-        "resources": execution_section.get('resources'),
-        "secondary_containers": execution_section.get('secondary_containers'),
-        "local": execution_section.get('local'),
-        "runs_per_job": execution_section.get('runs_per_job', 1),
-        "simulation": execution_section.get('simulation'),
-    }
-
-    # Build result dictionary
-    result = {
-        "vast": variation_file,
-        "scenario_file": scenario_file,
-        "configs": configs,
-        "_run_files": run_files,
-        "_input_files": campaign_input_files,
-        "_transient_files": campaign_transient_files,
-        "_output_dir": os.path.abspath(output_dir),
-        "execution": execution_params,
-        "created_at": datetime.now().isoformat()
-    }
-
-    # Add metadata if it exists
-    metadata = parameters.get('metadata')
-    if metadata:
-        result["metadata"] = metadata
+    result, variation_gui_classes = generate_configs(context, configurations, output_dir)
 
     # --- Store result in cache ---
     if _cache_meta is not None and _cache_key is not None:
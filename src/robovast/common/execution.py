@@ -29,6 +29,7 @@ from pprint import pformat
 
 import yaml
 
+from .campaign_data import write_configurations_index
 from .common import convert_dataclasses_to_dict, get_scenario_parameters
 from .config_identifier import (compute_config_identifier, hash_file_content,
                                 hash_run_files)
@@ -341,9 +342,11 @@ CLEANUP_EOF
     chmod +x "${BUILTIN_CLEANUP_SCRIPT}"
 
     POST_COMMAND_PARAM="--post-run ${BUILTIN_CLEANUP_SCRIPT}"
+    WARM_POOL_POST_RUN_PARAM="--post-run ${BUILTIN_CLEANUP_SCRIPT}"
     if [ -n "${POST_COMMAND}" ]; then
         if [ -e "${POST_COMMAND}" ]; then
             POST_COMMAND_PARAM="--post-run ${POST_COMMAND} --post-run ${BUILTIN_CLEANUP_SCRIPT}"
+            WARM_POOL_POST_RUN_PARAM="--unit-post-run ${POST_COMMAND} ${WARM_POOL_POST_RUN_PARAM}"
             log "Post-command '${POST_COMMAND}' will run before built-in cleanup."
         else
             log "ERROR: Post-command '${POST_COMMAND}' does not exist."
@@ -436,9 +439,13 @@ UPLOAD_EOF
     chmod +x "${S3_UPLOAD_SCRIPT}"
 
     POST_COMMAND_PARAM="--post-run ${BUILTIN_CLEANUP_SCRIPT} --post-run ${S3_UPLOAD_SCRIPT}"
+    # Warm-pool workers upload after every unit (before reporting it complete)
+    # and clean up once, after the last one.
+    WARM_POOL_POST_RUN_PARAM="--unit-post-run ${S3_UPLOAD_SCRIPT} ${POST_COMMAND_PARAM}"
     if [ -n "${POST_COMMAND}" ]; then
         if [ -e "${POST_COMMAND}" ]; then
             POST_COMMAND_PARAM="--post-run ${POST_COMMAND} --post-run ${BUILTIN_CLEANUP_SCRIPT} --post-run ${S3_UPLOAD_SCRIPT}"
+            WARM_POOL_POST_RUN_PARAM="--unit-post-run ${POST_COMMAND} ${WARM_POOL_POST_RUN_PARAM}"
             log "Post-command '${POST_COMMAND}' will run before built-in cleanup and S3 upload."
         else
             log "ERROR: Post-command '${POST_COMMAND}' does not exist."
@@ -521,6 +528,10 @@ def prepare_campaign_configs(out_dir, campaign_data, cluster=False):
     monitor_resources_dst = os.path.join(campaign_transient_dir, "monitor_resources.py")
     shutil.copy2(monitor_resources_src, monitor_resources_dst)
 
+    # Copy warm_worker.py into _transient/ (warm-pool execution, cluster only)
+    warm_worker_src = str(files('robovast.execution.data').joinpath('warm_worker.py'))
+    shutil.copy2(warm_worker_src, os.path.join(campaign_transient_dir, "warm_worker.py"))
+
     # Copy rosbag processing scripts into _transient/ for host-side post-run processing
     for script_name in ('rosbags_process.py', 'rosbags_common.py', 'ros2_exec.sh'):
         src = str(files('robovast.results_processing.data').joinpath(script_name))
@@ -538,9 +549,12 @@ def prepare_campaign_configs(out_dir, campaign_data, cluster=False):
 
     # Save scenario variations as YAML in _transient subdirectory
     scenario_variations_path = os.path.join(campaign_transient_dir, "configurations.yaml")
+    configurations_doc = convert_dataclasses_to_dict(campaign_data_for_dump)
     with open(scenario_variations_path, 'w') as f:
-        yaml.dump(convert_dataclasses_to_dict(campaign_data_for_dump), f, default_flow_style=False, sort_keys=False)
+        yaml.dump(configurations_doc, f, default_flow_style=False, sort_keys=False)
     logger.debug(f"Saved configurations to {scenario_variations_path}")
+    # Per-config index so single-config readers don't parse the whole YAML
+    write_configurations_index(out_dir, configurations_doc)
 
     # Compute hashes once per run (reused for all configs)
     run_files_hash = hash_run_files(vast_file_path, campaign_data.get("_run_files", []))
@@ -815,6 +829,27 @@ def write_job_links_manifest(transient_dir, jobs) -> None:
         yaml.dump(links, f, default_flow_style=False, sort_keys=True)
 
 
+def move_job_links(campaign_dir, moves) -> None:
+    """Re-key the link manifest for run dirs renamed per *moves*.
+
+    *moves* maps old to new ``<config>/<run>`` paths (e.g. repetitions merged
+    into another config). The targets are relative to the run dir, so only the
+    keys change. Missing manifest is a no-op.
+    """
+    manifest = os.path.join(campaign_dir, "_transient", JOB_LINKS_MANIFEST)
+    if not os.path.isfile(manifest):
+        return
+    with open(manifest) as f:
+        links = yaml.safe_load(f) or {}
+    moved = {f"{new}/job": links.pop(f"{old}/job") for old, new in moves.items()
+             if f"{old}/job" in links}
+    if not moved:
+        return
+    links.update(moved)
+    with open(manifest, "w") as f:
+        yaml.dump(links, f, default_flow_style=False, sort_keys=True)
+
+
 def create_job_links(campaign_dir) -> int:
     """Create the ``job`` symlinks described by a campaign's link manifest.
 
@@ -32,7 +32,7 @@ def fmt_size(n: int) -> str:
 _fmt_size = fmt_size
 
 
-def _fmt_rate(bps: float) -> str:
+def fmt_rate(bps: float) -> str:
     if bps >= 1024 * 1024:
         return f"{bps / 1024 / 1024:.1f} MiB/s"
     if bps >= 1024:
@@ -40,6 +40,9 @@ def _fmt_rate(bps: float) -> str:
     return f"{bps:.0f} B/s"
 
 
+_fmt_rate = fmt_rate
+
+
 def make_download_progress_callback(label: str, start: float):
     """Return a ``(received, total)`` callback that prints a download progress bar.
 
@@ -0,0 +1,272 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Campaign-level cache of parsed ``test.xml`` run summaries.
+
+Every reader of per-run results (run status aggregation, the campaign store
+indexer, metadata generation, the result analyzer, search extractors) needs the
+same few fields of a run's JUnit ``test.xml``. Instead of each one parsing the
+XML again, :func:`read_run_summaries` keeps one row per run in
+``<campaign>/.cache/run_summaries.db``, keyed on the ``test.xml`` mtime and
+size, and parses only new or changed files, in a thread pool. Parsed rows are
+also memoized in-process so repeated lookups (e.g. GUI tree refreshes) cost a
+single ``stat``.
+
+The cache is best effort: when the campaign directory is read-only the
+summaries are still returned, just not persisted.
+"""
+
+import logging
+import os
+import sqlite3
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+RUN_SUMMARY_FILENAME = "run_summaries.db"
+
+_SUMMARY_FIELDS = (
+    "success", "errors", "failures", "tests", "duration_sec", "start_time",
+    "failure_message", "status", "summary", "parse_error",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_summary (
+    run_dir TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    success INTEGER,
+    errors INTEGER,
+    failures INTEGER,
+    tests INTEGER,
+    duration_sec REAL,
+    start_time TEXT,
+    failure_message TEXT,
+    status TEXT,
+    summary TEXT,
+    parse_error TEXT
+)
+"""
+
+# test.xml path -> ((mtime_ns, size), summary)
+_memo: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _failure_text(root) -> str:
+    """Text of the first ``<failure>`` element of any testcase."""
+    for testcase in root.iter("testcase"):
+        failure = testcase.find("failure")
+        if failure is not None:
+            return failure.text or failure.get("message", "") or ""
+    return ""
+
+
+def extract_failure_summary(failure_text: str) -> Optional[str]:
+    """Extract a short summary from a failure message.
+
+    Algorithm: last '[✕] -- ' -> text after on that line;
+    else last '[✓] -- ' -> text after on that line;
+    if single-line message and no marker found -> take it completely.
+    """
+    if not failure_text:
+        return None
+    for marker in ("[✕] -- ", "[✓] -- "):
+        idx = failure_text.rfind(marker)
+        if idx >= 0:
+            start = idx + len(marker)
+            end = failure_text.find("\n", start)
+            rest = failure_text[start:end] if end >= 0 else failure_text[start:]
+            s = rest.strip()
+            return s if s else None
+    if "\n" not in failure_text:
+        s = failure_text.strip()
+        return s if s else None
+    return None
+
+
+def parse_test_xml(path: Path) -> dict[str, Any]:
+    """Parse one JUnit ``test.xml`` into a run summary.
+
+    Returns a dict with ``success``, ``errors``, ``failures``, ``tests``,
+    ``duration_sec``, ``start_time`` (ISO string), ``failure_message``,
+    ``status`` (``passed``/``failed``/``unknown``, from the testsuite element),
+    ``summary`` (short failure description) and ``parse_error`` (``None``
+    unless the file could not be parsed, in which case status is ``unknown``).
+    """
+    try:
+        return _summarize(ET.parse(path).getroot())
+    except (ET.ParseError, OSError, ValueError) as e:
+        return {
+            "success": False, "errors": 0, "failures": 0, "tests": 0,
+            "duration_sec": 0.0, "start_time": None, "failure_message": None,
+            "status": "unknown", "summary": None, "parse_error": str(e),
+        }
+
+
+def _summarize(root) -> dict[str, Any]:
+    errors = int(root.get("errors", "0"))
+    failures = int(root.get("failures", "0"))
+    tests = int(root.get("tests", "0"))
+
+    testcase = root.find("testcase")
+    duration = float(testcase.get("time", "0")) if testcase is not None else 0.0
+
+    start_time_iso = None
+    failure_message = None
+    if testcase is not None:
+        properties = testcase.find("properties")
+        if properties is not None:
+            for prop in properties.findall("property"):
+                if prop.get("name") == "start_time":
+                    ts = float(prop.get("value", "0"))
+                    start_time_iso = datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+                    break
+        failure_elem = testcase.find("failure")
+        if failure_elem is not None:
+            failure_message = failure_elem.get("message") or failure_elem.text
+
+    status = "unknown"
+    summary = None
+    testsuite = root if root.tag == "testsuite" else root.find("testsuite")
+    if testsuite is not None:
+        suite_failed = int(testsuite.get("errors", 0)) or int(testsuite.get("failures", 0))
+        status = "failed" if suite_failed else "passed"
+        if suite_failed:
+            summary = extract_failure_summary(_failure_text(root))
+
+    return {
+        "success": errors == 0 and failures == 0,
+        "duration_sec": duration,
+        "start_time": start_time_iso,
+        "errors": errors,
+        "failures": failures,
+        "tests": tests,
+        "failure_message": failure_message,
+        "status": status,
+        "summary": summary,
+        "parse_error": None,
+    }
+
+
+def _open_store(campaign_dir: Path) -> Optional[sqlite3.Connection]:
+    """Open (creating if needed) the campaign's summary database, or ``None``."""
+    try:
+        cache_dir = campaign_dir / ".cache"
+        cache_dir.mkdir(exist_ok=True)
+        conn = sqlite3.connect(str(cache_dir / RUN_SUMMARY_FILENAME), timeout=30)
+        conn.execute(_SCHEMA)
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        logger.debug("Run summary cache unavailable for %s: %s", campaign_dir, e)
+        return None
+
+
+def _from_row(row: tuple) -> dict[str, Any]:
+    summary = dict(zip(_SUMMARY_FIELDS, row))
+    summary["success"] = bool(summary["success"])
+    return summary
+
+
+def _lookup_campaign(campaign_dir: Path, wanted: dict[Path, tuple[int, int]],
+                     workers: Optional[int]) -> dict[Path, dict[str, Any]]:
+    """Resolve *wanted* (test.xml path -> stamp) of one campaign from cache or XML."""
+    conn = _open_store(campaign_dir)
+    found: dict[Path, dict[str, Any]] = {}
+    if conn is not None:
+        try:
+            for xml_path, stamp in wanted.items():
+                key = os.path.relpath(xml_path.parent, campaign_dir)
+                row = conn.execute(
+                    f"SELECT mtime_ns, size, {', '.join(_SUMMARY_FIELDS)} FROM run_summary WHERE run_dir = ?",
+                    (key,)).fetchone()
+                if row is not None and tuple(row[:2]) == stamp:
+                    found[xml_path] = _from_row(row[2:])
+        except sqlite3.Error as e:
+            logger.debug("Run summary cache read failed for %s: %s", campaign_dir, e)
+
+    misses = [p for p in wanted if p not in found]
+    if misses:
+        n_workers = min(workers or min(32, (os.cpu_count() or 1) + 4), len(misses))
+        if n_workers > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                parsed = list(pool.map(parse_test_xml, misses))
+        else:
+            parsed = [parse_test_xml(p) for p in misses]
+        found.update(zip(misses, parsed))
+        if conn is not None:
+            try:
+                with conn:
+                    conn.executemany(
+                        f"INSERT OR REPLACE INTO run_summary (run_dir, mtime_ns, size, {', '.join(_SUMMARY_FIELDS)}) "
+                        f"VALUES ({', '.join('?' * (3 + len(_SUMMARY_FIELDS)))})",
+                        [(os.path.relpath(p.parent, campaign_dir), *wanted[p],
+                          *(s[f] for f in _SUMMARY_FIELDS)) for p, s in zip(misses, parsed)])
+            except sqlite3.Error as e:
+                logger.debug("Run summary cache write failed for %s: %s", campaign_dir, e)
+    if conn is not None:
+        conn.close()
+    return found
+
+
+def read_run_summaries(run_dirs: Iterable[Path], *, workers: Optional[int] = None
+                       ) -> dict[Path, Optional[dict[str, Any]]]:
+    """Return the parsed ``test.xml`` summary of every run in *run_dirs*.
+
+    Runs are grouped by campaign (the run directory's grandparent) and looked
+    up in that campaign's summary cache; missing or stale entries are parsed
+    with a pool of *workers* threads and written back.
+
+    Args:
+        run_dirs: Run directories (e.g. ``campaign-<id>/<config>/0``).
+        workers: Maximum parser threads (default: CPU count + 4, at most 32).
+
+    Returns:
+        Mapping of each run dir (as given) to its summary (see
+        :func:`parse_test_xml`), or ``None`` when the run has no ``test.xml``.
+    """
+    result: dict[Path, Optional[dict[str, Any]]] = {}
+    pending: dict[Path, dict[Path, tuple[int, int]]] = {}
+    xml_paths: dict[Path, Path] = {}
+    for run_dir in run_dirs:
+        xml_path = Path(run_dir) / "test.xml"
+        try:
+            st = xml_path.stat()
+        except OSError:
+            result[run_dir] = None
+            continue
+        stamp = (st.st_mtime_ns, st.st_size)
+        memo = _memo.get(xml_path)
+        if memo is not None and memo[0] == stamp:
+            result[run_dir] = memo[1]
+            continue
+        xml_paths[run_dir] = xml_path
+        pending.setdefault(xml_path.parent.parent.parent, {})[xml_path] = stamp
+
+    for campaign_dir, wanted in pending.items():
+        for xml_path, summary in _lookup_campaign(campaign_dir, wanted, workers).items():
+            _memo[xml_path] = (wanted[xml_path], summary)
+    for run_dir, xml_path in xml_paths.items():
+        result[run_dir] = _memo[xml_path][1]
+    return result
+
+
+def read_run_summary(run_dir: Path) -> Optional[dict[str, Any]]:
+    """Summary of a single run (``None`` if it has no ``test.xml``)."""
+    return read_run_summaries([run_dir])[run_dir]
@@ -31,8 +31,18 @@ configuration; search campaigns have one batch per ask/tell round with one unit
 per evaluated parameter set.
 
 ``unit`` holds the sampled params (JSON), the objective(s)/measures (JSON), a
-status and the result path. ``campaign.strategy_state`` carries an opaque blob so
-a strategy can persist enough to resume.
+status, the requested repetitions and the result path. ``campaign.vast_hash``
+is the content hash of the ``.vast`` that drove a search; together with
+``unit.paramset_id`` and ``unit.n_reps`` it lets a later search reuse
+evaluations (:mod:`robovast.search.memo`). ``unit.racing_json`` logs the
+replicate decisions of ``search.racing`` (one entry per round: repetitions,
+confidence interval, decision). ``inflight`` lists the parameter sets an
+asynchronous search has dispatched but not yet scored (rows are removed once
+the unit is recorded), so a live reader sees what is currently executing; rows
+left by an interrupted run are taken over by the next run of the same campaign
+(:meth:`CampaignStore.take_inflight`), which dispatches them again.
+``campaign.strategy_state`` carries an opaque blob so a strategy can persist
+enough to resume.
 
 The canonical on-disk filename is :data:`STORE_FILENAME` (``campaign.db``),
 written at each campaign's root directory.
@@ -96,7 +106,7 @@ CREATE TABLE IF NOT EXISTS unit (
 """
 
 # Current schema version, stored in the database as ``PRAGMA user_version``.
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 4
 
 # Ordered, append-only migrations: ``_MIGRATIONS[i]`` is the SQL that upgrades a
 # database from ``user_version == i`` to ``user_version == i + 1``. To change the
@@ -108,6 +118,25 @@ _MIGRATIONS = [
     # pre-versioning robovast (its tables already present, ``user_version`` 0)
     # adopts version 1 without modification.
     _SCHEMA,
+    # 1 -> 2: parameter sets dispatched but not yet scored (async search).
+    """
+    CREATE TABLE IF NOT EXISTS inflight (
+        id            INTEGER PRIMARY KEY,
+        campaign_id   INTEGER NOT NULL REFERENCES campaign(id),
+        paramset_id   TEXT NOT NULL,
+        config_name   TEXT,
+        params_json   TEXT,
+        n_reps        INTEGER,
+        dispatched_at REAL
+    );
+    """,
+    # 2 -> 3: evaluation reuse keys (.vast content hash, requested repetitions).
+    """
+    ALTER TABLE campaign ADD COLUMN vast_hash TEXT;
+    ALTER TABLE unit ADD COLUMN n_reps INTEGER;
+    """,
+    # 3 -> 4: per-unit replicate decisions of adaptive allocation (racing).
+    "ALTER TABLE unit ADD COLUMN racing_json TEXT;",
 ]
 assert len(_MIGRATIONS) == SCHEMA_VERSION  # one migration per version step
 
@@ -115,8 +144,15 @@ assert len(_MIGRATIONS) == SCHEMA_VERSION  # one migration per version step
 class CampaignStore:
     """Thin sqlite wrapper for recording a search campaign."""
 
-    def __init__(self, db_path: str | Path):
+    def __init__(self, db_path: str | Path, read_only: bool = False):
         self.db_path = str(db_path)
+        if read_only:
+            # Another campaign's store: never migrate or write it (it may be
+            # live, or on read-only media). Reads are best-effort.
+            self._conn = sqlite3.connect(f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+                                         uri=True)
+            self._conn.row_factory = sqlite3.Row
+            return
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(self.db_path)
         self._conn.row_factory = sqlite3.Row
@@ -155,11 +191,11 @@ class CampaignStore:
         self.close()
 
     def create_campaign(self, name: str, config: dict, mode: str = "search",
-                        config_dir: str = "") -> int:
+                        config_dir: str = "", vast_hash: Optional[str] = None) -> int:
         cur = self._conn.execute(
-            "INSERT INTO campaign (name, mode, config_dir, config_json, created_at) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (name, mode, config_dir, json.dumps(config, default=str), time.time()),
+            "INSERT INTO campaign (name, mode, config_dir, config_json, created_at, vast_hash) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (name, mode, config_dir, json.dumps(config, default=str), time.time(), vast_hash),
         )
         self._conn.commit()
         return cur.lastrowid
@@ -183,22 +219,25 @@ class CampaignStore:
         status: str,
         result_dir: str,
         n_samples: Optional[int] = None,
+        n_reps: Optional[int] = None,
+        racing: Optional[list] = None,
     ) -> None:
         # Surface the sole objective as a queryable REAL column for the common
         # single-objective case; keep the full dict in JSON regardless.
         objective_scalar = next(iter(objectives.values())) if len(objectives) == 1 else None
         self._conn.execute(
             "INSERT INTO unit (batch_id, paramset_id, config_name, params_json, "
-            "objective, objectives_json, measures_json, n_samples, status, result_dir, created_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            "objective, objectives_json, measures_json, n_samples, n_reps, status, result_dir, "
+            "created_at, racing_json) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
             (
                 batch_id, paramset_id, config_name,
                 json.dumps(params, default=str),
                 objective_scalar,
                 json.dumps(objectives, default=str),
                 json.dumps(measures, default=str),
-                n_samples,
+                n_samples, n_reps,
                 status, result_dir, time.time(),
+                json.dumps(racing) if racing is not None else None,
             ),
         )
         self._conn.commit()
@@ -213,6 +252,38 @@ class CampaignStore:
         )
         self._conn.commit()
 
+    def record_inflight(self, campaign_id: int, paramset_id: str, config_name: str,
+                        params: dict, n_reps: int) -> int:
+        """Mark a parameter set as dispatched; returns the row id for
+        :meth:`clear_inflight`."""
+        cur = self._conn.execute(
+            "INSERT INTO inflight (campaign_id, paramset_id, config_name, params_json, "
+            "n_reps, dispatched_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (campaign_id, paramset_id, config_name, json.dumps(params, default=str),
+             n_reps, time.time()),
+        )
+        self._conn.commit()
+        return cur.lastrowid
+
+    def clear_inflight(self, inflight_id: int) -> None:
+        self._conn.execute("DELETE FROM inflight WHERE id = ?", (inflight_id,))
+        self._conn.commit()
+
+    def take_inflight(self, name: str) -> list[sqlite3.Row]:
+        """Remove and return the in-flight rows left by earlier runs of campaign *name*.
+
+        Called before a re-run registers itself, so every row belongs to a run
+        that ended without scoring those parameter sets. Oldest first.
+        """
+        rows = list(self._conn.execute(
+            "SELECT inflight.* FROM inflight JOIN campaign ON inflight.campaign_id = campaign.id "
+            "WHERE campaign.name = ? ORDER BY inflight.id", (name,)
+        ).fetchall())
+        if rows:
+            self._conn.executemany("DELETE FROM inflight WHERE id = ?", [(r["id"],) for r in rows])
+            self._conn.commit()
+        return rows
+
     def save_strategy_state(self, campaign_id: int, state: bytes) -> None:
         self._conn.execute(
             "UPDATE campaign SET strategy_state = ? WHERE id = ?", (state, campaign_id)
@@ -225,6 +296,14 @@ class CampaignStore:
         ).fetchone()
         return row["strategy_state"] if row else None
 
+    def latest_strategy_state(self, name: str) -> Optional[bytes]:
+        """The most recently saved strategy state of any campaign named *name*."""
+        row = self._conn.execute(
+            "SELECT strategy_state FROM campaign WHERE name = ? AND strategy_state IS NOT NULL "
+            "ORDER BY id DESC LIMIT 1", (name,)
+        ).fetchone()
+        return row["strategy_state"] if row else None
+
     # -- read helpers (used by the results GUI / readers) --------------------
 
     def list_campaigns(self) -> list[sqlite3.Row]:
@@ -244,3 +323,19 @@ class CampaignStore:
         return list(self._conn.execute(
             "SELECT * FROM unit WHERE batch_id = ? ORDER BY id", (batch_id,)
         ).fetchall())
+
+    def evaluated_units(self, vast_hash: str) -> list[sqlite3.Row]:
+        """Scored units of every search campaign driven by a ``.vast`` with
+        content hash *vast_hash* (reused evaluations excluded)."""
+        return list(self._conn.execute(
+            "SELECT unit.* FROM unit JOIN batch ON unit.batch_id = batch.id "
+            "JOIN campaign ON batch.campaign_id = campaign.id "
+            "WHERE campaign.vast_hash = ? AND unit.status = 'evaluated' "
+            "AND unit.n_reps IS NOT NULL ORDER BY unit.id", (vast_hash,)
+        ).fetchall())
+
+    def inflight(self, campaign_id: int) -> list[sqlite3.Row]:
+        """Parameter sets of a campaign currently executing, oldest first."""
+        return list(self._conn.execute(
+            "SELECT * FROM inflight WHERE campaign_id = ? ORDER BY id", (campaign_id,)
+        ).fetchall())
@@ -63,10 +63,10 @@ class ParameterVariationDistributionUniform(Variation):
         if min_val is None or max_val is None:
             raise ValueError("Parameters 'min' and 'max' are required for ParameterVariationDistributionUniform")
 
-        # Set random seed for reproducibility when one is provided
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
+        # Own generator per variation: configuration blocks may be generated
+        # concurrently, which would interleave draws from the global state.
+        # Same sequence as random.seed(seed); no seed draws from the OS.
+        rng = random.Random(seed)
 
         # If no input configs, create initial empty config
         if not in_configs or len(in_configs) == 0:
@@ -77,18 +77,18 @@ class ParameterVariationDistributionUniform(Variation):
         for _ in range(num_variations):
             # Generate random value
             if value_type in ['int', 'integer']:
-                value = random.randint(int(min_val), int(max_val))
+                value = rng.randint(int(min_val), int(max_val))
             elif value_type in ['float', 'double', 'number']:
-                value = random.uniform(float(min_val), float(max_val))
+                value = rng.uniform(float(min_val), float(max_val))
             elif value_type == 'bool':
                 # For bool, min/max are interpreted as probabilities
-                value = random.random() < float(max_val)
+                value = rng.random() < float(max_val)
             else:  # default to string
                 # Generate random number and convert to string
                 if isinstance(min_val, int) and isinstance(max_val, int):
-                    value = str(random.randint(int(min_val), int(max_val)))
+                    value = str(rng.randint(int(min_val), int(max_val)))
                 else:
-                    value = str(random.uniform(float(min_val), float(max_val)))
+                    value = str(rng.uniform(float(min_val), float(max_val)))
 
             random_values.append(value)
             self.progress_update(f"Generated random value: {param_name}={value}")
@@ -152,9 +152,8 @@ class ParameterVariationDistributionGaussian(Variation):
         if seed is None:
             raise ValueError("Parameter 'seed' is required for ParameterVariationDistributionGaussian")
 
-        # Set random seed
-        random.seed(seed)
-        np.random.seed(seed)
+        # Own generator per variation (same sequence as np.random.seed)
+        rng = np.random.RandomState(seed)  # pylint: disable=no-member
 
         # If no input configs, create initial empty config
         if not in_configs or len(in_configs) == 0:
@@ -164,7 +163,7 @@ class ParameterVariationDistributionGaussian(Variation):
         random_values = []
         for _ in range(num_variations):
             # Generate Gaussian random value
-            value = np.random.normal(float(mean), float(std))
+            value = rng.normal(float(mean), float(std))
 
             # Apply clipping if min/max are specified
             if min_val is not None:
@@ -16,14 +16,24 @@
 
 """Shared helpers for MCP result-browsing plugins."""
 
+import re
+from array import array
+from bisect import bisect_right
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import yaml
 from robovast.evaluation.mcp_server import results_resolver
 
 _metadata_cache: dict[Path, dict[str, Any]] = {}
 
+# Line-offset index for paginated reads: one checkpoint (first line number,
+# byte offset) per block of roughly ``_INDEX_BLOCK_SIZE`` bytes, aligned to
+# line starts. Seeking to a line reads at most one block before the page.
+_INDEX_BLOCK_SIZE = 256 * 1024
+_LINE_INDEX_CACHE_SIZE = 64
+_line_index_cache: dict[Path, tuple[tuple[int, int], "_LineIndex"]] = {}
+
 
 def read_campaign_metadata(campaign_path: Path) -> dict[str, Any]:
     """Read and cache ``metadata.yaml`` from a campaign directory.
@@ -57,9 +67,87 @@ def _is_binary(path: Path) -> bool:
         return True
 
 
+class _LineIndex:
+    """Sparse line-offset index of a text file."""
+
+    __slots__ = ("total_lines", "line_starts", "byte_starts")
+
+    def __init__(self, total_lines: int, line_starts: array, byte_starts: array):
+        self.total_lines = total_lines
+        self.line_starts = line_starts
+        self.byte_starts = byte_starts
+
+    def seek_position(self, line: int) -> tuple[int, int]:
+        """Return ``(byte_offset, first_line)`` of the block containing *line*."""
+        i = max(bisect_right(self.line_starts, line) - 1, 0)
+        return self.byte_starts[i], self.line_starts[i]
+
+
+def _build_line_index(path: Path) -> _LineIndex:
+    """Scan *path* once and record a checkpoint at the first line start of every block."""
+    line_starts = array("Q", [0])
+    byte_starts = array("Q", [0])
+    lines = 0
+    pos = 0
+    last_byte = b""
+    block_start = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(_INDEX_BLOCK_SIZE):
+            lines += chunk.count(b"\n")
+            pos += len(chunk)
+            last_byte = chunk[-1:]
+            if pos - block_start < _INDEX_BLOCK_SIZE:
+                continue
+            cut = chunk.rfind(b"\n")
+            if cut == -1:
+                continue
+            # All newlines counted so far lie before *boundary*.
+            boundary = pos - len(chunk) + cut + 1
+            line_starts.append(lines)
+            byte_starts.append(boundary)
+            block_start = boundary
+    if pos and last_byte != b"\n":
+        lines += 1
+    return _LineIndex(lines, line_starts, byte_starts)
+
+
+def _get_line_index(path: Path) -> _LineIndex:
+    """Return the line index of *path*, rebuilding it when the file changed."""
+    key = path.resolve()
+    st = key.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _line_index_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    index = _build_line_index(key)
+    _line_index_cache.pop(key, None)
+    if len(_line_index_cache) >= _LINE_INDEX_CACHE_SIZE:
+        _line_index_cache.pop(next(iter(_line_index_cache)))
+    _line_index_cache[key] = (stamp, index)
+    return index
+
+
+def _iter_lines_from(path: Path, index: _LineIndex, start: int) -> Iterator[tuple[int, str]]:
+    """Yield ``(line_number, text)`` from line *start* onwards without reading earlier blocks."""
+    byte_offset, line_no = index.seek_position(start)
+    with open(path, "rb") as f:
+        f.seek(byte_offset)
+        for raw in f:
+            if line_no >= start:
+                if raw.endswith(b"\n"):
+                    raw = raw[:-2] if raw.endswith(b"\r\n") else raw[:-1]
+                yield line_no, raw.decode("utf-8", errors="replace")
+            line_no += 1
+
+
 def _read_text_paginated(path: Path, lines: int = 100, offset: int = 0) -> dict:
     """Read *lines* text lines starting at *offset* from *path*.
 
+    A negative *offset* counts from the end of the file (``-100`` returns the
+    last 100 lines); the returned ``offset`` is always the absolute start line.
+    Only the requested page is read from disk, located via a line-offset index
+    that is built once per file and reused until its mtime or size changes.
+
     Returns a dict with ``content``, ``total_lines``, ``returned_lines``,
     ``offset``, and ``file_name``.
     """
@@ -68,10 +156,16 @@ def _read_text_paginated(path: Path, lines: int = 100, offset: int = 0) -> dict:
             "file_name": path.name,
             "error": "Binary file — content cannot be displayed.",
         }
-    text = path.read_text(encoding="utf-8", errors="replace")
-    all_lines = text.splitlines()
-    total = len(all_lines)
-    selected = all_lines[offset : offset + lines]
+    index = _get_line_index(path)
+    total = index.total_lines
+    if offset < 0:
+        offset = max(total + offset, 0)
+    selected: list[str] = []
+    if lines > 0 and offset < total:
+        for _, text in _iter_lines_from(path, index, offset):
+            selected.append(text)
+            if len(selected) >= lines:
+                break
     return {
         "file_name": path.name,
         "total_lines": total,
@@ -81,6 +175,44 @@ def _read_text_paginated(path: Path, lines: int = 100, offset: int = 0) -> dict:
     }
 
 
+def _search_text(path: Path, pattern: str, max_matches: int = 100, offset: int = 0) -> dict:
+    """Search *path* line by line for the regular expression *pattern*.
+
+    The file is streamed from line *offset*; scanning stops after
+    *max_matches* hits. When results are truncated, ``next_offset`` is the
+    line to pass as *offset* to continue the search.
+
+    Returns a dict with ``file_name``, ``pattern``, ``matches`` (list of
+    ``{"line": <number>, "content": <text>}``), ``returned_matches`` and
+    ``next_offset`` (``None`` when the end of the file was reached).
+    """
+    if _is_binary(path):
+        return {
+            "file_name": path.name,
+            "error": "Binary file — content cannot be searched.",
+        }
+    try:
+        regex = re.compile(pattern)
+    except re.error as e:
+        return {"file_name": path.name, "error": f"Invalid pattern: {e}"}
+    index = _get_line_index(path)
+    matches: list[dict] = []
+    next_offset = None
+    for line_no, text in _iter_lines_from(path, index, max(offset, 0)):
+        if len(matches) >= max_matches:
+            next_offset = line_no
+            break
+        if regex.search(text):
+            matches.append({"line": line_no, "content": text})
+    return {
+        "file_name": path.name,
+        "pattern": pattern,
+        "returned_matches": len(matches),
+        "matches": matches,
+        "next_offset": next_offset,
+    }
+
+
 def _list_files_relative(directory: Path) -> list[str]:
     """Return sorted list of file paths relative to *directory*."""
     if not directory.is_dir():
@@ -202,7 +202,8 @@ def get_campaign_run_file(
         campaign_id: Campaign name.
         file_name: file name (e.g. ``"files/growth_sim.py"``).
         lines: Maximum number of lines to return (default 100).
-        offset: Line offset to start reading from (default 0).
+        offset: Line offset to start reading from (default 0). Negative
+            values count from the end (``-100`` returns the last 100 lines).
     """
     config_dir = results_resolver.resolve_campaign_path(campaign_id) / "_config"
     path = config_dir / file_name
@@ -352,7 +353,8 @@ def get_campaign_transient_file(
         campaign_id: Campaign name.
         file_name: Relative path within the campaign transient files.
         lines: Maximum number of lines to return (default 100).
-        offset: Line offset to start reading from (default 0).
+        offset: Line offset to start reading from (default 0). Negative
+            values count from the end (``-100`` returns the last 100 lines).
     """
     transient_dir = results_resolver.resolve_campaign_path(campaign_id) / "_transient"
     path = transient_dir / file_name
@@ -120,7 +120,8 @@ def get_configuration_transient_file(
         configuration_id: Configuration name or identifier.
         file_name: path to transient file (e.g. ``"json-ld/coordinate.json"``).
         lines: Maximum number of lines to return (default 100).
-        offset: Line offset to start reading from (default 0).
+        offset: Line offset to start reading from (default 0). Negative
+            values count from the end (``-100`` returns the last 100 lines).
     """
     config_entry = _get_config_by_identifier_or_name(campaign_id, configuration_id)
     if config_entry is None:
@@ -190,7 +191,8 @@ def get_configuration_config_file(
         configuration_id: Configuration name or identifier.
         file_name: Configuration config file name.
         lines: Maximum number of lines to return (default 100).
-        offset: Line offset to start reading from (default 0).
+        offset: Line offset to start reading from (default 0). Negative
+            values count from the end (``-100`` returns the last 100 lines).
     """
     config_entry = _get_config_by_identifier_or_name(campaign_id, configuration_id)
     if config_entry is None:
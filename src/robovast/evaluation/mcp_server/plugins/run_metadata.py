@@ -30,7 +30,8 @@ from fastmcp import FastMCP
 
 from robovast.evaluation.mcp_server import results_resolver
 
-from ..plugin_common import _get_config_by_identifier_or_name, _read_text_paginated
+from ..plugin_common import (_get_config_by_identifier_or_name, _read_text_paginated,
+                             _search_text)
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +52,17 @@ def _get_test_result_entry(campaign_id: str, configuration_id: str, run: int) ->
     return None
 
 
+def _resolve_run_file(campaign_id: str, configuration_id: str, run: int, file_name: str):
+    """Path of *file_name* within a run, accepting ``<config>/<run>/``-prefixed names."""
+    run_path = results_resolver.resolve_run_path(campaign_id, configuration_id, run)
+    config_entry = _get_config_by_identifier_or_name(campaign_id, configuration_id)
+    config_name = config_entry.get("name", configuration_id) if config_entry else configuration_id
+    prefix = f"{config_name}/{run}/"
+    if file_name.startswith(prefix):
+        file_name = file_name[len(prefix):]
+    return run_path / file_name
+
+
 # -- Tool functions ----------------------------------------------------------
 
 
@@ -176,20 +188,46 @@ def get_run_output_file(
         file_name: Relative path within the run directory
             (e.g. ``"out.csv"``, ``"logs/system.log"``).
         lines: Maximum number of lines to return (default 100).
-        offset: Line offset to start reading from (default 0).
+        offset: Line offset to start reading from (default 0). Negative
+            values count from the end (``-100`` returns the last 100 lines).
     """
-    run_path = results_resolver.resolve_run_path(campaign_id, configuration_id, run)
-    config_entry = _get_config_by_identifier_or_name(campaign_id, configuration_id)
-    config_name = config_entry.get("name", configuration_id) if config_entry else configuration_id
-    prefix = f"{config_name}/{run}/"
-    if file_name.startswith(prefix):
-        file_name = file_name[len(prefix):]
-    path = run_path / file_name
+    path = _resolve_run_file(campaign_id, configuration_id, run, file_name)
     if not path.exists():
         return {"error": f"File not found: {file_name} in run {run}"}
     return _read_text_paginated(path, lines, offset)
 
 
+def search_run_output_file(
+    campaign_id: str,
+    configuration_id: str,
+    run: int,
+    file_name: str,
+    pattern: str,
+    max_matches: int = 100,
+    offset: int = 0,
+) -> dict:
+    """Search an output file of a run for lines matching a regular expression.
+
+    The file is scanned line by line, so large logs can be searched without
+    paging through them.
+
+    Args:
+        campaign_id: Campaign name.
+        configuration_id: Configuration name.
+        run: Run number (e.g. ``0``).
+        file_name: Relative path within the run directory
+            (e.g. ``"logs/system.log"``).
+        pattern: Python regular expression matched against each line.
+        max_matches: Maximum number of matching lines to return (default 100).
+        offset: Line to start searching from (default 0); pass the returned
+            ``next_offset`` to continue a truncated search.
+    """
+    path = _resolve_run_file(campaign_id, configuration_id, run, file_name)
+    if not path.exists():
+        return {"error": f"File not found: {file_name} in run {run}"}
+    return _search_text(path, pattern, max_matches, offset)
+
+
 # -- Plugin class ------------------------------------------------------------
 
 _TOOLS = [
@@ -197,6 +235,7 @@ _TOOLS = [
     get_run_sysinfo,
     list_run_additional_output_files,
     get_run_output_file,
+    search_run_output_file,
 ]
 
 
@@ -31,6 +31,7 @@ from PySide6.QtWidgets import (QApplication, QGroupBox, QHBoxLayout, QLabel,
 from robovast.common import load_config
 from robovast.common.analysis import get_run_status
 from robovast.common.execution import is_campaign_dir
+from robovast.common.run_summary import read_run_summaries
 from robovast.common.store import STORE_FILENAME, CampaignStore
 
 from .widgets.common import RunType
@@ -657,7 +658,9 @@ class RunResultsAnalyzer(QMainWindow):
                             label = f"{label}  [{unit['objective']:.4g}]"
                         config_item.setText(0, self._decorate_status(label, unit["status"]))
                         self._apply_status_color(config_item, unit["status"])
-                        for run_dir in self._list_run_dirs(result_dir):
+                        run_dirs = self._list_run_dirs(result_dir)
+                        read_run_summaries(run_dirs)  # parse uncached test.xml files in parallel
+                        for run_dir in run_dirs:
                             self._add_run_item(config_item, run_dir)
 
         except Exception as e:  # pylint: disable=broad-except
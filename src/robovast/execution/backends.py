@@ -26,20 +26,26 @@ backend only dispatches a batch's jobs so results land at
 docker-compose run-script generation but executes each batch **into a fixed
 campaign root** (no per-batch campaign-id nesting). A ``KubernetesBackend`` with
 the same interface can be added later to drive cluster batch and search through
-the same controller.
+the same controller. :class:`StandInBackend` executes no simulation at all; it
+stands in for a real backend when exercising the controller or a
+:class:`~robovast.execution.sharding.ShardingBackend` without Docker or a cluster.
 """
 
 import logging
 import os
 import re
+import shutil
 import subprocess  # nosec - invokes the generated, trusted robovast run script
 import tempfile
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Callable, Optional
 
 from robovast.common import prepare_campaign_configs
 from robovast.common.execution import (DEFAULT_ROBOVAST_IMAGE,
-                                       resolve_robovast_image)
+                                       move_job_links, resolve_robovast_image)
 from robovast.execution.execution_utils.execute_local import \
     generate_compose_run_script
 
@@ -67,8 +73,18 @@ class ExecutionBackend(ABC):
     Results stay keyed by config name / run number regardless of how the backend
     packs or dispatches, so the controller's scoring and the store are unaffected
     by the backend choice.
+
+    ``supports_concurrent_batches`` declares whether :meth:`run_batch` may be
+    called from several threads at once (each call with a distinct
+    ``batch_tag``); the asynchronous search scheduler only overlaps batches on
+    backends that set it. The controller postprocesses the campaign root while
+    such batches are still running, so these backends fill each config under
+    :func:`results_staging_dir` and move it into place whole
+    (:func:`publish_results`) instead of writing into the root directly.
     """
 
+    supports_concurrent_batches = False
+
     @abstractmethod
     def run_batch(self, campaign_data: dict, *, campaign_root: str, batch_tag: str,
                   runs: int, options: RunOptions) -> None:
@@ -87,6 +103,16 @@ class ExecutionBackend(ABC):
         storage, so the bucket holds a complete, local-equivalent campaign.
         """
 
+    def results_moved(self, campaign_root: str, moves: dict[str, str]) -> None:
+        """Hook called after the controller renamed run dirs in *campaign_root*.
+
+        *moves* maps old to new ``<config>/<run>`` paths (memo top-ups merge
+        their extra repetitions into the config they complete). The default
+        re-keys the job-link manifest; backends that also keep results in
+        storage move them there too.
+        """
+        move_job_links(campaign_root, moves)
+
     def count_run_artifacts(self, campaign_id: str) -> int | None:
         """Completed per-run artifacts published so far (controller progress poll).
 
@@ -99,6 +125,36 @@ class ExecutionBackend(ABC):
         return None
 
 
+def results_staging_dir(campaign_root: str, config_name: str) -> str:
+    """Where a concurrent backend assembles *config_name*'s results.
+
+    Lives under ``_transient/``, which run discovery and postprocessing skip,
+    on the same filesystem as the campaign root so :func:`publish_results` is a
+    rename.
+    """
+    return os.path.join(campaign_root, "_transient", "incoming", config_name)
+
+
+def publish_results(staging: str, target: str) -> None:
+    """Move the config dir assembled in *staging* to *target* in one step.
+
+    Run dirs already present under *target* (a re-delivered config) are
+    replaced. A missing *staging* dir (nothing was produced) is a no-op.
+    """
+    if not os.path.isdir(staging):
+        return
+    if not os.path.exists(target):
+        os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+        os.replace(staging, target)
+        return
+    for entry in os.listdir(staging):
+        dest = os.path.join(target, entry)
+        if os.path.isdir(dest) and not os.path.islink(dest):
+            shutil.rmtree(dest)
+        os.replace(os.path.join(staging, entry), dest)
+    shutil.rmtree(staging, ignore_errors=True)
+
+
 def _sanitize(tag: str) -> str:
     return re.sub(r"[^A-Za-z0-9_.-]", "_", tag)
 
@@ -176,3 +232,58 @@ class DockerBackend(ExecutionBackend):
             logger.warning(
                 "Batch %s run script exited with code %d (some runs failed); "
                 "continuing to evaluate produced results.", batch_tag, result.returncode)
+
+
+_PASSED_TEST_XML = ('<testsuite errors="0" failures="0" tests="1">'
+                    '<testcase name="stand-in" time="0.0"/></testsuite>\n')
+
+
+class StandInBackend(ExecutionBackend):
+    """Backend that fakes runs locally: no container, no cluster.
+
+    Each work item (config x run) is handed to ``run_item(config, run_dir)``,
+    which must write at least ``run_dir/test.xml``; the default writes a passing
+    one. Up to ``capacity`` items run at once in threads, each taking at least
+    ``delay_s`` seconds, so a stand-in can model a slower or smaller backend.
+    Batches may overlap; each config appears under the campaign root once all
+    of its runs are done.
+    """
+
+    supports_concurrent_batches = True
+
+    def __init__(self, run_item: Optional[Callable[[dict, str], None]] = None, *,
+                 capacity: int = 1, delay_s: float = 0.0):
+        if capacity < 1:
+            raise ValueError(f"StandInBackend requires capacity >= 1, got {capacity}")
+        self.run_item = run_item
+        self.capacity = capacity
+        self.delay_s = delay_s
+        self.batches: list[tuple[str, list[str], int]] = []
+
+    def _run_one(self, config: dict, run_dir: str) -> None:
+        start = time.monotonic()
+        os.makedirs(run_dir, exist_ok=True)
+        if self.run_item is not None:
+            self.run_item(config, run_dir)
+        else:
+            with open(os.path.join(run_dir, "test.xml"), "w", encoding="utf-8") as f:
+                f.write(_PASSED_TEST_XML)
+        remaining = self.delay_s - (time.monotonic() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def run_batch(self, campaign_data: dict, *, campaign_root: str, batch_tag: str,
+                  runs: int, options: RunOptions) -> None:
+        configs = campaign_data["configs"]
+        self.batches.append((batch_tag, [c["name"] for c in configs], runs))
+        with ThreadPoolExecutor(max_workers=self.capacity,
+                                thread_name_prefix="robovast-standin") as pool:
+            futures = {config["name"]: [
+                pool.submit(self._run_one, config, os.path.join(
+                    results_staging_dir(campaign_root, config["name"]), str(run)))
+                for run in range(runs)] for config in configs}
+            for name, config_futures in futures.items():
+                for future in config_futures:
+                    future.result()
+                publish_results(results_staging_dir(campaign_root, name),
+                                os.path.join(campaign_root, name))
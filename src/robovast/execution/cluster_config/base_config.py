@@ -15,9 +15,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import contextlib
+import io
 import os
 import subprocess  # nosec B404 - pigz is a fixed, trusted binary
 import tarfile
+import threading
 from typing import Optional
 
 
@@ -90,6 +93,37 @@ class BaseConfig(object):
             access_key=access_key, secret_key=secret_key,
             prefix=prefix or None, region=self.get_s3_region())
 
+    def stream_campaign(self, campaign_id: str, out, scratch_dir: str) -> None:
+        """Write this campaign's storage as a tar.gz to the writable *out*.
+
+        The streaming counterpart of :meth:`compress_campaign`: the controller
+        passes an
+        :class:`~robovast.execution.cluster_execution.share_providers.streaming.ArchiveStream`
+        that a share provider uploads from concurrently, so no local archive is
+        written. *scratch_dir* may hold small temporary files. The default
+        streams the S3/MinIO backend (:func:`_s3_stream`).
+        """
+        del scratch_dir
+        from robovast.execution.cluster_execution import \
+            in_pod_storage  # pylint: disable=import-outside-toplevel
+        bucket, prefix = in_pod_storage.campaign_storage_location(self, campaign_id)
+        access_key, secret_key = self.get_s3_credentials()
+        _s3_stream(
+            bucket, campaign_id, out,
+            endpoint=self.get_s3_endpoint(),
+            access_key=access_key, secret_key=secret_key,
+            prefix=prefix or None, region=self.get_s3_region())
+
+    def supports_campaign_streaming(self) -> bool:
+        """Whether :meth:`stream_campaign` matches this config's storage.
+
+        ``False`` for configs that override :meth:`compress_campaign` for
+        another store without a matching :meth:`stream_campaign`.
+        """
+        cls = type(self)
+        return (cls.stream_campaign is not BaseConfig.stream_campaign
+                or cls.compress_campaign is BaseConfig.compress_campaign)
+
     def verify_cluster_ready(self, k8s_client=None, namespace="default", kube_context=None):
         """Verify the storage infrastructure is ready before launching a run.
 
@@ -248,11 +282,73 @@ class BaseConfig(object):
 
 
 # ---------------------------------------------------------------------------
-# S3/MinIO download + compress, used by BaseConfig.compress_campaign for the
-# controller's upload-to-share step. Streams the bucket straight into a tar.gz
-# via pigz (parallel gzip). The GCS variant lives in the gcp config.
+# S3/MinIO download + compress, used by BaseConfig.compress_campaign and
+# BaseConfig.stream_campaign for the controller's upload-to-share step. Streams
+# the bucket straight into a tar.gz via pigz (parallel gzip), either into a local
+# file or into a streaming upload. The GCS variant lives in the gcp config.
 # ---------------------------------------------------------------------------
 
+_PIPE_CHUNK = 1024 * 1024
+
+
+@contextlib.contextmanager
+def _pigz(out):
+    """Yield the stdin of a ``pigz -c`` process that compresses into *out*.
+
+    *out* is either a real file (pigz writes to its descriptor directly) or
+    any object with ``write`` — e.g. the
+    :class:`~robovast.execution.cluster_execution.share_providers.streaming.ArchiveStream`
+    of a streaming upload — which a thread then feeds from pigz's stdout. An
+    error raised by ``out.write`` (a cancelled upload) stops pigz and is
+    re-raised here.
+    """
+    try:
+        fd = out.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        fd = None
+    pigz = subprocess.Popen(  # nosec B607 B603 - fixed binary, no shell
+        ["pigz", "-c"], stdin=subprocess.PIPE,
+        stdout=fd if fd is not None else subprocess.PIPE)
+    pump_error = []
+
+    def _pump():
+        try:
+            for chunk in iter(lambda: pigz.stdout.read(_PIPE_CHUNK), b""):
+                out.write(chunk)
+        except BaseException as exc:  # pylint: disable=broad-except
+            pump_error.append(exc)
+            pigz.stdout.close()  # pigz dies of SIGPIPE; writes to its stdin fail
+
+    pump = None
+    if fd is None:
+        pump = threading.Thread(target=_pump, name="robovast-pigz-output", daemon=True)
+        pump.start()
+    try:
+        yield pigz.stdin
+    finally:
+        try:
+            pigz.stdin.close()
+        except BrokenPipeError:
+            pass
+        pigz.wait()
+        if pump is not None:
+            pump.join()
+        if pump_error:
+            raise pump_error[0]
+    if pigz.returncode != 0:
+        raise RuntimeError(f"pigz exited with code {pigz.returncode}")
+
+
+def _tar_add_job_links(tar, links, archive_label):
+    """Add one symlink member per ``{link: target}`` entry of a job-link manifest."""
+    for link_rel, target in links.items():
+        tarinfo = tarfile.TarInfo(name=f"{archive_label}/{link_rel}")
+        tarinfo.type = tarfile.SYMTYPE
+        tarinfo.linkname = target
+        tarinfo.mode = 0o777
+        tar.addfile(tarinfo)
+
+
 def _s3_add_job_link_entries(tar, s3, bucket_name, prefix, archive_label):
     """Add ``<config>/<run>/job`` symlink members to the streaming tar.
 
@@ -266,18 +362,23 @@ def _s3_add_job_link_entries(tar, s3, bucket_name, prefix, archive_label):
         resp = s3.get_object(Bucket=bucket_name, Key=manifest_key)
     except Exception:  # pylint: disable=broad-except
         return  # no manifest → nothing to link
-    links = yaml.safe_load(resp["Body"].read()) or {}
-    for link_rel, target in links.items():
-        tarinfo = tarfile.TarInfo(name=f"{archive_label}/{link_rel}")
-        tarinfo.type = tarfile.SYMTYPE
-        tarinfo.linkname = target
-        tarinfo.mode = 0o777
-        tar.addfile(tarinfo)
+    _tar_add_job_links(tar, yaml.safe_load(resp["Body"].read()) or {}, archive_label)
 
 
-def _s3_compress(bucket, archive_dir, archive_name, *, endpoint, access_key,
-                 secret_key, prefix=None, region="us-east-1") -> str:
-    """Stream *bucket* (optionally under *prefix*) into a tar.gz; return its path.
+def _s3_compress(bucket, archive_dir, archive_name, **kwargs) -> str:
+    """Stream *bucket* into ``<archive_dir>/<archive_name>.tar.gz``; return its path.
+
+    See :func:`_s3_stream` for the keyword arguments.
+    """
+    output_path = os.path.join(archive_dir, f"{archive_name}.tar.gz")
+    with open(output_path, "wb") as out_f:
+        _s3_stream(bucket, archive_name, out_f, **kwargs)
+    return output_path
+
+
+def _s3_stream(bucket, archive_name, out, *, endpoint, access_key,
+               secret_key, prefix=None, region="us-east-1") -> None:
+    """Stream *bucket* (optionally under *prefix*) as a tar.gz into *out*.
 
     The archive's single top-level folder is *archive_name* (the campaign id), so
     it expands to ``<campaign>/<config>/<run>/...``.
@@ -286,7 +387,6 @@ def _s3_compress(bucket, archive_dir, archive_name, *, endpoint, access_key,
     from botocore.config import Config  # pylint: disable=import-outside-toplevel
 
     prefix = prefix.rstrip("/") + "/" if prefix else None
-    output_path = os.path.join(archive_dir, f"{archive_name}.tar.gz")
 
     s3 = boto3.client(
         "s3", endpoint_url=endpoint,
@@ -303,27 +403,17 @@ def _s3_compress(bucket, archive_dir, archive_name, *, endpoint, access_key,
     paginator = s3.get_paginator("list_objects_v2")
 
     # Stream uncompressed tar into pigz for parallel multi-core compression.
-    with open(output_path, "wb") as out_f:
-        pigz = subprocess.Popen(  # nosec B607 B603 - fixed binary, no shell
-            ["pigz", "-c"], stdin=subprocess.PIPE, stdout=out_f)
-        try:
-            with tarfile.open(fileobj=pigz.stdin, mode="w|") as tar:
-                for page in paginator.paginate(**paginate_kwargs):
-                    for obj in page.get("Contents", []):
-                        key = obj["Key"]
-                        relative_key = key[len(prefix):] if prefix else key
-                        tarinfo = tarfile.TarInfo(name=f"{archive_name}/{relative_key}")
-                        tarinfo.size = obj["Size"]
-                        response = s3.get_object(Bucket=bucket, Key=key)
-                        tarinfo.mode = (
-                            0o755 if response.get("Metadata", {}).get("executable") == "yes"
-                            else 0o644)
-                        tar.addfile(tarinfo, response["Body"])
-                _s3_add_job_link_entries(tar, s3, bucket, prefix, archive_name)
-        finally:
-            pigz.stdin.close()
-            pigz.wait()
-
-    if pigz.returncode != 0:
-        raise RuntimeError(f"pigz exited with code {pigz.returncode}")
-    return output_path
+    with _pigz(out) as pigz_stdin:
+        with tarfile.open(fileobj=pigz_stdin, mode="w|") as tar:
+            for page in paginator.paginate(**paginate_kwargs):
+                for obj in page.get("Contents", []):
+                    key = obj["Key"]
+                    relative_key = key[len(prefix):] if prefix else key
+                    tarinfo = tarfile.TarInfo(name=f"{archive_name}/{relative_key}")
+                    tarinfo.size = obj["Size"]
+                    response = s3.get_object(Bucket=bucket, Key=key)
+                    tarinfo.mode = (
+                        0o755 if response.get("Metadata", {}).get("executable") == "yes"
+                        else 0o644)
+                    tar.addfile(tarinfo, response["Body"])
+            _s3_add_job_link_entries(tar, s3, bucket, prefix, archive_name)
@@ -29,7 +29,9 @@ Required ``-o`` options at ``setup`` time::
         -o gcs_secret_key=<HMAC_SECRET_KEY> \\
         [-o storage_size=50Gi] [-o disk_type=pd-ssd]
 """
+import collections
 import concurrent.futures
+import itertools
 import json
 import logging
 import os
@@ -37,6 +39,7 @@ import re
 import shutil
 import subprocess
 import sys
+import tarfile
 import tempfile
 import threading
 import urllib.error
@@ -46,7 +49,7 @@ from typing import Optional
 
 from kubernetes import client, config
 
-from .base_config import BaseConfig
+from .base_config import BaseConfig, _pigz, _tar_add_job_links
 
 
 def _get_gke_cluster_info(kube_context=None): # pylint: disable=too-many-return-statements
@@ -371,6 +374,11 @@ file) have read/write access to it.
         return _gcs_compress(
             campaign_id, self.get_s3_bucket(), self.get_gcs_key_json(), archive_dir)
 
+    def stream_campaign(self, campaign_id: str, out, scratch_dir: str) -> None:
+        """Stream the campaign from GCS as a tar.gz into *out* (see :func:`_gcs_stream`)."""
+        _gcs_stream(
+            campaign_id, self.get_s3_bucket(), self.get_gcs_key_json(), out, scratch_dir)
+
     def get_gcs_key_file(self) -> Optional[str]:
         """Return the path to the GCS service-account key JSON file, or ``None``."""
         return self._gcs_key_file
@@ -600,13 +608,15 @@ file) have read/write access to it.
 
 
 # ---------------------------------------------------------------------------
-# Native GCS download + compress, used by GcpClusterConfig.compress_campaign for
-# the controller's upload-to-share step. Kept here (GCS is only used by this
-# config) rather than in a shared module. Parallel download then ``tar | pigz``.
+# Native GCS download + compress, used by GcpClusterConfig.compress_campaign and
+# stream_campaign for the controller's upload-to-share step. Kept here (GCS is
+# only used by this config) rather than in a shared module. Parallel download
+# then ``tar | pigz``, or a prefetching ``tar | pigz`` stream for uploads.
 # ---------------------------------------------------------------------------
 
 _GCS_DEFAULT_WORKERS = int(os.environ.get("ROBOVAST_GCS_WORKERS", "16"))
 _GCS_CHUNK = 4 * 1024 * 1024  # 4 MiB per read chunk
+_GCS_SPOOL_LIMIT = 16 * 1024 * 1024  # larger prefetched objects spill to disk
 
 
 def _gcs_get_access_token(key_json: dict) -> str:
@@ -654,8 +664,8 @@ def _gcs_list_blobs(bucket: str, prefix: str, token: str) -> list:
     return blobs
 
 
-def _gcs_download_blob(bucket: str, blob_name: str, dest_path: str, token: str) -> None:
-    """Download one GCS object to *dest_path*, streaming in 4 MiB chunks."""
+def _gcs_fetch_blob(bucket: str, blob_name: str, fh, token: str) -> None:
+    """Write one GCS object to the file object *fh*, streaming in 4 MiB chunks."""
     url = (
         f"https://storage.googleapis.com/storage/v1/b/"
         f"{urllib.parse.quote(bucket, safe='')}/o/"
@@ -663,14 +673,19 @@ def _gcs_download_blob(bucket: str, blob_name: str, dest_path: str, token: str)
         f"?alt=media"
     )
     req = urllib.request.Request(url, headers={"Authorization": f"Bearer {token}"})
-    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
     with urllib.request.urlopen(req, timeout=120) as resp:  # nosec B310 - https GCS API
-        with open(dest_path, "wb") as fh:
-            while True:
-                chunk = resp.read(_GCS_CHUNK)
-                if not chunk:
-                    break
-                fh.write(chunk)
+        while True:
+            chunk = resp.read(_GCS_CHUNK)
+            if not chunk:
+                break
+            fh.write(chunk)
+
+
+def _gcs_download_blob(bucket: str, blob_name: str, dest_path: str, token: str) -> None:
+    """Download one GCS object to *dest_path*."""
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    with open(dest_path, "wb") as fh:
+        _gcs_fetch_blob(bucket, blob_name, fh, token)
 
 
 def _gcs_create_job_links(campaign_dir: str) -> None:
@@ -788,3 +803,70 @@ def _gcs_compress(campaign: str, bucket: str, key_json: str, archive_dir: str,
         return output_path
     finally:
         shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def _gcs_stream(campaign: str, bucket: str, key_json: str, out, scratch_dir: str,
+                *, workers: int = _GCS_DEFAULT_WORKERS) -> None:
+    """Stream ``<campaign>/`` from *bucket* as a tar.gz into *out*.
+
+    The streaming counterpart of :func:`_gcs_compress`: instead of downloading
+    the whole campaign first, objects are fetched by *workers* threads a short
+    window ahead of the tar writer, each into a spooled temporary file (in
+    memory up to :data:`_GCS_SPOOL_LIMIT`, then under *scratch_dir*), and
+    appended to a ``tar | pigz`` stream in listing order. Job links from the
+    ``_transient/job_links.yaml`` manifest are added as symlink members.
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    key_data = json.loads(key_json)
+    prefix = f"{campaign}/"
+    token = _gcs_get_access_token(key_data)
+    blobs = [(name, size) for name, size in _gcs_list_blobs(bucket, prefix, token)
+             if not name.endswith("/")]
+    if not blobs:
+        raise RuntimeError(
+            f"No objects found under prefix '{prefix}' in bucket '{bucket}'.")
+    sys.stdout.write(
+        f"{campaign}: {len(blobs)} object(s)  "
+        f"{sum(size for _, size in blobs) / 1024 / 1024:.1f} MiB"
+        f"  ({workers} parallel workers, streaming)\n")
+    sys.stdout.flush()
+
+    def _fetch(blob_name):
+        spool = tempfile.SpooledTemporaryFile(max_size=_GCS_SPOOL_LIMIT, dir=scratch_dir)
+        try:
+            _gcs_fetch_blob(bucket, blob_name, spool, token)
+        except BaseException:
+            spool.close()
+            raise
+        size = spool.tell()
+        spool.seek(0)
+        return spool, size
+
+    links = {}
+    pending = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool, \
+            _pigz(out) as pigz_stdin, \
+            tarfile.open(fileobj=pigz_stdin, mode="w|") as tar:
+        try:
+            queue = iter(blobs)
+            for blob_name, _size in itertools.islice(queue, 2 * workers):
+                pending.append((blob_name, pool.submit(_fetch, blob_name)))
+            while pending:
+                blob_name, future = pending.popleft()
+                for next_name, _size in itertools.islice(queue, 1):
+                    pending.append((next_name, pool.submit(_fetch, next_name)))
+                spool, size = future.result()
+                with spool:
+                    relative = blob_name[len(prefix):]
+                    if relative == "_transient/job_links.yaml":
+                        links = yaml.safe_load(spool) or {}
+                        spool.seek(0)
+                    tarinfo = tarfile.TarInfo(name=f"{campaign}/{relative}")
+                    tarinfo.size = size
+                    tarinfo.mode = 0o644
+                    tar.addfile(tarinfo, spool)
+            _tar_add_job_links(tar, links, campaign)
+        finally:
+            for _name, future in pending:
+                future.cancel()
@@ -30,14 +30,23 @@ Public API
 * :func:`campaign_exists` — check whether a campaign already has data.
 * :func:`delete_campaign` — permanently remove a single campaign's data.
 * :func:`cleanup_campaigns` — remove one or all campaigns, return count.
+
+Deletion is done by :class:`_PrefixDeleter`: a campaign prefix is split into
+its top-level sub-prefixes with a delimiter listing, the sub-prefixes are
+listed concurrently, and the keys are removed in batched multi-object deletes
+(1000 keys per S3 ``DeleteObjects`` request, 100 per GCS batch) issued by a
+thread pool. Progress and throughput are logged while it runs.
 """
 
 import contextlib
 import logging
+import os
 import socket
 import subprocess
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
 import boto3
 from botocore.client import Config
@@ -48,7 +57,10 @@ from robovast.common.execution import is_campaign_dir
 logger = logging.getLogger(__name__)
 
 _S3_PORT = 9000
-_GCS_BATCH_SIZE = 100
+_S3_BATCH_SIZE = 1000   # DeleteObjects limit
+_GCS_BATCH_SIZE = 100   # JSON API batch limit
+_DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+_PROGRESS_INTERVAL = 2.0
 
 
 # ---------------------------------------------------------------------------
@@ -114,6 +126,7 @@ def _s3_connection(cluster_config, namespace: str, context: Optional[str]):
             s3={"addressing_style": "path"},
             request_checksum_calculation="when_required",
             response_checksum_validation="when_required",
+            max_pool_connections=2 * _DEFAULT_WORKERS,
         ),
         region_name=region,
     )
@@ -128,22 +141,37 @@ def _s3_connection(cluster_config, namespace: str, context: Optional[str]):
                 pf_proc.kill()
 
 
-@contextlib.contextmanager
-def _gcs_connection(cluster_config):
-    """Yield a ``google.cloud.storage.Client`` using the config's key file."""
+def _gcs_client(cluster_config):
+    """Return a ``google.cloud.storage.Client`` using the config's key file."""
     from google.cloud import storage as gcs_storage  # pylint: disable=import-outside-toplevel
 
     key_file = cluster_config.get_gcs_key_file()
     if key_file:
-        gcs = gcs_storage.Client.from_service_account_json(key_file)
-    else:
-        gcs = gcs_storage.Client()
+        return gcs_storage.Client.from_service_account_json(key_file)
+    return gcs_storage.Client()
+
+
+@contextlib.contextmanager
+def _gcs_connection(cluster_config):
+    """Yield a ``google.cloud.storage.Client`` using the config's key file."""
+    gcs = _gcs_client(cluster_config)
     try:
         yield gcs
     finally:
         pass  # google.cloud.storage.Client has no explicit close
 
 
+@contextlib.contextmanager
+def _storage_connection(cluster_config, namespace: str, context: Optional[str]):
+    """Yield a GCS client or an S3 client, whichever backs *cluster_config*."""
+    if _is_gcs(cluster_config):
+        with _gcs_connection(cluster_config) as gcs:
+            yield gcs
+    else:
+        with _s3_connection(cluster_config, namespace, context) as s3:
+            yield s3
+
+
 def _is_gcs(cluster_config) -> bool:
     return cluster_config.get_storage_backend() == "gcs"
 
@@ -160,7 +188,201 @@ def _bucket_name(campaign_id: str) -> str:
     return campaign_id.lower().replace("_", "-")
 
 
-def _delete_s3_prefix(s3, bucket: str, prefix: str) -> None:
+# ---------------------------------------------------------------------------
+# Internal: concurrent batched deletion
+# ---------------------------------------------------------------------------
+
+class _DeleteProgress:
+    """Thread-safe count of deleted objects, logged with throughput.
+
+    Logs at most every :data:`_PROGRESS_INTERVAL` seconds and forwards
+    ``(objects_deleted, objects_per_second)`` to *callback*.
+    """
+
+    def __init__(self, callback: Optional[Callable[[int, float], None]] = None):
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._last_report = self._start
+        self.deleted = 0
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self._start
+        return self.deleted / elapsed if elapsed > 0 else 0.0
+
+    def add(self, count: int) -> None:
+        with self._lock:
+            self.deleted += count
+            now = time.monotonic()
+            if now - self._last_report < _PROGRESS_INTERVAL:
+                return
+            self._last_report = now
+            deleted, rate = self.deleted, self.rate
+        logger.info("Deleted %d object(s) so far (%.0f objects/s)", deleted, rate)
+        if self._callback is not None:
+            self._callback(deleted, rate)
+
+    def finish(self) -> None:
+        elapsed = time.monotonic() - self._start
+        logger.info("Deleted %d object(s) in %.1fs (%.0f objects/s)",
+                    self.deleted, elapsed, self.rate)
+        if self._callback is not None:
+            self._callback(self.deleted, self.rate)
+
+
+class _PrefixDeleter:
+    """Delete everything under key prefixes with concurrent batched requests.
+
+    Each prefix is listed one level deep with a ``/`` delimiter; the keys
+    found at that level are deleted and every sub-prefix is listed
+    recursively in its own thread. Listed keys are cut into batches of
+    :attr:`batch_size` and deleted by *workers* threads. At most
+    ``2 * workers`` batches wait at any time, so memory stays bounded on
+    campaigns with millions of objects.
+
+    Subclasses implement :meth:`_list_level`, :meth:`_list_pages` and
+    :meth:`_delete_batch` for one storage backend.
+    """
+
+    batch_size = _S3_BATCH_SIZE
+
+    def __init__(self, bucket: str, workers: Optional[int] = None,
+                 progress: Optional[_DeleteProgress] = None):
+        self.bucket = bucket
+        self.workers = workers or _DEFAULT_WORKERS
+        self.progress = progress or _DeleteProgress()
+
+    def _list_level(self, prefix: str) -> tuple[list, list]:
+        """Return ``(keys, sub_prefixes)`` directly below *prefix*."""
+        raise NotImplementedError
+
+    def _list_pages(self, prefix: str):
+        """Yield lists of all keys under *prefix*, one listing page at a time."""
+        raise NotImplementedError
+
+    def _delete_batch(self, keys: list) -> None:
+        """Delete up to :attr:`batch_size` keys in one request."""
+        raise NotImplementedError
+
+    def delete_prefixes(self, prefixes: list) -> None:
+        slots = threading.BoundedSemaphore(2 * self.workers)
+        pending = []
+        pending_lock = threading.Lock()
+
+        def _run_batch(keys):
+            try:
+                self._delete_batch(keys)
+                self.progress.add(len(keys))
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.workers,
+                                thread_name_prefix="robovast-delete") as deleter, \
+                ThreadPoolExecutor(max_workers=self.workers,
+                                   thread_name_prefix="robovast-list") as lister:
+
+            def _submit(keys):
+                for i in range(0, len(keys), self.batch_size):
+                    slots.acquire()  # pylint: disable=consider-using-with
+                    future = deleter.submit(_run_batch, keys[i:i + self.batch_size])
+                    with pending_lock:
+                        pending.append(future)
+
+            def _list_and_submit(prefix):
+                for keys in self._list_pages(prefix):
+                    _submit(keys)
+
+            listings = []
+            for prefix in prefixes:
+                keys, sub_prefixes = self._list_level(prefix)
+                _submit(keys)
+                listings += [lister.submit(_list_and_submit, p) for p in sub_prefixes]
+            for future in listings:
+                future.result()
+        for future in pending:
+            future.result()
+
+
+class _S3Deleter(_PrefixDeleter):
+    """:class:`_PrefixDeleter` using ``ListObjectsV2`` and ``DeleteObjects``."""
+
+    def __init__(self, s3, bucket: str, workers: Optional[int] = None,
+                 progress: Optional[_DeleteProgress] = None):
+        super().__init__(bucket, workers, progress)
+        self._s3 = s3
+
+    def _list_level(self, prefix):
+        keys, sub_prefixes = [], []
+        paginator = self._s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix, Delimiter="/"):
+            keys += [obj["Key"] for obj in page.get("Contents", [])]
+            sub_prefixes += [p["Prefix"] for p in page.get("CommonPrefixes", [])]
+        return keys, sub_prefixes
+
+    def _list_pages(self, prefix):
+        paginator = self._s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            keys = [obj["Key"] for obj in page.get("Contents", [])]
+            if keys:
+                yield keys
+
+    def _delete_batch(self, keys):
+        response = self._s3.delete_objects(
+            Bucket=self.bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+        errors = response.get("Errors", [])
+        if errors:
+            first = errors[0]
+            raise RuntimeError(
+                f"Could not delete {len(errors)} object(s) from bucket '{self.bucket}' "
+                f"(e.g. '{first.get('Key')}': {first.get('Code')} {first.get('Message', '')})"
+            )
+
+
+class _GcsDeleter(_PrefixDeleter):
+    """:class:`_PrefixDeleter` using GCS listings and batched JSON API deletes.
+
+    ``google.cloud.storage`` batches are bound to their client, so every
+    worker thread gets its own client.
+    """
+
+    batch_size = _GCS_BATCH_SIZE
+
+    def __init__(self, cluster_config, gcs, bucket: str, workers: Optional[int] = None,
+                 progress: Optional[_DeleteProgress] = None):
+        super().__init__(bucket, workers, progress)
+        self._cluster_config = cluster_config
+        self._gcs = gcs
+        self._local = threading.local()
+
+    def _client(self):
+        if not hasattr(self._local, "client"):
+            self._local.client = _gcs_client(self._cluster_config)
+        return self._local.client
+
+    def _list_level(self, prefix):
+        blobs_iter = self._gcs.list_blobs(self.bucket, prefix=prefix, delimiter="/")
+        keys = [blob.name for blob in blobs_iter]  # consume so .prefixes is populated
+        return keys, sorted(blobs_iter.prefixes)
+
+    def _list_pages(self, prefix):
+        for page in self._client().list_blobs(self.bucket, prefix=prefix).pages:
+            keys = [blob.name for blob in page]
+            if keys:
+                yield keys
+
+    def _delete_batch(self, keys):
+        client = self._client()
+        bucket = client.bucket(self.bucket)
+        with client.batch():
+            for key in keys:
+                bucket.delete_blob(key)
+
+
+def _delete_s3_prefix(s3, bucket: str, prefix: str, workers: Optional[int] = None,
+                      progress: Optional[_DeleteProgress] = None) -> None:
     """Delete all objects in *bucket* whose key starts with *prefix*.
 
     Raises:
@@ -172,11 +394,71 @@ def _delete_s3_prefix(s3, bucket: str, prefix: str) -> None:
             "Refusing to delete with empty prefix — this would wipe the "
             f"entire bucket '{bucket}'.  Pass a non-empty prefix."
         )
-    paginator = s3.get_paginator("list_objects_v2")
-    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-        objects = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
-        if objects:
-            s3.delete_objects(Bucket=bucket, Delete={"Objects": objects})
+    _S3Deleter(s3, bucket, workers, progress).delete_prefixes([prefix])
+
+
+def _remove_campaign(conn, campaign_id: str, cluster_config,
+                     workers: Optional[int], progress: _DeleteProgress) -> None:
+    """Delete *campaign_id*'s data through an open storage connection *conn*."""
+    if _is_gcs(cluster_config):
+        gcs_bucket = cluster_config.get_s3_bucket()
+        _GcsDeleter(cluster_config, conn, gcs_bucket, workers, progress).delete_prefixes(
+            [f"{campaign_id}/"])
+        logger.debug("Deleted GCS prefix '%s/' from bucket '%s'", campaign_id, gcs_bucket)
+        return
+
+    shared_bucket = cluster_config.get_s3_bucket()
+    if shared_bucket:
+        _delete_s3_prefix(conn, shared_bucket, f"{campaign_id}/", workers, progress)
+        logger.debug(
+            "Deleted prefix '%s/' from shared S3 bucket '%s'", campaign_id, shared_bucket
+        )
+    else:
+        bucket_name = _bucket_name(campaign_id)
+        # The whole bucket belongs to the campaign; list it from the root.
+        _S3Deleter(conn, bucket_name, workers, progress).delete_prefixes([""])
+        conn.delete_bucket(Bucket=bucket_name)
+        logger.debug("Deleted S3 bucket '%s'", bucket_name)
+
+
+def _validate_campaign_id(campaign_id: str) -> None:
+    if not campaign_id or not campaign_id.strip():
+        raise ValueError("campaign_id must not be empty.")
+    if not is_campaign_dir(campaign_id):
+        raise ValueError(
+            f"Refusing to delete '{campaign_id}': does not match the expected "
+            f"campaign naming pattern.  This guard prevents accidental "
+            f"deletion of unrelated data."
+        )
+
+
+def _list_campaigns(conn, cluster_config) -> list:
+    """Campaign IDs via an open storage connection, from delimiter listings only."""
+    if _is_gcs(cluster_config):
+        blobs_iter = conn.list_blobs(cluster_config.get_s3_bucket(), delimiter="/")
+        _ = list(blobs_iter)  # consume so blobs_iter.prefixes is populated
+        return sorted(
+            p.rstrip("/")
+            for p in blobs_iter.prefixes
+            if is_campaign_dir(p.rstrip("/"))
+        )
+
+    shared_bucket = cluster_config.get_s3_bucket()
+    if shared_bucket:
+        paginator = conn.get_paginator("list_objects_v2")
+        campaigns: set = set()
+        for page in paginator.paginate(Bucket=shared_bucket, Delimiter="/"):
+            for prefix_obj in page.get("CommonPrefixes", []):
+                prefix = prefix_obj["Prefix"].rstrip("/")
+                if is_campaign_dir(prefix):
+                    campaigns.add(prefix)
+        return sorted(campaigns)
+    response = conn.list_buckets()
+    return sorted(
+        b["Name"]
+        for b in response.get("Buckets", [])
+        if is_campaign_dir(b["Name"])
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -200,35 +482,8 @@ def list_campaigns(
     Returns:
         list[str]: Sorted campaign IDs.
     """
-    if _is_gcs(cluster_config):
-        gcs_bucket = cluster_config.get_s3_bucket()
-        with _gcs_connection(cluster_config) as gcs:
-            blobs_iter = gcs.list_blobs(gcs_bucket, delimiter="/")
-            _ = list(blobs_iter)  # consume so blobs_iter.prefixes is populated
-            return sorted(
-                p.rstrip("/")
-                for p in blobs_iter.prefixes
-                if is_campaign_dir(p.rstrip("/"))
-            )
-
-    shared_bucket = cluster_config.get_s3_bucket()
-    with _s3_connection(cluster_config, namespace, context) as s3:
-        if shared_bucket:
-            paginator = s3.get_paginator("list_objects_v2")
-            campaigns: set = set()
-            for page in paginator.paginate(Bucket=shared_bucket, Delimiter="/"):
-                for prefix_obj in page.get("CommonPrefixes", []):
-                    prefix = prefix_obj["Prefix"].rstrip("/")
-                    if is_campaign_dir(prefix):
-                        campaigns.add(prefix)
-            return sorted(campaigns)
-        else:
-            response = s3.list_buckets()
-            return sorted(
-                b["Name"]
-                for b in response.get("Buckets", [])
-                if is_campaign_dir(b["Name"])
-            )
+    with _storage_connection(cluster_config, namespace, context) as conn:
+        return _list_campaigns(conn, cluster_config)
 
 
 def campaign_exists(
@@ -279,6 +534,8 @@ def delete_campaign(
     cluster_config,
     namespace: str = "default",
     context: Optional[str] = None,
+    workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, float], None]] = None,
 ) -> None:
     """Permanently delete all data for *campaign_id* from storage.
 
@@ -291,48 +548,21 @@ def delete_campaign(
         cluster_config: :class:`~robovast.execution.cluster_config.base_config.BaseConfig`.
         namespace:      Kubernetes namespace.
         context:        Kubernetes context.
+        workers:        Concurrent list/delete requests (default: one per
+                        CPU plus four, at most 32).
+        progress_callback:
+                        Optional ``(objects_deleted, objects_per_second)``
+                        callable, invoked every few seconds.
 
     Raises:
         ValueError: If *campaign_id* is empty or does not look like a valid
             campaign identifier.
     """
-    if not campaign_id or not campaign_id.strip():
-        raise ValueError("campaign_id must not be empty.")
-    if not is_campaign_dir(campaign_id):
-        raise ValueError(
-            f"Refusing to delete '{campaign_id}': does not match the expected "
-            f"campaign naming pattern.  This guard prevents accidental "
-            f"deletion of unrelated data."
-        )
-    if _is_gcs(cluster_config):
-        gcs_bucket = cluster_config.get_s3_bucket()
-        with _gcs_connection(cluster_config) as gcs:
-            prefix = f"{campaign_id}/"
-            blobs = list(gcs.list_blobs(gcs_bucket, prefix=prefix))
-            for i in range(0, len(blobs), _GCS_BATCH_SIZE):
-                chunk = blobs[i : i + _GCS_BATCH_SIZE]
-                with gcs.batch():
-                    for blob in chunk:
-                        blob.delete()
-        logger.debug("Deleted GCS prefix '%s/' from bucket '%s'", campaign_id, gcs_bucket)
-        return
-
-    shared_bucket = cluster_config.get_s3_bucket()
-    with _s3_connection(cluster_config, namespace, context) as s3:
-        if shared_bucket:
-            _delete_s3_prefix(s3, shared_bucket, f"{campaign_id}/")
-            logger.debug(
-                "Deleted prefix '%s/' from shared S3 bucket '%s'", campaign_id, shared_bucket
-            )
-        else:
-            bucket_name = _bucket_name(campaign_id)
-            paginator = s3.get_paginator("list_objects_v2")
-            for page in paginator.paginate(Bucket=bucket_name):
-                objects = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
-                if objects:
-                    s3.delete_objects(Bucket=bucket_name, Delete={"Objects": objects})
-            s3.delete_bucket(Bucket=bucket_name)
-            logger.debug("Deleted S3 bucket '%s'", bucket_name)
+    _validate_campaign_id(campaign_id)
+    progress = _DeleteProgress(progress_callback)
+    with _storage_connection(cluster_config, namespace, context) as conn:
+        _remove_campaign(conn, campaign_id, cluster_config, workers, progress)
+    progress.finish()
 
 
 def cleanup_campaigns(
@@ -341,12 +571,18 @@ def cleanup_campaigns(
     context: Optional[str] = None,
     campaign_id: Optional[str] = None,
     running_campaigns: set | None = None,
+    workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, float], None]] = None,
 ) -> int:
     """Remove one or all *finished* campaigns from storage.
 
     Campaigns listed in *running_campaigns* are **always skipped** to prevent
     deleting data that is still being produced by active jobs.
 
+    All campaigns are listed and removed through one storage connection (one
+    port-forward for embedded MinIO); see :func:`delete_campaign` for how the
+    objects of each are deleted.
+
     Args:
         cluster_config: :class:`~robovast.execution.cluster_config.base_config.BaseConfig`.
         namespace:      Kubernetes namespace.
@@ -359,6 +595,10 @@ def cleanup_campaigns(
                         even if they appear in storage.  Pass ``None`` only
                         when the caller has already verified nothing is
                         running.
+        workers:        Concurrent list/delete requests.
+        progress_callback:
+                        Optional ``(objects_deleted, objects_per_second)``
+                        callable, cumulative over all campaigns.
 
     Returns:
         int: Number of campaigns successfully removed.
@@ -366,42 +606,46 @@ def cleanup_campaigns(
     if running_campaigns is None:
         running_campaigns = set()
 
-    all_campaigns = list_campaigns(cluster_config, namespace, context)
-    if campaign_id:
-        # In per-bucket mode list_campaigns returns sanitized bucket names, so
-        # match either the raw ID (shared-bucket/GCS) or its sanitized form.
-        wanted = {campaign_id, _bucket_name(campaign_id)}
-        to_remove = [c for c in all_campaigns if c in wanted]
+    with _storage_connection(cluster_config, namespace, context) as conn:
+        all_campaigns = _list_campaigns(conn, cluster_config)
+        if campaign_id:
+            # In per-bucket mode list_campaigns returns sanitized bucket names, so
+            # match either the raw ID (shared-bucket/GCS) or its sanitized form.
+            wanted = {campaign_id, _bucket_name(campaign_id)}
+            to_remove = [c for c in all_campaigns if c in wanted]
+            if not to_remove:
+                logger.info("No campaign matching '%s' found in storage.", campaign_id)
+                return 0
+        else:
+            to_remove = all_campaigns
+
         if not to_remove:
-            logger.info("No campaign matching '%s' found in storage.", campaign_id)
+            logger.info("No campaigns found to remove.")
             return 0
-    else:
-        to_remove = all_campaigns
-
-    if not to_remove:
-        logger.info("No campaigns found to remove.")
-        return 0
-
-    # Safety: never delete campaigns that still have active jobs.
-    skipped = [c for c in to_remove if c in running_campaigns]
-    if skipped:
-        for name in skipped:
-            logger.warning(
-                "Skipping campaign '%s' — it still has running/pending jobs.",
-                name,
-            )
-    to_remove = [c for c in to_remove if c not in running_campaigns]
 
-    if not to_remove:
-        logger.info("No finished campaigns to remove (all still running).")
-        return 0
+        # Safety: never delete campaigns that still have active jobs.
+        skipped = [c for c in to_remove if c in running_campaigns]
+        if skipped:
+            for name in skipped:
+                logger.warning(
+                    "Skipping campaign '%s' — it still has running/pending jobs.",
+                    name,
+                )
+        to_remove = [c for c in to_remove if c not in running_campaigns]
 
-    removed = 0
-    for name in to_remove:
-        try:
-            delete_campaign(name, cluster_config, namespace, context)
-            removed += 1
-            logger.info("Removed campaign '%s' from storage.", name)
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.error("Failed to remove campaign '%s': %s", name, exc)
+        if not to_remove:
+            logger.info("No finished campaigns to remove (all still running).")
+            return 0
+
+        removed = 0
+        progress = _DeleteProgress(progress_callback)
+        for name in to_remove:
+            try:
+                _validate_campaign_id(name)
+                _remove_campaign(conn, name, cluster_config, workers, progress)
+                removed += 1
+                logger.info("Removed campaign '%s' from storage.", name)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Failed to remove campaign '%s': %s", name, exc)
+        progress.finish()
     return removed
@@ -348,6 +348,9 @@ def _controller_pod_manifest(pod_name, namespace, image, campaign_label,
             # Control channel (state + RPC). Declared for readability / Service
             # readiness; `kubectl port-forward` does not require it.
             "ports": [{"name": "control", "containerPort": _CONTROL_PORT}],
+            # Warm-pool worker pods reach the control channel at the pod IP.
+            "env": [{"name": "ROBOVAST_CONTROL_HOST",
+                     "valueFrom": {"fieldRef": {"fieldPath": "status.podIP"}}}],
             "volumeMounts": controller_mounts,
         }] + _aux_sidecar_containers(aux_specs),
         "volumes": volumes,
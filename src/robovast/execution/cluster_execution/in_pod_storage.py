@@ -35,6 +35,7 @@ since per-batch search runs target different prefixes within a campaign.
 import logging
 import os
 import socket
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +70,9 @@ class StorageClient:
     def download_prefix(self, bucket: str, prefix: str, local_dir: str) -> int:
         raise NotImplementedError
 
+    def delete_keys(self, bucket: str, keys: list[str]) -> None:
+        raise NotImplementedError
+
     def list_keys(self, bucket: str, prefix: str = "") -> list[str]:
         """Return object keys under *prefix* (no trailing-slash pseudo-dirs).
 
@@ -78,6 +82,16 @@ class StorageClient:
         """
         raise NotImplementedError
 
+    def list_children(self, bucket: str, prefix: str = "") -> list[str]:
+        """Return the immediate children of *prefix*, relative to it.
+
+        A delimited listing: objects directly under *prefix* are returned by
+        name, deeper levels collapse into one ``"<name>/"`` entry each, so the
+        cost does not grow with what is stored below them. Like
+        :meth:`list_keys`, returns ``[]`` for a not-yet-created bucket.
+        """
+        raise NotImplementedError
+
 
 class _S3StorageClient(StorageClient):
     """boto3-backed client for MinIO / S3 reachable from inside the cluster."""
@@ -169,6 +183,14 @@ class _S3StorageClient(StorageClient):
         logger.debug("Downloaded %d files from s3://%s/%s", count, bucket, prefix)
         return count
 
+    def delete_keys(self, bucket: str, keys: list[str]) -> None:
+        for i in range(0, len(keys), 1000):       # DeleteObjects takes up to 1000 keys
+            resp = self._s3.delete_objects(Bucket=bucket, Delete={
+                "Objects": [{"Key": k} for k in keys[i:i + 1000]], "Quiet": True})
+            if resp.get("Errors"):
+                raise RuntimeError(f"Could not delete {len(resp['Errors'])} object(s) "
+                                   f"from s3://{bucket}: {resp['Errors'][0]}")
+
     def list_keys(self, bucket: str, prefix: str = "") -> list[str]:
         from botocore.exceptions import ClientError  # pylint: disable=import-outside-toplevel
         prefix = prefix.rstrip("/")
@@ -187,6 +209,26 @@ class _S3StorageClient(StorageClient):
             raise
         return keys
 
+    def list_children(self, bucket: str, prefix: str = "") -> list[str]:
+        from botocore.exceptions import ClientError  # pylint: disable=import-outside-toplevel
+        prefix = prefix.rstrip("/")
+        key_prefix = f"{prefix}/" if prefix else ""
+        paginator = self._s3.get_paginator("list_objects_v2")
+        children = []
+        try:
+            for page in paginator.paginate(Bucket=bucket, Prefix=key_prefix, Delimiter="/"):
+                for obj in page.get("Contents", []) or []:
+                    if not obj["Key"].endswith("/"):
+                        children.append(obj["Key"][len(key_prefix):])
+                for sub in page.get("CommonPrefixes", []) or []:
+                    children.append(sub["Prefix"][len(key_prefix):])
+        except ClientError as exc:
+            code = exc.response.get("Error", {}).get("Code", "")
+            if code in ("404", "NoSuchBucket"):
+                return []
+            raise
+        return children
+
 
 class _GcsStorageClient(StorageClient):
     """google-cloud-storage client for a shared GCS bucket (prefix per campaign)."""
@@ -240,6 +282,9 @@ class _GcsStorageClient(StorageClient):
         logger.debug("Downloaded %d files from gs://%s/%s", count, bucket, prefix)
         return count
 
+    def delete_keys(self, bucket: str, keys: list[str]) -> None:
+        self._client.bucket(bucket).delete_blobs(keys)
+
     def list_keys(self, bucket: str, prefix: str = "") -> list[str]:
         from google.cloud.exceptions import NotFound  # pylint: disable=import-outside-toplevel
         gbucket = self._client.bucket(bucket)
@@ -251,6 +296,93 @@ class _GcsStorageClient(StorageClient):
         except NotFound:
             return []
 
+    def list_children(self, bucket: str, prefix: str = "") -> list[str]:
+        from google.cloud.exceptions import NotFound  # pylint: disable=import-outside-toplevel
+        gbucket = self._client.bucket(bucket)
+        prefix = prefix.rstrip("/")
+        key_prefix = f"{prefix}/" if prefix else ""
+        try:
+            blobs = self._client.list_blobs(gbucket, prefix=key_prefix, delimiter="/")
+            children = [b.name[len(key_prefix):] for b in blobs if not b.name.endswith("/")]
+            # ``prefixes`` is filled in while the pages are consumed above.
+            children.extend(p[len(key_prefix):] for p in sorted(blobs.prefixes))
+            return children
+        except NotFound:
+            return []
+
+
+class RunProgressTracker:
+    """Incremental count of finished runs under a campaign's storage prefix.
+
+    Each scenario run uploads ``<config>/<run>/test.xml`` on completion. Rather
+    than listing the whole (flat, ever-growing) campaign prefix on every progress
+    poll, the tracker only looks at configs it was told are running
+    (:meth:`track`) and stops once all their runs reported or their batch
+    finished (:meth:`retire`). Listings are delimited (:meth:`StorageClient.list_children`):
+    one lists the run directories of a config, then only the top level of each
+    run that appeared but has not reported yet is checked for the sentinel.
+    Finished runs and the (large) artifact trees below a run are never listed,
+    so a poll costs one short listing per unfinished config plus one per
+    unfinished run that has started uploading.
+
+    Thread-safe: batches register from their worker threads while the
+    controller's poller calls :meth:`count`.
+    """
+
+    SENTINEL = "test.xml"
+
+    def __init__(self, storage: StorageClient, bucket: str, prefix: str):
+        self._storage = storage
+        self._bucket = bucket
+        self._prefix = prefix
+        self._lock = threading.Lock()
+        # config -> expected runs, for configs still being listed.
+        self._pending: dict[str, int] = {}
+        # config -> run names whose sentinel has been seen.
+        self._seen: dict[str, set[str]] = {}
+
+    def track(self, config_names, runs: int) -> None:
+        """Start listing *config_names*, each expecting *runs* finished runs."""
+        with self._lock:
+            for name in config_names:
+                self._pending[name] = max(runs, self._pending.get(name, 0))
+                self._seen.setdefault(name, set())
+
+    def retire(self, config_names) -> None:
+        """Take a final count of *config_names* and stop listing them."""
+        names = [n for n in config_names if n in self._pending]
+        self._refresh(names)
+        with self._lock:
+            for name in names:
+                self._pending.pop(name, None)
+
+    def count(self) -> int:
+        """Cumulative number of finished runs across all tracked configs."""
+        with self._lock:
+            names = list(self._pending)
+        self._refresh(names)
+        with self._lock:
+            return sum(len(runs) for runs in self._seen.values())
+
+    def _refresh(self, names) -> None:
+        for name in names:
+            config_prefix = f"{self._prefix}{name}/"
+            with self._lock:
+                seen = set(self._seen.get(name, ()))
+            found = set()
+            for child in self._storage.list_children(self._bucket, config_prefix):
+                run = child[:-1]
+                if not child.endswith("/") or run in seen:
+                    continue
+                if self.SENTINEL in self._storage.list_children(self._bucket,
+                                                                f"{config_prefix}{child}"):
+                    found.add(run)
+            with self._lock:
+                seen = self._seen.setdefault(name, set())
+                seen |= found
+                if name in self._pending and len(seen) >= self._pending[name]:
+                    del self._pending[name]
+
 
 def campaign_storage_location(cluster_config, campaign_id: str) -> tuple[str, str]:
     """Return ``(bucket, campaign_prefix)`` for a campaign's storage location.
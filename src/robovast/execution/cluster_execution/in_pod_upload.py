@@ -23,6 +23,13 @@ storage in-cluster, so it compresses and uploads itself — no second pod, no
 (:meth:`~robovast.execution.cluster_config.base_config.BaseConfig.compress_campaign`);
 this module stays generic and just orchestrates compress → upload → retry.
 
+When both sides support it, compression and upload run as one pipeline
+(:func:`stream_campaign_upload`): the config's tar/gzip producer
+(``stream_campaign``) feeds the provider's ``upload_stream`` through a bounded
+:class:`~.share_providers.streaming.ArchiveStream`, so the pod needs neither
+disk space for the archive nor the time of two sequential phases. Set
+``ROBOVAST_STREAM_UPLOAD=0`` to force the compress-then-upload path.
+
 Share credentials are injected into the controller pod at launch (resolved from
 the host ``.env`` by :mod:`.controller_launcher`), so they are already present in
 ``os.environ`` here. :func:`load_provider_from_env` reads them (with optional
@@ -31,6 +38,7 @@ overrides supplied by a retrigger command).
 
 import logging
 import os
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -96,10 +104,85 @@ def verify_share_access(provider) -> None:
     logger.info("Share credentials OK.")
 
 
+def _streaming_enabled(cluster_config, provider) -> bool:
+    if os.environ.get("ROBOVAST_STREAM_UPLOAD", "1").strip().lower() in ("0", "false", "no"):
+        return False
+    config_ok = getattr(cluster_config, "supports_campaign_streaming", None)
+    provider_ok = getattr(provider, "supports_streaming_upload", None)
+    return bool(config_ok and config_ok() and provider_ok and provider_ok())
+
+
+def stream_campaign_upload(cluster_config, campaign_id: str, provider,
+                           progress_cb=None, scratch_dir: str | None = None,
+                           part_size: int | None = None) -> None:
+    """Compress *campaign_id* and upload it via *provider* in one pipeline.
+
+    ``cluster_config.stream_campaign`` runs in a producer thread and writes
+    the tar.gz into a bounded :class:`~.share_providers.streaming.ArchiveStream`;
+    ``provider.upload_stream`` sends it in fixed-size parts as it arrives.
+    A failed upload cancels the producer; a failed producer aborts the upload
+    with the producer's exception.
+
+    Args:
+        scratch_dir: Directory for the producer's temporary files; defaults to
+            ``$ROBOVAST_ARCHIVE_DIR``.
+        part_size: Bytes per uploaded part; defaults to
+            :data:`~.share_providers.streaming.STREAM_PART_SIZE`.
+
+    Raises whatever the producer or the upload raised.
+    """
+    from .share_providers import \
+        streaming  # pylint: disable=import-outside-toplevel
+
+    part_size = part_size or streaming.STREAM_PART_SIZE
+    stream = streaming.ArchiveStream(streaming.STREAM_BUFFER_PARTS * part_size)
+    scratch_dir = scratch_dir or _archive_dir()
+
+    def _produce():
+        try:
+            cluster_config.stream_campaign(campaign_id, stream, scratch_dir)
+        except BaseException as exc:  # pylint: disable=broad-except
+            stream.close(exc)
+        else:
+            stream.close()
+
+    producer = threading.Thread(target=_produce, name="robovast-compress", daemon=True)
+    producer.start()
+    try:
+        provider.upload_stream(stream, f"{campaign_id}.tar.gz", progress_callback=progress_cb,
+                               part_size=part_size)
+    except BaseException:
+        stream.cancel()
+        raise
+    finally:
+        producer.join()
+    logger.info("Streamed %.1f MiB to %s.", stream.bytes_written / 1024 / 1024,
+                provider.SHARE_TYPE)
+
+
+def _discard_partial_upload(provider, object_name: str) -> None:
+    """Best-effort removal of a failed streamed upload.
+
+    Its bytes belong to another gzip stream, so :meth:`upload_archive` must not
+    resume from them.
+    """
+    try:
+        provider.remove_archive(object_name)
+    except Exception:  # pylint: disable=broad-except
+        logger.debug("Could not remove partial upload %s", object_name, exc_info=True)
+
+
 def upload_campaign(cluster_config, campaign_id: str, provider,
                     progress_cb=None) -> bool:
     """Compress *campaign_id* from storage and upload it via *provider*.
 
+    If the cluster config can stream the campaign and the provider can upload
+    a stream, both run at once through :func:`stream_campaign_upload` and no
+    local archive is written. If the provider turns out not to support that
+    (:class:`~.share_providers.base.PartialUploadUnsupported`, e.g. a WebDAV
+    server that rejects partial ``PUT``, as RFC 9110 allows), the partial upload
+    is removed and the campaign is uploaded from a local archive instead:
+
     1. Compress: ``cluster_config.compress_campaign`` (storage-specific — S3 vs
        GCS lives in the cluster config) writes
        ``$ROBOVAST_ARCHIVE_DIR/<campaign>.tar.gz``.
@@ -118,6 +201,23 @@ def upload_campaign(cluster_config, campaign_id: str, provider,
     archive_dir = _archive_dir()
     os.makedirs(archive_dir, exist_ok=True)
 
+    if _streaming_enabled(cluster_config, provider):
+        from .share_providers.base import \
+            PartialUploadUnsupported  # pylint: disable=import-outside-toplevel
+
+        logger.info("Streaming campaign %s to %s...", campaign_id, provider.SHARE_TYPE)
+        try:
+            stream_campaign_upload(cluster_config, campaign_id, provider,
+                                   progress_cb=progress_cb, scratch_dir=archive_dir)
+        except PartialUploadUnsupported as exc:
+            logger.warning("%s Uploading from a local archive instead.", exc)
+            _discard_partial_upload(provider, f"{campaign_id}.tar.gz")
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Streaming upload to %s failed.", provider.SHARE_TYPE)
+            return False
+        else:
+            return True
+
     # 1. Compress straight from storage into the local archive dir. The cluster
     #    config owns the storage-specific compression.
     logger.info("Compressing campaign %s for upload...", campaign_id)
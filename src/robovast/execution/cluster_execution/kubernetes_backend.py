@@ -51,6 +51,7 @@ import logging
 import os
 import re
 import tempfile
+import threading
 import time
 
 import yaml
@@ -65,8 +66,10 @@ from robovast.common.execution import (build_job_parameter_documents,
                                        resolve_robovast_image,
                                        write_job_links_manifest)
 from robovast.common import prepare_campaign_configs
-from robovast.execution.backends import ExecutionBackend, RunOptions
-from robovast.execution.packer import build_jobs
+from robovast.execution.backends import (ExecutionBackend, RunOptions,
+                                         publish_results, results_staging_dir)
+from robovast.execution.packer import annotate_durations, build_jobs
+from robovast.execution.work_queue import QueueUnit, WorkQueue
 
 from . import in_pod_storage
 from .cluster_execution import _label_safe_campaign
@@ -74,6 +77,17 @@ from .manifests import JOB_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
+# Label carrying a job's (label-safe) batch tag, next to ``campaign-id``.
+BATCH_LABEL = "robovast-batch"
+
+# Slack on a warm-pool unit's lease beyond its runs' timeouts: the worker's
+# kill grace period plus the per-unit S3 upload.
+WARM_POOL_LEASE_MARGIN_S = 600.0
+
+# Serialises the read-modify-write of ``_transient/job_links.yaml`` when several
+# batches of one campaign run concurrently (asynchronous search scheduling).
+_JOB_LINKS_LOCK = threading.Lock()
+
 
 def _short_job_name(campaign: str, config_name: str, run_number: int) -> str:
     """Create a short Kubernetes job name (max 63 chars) for campaign-id-config-run.
@@ -119,7 +133,13 @@ class BatchJobRunner:
 
     @classmethod
     def for_batch(cls, *, campaign_data, campaign_id, batch_tag, runs, cluster_config,
-                  namespace, image, kube_context=None, log_tree=False):
+                  namespace, image, kube_context=None, log_tree=False, results_dir=None):
+        """Build the runner for one batch.
+
+        With ``execution.job_duration``, configs the controller has not
+        annotated yet get run-time predictions from the campaigns in
+        *results_dir* before any job is packed.
+        """
         self = cls()
         self.cluster_config = cluster_config
         self.namespace = namespace
@@ -137,6 +157,8 @@ class BatchJobRunner:
         self._batch_tag = batch_tag
 
         execution_params = campaign_data.get("execution", {}) or {}
+        annotate_durations(self.configs, execution_params, results_dir,
+                           campaign_data.get("vast"))
         self.pre_command = execution_params.get("pre_command")
         self.post_command = execution_params.get("post_command")
         self.run_as_user = execution_params.get("run_as_user", 1000)
@@ -235,6 +257,13 @@ class BatchJobRunner:
         self.replace_template(job_manifest, "$JOB_FULL_NAME", job_full_name)
         self.replace_template(job_manifest, "$ITEM", item_tag)
         self.replace_template(job_manifest, "$TOTAL_JOB_NUM", str(total_jobs))
+        if self._batch_tag:
+            # Batches of one campaign share the campaign-id label; this one lets
+            # a batch clean up only its own jobs and pods.
+            batch_label = _label_safe_campaign(self._batch_tag)
+            job_manifest["metadata"].setdefault("labels", {})[BATCH_LABEL] = batch_label
+            job_manifest["spec"]["template"]["metadata"].setdefault(
+                "labels", {})[BATCH_LABEL] = batch_label
 
         s3_endpoint, s3_access_key, s3_secret_key, bucket_name, campaign_prefix = self._s3_settings()
 
@@ -361,6 +390,26 @@ class BatchJobRunner:
 
         return job_manifest
 
+    @staticmethod
+    def _init_mirror_cmd(config_names) -> str:
+        """initContainer command mirroring the shared and the given configs' files
+        into ``/config`` (restoring executable bits)."""
+        per_config_mirror = "".join(
+            f"(mc mirror mystore/$S3_BUCKET/${{S3_CAMPAIGN_PREFIX}}{cn}/_config/ /config/{cn}/ 2>/dev/null || true); "
+            for cn in config_names
+        )
+        return (
+            f"mc alias set mystore \"$S3_ENDPOINT\" \"$S3_ACCESS_KEY\" \"$S3_SECRET_KEY\" && "
+            f"mc mirror mystore/$S3_BUCKET/${{S3_CAMPAIGN_PREFIX}}_config/ /config/ && "
+            f"mc mirror mystore/$S3_BUCKET/${{S3_CAMPAIGN_PREFIX}}_transient/ /config/ && "
+            f"{per_config_mirror}"
+            f"for s3pfx in ${{S3_CAMPAIGN_PREFIX}}_config ${{S3_CAMPAIGN_PREFIX}}_transient; do "
+            f"mc find mystore/$S3_BUCKET/$s3pfx/ 2>/dev/null | while IFS= read -r obj; do "
+            f"mc stat --json \"$obj\" 2>/dev/null | grep -qi 'executable.*yes' && "
+            f"chmod +x \"/config/${{obj#mystore/$S3_BUCKET/$s3pfx/}}\" 2>/dev/null || true; "
+            f"done; done; true"
+        )
+
     def create_job_manifest(self, job, total_jobs: int) -> dict:
         """Create a manifest for one job (1..K configs).
 
@@ -375,21 +424,7 @@ class BatchJobRunner:
         """
         _, _, _, _, campaign_prefix = self._s3_settings()
         job_tag = self._job_tag(job.index)
-        per_config_mirror = "".join(
-            f"(mc mirror mystore/$S3_BUCKET/${{S3_CAMPAIGN_PREFIX}}{cn}/_config/ /config/{cn}/ 2>/dev/null || true); "
-            for cn in job.config_names
-        )
-        init_cmd = (
-            f"mc alias set mystore \"$S3_ENDPOINT\" \"$S3_ACCESS_KEY\" \"$S3_SECRET_KEY\" && "
-            f"mc mirror mystore/$S3_BUCKET/${{S3_CAMPAIGN_PREFIX}}_config/ /config/ && "
-            f"mc mirror mystore/$S3_BUCKET/${{S3_CAMPAIGN_PREFIX}}_transient/ /config/ && "
-            f"{per_config_mirror}"
-            f"for s3pfx in ${{S3_CAMPAIGN_PREFIX}}_config ${{S3_CAMPAIGN_PREFIX}}_transient; do "
-            f"mc find mystore/$S3_BUCKET/$s3pfx/ 2>/dev/null | while IFS= read -r obj; do "
-            f"mc stat --json \"$obj\" 2>/dev/null | grep -qi 'executable.*yes' && "
-            f"chmod +x \"/config/${{obj#mystore/$S3_BUCKET/$s3pfx/}}\" 2>/dev/null || true; "
-            f"done; done; true"
-        )
+        init_cmd = self._init_mirror_cmd(job.config_names)
         extra_env = (
             ('SCENARIO_PARAMETER_FILE', f"/config/{job_tag}.params.yaml"),
             ('OUTPUT_RESULT_PER_SCENARIO', 'true'),
@@ -421,13 +456,16 @@ class BatchJobRunner:
         """
         return build_jobs(self.configs, self.num_runs, self.campaign_data.get("execution") or {})
 
+    def _scenario_name(self) -> str:
+        vast_dir = os.path.dirname(self.campaign_data["vast"])
+        scenario_path = os.path.join(vast_dir, self.campaign_data["scenario_file"])
+        return next(iter(get_scenario_parameters(scenario_path).keys()))
+
     def _write_job_param_files(self, out_dir):
         """Write one multi-document scenario-parameter file per packed job into
         ``out_dir/_transient/`` so they upload with the campaign and are mirrored
         into each packed job's ``/config`` as ``job-<idx>.params.yaml``."""
-        vast_dir = os.path.dirname(self.campaign_data["vast"])
-        scenario_path = os.path.join(vast_dir, self.campaign_data["scenario_file"])
-        scenario_name = next(iter(get_scenario_parameters(scenario_path).keys()))
+        scenario_name = self._scenario_name()
         transient_dir = os.path.join(out_dir, "_transient")
         os.makedirs(transient_dir, exist_ok=True)
         jobs = self._build_jobs()
@@ -442,6 +480,83 @@ class BatchJobRunner:
         if not self._batch_tag:
             write_job_links_manifest(transient_dir, jobs)
 
+    # -- warm pool ------------------------------------------------------------
+
+    def _warm_pool_size(self) -> int:
+        """Worker pods for warm-pool mode (``execution.warm_pool``); 0 when off."""
+        return int((self.campaign_data.get("execution") or {}).get("warm_pool") or 0)
+
+    def _worker_tag(self, index: int) -> str:
+        """Flat worker tag (job name, ``WARM_POOL_WORKER``), like :meth:`_job_tag`."""
+        return f"{self._batch_tag}-worker-{index}" if self._batch_tag else f"worker-{index}"
+
+    def _worker_artifact_path(self, worker: str) -> str:
+        """``_jobs/`` sub-path of a worker's artifacts, like :meth:`_job_artifact_path`."""
+        name = worker[len(self._batch_tag) + 1:] if self._batch_tag else worker
+        return f"{self._batch_tag}/{name}" if self._batch_tag else name
+
+    def build_queue_units(self) -> list[QueueUnit]:
+        """One warm-pool queue unit per packed job, carrying its parameter file."""
+        scenario_name = self._scenario_name()
+        return [
+            QueueUnit(
+                id=self._job_tag(job.index),
+                documents=dump_multi_document_yaml(
+                    build_job_parameter_documents(job, scenario_name)),
+                items=[[item.config_name, item.run_number] for item in job.items],
+            )
+            for job in self._build_jobs()
+        ]
+
+    def create_worker_manifest(self, index: int, total_workers: int, queue_url: str) -> dict:
+        """Create a manifest for warm-pool worker *index*.
+
+        Like :meth:`create_job_manifest`, but the init container mirrors every
+        config of the batch and the entrypoint starts ``warm_worker.py``, which
+        pulls packed jobs from *queue_url* until the batch is done. Job-level
+        artifacts of all units a worker ran land in ``_jobs/<batch>/worker-<idx>``.
+        The per-run ``timeout`` is not a pod deadline here (a worker runs many
+        jobs): the worker kills a unit's scenario after ``timeout`` seconds per
+        run instead, before the unit's lease (:meth:`_queue_lease_s`) expires.
+        """
+        _, _, _, _, campaign_prefix = self._s3_settings()
+        worker = self._worker_tag(index)
+        timeout = (self.campaign_data.get("execution") or {}).get("timeout")
+        extra_env = (
+            ('WARM_POOL_QUEUE_URL', queue_url),
+            ('WARM_POOL_WORKER', worker),
+            ('WARM_POOL_RUN_TIMEOUT', str(int(timeout)) if timeout else '0'),
+            ('OUTPUT_RESULT_PER_SCENARIO', 'true'),
+            ('OUTPUT_DIR', f"/out/_jobs/{self._worker_artifact_path(worker)}"),
+            ('SCENARIO_OUTPUT_DIR', '/out'),
+        )
+        manifest = self._build_job_manifest(
+            job_short_name=_short_job_name(self.campaign, worker, index),
+            job_full_name=f"{self.campaign}-{worker}",
+            item_tag=worker,
+            total_jobs=total_workers,
+            s3_prefix=campaign_prefix.rstrip("/"),
+            init_cmd=self._init_mirror_cmd([c["name"] for c in self.configs if c.get("name")]),
+            extra_main_env=extra_env,
+        )
+        manifest["spec"].pop("activeDeadlineSeconds", None)
+        return manifest
+
+    def _queue_lease_s(self, units: list[QueueUnit]) -> float:
+        """Lease per unit: the per-run timeout times the largest unit's runs.
+
+        Adds :data:`WARM_POOL_LEASE_MARGIN_S` for the worker's kill grace period
+        and per-unit upload, so a unit killed at its deadline still completes
+        within the lease. Warm-pool mode requires ``execution.timeout`` (the
+        config validation enforces it): a flat lease would hand a slow but live
+        unit to a second worker.
+        """
+        timeout = (self.campaign_data.get("execution") or {}).get("timeout")
+        if not timeout:
+            raise ValueError("execution.warm_pool requires execution.timeout")
+        return (float(timeout) * max((len(u.items) for u in units), default=1)
+                + WARM_POOL_LEASE_MARGIN_S)
+
     def get_remaining_jobs(self, job_names):
         running_jobs = []
         for job_name in job_names:
@@ -464,12 +579,20 @@ class BatchJobRunner:
                 running_jobs.append(job_name)
         return running_jobs
 
-    def cleanup_jobs(self, campaign=None):
-        """Delete jobs. If campaign is given, only delete jobs with that campaign-id label."""
+    @staticmethod
+    def _label_selector(campaign=None, batch=None):
+        """``jobgroup=scenario-runs``, narrowed to a campaign and a batch of it."""
         label_selector = "jobgroup=scenario-runs"
         if campaign is not None:
-            label_safe = _label_safe_campaign(campaign)
-            label_selector = f"jobgroup=scenario-runs,campaign-id={label_safe}"
+            label_selector += f",campaign-id={_label_safe_campaign(campaign)}"
+            if batch:
+                label_selector += f",{BATCH_LABEL}={_label_safe_campaign(batch)}"
+        return label_selector
+
+    def cleanup_jobs(self, campaign=None, batch=None):
+        """Delete jobs. If campaign is given, only delete jobs with that campaign-id
+        label, and with *batch* only those of that batch."""
+        label_selector = self._label_selector(campaign, batch)
         try:
             logger.debug(f"Deleting jobs with label selector '{label_selector}'")
             self.k8s_batch_client.delete_collection_namespaced_job(
@@ -483,12 +606,10 @@ class BatchJobRunner:
         except client.rest.ApiException as e:
             logger.error(f"Error deleting jobs with label selector: {e}")
 
-    def cleanup_pods(self, campaign=None):
-        """Delete pods. If campaign is given, only delete pods with that campaign-id label."""
-        label_selector = "jobgroup=scenario-runs"
-        if campaign is not None:
-            label_safe = _label_safe_campaign(campaign)
-            label_selector = f"jobgroup=scenario-runs,campaign-id={label_safe}"
+    def cleanup_pods(self, campaign=None, batch=None):
+        """Delete pods. If campaign is given, only delete pods with that campaign-id
+        label, and with *batch* only those of that batch."""
+        label_selector = self._label_selector(campaign, batch)
         try:
             logger.debug(f"Deleting pods with label selector '{label_selector}'")
             self.k8s_client.delete_collection_namespaced_pod(
@@ -563,8 +684,14 @@ class BatchJobRunner:
 
     # -- in-pod execution ---------------------------------------------------
 
-    def run_batch_in_pod(self, campaign_root: str):
-        """Upload, run and download one batch; results land under *campaign_root*."""
+    def run_batch_in_pod(self, campaign_root: str, control=None):
+        """Upload, run and download one batch; results land under *campaign_root*.
+
+        *control* is the controller's ``(ControllerState, base_url)`` control
+        channel. With it and ``execution.warm_pool`` set, the batch runs on
+        warm-pool workers pulling from a queue served there (see
+        :mod:`robovast.execution.work_queue`); otherwise one Job per packed job.
+        """
         self._ensure_k8s_initialized()
         _, _, _, bucket_name, campaign_prefix = self._s3_settings()
         storage = in_pod_storage.storage_client_for(self.cluster_config)
@@ -579,12 +706,75 @@ class BatchJobRunner:
             logger.info("Batch %s: uploaded %d config file(s) to %s/%s",
                         self._batch_tag, n, bucket_name, campaign_prefix)
 
-        # 3. Build and submit one Job per packed job, then wait.
-        jobs = self._build_jobs()
-        total_jobs = len(jobs)
+        # 3. Build and submit one Job per packed job (or per warm-pool worker),
+        #    then wait.
+        queue = None
+        queue_name = self._batch_tag or "batch"
+        if control is not None and self._warm_pool_size():
+            state, base_url = control
+            units = self.build_queue_units()
+            queue = WorkQueue(units, lease_s=self._queue_lease_s(units))
+            state.register_queue(queue_name, queue)
+            workers = min(self._warm_pool_size(), len(units))
+            manifests = [self.create_worker_manifest(i, workers, f"{base_url}/queue/{queue_name}")
+                         for i in range(workers)]
+            logger.info("Batch %s: warm pool of %d worker(s) for %d packed job(s)",
+                        self._batch_tag, workers, len(units))
+        else:
+            jobs = self._build_jobs()
+            manifests = [self.create_job_manifest(job, len(jobs)) for job in jobs]
+        try:
+            self._submit_and_wait(manifests)
+        finally:
+            if queue is not None:
+                control[0].unregister_queue(queue_name)
+        if queue is not None and queue.failed:
+            logger.error("Batch %s: %d packed job(s) lost their lease %d times and were "
+                         "given up: %s", self._batch_tag, len(queue.failed),
+                         queue.max_attempts, ", ".join(queue.failed))
+        if queue is not None and queue.remaining:
+            logger.error("Batch %s: warm-pool workers exited with %d packed job(s) "
+                         "not run", self._batch_tag, queue.remaining)
+
+        # 4. Download this batch's results into the campaign root for scoring.
+        #    The campaign prefix is flat/shared across batches, so we identify this
+        #    batch's results by its config names (self.configs == this batch's
+        #    composed configs) and fetch only those <config>/ dirs — the same
+        #    config names the controller scores at campaign_root/<config>/.
+        #    Each config is staged and moved in whole: with asynchronous
+        #    scheduling the controller postprocesses the root meanwhile.
+        os.makedirs(campaign_root, exist_ok=True)
+        got = 0
+        for config_data in self.configs:
+            cn = config_data.get("name")
+            if not cn:
+                continue
+            staging = results_staging_dir(campaign_root, cn)
+            got += storage.download_prefix(bucket_name, f"{campaign_prefix}{cn}", staging)
+            publish_results(staging, os.path.join(campaign_root, cn))
+        logger.info("Batch %s: downloaded %d result file(s) into %s",
+                    self._batch_tag, got, campaign_root)
+
+        # 4b. Record this batch's <config>/<run>/job -> _jobs/<batch>/job-<idx>
+        #     links so upload-to-share can materialise the per-run `job` symlinks.
+        #     Warm-pool items link to the worker that ran them, and their
+        #     per-item startup / run / teardown latency is published.
+        if queue is None:
+            self._write_job_links(campaign_root)
+        else:
+            timings = queue.timings()
+            self._write_job_links(campaign_root, {
+                f"{t['config']}/{t['run']}/job": self._worker_artifact_path(t["worker"])
+                for t in timings})
+            path = os.path.join(campaign_root, "_execution", "warm_pool", f"{queue_name}.csv")
+            queue.write_timings(path)
+            logger.info("Batch %s: wrote %d warm-pool timing row(s) to %s",
+                        self._batch_tag, len(timings), path)
+
+    def _submit_and_wait(self, manifests):
+        """Create the Jobs, wait for all of them, then delete them."""
         job_names = []
-        for job in jobs:
-            manifest = self.create_job_manifest(job, total_jobs)
+        for manifest in manifests:
             name = manifest["metadata"]["name"]
             job_names.append(name)
             try:
@@ -606,35 +796,17 @@ class BatchJobRunner:
             time.sleep(2)
         logger.info("Batch %s: all jobs finished.", self._batch_tag)
 
-        # 4. Download this batch's results into the campaign root for scoring.
-        #    The campaign prefix is flat/shared across batches, so we identify this
-        #    batch's results by its config names (self.configs == this batch's
-        #    composed configs) and fetch only those <config>/ dirs — the same
-        #    config names the controller scores at campaign_root/<config>/.
-        os.makedirs(campaign_root, exist_ok=True)
-        got = 0
-        for config_data in self.configs:
-            cn = config_data.get("name")
-            if not cn:
-                continue
-            got += storage.download_prefix(
-                bucket_name, f"{campaign_prefix}{cn}", os.path.join(campaign_root, cn))
-        logger.info("Batch %s: downloaded %d result file(s) into %s",
-                    self._batch_tag, got, campaign_root)
-
-        # 4b. Record this batch's <config>/<run>/job -> _jobs/<batch>/job-<idx>
-        #     links so upload-to-share can materialise the per-run `job` symlinks.
-        self._write_job_links(campaign_root)
+        # Clean up this batch's jobs/pods. With asynchronous scheduling other
+        # batches of this campaign are still running, so the selector includes
+        # the batch label as well as the campaign-id.
+        self.cleanup_jobs(campaign=self.campaign, batch=self._batch_tag)
+        self.cleanup_pods(campaign=self.campaign, batch=self._batch_tag)
 
-        # 5. Clean up this batch's jobs/pods (sequential batches share the
-        #    campaign-id label, so only this batch's resources are present).
-        self.cleanup_jobs(campaign=self.campaign)
-        self.cleanup_pods(campaign=self.campaign)
-
-    def _write_job_links(self, campaign_root: str):
+    def _write_job_links(self, campaign_root: str, targets=None):
         """Merge this batch's job-link entries into ``_transient/job_links.yaml``.
 
-        ``<config>/<run>/job`` -> ``../../_jobs/<batch>/job-<idx>``. Accumulated
+        ``<config>/<run>/job`` -> ``../../_jobs/<batch>/job-<idx>`` (or the given
+        *targets*, ``<config>/<run>/job`` -> ``_jobs/`` sub-path). Accumulated
         across batches (the manifest is shared), uploaded by ``finalize_campaign``,
         and turned into real symlinks by the controller's upload-to-share
         compression.
@@ -645,21 +817,27 @@ class BatchJobRunner:
         transient = os.path.join(campaign_root, "_transient")
         os.makedirs(transient, exist_ok=True)
         manifest = os.path.join(transient, JOB_LINKS_MANIFEST)
-        links = {}
-        if os.path.isfile(manifest):
-            with open(manifest, encoding="utf-8") as f:
-                links = yaml.safe_load(f) or {}
-        for job in self._build_jobs():
-            target = f"../../_jobs/{self._job_artifact_path(job.index)}"
-            for item in job.items:
-                links[f"{item.config_name}/{item.run_number}/job"] = target
-        with open(manifest, "w", encoding="utf-8") as f:
-            yaml.safe_dump(links, f, default_flow_style=False, sort_keys=True)
+        with _JOB_LINKS_LOCK:
+            links = {}
+            if os.path.isfile(manifest):
+                with open(manifest, encoding="utf-8") as f:
+                    links = yaml.safe_load(f) or {}
+            if targets is None:
+                targets = {f"{item.config_name}/{item.run_number}/job":
+                           self._job_artifact_path(job.index)
+                           for job in self._build_jobs() for item in job.items}
+            for link, target in targets.items():
+                links[link] = f"../../_jobs/{target}"
+            with open(manifest, "w", encoding="utf-8") as f:
+                yaml.safe_dump(links, f, default_flow_style=False, sort_keys=True)
 
 
 class KubernetesBackend(ExecutionBackend):
     """Run batches as Kubernetes Jobs from inside the controller pod.
 
+    Batches are namespaced (job names, param files, ``_jobs/<batch>``) and clean
+    up only their own jobs, so several may run at once.
+
     Args:
         cluster_config: Reconstructed cluster config (storage + scheduling).
         namespace: Kubernetes namespace for the jobs.
@@ -668,6 +846,8 @@ class KubernetesBackend(ExecutionBackend):
         log_tree: Forward ``-t`` (live scenario tree) to the jobs.
     """
 
+    supports_concurrent_batches = True
+
     def __init__(self, *, cluster_config, namespace="default", kube_context=None,
                  log_tree=False):
         self.cluster_config = cluster_config
@@ -677,9 +857,13 @@ class KubernetesBackend(ExecutionBackend):
         # Captured from run_batch for finalize_campaign (execution.yaml metadata).
         self._execution_params: dict = {}
         self._runs = None
-        # Lazily-built read-only storage client for count_run_artifacts (the
+        # Lazily-built per-campaign run counters for count_run_artifacts (the
         # controller's progress poller); separate from the write path.
-        self._progress_storage = None
+        self._progress: dict[str, in_pod_storage.RunProgressTracker] = {}
+        self._progress_lock = threading.Lock()
+        # The controller's (ControllerState, base_url) control channel, set by
+        # the in-pod controller; warm-pool batches serve their work queue there.
+        self.control = None
 
     def run_batch(self, campaign_data: dict, *, campaign_root: str, batch_tag: str,
                   runs: int, options: RunOptions) -> None:
@@ -701,7 +885,16 @@ class KubernetesBackend(ExecutionBackend):
             kube_context=self.kube_context,
             log_tree=self.log_tree or options.log_tree,
         )
-        runner.run_batch_in_pod(campaign_root)
+        progress = self._progress_tracker(campaign_id)
+        config_names = [c["name"] for c in campaign_data.get("configs", [])]
+        progress.track(config_names, runs)
+        try:
+            runner.run_batch_in_pod(campaign_root, control=self.control)
+        finally:
+            try:
+                progress.retire(config_names)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug("Final run count for %s failed: %s", batch_tag, exc)
 
     def finalize_campaign(self, campaign_root: str) -> None:
         """Publish the canonical campaign to storage so the bucket matches local.
@@ -732,14 +925,37 @@ class KubernetesBackend(ExecutionBackend):
         logger.info("Published canonical campaign (%d file(s), incl. campaign.db / "
                     "_execution / metrics) to %s/%s", n, bucket, prefix)
 
-    # Per-run JUnit report each scenario run uploads on completion; counting these
-    # under the (flat, campaign-wide) prefix gives cumulative finished runs.
-    _RUN_SENTINEL = "/test.xml"
-
-    def count_run_artifacts(self, campaign_id: str) -> int | None:
+    def results_moved(self, campaign_root: str, moves: dict[str, str]) -> None:
+        """Re-key the job links and move the renamed runs in storage as well,
+        so the published campaign (and ``upload-to-share``) match the local one."""
+        with _JOB_LINKS_LOCK:
+            super().results_moved(campaign_root, moves)
+        campaign_id = os.path.basename(os.path.normpath(campaign_root))
         bucket, prefix = in_pod_storage.campaign_storage_location(
             self.cluster_config, campaign_id)
-        if self._progress_storage is None:
-            self._progress_storage = in_pod_storage.storage_client_for(self.cluster_config)
-        keys = self._progress_storage.list_keys(bucket, prefix)
-        return sum(1 for k in keys if k.endswith(self._RUN_SENTINEL))
+        storage = in_pod_storage.storage_client_for(self.cluster_config)
+        for old, new in moves.items():
+            stale = storage.list_keys(bucket, f"{prefix}{old}")
+            if not stale:
+                continue            # not run on this backend
+            storage.upload_dir(os.path.join(campaign_root, new), bucket, f"{prefix}{new}")
+            storage.delete_keys(bucket, stale)
+        logger.info("Moved %d run(s) to their merged config in %s/%s",
+                    len(moves), bucket, prefix)
+
+    def _progress_tracker(self, campaign_id: str) -> "in_pod_storage.RunProgressTracker":
+        with self._progress_lock:
+            tracker = self._progress.get(campaign_id)
+            if tracker is None:
+                bucket, prefix = in_pod_storage.campaign_storage_location(
+                    self.cluster_config, campaign_id)
+                tracker = in_pod_storage.RunProgressTracker(
+                    in_pod_storage.storage_client_for(self.cluster_config), bucket, prefix)
+                self._progress[campaign_id] = tracker
+            return tracker
+
+    def count_run_artifacts(self, campaign_id: str) -> int | None:
+        # Only the configs of batches submitted by this backend are listed (and
+        # only until all their runs reported), so polling stays cheap on large
+        # campaigns; see RunProgressTracker.
+        return self._progress_tracker(campaign_id).count()
@@ -23,9 +23,19 @@ from abc import ABC, abstractmethod
 
 import click
 
+from .streaming import STREAM_PART_SIZE
+
 logger = logging.getLogger(__name__)
 
-__all__ = ["BaseShareProvider", "UploadProgressReader"]
+__all__ = ["BaseShareProvider", "PartialUploadUnsupported", "UploadProgressReader"]
+
+
+class PartialUploadUnsupported(click.UsageError):
+    """The share server cannot append to an upload (no partial ``PUT``).
+
+    Raised by :meth:`BaseShareProvider.upload_stream`; the same campaign can
+    still be uploaded in one piece from a local archive.
+    """
 
 
 class UploadProgressReader:
@@ -177,6 +187,41 @@ class BaseShareProvider(ABC):
             dict[str, str]: Mapping of variable name to value.
         """
 
+    # ------------------------------------------------------------------
+    # Optional streaming upload (compress and upload at the same time)
+    # ------------------------------------------------------------------
+
+    def upload_stream(
+        self,
+        stream,
+        object_name: str,
+        progress_callback=None,
+        part_size: int = STREAM_PART_SIZE,
+    ) -> None:
+        """Upload an archive of unknown size from *stream* as *object_name*.
+
+        *stream* is an
+        :class:`~robovast.execution.cluster_execution.share_providers.streaming.ArchiveStream`
+        filled by the compressor while this runs. Implementations send it in
+        fixed-size parts (see
+        :func:`~robovast.execution.cluster_execution.share_providers.streaming.iter_parts`),
+        retrying a failed part where the backend can resume, and call
+        ``progress_callback(bytes_sent, total_bytes)`` with ``total_bytes`` 0
+        until the last part.
+
+        Raise :class:`NotImplementedError` if the provider needs the archive
+        on disk (default); the controller then compresses first and calls
+        :meth:`upload_archive`.
+        """
+        _ = stream, object_name, progress_callback, part_size
+        raise NotImplementedError(
+            f"Provider '{self.SHARE_TYPE}' does not support streaming uploads."
+        )
+
+    def supports_streaming_upload(self) -> bool:
+        """Whether :meth:`upload_stream` is implemented."""
+        return type(self).upload_stream is not BaseShareProvider.upload_stream
+
     # ------------------------------------------------------------------
     # Pre-flight credential check (used by the controller before a campaign)
     # ------------------------------------------------------------------
@@ -259,6 +304,47 @@ class BaseShareProvider(ABC):
             f"Provider '{self.SHARE_TYPE}' does not support 'results download'."
         )
 
+    # ------------------------------------------------------------------
+    # Optional segmented download interface (``results download --segments``)
+    # ------------------------------------------------------------------
+
+    def archive_info(self, object_name: str) -> tuple[int, str | None]:
+        """Return ``(size_in_bytes, checksum)`` of *object_name* on the share.
+
+        *checksum* is ``"<hashlib name>:<hex digest>"`` (e.g. ``"md5:…"``) or
+        ``None`` when the share does not report one.  Used to pre-size and
+        verify downloads.
+
+        Raise :class:`NotImplementedError` if the provider cannot tell
+        (default).
+        """
+        _ = object_name
+        raise NotImplementedError(
+            f"Provider '{self.SHARE_TYPE}' does not report archive sizes."
+        )
+
+    def read_archive_range(self, object_name: str, start: int, end: int, write) -> None:
+        """Fetch bytes ``[start, end)`` of *object_name*, passing each chunk
+        to *write* in order.
+
+        Called concurrently from several threads by
+        :func:`~robovast.execution.cluster_execution.share_providers.segmented.download_segmented`,
+        so implementations must not share a connection between calls.
+
+        Raise :class:`NotImplementedError` if the provider cannot read ranges
+        (default); downloads then use :meth:`download_archive`.
+        """
+        _ = object_name, start, end, write
+        raise NotImplementedError(
+            f"Provider '{self.SHARE_TYPE}' does not support segmented downloads."
+        )
+
+    def supports_segmented_download(self) -> bool:
+        """Whether :meth:`read_archive_range` and :meth:`archive_info` are implemented."""
+        cls = type(self)
+        return (cls.read_archive_range is not BaseShareProvider.read_archive_range
+                and cls.archive_info is not BaseShareProvider.archive_info)
+
     # ------------------------------------------------------------------
     # Optional remove interface (used by ``results remove-from-share``)
     # ------------------------------------------------------------------
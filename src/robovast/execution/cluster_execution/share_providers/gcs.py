@@ -17,8 +17,10 @@
 
 """Google Cloud Storage share provider for ``cluster upload-to-share``."""
 
+import base64
 import json
 import os
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
@@ -30,6 +32,7 @@ import click
 from robovast.common.execution import is_campaign_dir
 
 from .base import BaseShareProvider, UploadProgressReader
+from .streaming import STREAM_PART_SIZE, iter_parts
 
 __all__ = ["GcsShareProvider"]
 
@@ -230,6 +233,83 @@ class GcsShareProvider(BaseShareProvider):
 
         self._gcs_delete_session(archive_path)
 
+    def upload_stream(
+        self,
+        stream,
+        object_name: str,
+        progress_callback=None,
+        part_size: int = STREAM_PART_SIZE,
+        retries: int = 3,
+    ) -> None:
+        """Upload a streamed archive as fixed-size parts of one resumable session.
+
+        Every part but the last is sent with ``Content-Range: bytes a-b/*``
+        (the size is not known yet); the last one declares the total, which
+        finalizes the object. After a failed part, GCS is asked how much of it
+        it kept and the rest of the part is sent again.
+        """
+        bucket = os.environ["ROBOVAST_GCS_BUCKET"]
+        prefix = os.environ.get("ROBOVAST_GCS_PREFIX", "")
+        remote_name = f"{prefix}{object_name}" if prefix else object_name
+        token = self._access_token_for_verify()
+        session_uri = self._gcs_initiate_resumable(bucket, remote_name, None, token)
+
+        for offset, data, last in iter_parts(stream, part_size):
+            total = offset + len(data) if last else None
+            self._gcs_put_part(session_uri, object_name, data, offset, total, retries)
+            if progress_callback is not None:
+                progress_callback(offset + len(data), total or 0)
+
+    def _gcs_put_part(self, session_uri: str, object_name: str, data: bytes,
+                      offset: int, total: int | None, retries: int) -> None:
+        """Send *data* at *offset* of a resumable session; ``total`` ends it."""
+        end = offset + len(data)
+        size = "*" if total is None else str(total)
+        start = offset
+        for attempt in range(retries + 1):
+            content_range = (f"bytes {start}-{end - 1}/{size}" if start < end
+                             else f"bytes */{size}")
+            req = urllib.request.Request(
+                session_uri,
+                data=data[start - offset:],
+                method="PUT",
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": str(end - start),
+                    "Content-Range": content_range,
+                },
+            )
+            try:
+                with urllib.request.urlopen(req, timeout=600):  # nosec B310 - GCS session URI
+                    return  # 200/201: the object is complete
+            except urllib.error.HTTPError as exc:
+                if exc.code == 308 and total is None \
+                        and self._gcs_committed(exc.headers) >= end:
+                    return  # Resume Incomplete: this part is stored
+                error = f"HTTP {exc.code} {exc.reason}"
+                if exc.code not in (308, 408, 429) and exc.code < 500:
+                    raise click.UsageError(
+                        f"{error} uploading {object_name} to GCS at byte {start}") from exc
+            except (urllib.error.URLError, OSError) as exc:
+                error = str(getattr(exc, "reason", exc))
+            if attempt == retries:
+                raise click.UsageError(
+                    f"Upload to GCS failed for {object_name} at byte {start}: {error}")
+            time.sleep(min(30, 2 ** attempt))
+            committed = self._gcs_query_progress(session_uri, "*" if total is None else total)
+            if committed is None:
+                raise click.UsageError(
+                    f"GCS upload session for {object_name} expired; retry the upload.")
+            if total is not None and committed == total:
+                return
+            start = min(max(committed, offset), end)
+
+    @staticmethod
+    def _gcs_committed(headers) -> int:
+        """Bytes GCS holds according to the ``Range`` header of a 308 response."""
+        range_header = headers.get("Range", "")
+        return int(range_header.split("-")[-1]) + 1 if range_header else 0
+
     # -- resumable-session management --------------------------------------
 
     @staticmethod
@@ -264,24 +344,25 @@ class GcsShareProvider(BaseShareProvider):
             pass
 
     @staticmethod
-    def _gcs_initiate_resumable(bucket: str, remote_name: str, total: int, token: str) -> str:
-        """POST to the GCS resumable-upload initiation endpoint; return the session URI."""
+    def _gcs_initiate_resumable(bucket: str, remote_name: str, total: int | None,
+                                token: str) -> str:
+        """POST to the GCS resumable-upload initiation endpoint; return the session URI.
+
+        *total* is ``None`` for a streamed upload whose size is not known yet.
+        """
         url = (
             f"https://storage.googleapis.com/upload/storage/v1/b/"
             f"{urllib.parse.quote(bucket, safe='')}/o?uploadType=resumable"
         )
         body = json.dumps({"name": remote_name}).encode()
-        req = urllib.request.Request(
-            url,
-            data=body,
-            method="POST",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json; charset=UTF-8",
-                "X-Upload-Content-Type": "application/octet-stream",
-                "X-Upload-Content-Length": str(total),
-            },
-        )
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json; charset=UTF-8",
+            "X-Upload-Content-Type": "application/octet-stream",
+        }
+        if total is not None:
+            headers["X-Upload-Content-Length"] = str(total)
+        req = urllib.request.Request(url, data=body, method="POST", headers=headers)
         try:
             with urllib.request.urlopen(req, timeout=60) as resp:  # nosec B310
                 session_uri = resp.headers.get("Location")
@@ -294,9 +375,10 @@ class GcsShareProvider(BaseShareProvider):
         return session_uri
 
     @staticmethod
-    def _gcs_query_progress(session_uri: str, total: int) -> int | None:
+    def _gcs_query_progress(session_uri: str, total: int | str) -> int | None:
         """Ask GCS how many bytes it holds for a session.
 
+        *total* is ``"*"`` while a streamed upload's size is still unknown.
         Returns the byte offset to resume from (``total`` = already complete), or
         ``None`` if the session has expired (HTTP 404).
         """
@@ -311,10 +393,7 @@ class GcsShareProvider(BaseShareProvider):
                 return total  # 200/201 — already complete
         except urllib.error.HTTPError as exc:
             if exc.code == 308:  # Resume Incomplete
-                range_header = exc.headers.get("Range", "")
-                if range_header:
-                    return int(range_header.split("-")[-1]) + 1
-                return 0
+                return GcsShareProvider._gcs_committed(exc.headers)
             if exc.code == 404:
                 return None  # session expired
             raise click.UsageError(
@@ -400,11 +479,7 @@ class GcsShareProvider(BaseShareProvider):
             resume_offset: Byte offset to resume downloading from.
         """
         bucket = os.environ["ROBOVAST_GCS_BUCKET"]
-        url = (
-            f"https://storage.googleapis.com/"
-            f"{urllib.parse.quote(bucket, safe='')}"
-            f"/{urllib.parse.quote(object_name, safe='/')}"
-        )
+        url = self._object_url(object_name)
 
         chunk_size = 256 * 1024  # 256 KiB
         received = resume_offset
@@ -445,6 +520,48 @@ class GcsShareProvider(BaseShareProvider):
                 f"Failed to download '{object_name}': {exc.reason}"
             ) from exc
 
+    @staticmethod
+    def _object_url(object_name: str) -> str:
+        bucket = os.environ["ROBOVAST_GCS_BUCKET"]
+        return (
+            f"https://storage.googleapis.com/"
+            f"{urllib.parse.quote(bucket, safe='')}"
+            f"/{urllib.parse.quote(object_name, safe='/')}"
+        )
+
+    def archive_info(self, object_name: str) -> tuple[int, str | None]:
+        """Size and MD5 (from ``x-goog-hash``) of *object_name*."""
+        req = urllib.request.Request(self._object_url(object_name), method="HEAD")
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:  # nosec B310 - https GCS endpoint
+                size = int(resp.headers.get("Content-Length") or -1)
+                goog_hash = resp.headers.get("x-goog-hash", "")
+        except urllib.error.HTTPError as exc:
+            raise click.UsageError(
+                f"Cannot stat '{object_name}' in GCS: HTTP {exc.code} {exc.reason}"
+            ) from exc
+        except urllib.error.URLError as exc:
+            raise click.UsageError(f"Cannot stat '{object_name}': {exc.reason}") from exc
+        for entry in goog_hash.split(","):
+            algorithm, _, value = entry.strip().partition("=")
+            if algorithm == "md5":
+                return size, f"md5:{base64.b64decode(value).hex()}"
+        # Composite objects only carry a crc32c, which hashlib cannot check.
+        return size, None
+
+    def read_archive_range(self, object_name: str, start: int, end: int, write) -> None:
+        """Fetch bytes ``[start, end)`` of *object_name* with a ``Range`` request."""
+        req = urllib.request.Request(self._object_url(object_name),
+                                     headers={"Range": f"bytes={start}-{end - 1}"})
+        with urllib.request.urlopen(req, timeout=60) as resp:  # nosec B310 - https GCS endpoint
+            if resp.status != 206:
+                raise click.ClickException(f"GCS ignored the range request for '{object_name}'")
+            while True:
+                chunk = resp.read(256 * 1024)
+                if not chunk:
+                    break
+                write(chunk)
+
     # ------------------------------------------------------------------
     # Remove interface (authenticated, requires ROBOVAST_GCS_KEY_FILE)
     # ------------------------------------------------------------------
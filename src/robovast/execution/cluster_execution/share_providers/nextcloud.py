@@ -31,6 +31,7 @@ import requests
 from robovast.common.execution import is_campaign_dir
 
 from .base import BaseShareProvider, UploadProgressReader
+from .segmented import checksum_from_headers, read_http_range
 
 __all__ = ["NextcloudShareProvider"]
 
@@ -268,6 +269,27 @@ class NextcloudShareProvider(BaseShareProvider):
                         received += len(chunk)
                         if progress_callback and total:
                             progress_callback(received, total)
+    def archive_info(self, object_name: str) -> tuple[int, str | None]:
+        """Size (``HEAD`` ``Content-Length``) and ``OC-Checksum`` of *object_name*."""
+        webdav_url, _ = self._parse_share_url()
+        file_url = webdav_url + urllib.parse.quote(object_name, safe="")
+        try:
+            with self._session() as session:
+                resp = session.head(file_url, timeout=30, allow_redirects=True)
+                resp.raise_for_status()
+        except requests.RequestException as exc:
+            raise click.UsageError(
+                f"Cannot stat '{object_name}' on Nextcloud share: {exc}"
+            ) from exc
+        return int(resp.headers.get("Content-Length", -1)), checksum_from_headers(resp.headers)
+
+    def read_archive_range(self, object_name: str, start: int, end: int, write) -> None:
+        """Fetch bytes ``[start, end)`` of *object_name* with a ``Range`` request."""
+        webdav_url, _ = self._parse_share_url()
+        file_url = webdav_url + urllib.parse.quote(object_name, safe="")
+        with self._session() as session:
+            read_http_range(session, file_url, start, end, write)
+
     def remove_archive(self, object_name: str) -> None:
         """Delete *object_name* from the Nextcloud share via WebDAV ``DELETE``.
 
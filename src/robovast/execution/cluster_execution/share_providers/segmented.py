@@ -0,0 +1,251 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Segmented, resumable archive downloads from a share.
+
+A single TCP stream over a high-latency link stays far below the available
+bandwidth. :func:`download_segmented` splits an archive into fixed-size
+segments and fetches several at a time through the provider's
+:meth:`~.base.BaseShareProvider.read_archive_range` (HTTP range requests,
+parallel SFTP reads, ...), writing each at its offset in a pre-sized file.
+Finished segments are recorded in a sidecar ``<dest>.state.json``, so an
+interrupted download continues with the missing segments. At the end the
+size and, where the share reports one, the checksum are verified
+(:func:`verify_archive`).
+"""
+
+import base64
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import click
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["SEGMENT_SIZE", "STATE_SUFFIX", "checksum_from_headers", "download_segmented",
+           "read_http_range", "verify_archive"]
+
+#: Bytes fetched per range request.
+SEGMENT_SIZE = 64 * 1024 * 1024
+
+#: Suffix of the sidecar file recording finished segments.
+STATE_SUFFIX = ".state.json"
+
+_HASH_CHUNK = 8 * 1024 * 1024
+
+
+def _load_state(state_path: str) -> dict:
+    try:
+        with open(state_path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state_path: str, state: dict) -> None:
+    tmp = state_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(state, fh)
+    os.replace(tmp, state_path)
+
+
+def checksum_from_headers(headers) -> Optional[str]:
+    """MD5 or SHA-1 checksum from HTTP response headers, if the server sends one.
+
+    Understands ``OC-Checksum: MD5:<hex>`` (Nextcloud/ownCloud, possibly
+    several space-separated entries) and ``Digest: md5=<base64>`` (RFC 3230).
+    """
+    for entry in (headers.get("OC-Checksum") or "").split():
+        algorithm, _, value = entry.partition(":")
+        if algorithm.lower() in ("md5", "sha1") and value:
+            return f"{algorithm.lower()}:{value.lower()}"
+    for entry in (headers.get("Digest") or "").split(","):
+        algorithm, _, value = entry.strip().partition("=")
+        if algorithm.lower() in ("md5", "sha"):
+            try:
+                digest = base64.b64decode(value).hex()
+            except ValueError:
+                continue
+            return f"{'md5' if algorithm.lower() == 'md5' else 'sha1'}:{digest}"
+    return None
+
+
+def read_http_range(session, url: str, start: int, end: int, write) -> None:
+    """``GET`` bytes ``[start, end)`` of *url* with a ``Range`` header.
+
+    Raises:
+        click.ClickException: If the server ignores the range.
+    """
+    with session.get(url, stream=True, timeout=60,
+                     headers={"Range": f"bytes={start}-{end - 1}"}) as resp:
+        resp.raise_for_status()
+        if resp.status_code != 206:
+            raise click.ClickException(
+                f"Server does not support range requests for {url}; "
+                "download without --segments.")
+        for chunk in resp.iter_content(chunk_size=256 * 1024):
+            write(chunk)
+
+
+def verify_archive(path: str, size: int, checksum: Optional[str]) -> None:
+    """Check the size and checksum (``"<hashlib name>:<hex>"``) of a download.
+
+    A negative *size* (the share did not report one) skips the size check.
+
+    Raises:
+        click.ClickException: On a mismatch; the file is removed so the next
+            attempt starts over.
+    """
+    actual_size = os.path.getsize(path)
+    problem = None
+    if 0 <= size != actual_size:
+        problem = f"size is {actual_size} bytes, the share reports {size}"
+    elif checksum:
+        algorithm, _, expected = checksum.partition(":")
+        try:
+            digest = hashlib.new(algorithm)
+        except ValueError:
+            logger.warning("Cannot verify unsupported checksum type '%s'", algorithm)
+            return
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(_HASH_CHUNK), b""):
+                digest.update(chunk)
+        if digest.hexdigest() != expected.lower():
+            problem = f"{algorithm} is {digest.hexdigest()}, the share reports {expected}"
+    if problem:
+        os.unlink(path)
+        raise click.ClickException(f"Downloaded archive {os.path.basename(path)} is corrupt: {problem}")
+
+
+def download_segmented(
+    provider,
+    object_name: str,
+    dest_path: str,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    connections: int = 4,
+    segment_size: int = SEGMENT_SIZE,
+    retries: int = 3,
+) -> None:
+    """Download *object_name* to *dest_path* over *connections* parallel streams.
+
+    Resumes from ``dest_path + STATE_SUFFIX`` if it describes the same remote
+    archive (name, size, checksum, segment size); otherwise starts over. A
+    failed segment is retried *retries* times before the download fails; its
+    finished segments are kept for the next attempt. If the share does not
+    report the archive's size, it is fetched with ``provider.download_archive``.
+
+    Args:
+        provider: A share provider implementing ``archive_info``,
+            ``read_archive_range`` and ``download_archive``.
+        object_name: The archive on the share.
+        dest_path: Local file to write.
+        progress_callback: Optional ``(bytes_received, total_bytes)`` callable.
+        connections: Segments fetched concurrently.
+        segment_size: Bytes per segment.
+        retries: Attempts per segment after the first.
+
+    Raises:
+        click.ClickException: If the download fails or does not verify.
+    """
+    size, checksum = provider.archive_info(object_name)
+    state_path = dest_path + STATE_SUFFIX
+    if size < 0:
+        # Nothing to split into segments: fetch it in one stream, as for
+        # providers without range support.
+        logger.warning("The share does not report the size of '%s'; downloading it "
+                       "over one connection.", object_name)
+        for stale in (state_path, dest_path):
+            if os.path.exists(stale):
+                os.unlink(stale)          # a segmented .part is sparse: not resumable
+        provider.download_archive(object_name, dest_path, progress_callback)
+        verify_archive(dest_path, size, checksum)
+        return
+    state = _load_state(state_path)
+    expected = {"object": object_name, "size": size, "checksum": checksum, "segment_size": segment_size}
+    if any(state.get(k) != v for k, v in expected.items()) or not os.path.exists(dest_path) \
+            or os.path.getsize(dest_path) != size:
+        state = {**expected, "done": []}
+        with open(dest_path, "wb") as fh:
+            fh.truncate(size)
+        _save_state(state_path, state)
+
+    n_segments = -(-size // segment_size)
+    done = set(state["done"])
+    lock = threading.Lock()
+    received = [sum(min(segment_size, size - i * segment_size) for i in done)]
+
+    def _progress(n: int) -> None:
+        with lock:
+            received[0] += n
+            if progress_callback is not None and size:
+                progress_callback(received[0], size)
+
+    fd = os.open(dest_path, os.O_WRONLY)
+
+    def _write(pos: list, chunk: bytes) -> None:
+        os.pwrite(fd, chunk, pos[0])
+        pos[0] += len(chunk)
+        _progress(len(chunk))
+
+    def _fetch(index: int) -> None:
+        start = index * segment_size
+        end = min(size, start + segment_size)
+        for attempt in range(retries + 1):
+            pos = [start]
+            try:
+                provider.read_archive_range(object_name, start, end,
+                                            functools.partial(_write, pos))
+                if pos[0] != end:
+                    raise click.ClickException(
+                        f"Short read of '{object_name}' at byte {start}: "
+                        f"got {pos[0] - start} of {end - start} bytes")
+                break
+            except Exception as exc:  # pylint: disable=broad-except
+                _progress(start - pos[0])
+                if attempt == retries:
+                    raise
+                logger.warning("Segment %d of '%s' failed (%s); retrying", index, object_name, exc)
+                time.sleep(min(30, 2 ** attempt))
+        with lock:
+            state["done"].append(index)
+            _save_state(state_path, state)
+
+    try:
+        if progress_callback is not None and size:
+            progress_callback(received[0], size)
+        with ThreadPoolExecutor(max_workers=max(1, connections),
+                                thread_name_prefix="robovast-download") as pool:
+            list(pool.map(_fetch, [i for i in range(n_segments) if i not in done]))
+    except click.ClickException:
+        raise
+    except Exception as exc:
+        raise click.ClickException(
+            f"Download of '{object_name}' interrupted ({exc}); run the command again to resume."
+        ) from exc
+    finally:
+        os.close(fd)
+
+    try:
+        verify_archive(dest_path, size, checksum)
+    finally:
+        os.unlink(state_path)
@@ -290,6 +290,34 @@ class SftpShareProvider(BaseShareProvider):
             sftp.close()
             ssh.close()
 
+    def archive_info(self, object_name: str) -> tuple[int, str | None]:
+        """Size of *object_name* (SFTP reports no checksum)."""
+        remote_dir = os.environ["ROBOVAST_SFTP_REMOTE_DIR"]
+        ssh, sftp = self._connect()
+        try:
+            return sftp.stat(f"{remote_dir.rstrip('/')}/{object_name}").st_size or 0, None
+        finally:
+            sftp.close()
+            ssh.close()
+
+    def read_archive_range(self, object_name: str, start: int, end: int, write) -> None:
+        """Fetch bytes ``[start, end)`` of *object_name* over its own connection.
+
+        ``readv`` pipelines the SFTP read requests of each 1 MiB block, so a
+        segment is not bound by one request's round trip.
+        """
+        remote_dir = os.environ["ROBOVAST_SFTP_REMOTE_DIR"]
+        block = 1024 * 1024
+        ssh, sftp = self._connect()
+        try:
+            with sftp.open(f"{remote_dir.rstrip('/')}/{object_name}", "rb") as remote_fh:
+                for offset in range(start, end, block):
+                    for data in remote_fh.readv([(offset, min(block, end - offset))]):
+                        write(data)
+        finally:
+            sftp.close()
+            ssh.close()
+
     def remove_archive(self, object_name: str) -> None:
         """Remove *object_name* from the remote directory.
 
@@ -0,0 +1,139 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Streaming archive uploads: compress and upload at the same time.
+
+Instead of writing the whole ``<campaign>.tar.gz`` to the pod's disk and
+uploading it afterwards, the cluster config's tar/gzip producer writes into an
+:class:`ArchiveStream` — a bounded in-memory buffer — while the share provider
+reads fixed-size parts from it (:func:`iter_parts`) and sends each as one
+request of a resumable upload
+(:meth:`~.base.BaseShareProvider.upload_stream`). The producer blocks while the
+buffer is full, so memory stays at a few parts and no local archive is needed.
+"""
+
+import threading
+from collections import deque
+from typing import Iterator
+
+__all__ = ["STREAM_BUFFER_PARTS", "STREAM_PART_SIZE", "ArchiveStream", "iter_parts"]
+
+#: Bytes per uploaded part; a multiple of 256 KiB as GCS resumable uploads require.
+STREAM_PART_SIZE = 32 * 1024 * 1024
+
+#: Parts the producer may run ahead of the upload.
+STREAM_BUFFER_PARTS = 2
+
+
+class ArchiveStream:
+    """Bounded byte pipe from an archive producer thread to an uploader.
+
+    The producer calls :meth:`write` and finally :meth:`close` (passing the
+    exception if it failed); the uploader calls :meth:`read`. :meth:`write`
+    blocks while more than *max_bytes* are buffered, and raises
+    :class:`BrokenPipeError` once the uploader has given up (:meth:`cancel`),
+    so a failed upload stops the compression as well.
+    """
+
+    def __init__(self, max_bytes: int = STREAM_BUFFER_PARTS * STREAM_PART_SIZE):
+        self._max_bytes = max_bytes
+        self._chunks = deque()
+        self._size = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._error = None
+        self._cancelled = False
+        self._wanted = 0
+        #: Total bytes written by the producer so far.
+        self.bytes_written = 0
+
+    # -- producer side -------------------------------------------------------
+
+    def write(self, data) -> int:
+        if not data:
+            return 0
+        data = bytes(data)
+        with self._cond:
+            while self._size >= max(self._max_bytes, self._wanted) and not self._cancelled:
+                self._cond.wait()
+            if self._cancelled:
+                raise BrokenPipeError("archive upload was cancelled")
+            self._chunks.append(data)
+            self._size += len(data)
+            self.bytes_written += len(data)
+            self._cond.notify_all()
+        return len(data)
+
+    def close(self, error: BaseException | None = None) -> None:
+        """Mark the end of the archive, or its failure with *error*."""
+        with self._cond:
+            self._closed = True
+            self._error = error
+            self._cond.notify_all()
+
+    # -- consumer side -------------------------------------------------------
+
+    def read(self, n: int) -> bytes:
+        """Return the next *n* bytes; fewer only at the end of the archive.
+
+        Raises the producer's exception if compression failed.
+        """
+        with self._cond:
+            self._wanted = n
+            self._cond.notify_all()
+            while self._size < n and not self._closed:
+                self._cond.wait()
+            self._wanted = 0
+            if self._error is not None:
+                raise self._error
+            out = bytearray()
+            while self._chunks and len(out) < n:
+                chunk = self._chunks.popleft()
+                take = n - len(out)
+                if len(chunk) > take:
+                    self._chunks.appendleft(chunk[take:])
+                    chunk = chunk[:take]
+                out += chunk
+            self._size -= len(out)
+            self._cond.notify_all()
+            return bytes(out)
+
+    def cancel(self) -> None:
+        """Give up reading; pending and future writes raise :class:`BrokenPipeError`."""
+        with self._cond:
+            self._cancelled = True
+            self._chunks.clear()
+            self._size = 0
+            self._cond.notify_all()
+
+
+def iter_parts(stream: ArchiveStream, part_size: int = STREAM_PART_SIZE
+               ) -> Iterator[tuple[int, bytes, bool]]:
+    """Yield ``(offset, data, is_last)`` for consecutive parts of *stream*.
+
+    Every part but the last is exactly *part_size* bytes. The last part is
+    recognised by reading one part ahead, so resumable protocols can declare
+    the total size with it. An empty archive yields one empty last part.
+    """
+    offset = 0
+    part = stream.read(part_size)
+    while True:
+        following = stream.read(part_size) if len(part) == part_size else b""
+        yield offset, part, not following
+        if not following:
+            return
+        offset += len(part)
+        part = following
@@ -20,6 +20,7 @@
 import base64
 import os
 import re
+import time
 import urllib.parse
 
 import click
@@ -27,10 +28,17 @@ import requests
 
 from robovast.common.execution import is_campaign_dir
 
-from .base import BaseShareProvider, UploadProgressReader
+from .base import (BaseShareProvider, PartialUploadUnsupported,
+                   UploadProgressReader)
+from .segmented import checksum_from_headers, read_http_range
+from .streaming import STREAM_PART_SIZE, iter_parts
 
 __all__ = ["WebDavShareProvider"]
 
+# Responses to a ``PUT`` with ``Content-Range`` that mean the server refuses
+# partial PUT rather than this part (Apache mod_dav answers 400, others 405/501).
+_CONTENT_RANGE_REJECTED = (400, 405, 416, 501)
+
 
 class WebDavShareProvider(BaseShareProvider):
     """Upload/download campaign archives to a WebDAV server with user/password login.
@@ -127,6 +135,71 @@ class WebDavShareProvider(BaseShareProvider):
                 f"WebDAV PUT of '{object_name}' returned HTTP {resp.status_code}: "
                 f"{resp.text[:200]}")
 
+    def upload_stream(
+        self,
+        stream,
+        object_name: str,
+        progress_callback=None,
+        part_size: int = STREAM_PART_SIZE,
+        retries: int = 3,
+    ) -> None:
+        """Upload a streamed archive in fixed-size parts.
+
+        The first part is a plain ``PUT``; each further part is appended with
+        ``Content-Range: bytes <start>-<end>/*`` — the partial ``PUT`` that
+        :meth:`upload_archive` resumes with. A failed part is retried from the
+        size the server reports for the file. The final size is checked with a
+        ``HEAD``, which catches servers that ignore ``Content-Range``.
+        """
+        url = self._file_url(object_name)
+        total = 0
+        with self._session() as session:
+            for offset, data, last in iter_parts(stream, part_size):
+                self._put_part(session, url, object_name, data, offset, retries)
+                total = offset + len(data)
+                if progress_callback is not None:
+                    progress_callback(total, total if last else 0)
+
+        remote_size = self._remote_size(url)
+        if remote_size != total:
+            raise PartialUploadUnsupported(
+                f"WebDAV server stored {remote_size} of {total} bytes of '{object_name}'; "
+                "it may not support partial PUT (Content-Range) for streamed uploads. "
+                "Set ROBOVAST_STREAM_UPLOAD=0 to always upload from a local archive.")
+
+    def _put_part(self, session, url: str, object_name: str, data: bytes,
+                  offset: int, retries: int) -> None:
+        """``PUT`` *data* at *offset* of *url*, resuming from the remote size on errors."""
+        end = offset + len(data)
+        start = offset
+        for attempt in range(retries + 1):
+            headers = {"Content-Length": str(end - start)}
+            if start > 0:
+                headers["Content-Range"] = f"bytes {start}-{end - 1}/*"
+            try:
+                resp = session.put(url, data=data[start - offset:], headers=headers,
+                                   timeout=(30, None))
+                if resp.status_code in (200, 201, 204):
+                    return
+                error = f"HTTP {resp.status_code}: {resp.text[:200]}"
+                if start > 0 and resp.status_code in _CONTENT_RANGE_REJECTED:
+                    raise PartialUploadUnsupported(
+                        f"WebDAV PUT of '{object_name}' with Content-Range returned {error}; "
+                        "the server does not support partial PUT.")
+                if resp.status_code < 500 and resp.status_code not in (408, 429):
+                    raise click.UsageError(
+                        f"WebDAV PUT of '{object_name}' at byte {start} returned {error}")
+            except requests.RequestException as exc:
+                error = str(exc)
+            if attempt == retries:
+                raise click.UsageError(
+                    f"Upload to WebDAV failed for '{object_name}' at byte {start}: {error}")
+            time.sleep(min(30, 2 ** attempt))
+            stored = self._remote_size(url)
+            start = stored if offset < stored <= end else offset
+            if start == end:
+                return
+
     def _remote_size(self, url: str) -> int:
         """Return the size of the remote file in bytes, or 0 if absent/unknown."""
         try:
@@ -390,6 +463,23 @@ class WebDavShareProvider(BaseShareProvider):
                 "Check network connectivity and the ROBOVAST_WEBDAV_URL setting."
             ) from exc
 
+    def archive_info(self, object_name: str) -> tuple[int, str | None]:
+        """Size (``HEAD`` ``Content-Length``) and checksum header of *object_name*."""
+        try:
+            with self._session() as session:
+                resp = session.head(self._file_url(object_name), timeout=30, allow_redirects=True)
+                resp.raise_for_status()
+        except requests.RequestException as exc:
+            raise click.UsageError(
+                f"Cannot stat '{object_name}' on WebDAV server: {exc}"
+            ) from exc
+        return int(resp.headers.get("Content-Length", -1)), checksum_from_headers(resp.headers)
+
+    def read_archive_range(self, object_name: str, start: int, end: int, write) -> None:
+        """Fetch bytes ``[start, end)`` of *object_name* with a ``Range`` request."""
+        with self._session() as session:
+            read_http_range(session, self._file_url(object_name), start, end, write)
+
     def remove_archive(self, object_name: str) -> None:
         """Remove *object_name* from the WebDAV share via HTTP DELETE.
 
@@ -32,6 +32,9 @@ daemon thread beside the synchronous controller loop:
 * ``POST /command`` — an extensible RPC: dispatch ``{name, args}`` through the
   :data:`HANDLERS` registry. Ships one handler (``stop``); register more later.
 * ``GET  /healthz`` — liveness.
+* ``POST /queue/{name}/claim`` and ``POST /queue/{name}/complete`` — the
+  warm-pool work queues (:mod:`robovast.execution.work_queue`) a backend
+  registers per batch; worker pods pull packed jobs from them.
 
 FastAPI auto-emits an OpenAPI schema (``/docs``), so the same contract serves the
 CLI now and a web UI later (reached via ``kubectl port-forward`` now, a Service /
@@ -42,6 +45,7 @@ Ingress later — no code change).
 import cleanly anywhere; ``pydantic`` is a core dependency.
 """
 
+import dataclasses
 import logging
 import threading
 import time
@@ -114,6 +118,22 @@ class CommandResult(BaseModel):
     error: Optional[str] = None
 
 
+class ClaimRequest(BaseModel):
+    worker: str
+
+
+class ClaimResponse(BaseModel):
+    """A leased unit (``QueueUnit`` fields), or none; ``done`` ends the worker."""
+    unit: Optional[dict] = None
+    done: bool = False
+
+
+class CompleteRequest(BaseModel):
+    worker: str
+    unit: str
+    timings: list[dict] = Field(default_factory=list)
+
+
 # -- shared state -----------------------------------------------------------
 
 class ControllerState:
@@ -134,6 +154,8 @@ class ControllerState:
         # upload. A `stop` request abandons the wait and terminates.
         self._retrigger_event = threading.Event()
         self._retrigger_overrides: dict = {}
+        # Warm-pool work queues by name (one per running batch).
+        self._queues: dict[str, Any] = {}
 
     def snapshot(self) -> Status:
         with self._lock:
@@ -191,6 +213,21 @@ class ControllerState:
         return "retrigger", overrides
 
 
+    # -- warm-pool work queues ---------------------------------------------
+
+    def register_queue(self, name: str, queue) -> None:
+        with self._lock:
+            self._queues[name] = queue
+
+    def unregister_queue(self, name: str) -> None:
+        with self._lock:
+            self._queues.pop(name, None)
+
+    def queue(self, name: str):
+        with self._lock:
+            return self._queues.get(name)
+
+
 # -- command registry -------------------------------------------------------
 
 # name -> handler(state, **args) -> result. Extend by decorating new handlers.
@@ -264,6 +301,23 @@ def build_app(state: ControllerState):
     def healthz() -> dict:
         return {"ok": True}
 
+    def _queue(name: str):
+        queue = state.queue(name)
+        if queue is None:
+            raise HTTPException(status_code=404, detail=f"no work queue '{name}'")
+        return queue
+
+    @app.post("/queue/{name}/claim", response_model=ClaimResponse)
+    def claim(name: str, request: ClaimRequest) -> ClaimResponse:
+        unit, done = _queue(name).claim(request.worker)
+        return ClaimResponse(unit=None if unit is None else dataclasses.asdict(unit),
+                             done=done)
+
+    @app.post("/queue/{name}/complete")
+    def complete(name: str, request: CompleteRequest) -> dict:
+        return {"accepted": _queue(name).complete(request.worker, request.unit,
+                                                  request.timings)}
+
     return app
 
 
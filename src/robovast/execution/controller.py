@@ -24,28 +24,43 @@ uniform layout (``<results>/<CAMPAIGN_ID>/<config>/<run>/``) plus a live
 * **batch mode** (no ``search:`` block) — a strategy-less campaign with exactly
   one *batch* of the enumerated configurations.
 * **search mode** — the strategy proposes batches; each batch is composed,
-  executed, scored (Extractor) and fed back via ``tell``.
+  executed, scored (Extractor) and fed back via ``tell``. With
+  ``search.scheduling: async`` the loop is steady-state instead: up to
+  ``max_in_flight`` parameter sets execute concurrently and each freed slot is
+  refilled as soon as its result is scored, so ask, execution and evaluation
+  overlap.
 
 A campaign runs one or more *batches*; the batch is a logical grouping recorded
 in the store, not a directory level, so batch and search share the flat layout.
 """
 
+import json
 import logging
 import os
+import shutil
 import sys
 import tempfile
 import threading
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from robovast.common.campaign_data import aggregate_run_status, list_run_dirs
 from robovast.common.logging_config import (add_campaign_log_handler,
                                             remove_campaign_log_handler)
 from robovast.common.store import STORE_FILENAME, CampaignStore
+from robovast.search.memo import EvaluationMemo, MemoEntry, vast_content_hash
+from robovast.search.racing import Racing
+from robovast.search.types import Evaluation, ParamSet
 
 from .backends import DockerBackend, ExecutionBackend, RunOptions
 from .notify import Notifier
+from .packer import (DurationModel, build_jobs, makespan_report,
+                     write_makespan_report)
 
 # Use the qualified name rather than __name__: this module is the in-pod cluster
 # entrypoint (``python -m robovast.execution.controller``), where __name__ is
@@ -68,6 +83,29 @@ def campaign_id_for(campaign_config) -> str:
     return f"{name}-{datetime.now().strftime('%Y-%m-%d-%H%M%S')}"
 
 
+@dataclass
+class _Unit:
+    """How one proposed parameter set is evaluated within a batch.
+
+    ``cached`` is set when the memo already holds enough repetitions (nothing
+    runs). Otherwise ``run_ps`` is composed and executed with ``run_reps``
+    repetitions; for a top-up (``top_up``) those are only the missing ones and
+    are merged into the existing ``config_name`` result dir.
+    """
+    ps: ParamSet
+    reps: int
+    cached: Optional[MemoEntry] = None
+    run_ps: Optional[ParamSet] = None
+    run_reps: int = 0
+    config_name: str = ""
+    top_up: bool = False
+
+    @property
+    def have_reps(self) -> int:
+        """Repetitions the unit's result dir holds once it is executed."""
+        return self.cached.n_reps if self.cached is not None else self.reps
+
+
 class CampaignController:
     """Drives a campaign (batch or search) to completion over one backend."""
 
@@ -75,7 +113,9 @@ class CampaignController:
                  options: RunOptions, store: CampaignStore, campaign_config_dump: dict,
                  vast_dir: str, strategy=None, evaluator=None, compose=None,
                  per_batch: int = 1, postprocessing=None, batch_campaign_data=None,
-                 stop_conditions=None, state=None, notifier=None):
+                 stop_conditions=None, state=None, notifier=None,
+                 scheduling: str = "generational", max_in_flight: int | None = None,
+                 vast_hash: str | None = None, memoize: str = "off", racing=None):
         self.campaign_id = campaign_id
         self.campaign_root = os.path.join(results_dir, campaign_id)
         self.runs = runs
@@ -88,6 +128,20 @@ class CampaignController:
         self.evaluator = evaluator
         self.compose = compose
         self.per_batch = per_batch
+        # 'generational' (lock-step ask/execute/tell batches) or 'async'
+        # (steady-state, up to max_in_flight parameter sets executing at once).
+        self.scheduling = scheduling
+        self.max_in_flight = max_in_flight
+        # Content hash of the .vast (recorded on the campaign row so later
+        # searches can reuse this one's evaluations) and the reuse scope:
+        # 'off', 'campaign' or 'all' (see robovast.search.memo).
+        self.vast_hash = vast_hash
+        self.memo = (EvaluationMemo(vast_hash, self.campaign_root, scope=memoize)
+                     if memoize != "off" and vast_hash is not None else None)
+        # Adaptive replicate allocation (search.racing); None runs every set
+        # with its full repetition count up front.
+        self.racing = Racing(racing, default_max=runs) if racing is not None else None
+        self._default_reps = self.racing.initial_reps if self.racing else runs
         self.batch_campaign_data = batch_campaign_data
         self.mode = "search" if strategy is not None else "batch"
         self.postprocessing = postprocessing or []
@@ -108,6 +162,12 @@ class CampaignController:
         self._batch_active = threading.Event()
         self._batch_baseline = 0
         self._batch_total = 0
+        # Per-run duration predictions for ``execution.job_duration`` packing;
+        # built on first use from earlier campaigns, then fed every batch.
+        self._durations: DurationModel | None = None
+        self._durations_lock = threading.Lock()
+        # Parameter sets an interrupted earlier run left in flight (async search).
+        self._resumed: list[ParamSet] = []
 
     # -- lifecycle ----------------------------------------------------------
 
@@ -130,9 +190,12 @@ class CampaignController:
         # downloaded from the container that produced it. config_dir is the
         # in-campaign "_config" copy of the .vast: the base against which this
         # campaign's evaluation.visualization notebooks resolve in the GUI.
+        if self.strategy is not None:
+            self._restore_strategy_state()
+            self._take_inflight()
         campaign_id = self.store.create_campaign(
             self.campaign_id, self.campaign_config_dump, mode=self.mode,
-            config_dir="_config")
+            config_dir="_config", vast_hash=self.vast_hash)
         if self.state is not None:
             self.state.update(mode=self.mode, campaign_id=self.campaign_id)
             self.state.set_phase("running")
@@ -154,6 +217,10 @@ class CampaignController:
         finally:
             self._stop_progress_poller()
             self.notifier.stop_heartbeat()
+            if self.postprocessing:
+                from robovast.results_processing.rosbags_worker import \
+                    shutdown_warm_workers
+                shutdown_warm_workers()
             remove_campaign_log_handler(log_handler)
 
     # -- run-level progress poller ------------------------------------------
@@ -236,9 +303,7 @@ class CampaignController:
             self.state.update(batch=0)
         self._begin_batch_progress(len(configs) * self.runs)
         try:
-            self.backend.run_batch(
-                self.batch_campaign_data, campaign_root=self.campaign_root,
-                batch_tag="batch-0", runs=self.runs, options=self.options)
+            self._dispatch(self.batch_campaign_data, "batch-0", self.runs)
         finally:
             self._end_batch_progress()
 
@@ -262,12 +327,13 @@ class CampaignController:
     # -- search mode --------------------------------------------------------
 
     def _run_search(self, campaign_id: int):
-        from robovast.search.stopping import StopResult, StopSnapshot
         stop = self.stop_conditions
-        obj_name = self.strategy.single_objective.name
         if not stop.has_budget:
             logger.warning("No 'budget' cap configured — this search is bounded "
                            "only by its 'stopping' criteria; it may run a long time.")
+        if self.scheduling == "async":
+            return self._run_search_async(campaign_id)
+        obj_name = self.strategy.single_objective.name
         batch_idx = 0
         start = time.monotonic()
         best_objective = None          # best-so-far, in raw objective units
@@ -279,36 +345,90 @@ class CampaignController:
                 self.state.update(batch=batch_idx)
             logger.info("\n%s\n🔁  Batch %d  —  %d parameter set(s)\n%s",
                         _BAR, batch_idx, len(param_sets), _BAR)
-            evaluations = self._run_search_batch(param_sets, batch_idx, batch_id)
+            evaluations = self._run_search_batch(param_sets, batch_idx, batch_id,
+                                                 incumbent=best_objective)
             self.strategy.tell(evaluations)
+            self._save_strategy_state(campaign_id)
             batch_idx += 1
             best_objective = self._update_best(best_objective, evaluations, obj_name)
-
-            snap = StopSnapshot(batch=batch_idx,
-                                elapsed=time.monotonic() - start,
-                                best_objective=best_objective,
-                                metrics=self.strategy.report().extra if stop.needs_metrics else {})
-            progress = stop.progress(snap)
-            # Live progress toward every budget/stopping criterion.
-            logger.info("📊  %s", " | ".join(
-                f"{p.label} {self._fmt(p.current)}/{self._fmt(p.limit)}" for p in progress))
-            if self.state is not None:
-                self._history.append({"idx": batch_idx - 1, "n_units": len(evaluations)})
-                self.state.update(batches_done=batch_idx, best_objective=best_objective,
-                                  budget=[self._budget_item(p) for p in progress],
-                                  batch_history=list(self._history))
-            self.notifier.batch_finished(batch_idx - 1, len(evaluations))
-            result = stop.should_stop(snap)
-            if not result and self.state is not None and self.state.stop_requested:
-                result = StopResult(kind="external",
-                                    reason="stop requested via control API")
+            result = self._end_of_batch(batch_idx, len(evaluations), best_objective, start)
             if result:
-                if self.state is not None:
-                    self.state.set_phase("finishing")
-                    self.state.update(stop={"kind": result.kind, "reason": result.reason})
-                logger.info("\n%s\n⏹  Stopping — %s\n%s", _BAR, result.reason, _BAR)
                 break
+        return self._finish_search(campaign_id, result, batch_idx, start)
+
+    def _end_of_batch(self, batch_idx, n_units, best_objective, start):
+        """Progress line, control-channel update and stop check after a batch.
+
+        ``batch_idx`` is the number of batches completed so far. Returns the
+        :class:`~robovast.search.stopping.StopResult` that ends the search, or
+        ``None`` to continue. Must be called once per batch, in order.
+        """
+        from robovast.search.stopping import StopResult, StopSnapshot
+        stop = self.stop_conditions
+        snap = StopSnapshot(batch=batch_idx,
+                            elapsed=time.monotonic() - start,
+                            best_objective=best_objective,
+                            metrics=self.strategy.report().extra if stop.needs_metrics else {})
+        progress = stop.progress(snap)
+        # Live progress toward every budget/stopping criterion.
+        logger.info("📊  %s", " | ".join(
+            f"{p.label} {self._fmt(p.current)}/{self._fmt(p.limit)}" for p in progress))
+        if self.state is not None:
+            self._history.append({"idx": batch_idx - 1, "n_units": n_units})
+            self.state.update(batches_done=batch_idx, best_objective=best_objective,
+                              budget=[self._budget_item(p) for p in progress],
+                              batch_history=list(self._history))
+        self.notifier.batch_finished(batch_idx - 1, n_units)
+        result = stop.should_stop(snap)
+        if not result and self.state is not None and self.state.stop_requested:
+            result = StopResult(kind="external",
+                                reason="stop requested via control API")
+        if result:
+            self._announce_stop(result)
+        return result
+
+    def _announce_stop(self, result) -> None:
+        if self.state is not None:
+            self.state.set_phase("finishing")
+            self.state.update(stop={"kind": result.kind, "reason": result.reason})
+        logger.info("\n%s\n⏹  Stopping — %s\n%s", _BAR, result.reason, _BAR)
+
+    def _restore_strategy_state(self) -> None:
+        """Resume the strategy from an earlier run of this campaign, if any."""
+        state = self.store.latest_strategy_state(self.campaign_id)
+        if state is None:
+            return
+        self.strategy.set_state(state)
+        logger.info("Resumed %s from the state saved by an earlier run of %s",
+                    type(self.strategy).__name__, self.campaign_id)
+
+    def _take_inflight(self) -> None:
+        """Take over the parameter sets an earlier run of this campaign left in flight.
 
+        An asynchronous search dispatches them again before asking the strategy
+        for new ones; the generational loop has no slot for them.
+        """
+        rows = self.store.take_inflight(self.campaign_id)
+        if not rows:
+            return
+        if self.scheduling != "async":
+            logger.warning("Dropping %d parameter set(s) an earlier asynchronous run of %s "
+                           "left in flight; only async scheduling resumes them.",
+                           len(rows), self.campaign_id)
+            return
+        self._resumed = [ParamSet(values=json.loads(row["params_json"]), n_reps=row["n_reps"])
+                         for row in rows]
+        logger.info("Resuming %d parameter set(s) an earlier run of %s left in flight",
+                    len(rows), self.campaign_id)
+
+    def _save_strategy_state(self, campaign_id) -> None:
+        state = self.strategy.get_state()
+        if state is not None:
+            self.store.save_strategy_state(campaign_id, state)
+
+    def _finish_search(self, campaign_id, result, batch_idx, start):
+        """Persist the stop outcome and return the strategy's final report."""
+        self._save_strategy_state(campaign_id)
         elapsed_s = time.monotonic() - start
         self.store.record_outcome(
             campaign_id, stop_kind=result.kind, stop_reason=result.reason,
@@ -316,10 +436,243 @@ class CampaignController:
         report = self.strategy.report()
         report.extra['stop'] = {"kind": result.kind, "reason": result.reason,
                                 "batches": batch_idx, "elapsed_s": elapsed_s}
+        report.extra['scoring'] = self.evaluator.timings()
         logger.info("\n%s\n✅  Search complete  —  %d batch(es), %d evaluation(s) "
                     "(%s)\n%s", _BAR, batch_idx, len(report.evaluations), result.reason, _BAR)
         return report
 
+    def _run_search_async(self, campaign_id: int):
+        """Steady-state search: keep up to ``max_in_flight`` parameter sets running.
+
+        Each parameter set is composed on its own and handed to
+        ``backend.run_batch`` on a worker thread; whenever one or more finish,
+        postprocessing runs once, the finished sets are scored and recorded, the
+        strategy is told and the freed slots are refilled. Concurrent backends
+        move each config into the campaign root only once it is complete
+        (:func:`~robovast.execution.backends.publish_results`), so postprocessing
+        never sees the runs of sets still being delivered. ``INCREMENTAL_TELL``
+        strategies are asked for exactly the free slots; others are asked for a
+        whole generation (``per_batch``) and told once it has fully completed.
+
+        Every ``per_batch`` scored sets form one store batch, and budgets,
+        stopping criteria and progress are evaluated per such batch as in the
+        generational loop. The ``batches`` budget also caps how many sets are
+        dispatched. Once a criterion fires nothing new is dispatched; sets
+        already running are drained, scored and told.
+        """
+        from robovast.search.stopping import StopResult
+        stop = self.stop_conditions
+        obj_name = self.strategy.single_objective.name
+        incremental = self.strategy.INCREMENTAL_TELL
+        slots = self.max_in_flight or self.per_batch
+        if slots > 1 and not self.backend.supports_concurrent_batches:
+            logger.warning("Backend %s cannot run batches concurrently; async search "
+                           "runs one parameter set at a time.", type(self.backend).__name__)
+            slots = 1
+        max_dispatch = (stop.max_batches * self.per_batch
+                        if stop.max_batches is not None else None)
+        logger.info("\n%s\n🔁  Async search  —  up to %d parameter set(s) in flight\n%s",
+                    _BAR, slots, _BAR)
+
+        # (generation, ParamSet) asked, not yet dispatched; sets resumed from an
+        # earlier run come first, outside any generation.
+        queue: deque = deque((None, ps) for ps in self._resumed)
+        self._resumed = []
+        generations: dict[int, dict] = {}   # non-incremental: generation -> pending/evaluations
+        in_flight: dict = {}            # Future -> (seq, generation, ps, config_name, inflight_id)
+        n_generations = dispatched = runs_dispatched = runs_done = 0
+        batch_idx = batch_evals = 0
+        batch_id = None
+        best_objective = None
+        result = None
+        start = time.monotonic()
+        pool = ThreadPoolExecutor(max_workers=slots, thread_name_prefix="robovast-async")
+        aborted = True
+        try:
+            while True:
+                while (result is None and len(in_flight) < slots
+                       and (max_dispatch is None or dispatched < max_dispatch)):
+                    if not queue:
+                        if not incremental and generations:
+                            break       # wait until the outstanding generation is told
+                        n = slots - len(in_flight) if incremental else self.per_batch
+                        if max_dispatch is not None:
+                            n = min(n, max_dispatch - dispatched)
+                        param_sets = self.strategy.ask(n)
+                        if not param_sets:
+                            break
+                        if not incremental:
+                            generations[n_generations] = {"pending": len(param_sets),
+                                                          "evaluations": []}
+                        queue.extend((n_generations, ps) for ps in param_sets)
+                        n_generations += 1
+                    entry = self._next_dispatchable(queue, in_flight)
+                    if entry is None:
+                        break           # only duplicates of running sets are queued
+                    gen, ps = entry
+                    unit = self._plan_unit(ps)
+                    if unit.cached is not None:
+                        future, produced, inflight_id = Future(), None, None
+                        future.set_result(None)
+                    else:
+                        future, produced = self._dispatch_async(pool, unit, dispatched)
+                        inflight_id = self.store.record_inflight(
+                            campaign_id, ps.id, unit.config_name or produced, ps.values,
+                            unit.reps)
+                    in_flight[future] = (dispatched, gen, unit, produced, inflight_id)
+                    dispatched += 1
+                    runs_dispatched += unit.run_reps
+                    self._publish_async_runs(runs_done, runs_dispatched)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                finished = sorted((in_flight.pop(f) for f in done), key=lambda e: e[0])
+                for f in done:
+                    f.result()          # surface backend errors like the generational loop
+                for _seq, _gen, unit, produced, _id in finished:
+                    if produced is not None:
+                        self._place_results(unit, produced)
+                if any(unit.cached is None for _s, _g, unit, _p, _i in finished):
+                    self._run_postprocessing()
+
+                to_tell = []
+                for _seq, gen, unit, _produced, inflight_id in finished:
+                    if batch_id is None:
+                        batch_id = self.store.open_batch(campaign_id, batch_idx, ".")
+                        if self.state is not None:
+                            self.state.update(batch=batch_idx)
+                    ev = self._finish_unit(batch_id, unit)
+                    if inflight_id is not None:
+                        self.store.clear_inflight(inflight_id)
+                    runs_done += unit.run_reps
+                    best_objective = self._update_best(best_objective, [ev], obj_name)
+                    if incremental:
+                        to_tell.append(ev)
+                    elif gen is not None:       # resumed sets belong to no generation
+                        group = generations[gen]
+                        group["evaluations"].append(ev)
+                        group["pending"] -= 1
+                        if group["pending"] == 0:
+                            to_tell.extend(generations.pop(gen)["evaluations"])
+                    batch_evals += 1
+                    if batch_evals == self.per_batch:
+                        if to_tell:
+                            self.strategy.tell(to_tell)
+                            to_tell = []
+                        self._save_strategy_state(campaign_id)
+                        batch_idx += 1
+                        batch_id, batch_evals = None, 0
+                        if result is None:
+                            result = self._end_of_batch(batch_idx, self.per_batch,
+                                                        best_objective, start)
+                if to_tell:
+                    self.strategy.tell(to_tell)
+                self._publish_async_runs(runs_done, runs_dispatched)
+                if result is None and self.state is not None and self.state.stop_requested:
+                    result = StopResult(kind="external",
+                                        reason="stop requested via control API")
+                    self._announce_stop(result)
+            aborted = False
+        finally:
+            # On an error, let running sets finish before the campaign is
+            # finalized; their in-flight rows stay for the next run to resume.
+            running = sum(1 for f in in_flight if not f.done())
+            if aborted and running:
+                logger.warning("Waiting for %d running parameter set(s) to finish; a re-run "
+                               "of the campaign dispatches them again.", running)
+            pool.shutdown(wait=aborted, cancel_futures=True)
+
+        if result is None:
+            # The strategy ran dry (or only duplicates remained) before any
+            # criterion fired; close the partial batch so its units are counted.
+            if batch_evals:
+                batch_idx += 1
+                result = self._end_of_batch(batch_idx, batch_evals, best_objective, start)
+            if result is None:
+                result = StopResult(kind="exhausted",
+                                    reason="strategy proposed no further parameter sets")
+                self._announce_stop(result)
+        return self._finish_search(campaign_id, result, batch_idx, start)
+
+    @staticmethod
+    def _next_dispatchable(queue: deque, in_flight: dict):
+        """Pop the oldest queued entry whose parameter set is not already running.
+
+        Identical parameter sets share a result directory, so a duplicate waits
+        in the queue until its twin has been scored. Returns ``None`` if every
+        queued entry is such a duplicate.
+        """
+        running = {entry[2].ps.id for entry in in_flight.values()}
+        for i, (gen, ps) in enumerate(queue):
+            if ps.id not in running:
+                del queue[i]
+                return gen, ps
+        return None
+
+    def _dispatch_async(self, pool, unit, seq):
+        """Compose one unit and submit its execution to ``pool``.
+
+        Composition happens on the calling thread; the composed artifacts live in
+        a temp dir the worker removes once ``run_batch`` returns. Returns the
+        future and the produced config name.
+        """
+        artifacts = tempfile.mkdtemp(prefix="robovast_compose_")
+        try:
+            campaign_data, name_by_id = self.compose.compose([unit.run_ps], artifacts)
+        except BaseException:
+            shutil.rmtree(artifacts, ignore_errors=True)
+            raise
+
+        def _execute():
+            try:
+                self._dispatch(campaign_data, f"async-{seq}", unit.run_reps)
+            finally:
+                shutil.rmtree(artifacts, ignore_errors=True)
+
+        return pool.submit(_execute), name_by_id[unit.run_ps.id]
+
+    def _duration_model(self, vast_file) -> DurationModel:
+        if self._durations is None:
+            self._durations = DurationModel.from_results_dir(
+                Path(self.campaign_root).parent, vast_file)
+        return self._durations
+
+    def _dispatch(self, campaign_data, batch_tag, runs) -> None:
+        """Hand one batch to the backend.
+
+        With ``execution.job_duration`` the configs first get their predicted
+        run time (:class:`~robovast.execution.packer.DurationModel`) for the
+        backend's duration-aware packer; afterwards the predicted and actual
+        makespan are appended to ``_execution/makespan.csv`` and the observed
+        run times feed the model.
+        """
+        execution = campaign_data.get("execution") or {}
+        if not execution.get("job_duration"):
+            self.backend.run_batch(campaign_data, campaign_root=self.campaign_root,
+                                   batch_tag=batch_tag, runs=runs, options=self.options)
+            return
+        with self._durations_lock:
+            model = self._duration_model(campaign_data.get("vast"))
+            model.annotate(campaign_data["configs"])
+        jobs = build_jobs(campaign_data["configs"], runs, execution)
+        self.backend.run_batch(campaign_data, campaign_root=self.campaign_root,
+                               batch_tag=batch_tag, runs=runs, options=self.options)
+        report = makespan_report(jobs, self.campaign_root)
+        with self._durations_lock:
+            for name, times in report["run_s"].items():
+                for duration in times:
+                    model.observe(name, duration)
+            write_makespan_report(
+                os.path.join(self.campaign_root, "_execution", "makespan.csv"), batch_tag, report)
+        logger.info("Batch %s: %d job(s), predicted makespan %.0fs, actual %.0fs",
+                    batch_tag, report["jobs"], report["predicted_s"], report["actual_s"])
+
+    def _publish_async_runs(self, completed: int, total: int) -> None:
+        """Cumulative run progress for the control channel (async scheduling)."""
+        if self.state is not None:
+            self.state.update(runs={"completed": completed, "total": total})
+
     @staticmethod
     def _fmt(v):
         return f"{v:.4g}" if isinstance(v, float) else str(v)
@@ -352,47 +705,205 @@ class CampaignController:
                 best = v
         return best
 
-    def _run_search_batch(self, param_sets, batch_idx, batch_id):
+    def _run_search_batch(self, param_sets, batch_idx, batch_id, incumbent=None):
         """Compose, execute and score one batch.
 
-        Parameter sets are grouped by effective repetition count (``ps.n_reps``
-        or the campaign default ``runs``); each group runs with that many reps.
-        With the default strategy every set uses the default, so this is a single
-        group.
+        Parameter sets already in the evaluation memo are answered from it (or
+        topped up with just the missing repetitions). The rest are grouped by
+        effective repetition count (``ps.n_reps`` or the campaign default
+        ``runs``); each group runs with that many reps. With the default
+        strategy every set uses the default, so this is a single group. With
+        the memo enabled, a set proposed twice in one batch runs once; its twin
+        is answered from the memo in a follow-up round.
+
+        With ``search.racing`` the default is the racing ``initial_reps`` and
+        undecided sets are then topped up round by round (see :meth:`_race`);
+        *incumbent* is the best objective of earlier batches.
         """
-        groups: dict[int, list] = {}
-        for ps in param_sets:
-            groups.setdefault(ps.n_reps or self.runs, []).append(ps)
-        multi = len(groups) > 1
-
-        # Expected runs across the whole batch (all reps-groups), for run progress.
-        self._begin_batch_progress(sum((ps.n_reps or self.runs) for ps in param_sets))
-        evaluations = []
+        self._begin_batch_progress(sum((ps.n_reps or self._default_reps) for ps in param_sets))
+        scored = []
+        pending = list(param_sets)
+        rounds = 0
         try:
-            for reps, group in sorted(groups.items()):
-                tag = f"batch-{batch_idx}" + (f"/reps-{reps}" if multi else "")
-                # Compose into a temp dir (intermediate config artifacts); the backend
-                # stages from it and only results land under the campaign root.
-                with tempfile.TemporaryDirectory(prefix="robovast_compose_") as artifacts:
-                    campaign_data, name_by_id = self.compose.compose(group, artifacts)
-                    self.backend.run_batch(
-                        campaign_data, campaign_root=self.campaign_root, batch_tag=tag,
-                        runs=reps, options=self.options)
-                self._run_postprocessing()
-
-                for ps in group:
-                    config_name = name_by_id[ps.id]
-                    config_dir = Path(self.campaign_root) / config_name
-                    ev = self.evaluator.evaluate(config_dir, ps)
-                    evaluations.append(ev)
-                    self.store.record_unit(
-                        batch_id=batch_id, paramset_id=ps.id, config_name=config_name,
-                        params=ps.values, objectives=ev.objectives, measures=ev.measures,
-                        n_samples=ev.n_samples, status="evaluated",
-                        result_dir=os.path.relpath(config_dir, self.campaign_root))
+            while pending:
+                units, pending = self._plan_round(pending)
+                tag = f"batch-{batch_idx}" + (f"/round-{rounds}" if rounds else "")
+                self._execute_units([u for u in units if u.cached is None], tag)
+                scored.extend(zip(units, self._evaluate_units(units)))
+                rounds += 1
+            decisions = self._race(scored, batch_idx, incumbent) if self.racing else {}
         finally:
             self._end_batch_progress()
-        return evaluations
+        return [self._record_unit(batch_id, u, ev, decisions.get(u.ps.id))
+                for u, ev in scored]
+
+    def _race(self, scored, batch_idx, incumbent):
+        """Top up undecided parameter sets of a batch until racing settles them.
+
+        Each round computes every racing set's confidence interval and, while it
+        still contains the incumbent (best objective so far, including this
+        batch) or the racing threshold, runs ``step`` more repetitions. Sets
+        with an explicit ``n_reps`` are left alone; a twin (same id) shares its
+        first occurrence's outcome. Updates *scored* in place and returns the
+        per-set decision log for ``unit.racing_json``.
+        """
+        spec = self.strategy.single_objective
+        pick = min if spec.direction == 'minimize' else max
+        first: dict[str, int] = {}
+        for i, (u, _ev) in enumerate(scored):
+            first.setdefault(u.ps.id, i)
+        racing = [i for i in first.values() if scored[i][0].ps.n_reps is None]
+        log: dict[str, list] = {}
+        round_no = 0
+        while True:
+            values = [float(ev.objectives[spec.name]) for _u, ev in scored]
+            best = pick(values + ([incumbent] if incumbent is not None else []))
+            top_ups = []
+            for i in racing:
+                unit, ev = scored[i]
+                config_dir = Path(ev.raw["config_dir"])
+                interval = self.evaluator.interval(config_dir, self.racing.confidence)
+                have = unit.have_reps
+                more, reason = self.racing.decide(interval, have, best)
+                log.setdefault(unit.ps.id, []).append({
+                    "reps": have, "objective": float(ev.objectives[spec.name]),
+                    "interval": list(interval) if interval is not None else None,
+                    "decision": "more" if more else "stop", "reason": reason})
+                if more:
+                    top_ups.append((i, self._top_up_unit(
+                        unit.ps, self.racing.next_reps(have, interval), config_dir, have)))
+            if not top_ups:
+                break
+            logger.info("Racing: %d of %d parameter set(s) need more repetitions",
+                        len(top_ups), len(racing))
+            self._execute_units([u for _i, u in top_ups], f"batch-{batch_idx}/race-{round_no}")
+            for (i, unit), ev in zip(top_ups, self._evaluate_units([u for _i, u in top_ups])):
+                scored[i] = (unit, ev)
+            racing = [i for i, _unit in top_ups]
+            round_no += 1
+        for i, (unit, _ev) in enumerate(scored):
+            lead_unit, lead_ev = scored[first[unit.ps.id]]
+            if lead_unit is not unit:
+                twin = _Unit(ps=unit.ps, reps=lead_unit.have_reps, cached=MemoEntry(
+                    n_reps=lead_unit.have_reps, n_samples=lead_ev.n_samples,
+                    objectives=lead_ev.objectives, measures=lead_ev.measures,
+                    result_dir=Path(lead_ev.raw["config_dir"])))
+                scored[i] = (twin, self._evaluate_unit(twin))
+        return log
+
+    def _plan_round(self, param_sets):
+        """Split *param_sets* into planned units and twins deferred to a later round."""
+        units, deferred, seen = [], [], set()
+        for ps in param_sets:
+            if self.memo is not None and ps.id in seen:
+                deferred.append(ps)
+                continue
+            seen.add(ps.id)
+            units.append(self._plan_unit(ps))
+        return units, deferred
+
+    def _execute_units(self, units, tag):
+        """Run the units that need execution, grouped by repetitions to run."""
+        groups: dict[int, list] = {}
+        for u in units:
+            groups.setdefault(u.run_reps, []).append(u)
+        multi = len(groups) > 1
+        for reps, group in sorted(groups.items()):
+            group_tag = tag + (f"/reps-{reps}" if multi else "")
+            # Compose into a temp dir (intermediate config artifacts); the backend
+            # stages from it and only results land under the campaign root.
+            with tempfile.TemporaryDirectory(prefix="robovast_compose_") as artifacts:
+                campaign_data, name_by_id = self.compose.compose(
+                    [u.run_ps for u in group], artifacts)
+                self._dispatch(campaign_data, group_tag, reps)
+            for u in group:
+                self._place_results(u, name_by_id[u.run_ps.id])
+            self._run_postprocessing()
+
+    def _plan_unit(self, ps) -> "_Unit":
+        """Decide how to evaluate *ps*: reuse, top up, or run from scratch."""
+        reps = ps.n_reps or self._default_reps
+        entry = self.memo.lookup(ps.id) if self.memo is not None else None
+        if entry is None:
+            return _Unit(ps=ps, reps=reps, run_ps=ps, run_reps=reps)
+        if entry.n_reps >= reps:
+            return _Unit(ps=ps, reps=reps, cached=entry)
+        root = os.path.abspath(self.campaign_root)
+        if os.path.commonpath([root, os.path.abspath(entry.result_dir)]) != root:
+            # Runs of an earlier campaign stay where they are (its store and
+            # bucket refer to them); this campaign runs all repetitions itself.
+            return _Unit(ps=ps, reps=reps, run_ps=ps, run_reps=reps)
+        return self._top_up_unit(ps, reps, Path(entry.result_dir), entry.n_reps)
+
+    def _top_up_unit(self, ps, reps, result_dir: Path, have: int) -> "_Unit":
+        """A unit running only the ``reps - have`` missing repetitions of *ps*.
+
+        They run under a distinct config name and are merged into *result_dir*
+        (a config of this campaign) afterwards (:meth:`_place_results`).
+        """
+        logger.info("Topping up %s from %d to %d repetition(s)", ps.id, have, reps)
+        return _Unit(ps=ps, reps=reps, run_ps=ParamSet(values=ps.values, id=f"{ps.id}r{have}"),
+                     run_reps=reps - have, config_name=result_dir.name, top_up=True)
+
+    def _place_results(self, unit, produced_name) -> None:
+        """Bind the executed config to *unit*; merge top-up runs into its result dir.
+
+        The backend is told about the renamed runs so job links and results
+        kept in storage follow them.
+        """
+        if not unit.top_up:
+            unit.config_name = produced_name
+            return
+        root = Path(self.campaign_root)
+        target = root / unit.config_name
+        existing = list_run_dirs(target)
+        next_run = int(existing[-1].name) + 1 if existing else 0
+        moves = {}
+        for offset, run_dir in enumerate(list_run_dirs(root / produced_name)):
+            run_dir.rename(target / str(next_run + offset))
+            moves[f"{produced_name}/{run_dir.name}"] = f"{unit.config_name}/{next_run + offset}"
+        shutil.rmtree(root / produced_name, ignore_errors=True)
+        if moves:
+            self.backend.results_moved(self.campaign_root, moves)
+
+    def _evaluate_unit(self, unit):
+        """Score an executed unit (feeding the memo), or answer it from the memo."""
+        return self._evaluate_units([unit])[0]
+
+    def _evaluate_units(self, units):
+        """Score *units* in order; executed ones concurrently (``evaluate_many``)."""
+        executed = [u for u in units if u.cached is None]
+        evaluations = self.evaluator.evaluate_many(
+            [(Path(self.campaign_root) / u.config_name, u.ps) for u in executed])
+        for unit, ev in zip(executed, evaluations):
+            if self.memo is not None:
+                self.memo.add(unit.ps.id, unit.reps, ev.n_samples, ev.objectives,
+                              ev.measures, Path(ev.raw["config_dir"]))
+        fresh = iter(evaluations)
+        return [next(fresh) if u.cached is None else self._reused_evaluation(u)
+                for u in units]
+
+    @staticmethod
+    def _reused_evaluation(unit):
+        entry = unit.cached
+        return Evaluation(params=unit.ps, objectives=dict(entry.objectives),
+                          measures=dict(entry.measures), n_samples=entry.n_samples,
+                          raw={"config_dir": str(entry.result_dir), "reused": True})
+
+    def _record_unit(self, batch_id, unit, ev, racing=None):
+        """Record a scored unit in the store; returns *ev*."""
+        result_dir = Path(ev.raw["config_dir"])
+        self.store.record_unit(
+            batch_id=batch_id, paramset_id=unit.ps.id, config_name=result_dir.name,
+            params=unit.ps.values, objectives=ev.objectives, measures=ev.measures,
+            n_samples=ev.n_samples, n_reps=unit.have_reps,
+            status="reused" if unit.cached is not None else "evaluated",
+            result_dir=os.path.relpath(result_dir, self.campaign_root), racing=racing)
+        return ev
+
+    def _finish_unit(self, batch_id, unit):
+        """Score and record one unit."""
+        return self._record_unit(batch_id, unit, self._evaluate_unit(unit))
 
     def _run_postprocessing(self) -> None:
         """Run search.postprocessing over the campaign root (no-op if none).
@@ -407,6 +918,11 @@ class CampaignController:
         # heavier deps) unless a search actually configures postprocessing.
         from robovast.results_processing.postprocessing import \
             run_postprocessing_commands
+        from robovast.results_processing.rosbags_worker import \
+            enable_warm_workers
+
+        # Postprocessing repeats after every batch: keep the rosbag container warm.
+        enable_warm_workers()
         run_postprocessing_commands(
             self.postprocessing, results_dir=self.campaign_root,
             config_dir=self.vast_dir, output=logger.info)
@@ -432,7 +948,8 @@ def _make_upload_progress_cb(state):
 
     The callback derives transfer *rate* from the gap between published samples
     (the providers report only sent/total) and throttles writes to ≥1% advance or
-    ≥0.5 s elapsed (plus the final 100% sample) to keep lock churn low. A fresh
+    ≥0.5 s elapsed (plus the final 100% sample) to keep lock churn low. While a
+    streamed upload's size is unknown the providers report ``total`` 0. A fresh
     callback is created per upload attempt so its rate baseline resets on retry.
     """
     if state is None:
@@ -443,7 +960,7 @@ def _make_upload_progress_cb(state):
         now = time.time()
         pct = (sent / total * 100.0) if total else 0.0
         if (last["t"] is not None and pct - last["pushed_pct"] < 1.0
-                and now - last["t"] < 0.5 and sent < total):
+                and now - last["t"] < 0.5 and (not total or sent < total)):
             return
         rate = None
         if last["t"] is not None and now > last["t"]:
@@ -565,7 +1082,10 @@ def run_search_campaign(vast_file, campaign_config, results_dir, runs,
         vast_dir=vast_dir, strategy=build_strategy(search_cfg, vast_dir),
         evaluator=Evaluator(search_cfg, vast_dir), compose=Compose(vast_file),
         per_batch=search_cfg.per_batch, postprocessing=search_cfg.postprocessing,
-        stop_conditions=build_stop_conditions(search_cfg), state=state, notifier=notifier)
+        stop_conditions=build_stop_conditions(search_cfg), state=state, notifier=notifier,
+        scheduling=search_cfg.scheduling, max_in_flight=search_cfg.max_in_flight,
+        vast_hash=vast_content_hash(vast_file, campaign_config), memoize=search_cfg.memoize,
+        racing=search_cfg.racing)
     try:
         return controller.run()
     finally:
@@ -652,8 +1172,6 @@ def _build_cluster_backend(namespace, kube_context, log_tree):
     uses for storage and scheduling (its ``get_s3_endpoint()`` is the
     cluster-internal endpoint, so all storage traffic stays in-cluster).
     """
-    import json
-
     from robovast.execution.cluster_execution.cluster_setup import \
         get_cluster_config
     from robovast.execution.cluster_execution.kubernetes_backend import \
@@ -741,6 +1259,11 @@ def main(argv=None):
         port = int(os.environ.get("ROBOVAST_CONTROL_PORT", "0")) or None
         state = ControllerState()
         serve_in_thread(state, **({"port": port} if port else {}))
+        # Warm-pool workers reach the channel at this pod's IP (downward API).
+        pod_ip = os.environ.get("ROBOVAST_CONTROL_HOST")
+        if pod_ip:
+            from robovast.execution.control_server import DEFAULT_PORT
+            backend.control = (state, f"http://{pod_ip}:{port or DEFAULT_PORT}")
     except Exception:  # pylint: disable=broad-except
         logger.warning("Could not start the control channel; continuing without it.",
                        exc_info=True)
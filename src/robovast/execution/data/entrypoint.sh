@@ -164,6 +164,23 @@ else
     if [ -n "${SIMULATION}" ]; then
         SIMULATION_PARAM="--simulation ${SIMULATION}"
     fi
+    # Warm-pool mode: the bring-up above is paid once per pod; the worker then
+    # pulls packed jobs from the controller's queue and runs each with its own
+    # parameter file until the batch is done. The post-command and S3 upload
+    # run after every job, cleanup once after the last one; a job is killed
+    # after WARM_POOL_RUN_TIMEOUT seconds per run.
+    if [ -n "${WARM_POOL_QUEUE_URL}" ]; then
+        if command -v ros2 > /dev/null 2>&1; then
+            SCENARIO_CMD="ros2 run scenario_execution_ros scenario_execution_ros"
+        else
+            SCENARIO_CMD="scenario_execution"
+        fi
+        log "Starting warm-pool worker (queue ${WARM_POOL_QUEUE_URL})..."
+        exec python3 /config/warm_worker.py --queue "${WARM_POOL_QUEUE_URL}" \
+            --worker "${WARM_POOL_WORKER:-$(hostname)}" --output-dir "${SCENARIO_OUTPUT_DIR}" \
+            --run-timeout "${WARM_POOL_RUN_TIMEOUT:-0}" ${WARM_POOL_POST_RUN_PARAM} -- \
+            ${SCENARIO_CMD} -o ${SCENARIO_OUTPUT_DIR} /config/${SCENARIO_FILE} ${PER_SCENARIO_PARAM} ${SIMULATION_PARAM} ${SCENARIO_EXECUTION_PARAMETERS}
+    fi
     if command -v ros2 > /dev/null 2>&1; then
         if [ -e "${SCENARIO_PARAMETER_FILE}" ]; then
             log "Starting scenario execution (ROS2) with config file..."
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Warm-pool worker - pulls packed jobs from the controller until the batch is done.
+
+Runs inside a simulation pod after the entrypoint's one-time bring-up (ROS
+environment, virtual display, resource monitor). Each claimed unit is one packed
+job: its multi-document parameter file is written to ``--param-file`` and the
+scenario command after ``--`` is run with ``--scenario-parameter-file`` appended.
+Per work item, the startup latency (gap before its run started: bring-up for the
+first item, simulator reset for later ones), run time and, for the last item, the
+teardown latency are taken from the items' ``test.xml`` and reported back with
+the completion.
+
+``--unit-post-run`` scripts (the post-command and the S3 upload) run after every
+unit, and the unit is only reported complete once they all succeeded - otherwise
+the worker stops and the unit's lease expires, so another worker re-runs it.
+With ``--run-timeout`` a unit's scenario is killed after that many seconds per
+work item, which keeps it inside its lease. ``--post-run`` scripts (cleanup,
+final upload) run once, after the queue is done.
+
+Standard library only: simulation images are not expected to ship robovast.
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess  # nosec B404 - runs the scenario command given by the entrypoint
+import sys
+import time
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ET  # nosec B405 - our own test.xml output
+
+POLL_INTERVAL_S = 5.0
+RETRIES = 5
+KILL_GRACE_S = 10.0
+
+
+class QueueClient:
+    """JSON client for the controller's ``/queue/<name>`` endpoints."""
+
+    def __init__(self, url, worker):
+        self.url = url.rstrip("/")
+        self.worker = worker
+
+    def _post(self, path, body):
+        data = json.dumps(body).encode("utf-8")
+        for attempt in range(RETRIES):
+            request = urllib.request.Request(
+                f"{self.url}/{path}", data=data, headers={"Content-Type": "application/json"})
+            try:
+                with urllib.request.urlopen(request, timeout=30) as resp:  # nosec B310
+                    return json.loads(resp.read().decode("utf-8"))
+            except (urllib.error.URLError, OSError) as exc:
+                if attempt == RETRIES - 1:
+                    raise
+                print(f"[warm-worker] queue request failed ({exc}); retrying", flush=True)
+                time.sleep(2 ** attempt)
+        return None
+
+    def claim(self):
+        reply = self._post("claim", {"worker": self.worker})
+        return reply.get("unit"), reply.get("done", False)
+
+    def complete(self, unit_id, timings):
+        reply = self._post("complete", {"worker": self.worker, "unit": unit_id,
+                                        "timings": timings})
+        return bool(reply and reply.get("accepted"))
+
+
+def _read_result(path):
+    """``(start_time, duration)`` of a test.xml, ``None`` where unavailable."""
+    try:
+        testcase = ET.parse(path).getroot().find(".//testcase")  # nosec B314
+    except (ET.ParseError, OSError):
+        return None, None
+    if testcase is None:
+        return None, None
+    duration = float(testcase.get("time", "0"))
+    for prop in testcase.iter("property"):
+        if prop.get("name") == "start_time":
+            return float(prop.get("value", "0")), duration
+    return None, duration
+
+
+def item_timings(items, output_dir, launched, finished):
+    """Per-item latency of one packed job run between *launched* and *finished*.
+
+    Items whose start is unknown (no test.xml or no ``start_time``) report
+    ``None`` latencies, and the next item's startup is measured from the last
+    known end.
+    """
+    timings = []
+    previous_end = launched
+    for config, run_number in items:
+        start, duration = _read_result(f"{output_dir}/{config}/{run_number}/test.xml")
+        entry = {"config": config, "run": run_number, "run_s": duration,
+                 "startup_s": None, "teardown_s": None}
+        if start is not None and previous_end is not None:
+            entry["startup_s"] = max(0.0, start - previous_end)
+        previous_end = start + duration if start is not None and duration is not None else None
+        timings.append(entry)
+    if timings and previous_end is not None:
+        timings[-1]["teardown_s"] = max(0.0, finished - previous_end)
+    return timings
+
+
+def run_scenario(command, timeout=None):
+    """Run *command* in its own process group; kill the group after *timeout* s.
+
+    Returns the exit code, ``None`` when the run was killed.
+    """
+    proc = subprocess.Popen(command, start_new_session=True)  # nosec B603
+    try:
+        return proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _killpg(proc.pid, signal.SIGTERM)
+        try:
+            proc.wait(timeout=KILL_GRACE_S)
+        except subprocess.TimeoutExpired:
+            _killpg(proc.pid, signal.SIGKILL)
+            proc.wait()
+        return None
+
+
+def _killpg(pgid, sig):
+    try:
+        os.killpg(pgid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def run_scripts(scripts):
+    """Run *scripts* in order; ``False`` as soon as one fails."""
+    for script in scripts:
+        try:
+            code = subprocess.run([script], check=False).returncode  # nosec B603
+        except OSError as exc:
+            print(f"[warm-worker] {script} failed to start: {exc}", flush=True)
+            return False
+        if code != 0:
+            print(f"[warm-worker] {script} exited with code {code}", flush=True)
+            return False
+    return True
+
+
+def run(client, command, param_file, output_dir, poll_interval=POLL_INTERVAL_S,
+        unit_post_run=(), run_timeout=None):
+    """Claim and run units until the queue is done; returns the number run.
+
+    Raises :class:`RuntimeError` when a unit's *unit_post_run* scripts fail;
+    that unit is not reported complete.
+    """
+    count = 0
+    while True:
+        unit, done = client.claim()
+        if unit is None:
+            if done:
+                return count
+            time.sleep(poll_interval)
+            continue
+        with open(param_file, "w", encoding="utf-8") as f:
+            f.write(unit["documents"])
+        print(f"[warm-worker] running {unit['id']} ({len(unit['items'])} item(s))", flush=True)
+        timeout = run_timeout * max(len(unit["items"]), 1) if run_timeout else None
+        launched = time.time()
+        code = run_scenario([*command, "--scenario-parameter-file", param_file], timeout)
+        finished = time.time()
+        if code is None:
+            print(f"[warm-worker] {unit['id']} killed after {timeout:.0f}s", flush=True)
+        elif code != 0:
+            print(f"[warm-worker] {unit['id']} exited with code {code}", flush=True)
+        if not run_scripts(unit_post_run):
+            raise RuntimeError(f"post-run of {unit['id']} failed")
+        if not client.complete(unit["id"],
+                               item_timings(unit["items"], output_dir, launched, finished)):
+            print(f"[warm-worker] completion of {unit['id']} was not accepted "
+                  "(lease expired)", flush=True)
+        count += 1
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--" not in argv:
+        print("usage: warm_worker.py [options] -- <scenario command>", file=sys.stderr)
+        return 2
+    split = argv.index("--")
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queue", required=True, help="Queue URL (…/queue/<name>)")
+    parser.add_argument("--worker", required=True, help="Worker name (pod name)")
+    parser.add_argument("--output-dir", default="/out")
+    parser.add_argument("--param-file", default="/tmp/warm_pool.params.yaml")
+    parser.add_argument("--post-run", action="append", default=[])
+    parser.add_argument("--unit-post-run", action="append", default=[])
+    parser.add_argument("--run-timeout", type=float, default=0.0,
+                        help="Seconds per work item before a unit is killed (0: none)")
+    args = parser.parse_args(argv[:split])
+
+    status = 0
+    try:
+        n = run(QueueClient(args.queue, args.worker), argv[split + 1:], args.param_file,
+                args.output_dir, unit_post_run=args.unit_post_run,
+                run_timeout=args.run_timeout or None)
+        print(f"[warm-worker] queue done after {n} unit(s)", flush=True)
+    except Exception as exc:  # pylint: disable=broad-except
+        print(f"[warm-worker] stopping: {exc}", flush=True)
+        status = 1
+    for script in args.post_run:
+        subprocess.run([script], check=False)  # nosec B603
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -476,6 +476,11 @@ def _fmt_rate(bps):
     return f"{bps:.0f} B/s"
 
 
+def _echo_delete_progress(deleted, rate):
+    """Progress line for ``bucket_ops`` deletions: objects removed and objects/s."""
+    click.echo(f"  Deleted {deleted} object(s)  ({rate:.0f} objects/s)")
+
+
 def _monitor_via_controller(namespace, kube_context, interval, once):
     """Monitor campaigns through their controllers' control channels.
 
@@ -539,9 +544,12 @@ def _monitor_via_controller(namespace, kube_context, interval, once):
         lines.append(run_line)
         up = (status.get("extra") or {}).get("upload")
         if status.get("phase") == "uploading" and up:
-            u_bar, u_pct = _progress_bar(up.get("sent", 0), up.get("total", 0))
-            up_line = (f"  Upload: [{u_bar}] {u_pct:5.1f}%  "
-                       f"{_fmt_size(up.get('sent', 0))}/{_fmt_size(up.get('total', 0))}")
+            if up.get("total"):
+                u_bar, u_pct = _progress_bar(up.get("sent", 0), up["total"])
+                up_line = (f"  Upload: [{u_bar}] {u_pct:5.1f}%  "
+                           f"{_fmt_size(up.get('sent', 0))}/{_fmt_size(up['total'])}")
+            else:  # streamed while compressing; the final size is not known yet
+                up_line = f"  Upload: {_fmt_size(up.get('sent', 0))} streamed"
             if up.get("rate") is not None:
                 up_line += f"   {_fmt_rate(up['rate'])}"
             lines.append(up_line)
@@ -1057,9 +1065,11 @@ def setup(list_configs, namespace, options, force, kube_context, cluster_config)
               help='Only remove this campaign\'s bucket (e.g. campaign-2025-02-27-123456). Without this, removes all campaign buckets.')
 @click.option('--option', '-o', 'options', multiple=True,
               help='Cluster-specific option in key=value format (e.g. gcs_access_key=<key>).')
+@click.option('--workers', '-w', type=int, default=None,
+              help='Concurrent list/delete requests (default: CPU count + 4, at most 32).')
 @click.option('--context', '-x', 'kube_context', default=None,
               help='Kubernetes context to use (default: active context in kubeconfig)')
-def download_cleanup(campaign, options, kube_context):
+def download_cleanup(campaign, options, workers, kube_context):
     """Remove result buckets from cluster S3 without downloading.
 
     Deletes run result buckets (``campaign-*``) from the MinIO S3 server in the cluster.
@@ -1111,6 +1121,8 @@ def download_cleanup(campaign, options, kube_context):
             context=kube_context,
             campaign_id=campaign,
             running_campaigns=running_campaigns,
+            workers=workers,
+            progress_callback=_echo_delete_progress,
         )
         click.echo(f"✓ Removed {count} bucket(s) from S3.")
 
@@ -1125,9 +1137,11 @@ def download_cleanup(campaign, options, kube_context):
               help='Also remove the campaign S3 result bucket(s) from the cluster MinIO server.')
 @click.option('--option', '-o', 'options', multiple=True,
               help='Cluster-specific option in key=value format (e.g. gcs_access_key=<key>). Used with --data when credentials are not stored in the flag file.')
+@click.option('--workers', '-w', type=int, default=None,
+              help='With --data: concurrent list/delete requests (default: CPU count + 4, at most 32).')
 @click.option('--context', '-x', 'kube_context', default=None,
               help='Kubernetes context to use (default: active context in kubeconfig)')
-def run_cleanup(campaign, data, options, kube_context):
+def run_cleanup(campaign, data, options, workers, kube_context):
     """Clean up jobs and pods from a cluster run.
 
     Removes scenario execution jobs and their associated pods. By default
@@ -1225,6 +1239,8 @@ def run_cleanup(campaign, data, options, kube_context):
                 context=kube_context,
                 campaign_id=campaign,
                 running_campaigns=running_campaigns,
+                workers=workers,
+                progress_callback=_echo_delete_progress,
             )
             click.echo(f"✓ Removed {count} S3 bucket(s).")
 
@@ -1398,7 +1414,8 @@ def prepare_run(output, config, runs, cluster_config, options, log_tree, kube_co
             job_runner = BatchJobRunner.for_batch(
                 campaign_data=campaign_data, campaign_id=campaign_id, batch_tag=None,
                 runs=num_runs, cluster_config=cluster_config, namespace=namespace,
-                image=image, kube_context=kube_context, log_tree=log_tree)
+                image=image, kube_context=kube_context, log_tree=log_tree,
+                results_dir=project_config.results_dir)
 
             click.echo(f"Preparing run configuration 'ID: {campaign_id}', run configs: "
                        f"{len(campaign_data['configs'])}, runs per run config: {num_runs}...")
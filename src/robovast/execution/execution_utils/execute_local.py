@@ -31,7 +31,7 @@ from robovast.common.execution import (build_job_parameter_documents,
                                        dump_multi_document_yaml,
                                        resolve_robovast_image,
                                        write_job_links_manifest)
-from robovast.execution.packer import build_jobs
+from robovast.execution.packer import annotate_durations, build_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -805,6 +805,8 @@ def generate_compose_run_script(runs, campaign_data, config_path_result, pre_com
         os.path.dirname(campaign_data["vast"]), campaign_data["scenario_file"])
     scenario_name = next(iter(get_scenario_parameters(scenario_path).keys()))
 
+    annotate_durations(campaign_data["configs"], execution_params, results_dir,
+                       campaign_data.get("vast"))
     jobs = build_jobs(campaign_data["configs"], runs, execution_params)
     os.makedirs(os.path.join(config_path_result, "_transient"), exist_ok=True)
     # Canonical record of the per-job artifact links (also used by the cluster
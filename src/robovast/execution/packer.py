@@ -28,18 +28,36 @@ and *how* a job is dispatched (local vs. cluster). Crucially, results stay keyed
 by configuration name / run number regardless of how work items were packed, so
 downstream reading and post-processing never need to know about packing.
 
-Two packers are provided:
+Three packers are provided:
 
 * :class:`OnePerJob` — one work item per job (one job == one config/run).
   The right choice when setup dominates and one job should be one scenario
   (e.g. Gazebo). This is the default.
 * :class:`FixedK` — up to ``k`` work items per job.
-
-Use :func:`build_jobs` to select and apply the packer from an execution config.
+* :class:`LongestProcessingTimeFirst` — jobs of about ``job_duration`` seconds,
+  balanced by each config's predicted run time (longest-processing-time-first
+  bin packing), so one slow config does not make its job the batch's tail.
+  Predictions come from a :class:`DurationModel` over earlier runs and are
+  attached to the configs (``_predicted_duration_s``) before packing, by
+  :func:`annotate_durations` wherever jobs are built.
+
+Use :func:`build_jobs` to select and apply the packer from an execution config,
+and :func:`makespan_report` to compare a packing's prediction with what ran.
 """
 
+import csv
+import heapq
 import logging
+import math
+import os
+import statistics
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from robovast.common.config_identifier import hash_file_content
+from robovast.common.run_summary import read_run_summaries
+from robovast.common.store import STORE_FILENAME
 
 logger = logging.getLogger(__name__)
 
@@ -72,9 +90,12 @@ class JobSpec:
         items: The work items, in execution order.
         index: 0-based index of this job within the campaign (stable, used for
             job naming and progress display).
+        predicted_s: Predicted duration in seconds (duration-aware packing
+            only, else ``None``).
     """
     items: list[WorkItem]
     index: int = 0
+    predicted_s: Optional[float] = None
 
     @property
     def config_names(self) -> list[str]:
@@ -117,6 +138,220 @@ class FixedK(Packer):
         return jobs
 
 
+DURATION_KEY = "_predicted_duration_s"
+
+#: Most recent campaigns of a results directory consulted for run durations.
+DURATION_HISTORY_CAMPAIGNS = 20
+
+
+class DurationModel:
+    """Predicts the per-run duration (seconds) of configurations.
+
+    Known configs (same name seen before, e.g. an earlier campaign of the same
+    ``.vast``) are predicted by the mean of their observed ``test.xml`` run
+    times. Unknown ones are predicted from a numeric config *feature* (e.g.
+    ``_path_length``) by a least-squares line fitted on the known configs that
+    carry it; without a usable fit the median known duration is used, and
+    ``default_s`` when nothing was observed at all.
+    """
+
+    def __init__(self, history: Optional[dict[str, float]] = None, *,
+                 default_s: float = 60.0, feature: str = "_path_length"):
+        self.default_s = default_s
+        self.feature = feature
+        self._totals: dict[str, list] = {}
+        for name, duration in (history or {}).items():
+            self.observe(name, duration)
+
+    @classmethod
+    def from_campaigns(cls, campaign_dirs: Iterable[Path], **kwargs) -> "DurationModel":
+        """Build from the completed runs (``<campaign>/<config>/<run>/test.xml``)."""
+        model = cls(**kwargs)
+        run_dirs = [run_dir for campaign_dir in campaign_dirs
+                    for config_dir in Path(campaign_dir).iterdir()
+                    if config_dir.is_dir() and not config_dir.name.startswith((".", "_"))
+                    for run_dir in config_dir.iterdir() if run_dir.name.isdigit()]
+        for run_dir, summary in read_run_summaries(run_dirs).items():
+            if summary is not None and summary["parse_error"] is None:
+                model.observe(run_dir.parent.name, summary["duration_sec"])
+        return model
+
+    @classmethod
+    def from_results_dir(cls, results_dir, vast_file=None,
+                         limit: int = DURATION_HISTORY_CAMPAIGNS, **kwargs) -> "DurationModel":
+        """Build from the *limit* most recent campaigns of *vast_file* in *results_dir*.
+
+        Config names repeat across ``.vast`` files, so only campaigns whose
+        ``_config`` copy of the ``.vast`` has the same content count as history;
+        without a *vast_file* the model starts empty.
+        """
+        results_dir = Path(results_dir) if results_dir else None
+        if results_dir is None or not results_dir.is_dir() or not vast_file \
+                or not os.path.isfile(vast_file):
+            return cls(**kwargs)
+        vast_hash = hash_file_content(vast_file)
+        campaigns = sorted(
+            (d for d in results_dir.iterdir() if (d / STORE_FILENAME).exists()
+             and any(hash_file_content(str(v)) == vast_hash
+                     for v in (d / "_config").glob("*.vast"))),
+            key=lambda d: d.stat().st_mtime, reverse=True)
+        return cls.from_campaigns(campaigns[:limit], **kwargs)
+
+    def observe(self, config_name: str, duration_s: float) -> None:
+        if duration_s > 0:
+            total = self._totals.setdefault(config_name, [0.0, 0])
+            total[0] += duration_s
+            total[1] += 1
+
+    def known(self, config_name: str) -> Optional[float]:
+        total = self._totals.get(config_name)
+        return total[0] / total[1] if total else None
+
+    def _feature(self, config: dict) -> Optional[float]:
+        value = config.get(self.feature, (config.get("config") or {}).get(self.feature))
+        return float(value) if isinstance(value, (int, float)) else None
+
+    def predict(self, configs: list[dict]) -> dict[str, float]:
+        """Predicted per-run seconds for each config, keyed by name."""
+        known = {c["name"]: self.known(c["name"]) for c in configs}
+        points = [(x, known[c["name"]]) for c in configs
+                  if known[c["name"]] is not None and (x := self._feature(c)) is not None]
+        fit = None
+        if len({x for x, _y in points}) >= 2:
+            mean_x = statistics.fmean(x for x, _y in points)
+            mean_y = statistics.fmean(y for _x, y in points)
+            slope = (sum((x - mean_x) * (y - mean_y) for x, y in points)
+                     / sum((x - mean_x) ** 2 for x, _y in points))
+            fit = (mean_y - slope * mean_x, slope)
+        observed = [self.known(n) for n in self._totals]
+        fallback = statistics.median(observed) if observed else self.default_s
+        floor = min(observed) if observed else self.default_s
+        out = {}
+        for config in configs:
+            duration = known[config["name"]]
+            if duration is None:
+                x = self._feature(config)
+                duration = (max(floor, fit[0] + fit[1] * x)
+                            if fit is not None and x is not None else fallback)
+            out[config["name"]] = duration
+        return out
+
+    def annotate(self, configs: list[dict]) -> None:
+        """Store each config's prediction under :data:`DURATION_KEY`.
+
+        Underscore keys are internal: they are not written to the config files.
+        """
+        predictions = self.predict(configs)
+        for config in configs:
+            config[DURATION_KEY] = predictions[config["name"]]
+
+
+def annotate_durations(configs: list[dict], execution_cfg: dict,
+                       results_dir, vast_file=None) -> Optional[DurationModel]:
+    """Attach predicted run times for duration-aware packing, where missing.
+
+    A no-op (returning ``None``) unless ``execution.job_duration`` is set and
+    some config has no :data:`DURATION_KEY` yet (the controller annotates its
+    batches itself). Otherwise predicts from the campaigns of *vast_file* in
+    *results_dir* and returns the model used.
+    """
+    if not execution_cfg.get("job_duration") or all(DURATION_KEY in c for c in configs):
+        return None
+    model = DurationModel.from_results_dir(results_dir, vast_file)
+    model.annotate(configs)
+    return model
+
+
+class LongestProcessingTimeFirst(Packer):
+    """Jobs of about ``target_s`` seconds, balanced by predicted run time.
+
+    Makes ``ceil(total / target_s)`` jobs (more if ``max_items`` caps the work
+    items per job) and assigns work items longest first, each to the currently
+    shortest job that still has room. Items without a prediction count
+    ``default_s``. Within a job, items keep config-major order.
+    """
+
+    def __init__(self, target_s: float, max_items: Optional[int] = None,
+                 default_s: float = 60.0):
+        if target_s <= 0:
+            raise ValueError(f"LongestProcessingTimeFirst requires target_s > 0, got {target_s}")
+        self.target_s = target_s
+        self.max_items = max_items
+        self.default_s = default_s
+
+    def _duration(self, item: WorkItem) -> float:
+        predicted = item.config.get(DURATION_KEY)
+        return float(predicted) if predicted is not None else self.default_s
+
+    def pack(self, items: list[WorkItem]) -> list[JobSpec]:
+        if not items:
+            return []
+        durations = [self._duration(it) for it in items]
+        n_jobs = max(1, math.ceil(sum(durations) / self.target_s))
+        if self.max_items:
+            n_jobs = max(n_jobs, math.ceil(len(items) / self.max_items))
+        n_jobs = min(n_jobs, len(items))
+        # (load, job) min-heap; a full job is dropped from the heap.
+        heap = [(0.0, j) for j in range(n_jobs)]
+        members: list[list[int]] = [[] for _ in range(n_jobs)]
+        loads = [0.0] * n_jobs
+        for i in sorted(range(len(items)), key=lambda i: -durations[i]):
+            load, j = heapq.heappop(heap)
+            members[j].append(i)
+            loads[j] = load + durations[i]
+            if not self.max_items or len(members[j]) < self.max_items:
+                heapq.heappush(heap, (loads[j], j))
+        order = sorted(range(n_jobs), key=lambda j: min(members[j]))
+        return [JobSpec(items=[items[i] for i in sorted(members[j])], index=k,
+                        predicted_s=loads[j])
+                for k, j in enumerate(order)]
+
+
+def makespan_report(jobs: list[JobSpec], campaign_root: str) -> dict:
+    """Predicted vs. actual duration of a packed batch, once it has run.
+
+    The makespan is the longest job — the batch's wall time when every job gets
+    a slot. A job's actual time is the sum of its runs' ``test.xml`` times.
+    Returns ``{"jobs", "predicted_s", "actual_s", "run_s"}`` where ``run_s`` maps
+    config name to its observed run times; ``predicted_s`` is ``None`` unless
+    the jobs were packed by duration.
+    """
+    run_dirs = {(it.config_name, it.run_number):
+                Path(campaign_root) / it.config_name / str(it.run_number)
+                for job in jobs for it in job.items}
+    summaries = read_run_summaries(run_dirs.values())
+    actual, run_s = [], {}
+    for job in jobs:
+        total = 0.0
+        for it in job.items:
+            summary = summaries[run_dirs[(it.config_name, it.run_number)]]
+            if summary is not None and summary["parse_error"] is None:
+                total += summary["duration_sec"]
+                run_s.setdefault(it.config_name, []).append(summary["duration_sec"])
+        actual.append(total)
+    predicted = [job.predicted_s for job in jobs]
+    return {"jobs": len(jobs),
+            "predicted_s": max(predicted) if predicted and None not in predicted else None,
+            "actual_s": max(actual, default=0.0), "run_s": run_s}
+
+
+MAKESPAN_FIELDS = ("batch", "jobs", "predicted_s", "actual_s")
+
+
+def write_makespan_report(path: str, batch: str, report: dict) -> None:
+    """Append one batch's :func:`makespan_report` to the CSV at *path*."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    new = not os.path.exists(path)
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=MAKESPAN_FIELDS, extrasaction="ignore")
+        if new:
+            writer.writeheader()
+        writer.writerow({**report, "batch": batch,
+                         "predicted_s": ("" if report["predicted_s"] is None
+                                         else round(report["predicted_s"], 1)),
+                         "actual_s": round(report["actual_s"], 1)})
+
+
 def build_work_items(configs: list[dict], runs: int) -> list[WorkItem]:
     """Enumerate work items for a campaign.
 
@@ -137,6 +372,8 @@ def build_work_items(configs: list[dict], runs: int) -> list[WorkItem]:
 def select_packer(execution_cfg: dict) -> Packer:
     """Select a packer from an execution config dict.
 
+    ``job_duration`` (seconds) selects :class:`LongestProcessingTimeFirst`,
+    with ``runs_per_job`` > 1 as its cap on runs per job. Otherwise
     ``runs_per_job`` (default 1) drives the choice: 1 selects
     :class:`OnePerJob` (one run per job — the historical behaviour); a value
     >1 selects :class:`FixedK`.
@@ -144,6 +381,9 @@ def select_packer(execution_cfg: dict) -> Packer:
     k = int(execution_cfg.get("runs_per_job") or 1)
     if k < 1:
         raise ValueError(f"execution.runs_per_job must be >= 1, got {k}")
+    target = execution_cfg.get("job_duration")
+    if target:
+        return LongestProcessingTimeFirst(float(target), max_items=k if k > 1 else None)
     return FixedK(k) if k > 1 else OnePerJob()
 
 
@@ -0,0 +1,161 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Run one campaign on several execution backends at once.
+
+:class:`ShardingBackend` is an :class:`~robovast.execution.backends.ExecutionBackend`
+wrapping several others (e.g. two clusters and a few workstations), each with a
+declared ``capacity`` — the number of work items (config x run) it runs at once.
+A batch's configs go into a shared queue; one worker per backend repeatedly
+takes a *shard* of about ``capacity`` work items (never more than its
+capacity-proportional share of the batch) and runs it as a sub-batch. A backend
+that finishes early simply takes the next shard, so the split rebalances to the
+backends' actual speed. If a backend fails, its shard is put back for the others
+and the backend gets no further work in this batch.
+
+Shards are whole configs: all runs of a config go to one backend, so run numbers
+and each backend's own packing (:mod:`robovast.execution.packer`) are
+unchanged. Every backend delivers into the one ``campaign_root``, which is where
+results must land for any backend, so nothing needs merging afterwards.
+"""
+
+import logging
+import math
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from .backends import ExecutionBackend, RunOptions, _sanitize
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Shard:
+    """One wrapped backend.
+
+    Attributes:
+        name: Label used in logs and sub-batch tags (``<batch_tag>-<name>-<n>``).
+        backend: The wrapped backend.
+        capacity: Work items (config x run) it executes concurrently (>= 1).
+    """
+    name: str
+    backend: ExecutionBackend
+    capacity: int = 1
+
+    def __post_init__(self):
+        if self.capacity < 1:
+            raise ValueError(f"Shard '{self.name}' requires capacity >= 1, "
+                             f"got {self.capacity}")
+
+
+class ShardingBackend(ExecutionBackend):
+    """Splits each batch across several backends by capacity (see module doc)."""
+
+    def __init__(self, shards: list[Shard]):
+        if not shards:
+            raise ValueError("ShardingBackend requires at least one shard")
+        names = [s.name for s in shards]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Shard names must be unique, got {names}")
+        self.shards = shards
+        # One worker per shard calls its backend serially, so only concurrent
+        # batches of the whole sharding backend need each backend's support.
+        self.supports_concurrent_batches = all(
+            s.backend.supports_concurrent_batches for s in shards)
+        self._lock = threading.Lock()
+        # Work items finished on shards that cannot count their own artifacts.
+        self._finished_uncounted = 0
+
+    def run_batch(self, campaign_data: dict, *, campaign_root: str, batch_tag: str,
+                  runs: int, options: RunOptions) -> None:
+        queue = deque(campaign_data["configs"])
+        campaign_id = os.path.basename(os.path.normpath(campaign_root))
+        total_items = len(queue) * runs
+        failed: dict[str, BaseException] = {}
+        queue_lock = threading.Lock()
+        seq = {s.name: 0 for s in self.shards}
+
+        def _take(shard: Shard, total_capacity: int) -> list[dict]:
+            share = math.ceil(total_items * shard.capacity / total_capacity)
+            n = max(1, min(shard.capacity, share) // max(runs, 1))
+            with queue_lock:
+                return [queue.popleft() for _ in range(min(n, len(queue)))]
+
+        def _work(shard: Shard, total_capacity: int) -> None:
+            while True:
+                configs = _take(shard, total_capacity)
+                if not configs:
+                    return
+                tag = f"{batch_tag}-{_sanitize(shard.name)}-{seq[shard.name]}"
+                seq[shard.name] += 1
+                logger.info("Shard %s: running %d config(s) x %d run(s) as %s",
+                            shard.name, len(configs), runs, tag)
+                try:
+                    shard.backend.run_batch(
+                        {**campaign_data, "configs": configs}, campaign_root=campaign_root,
+                        batch_tag=tag, runs=runs, options=options)
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.error("Shard %s failed on %s (%s); handing its %d config(s) "
+                                 "to the other shards", shard.name, tag, exc, len(configs))
+                    with queue_lock:
+                        queue.extendleft(reversed(configs))
+                        failed[shard.name] = exc
+                    return
+                if shard.backend.count_run_artifacts(campaign_id) is None:
+                    with self._lock:
+                        self._finished_uncounted += len(configs) * runs
+
+        # A failed shard's configs may be re-queued after the others drained the
+        # queue and exited, so go round until it is empty or no shard is left.
+        while queue:
+            alive = [s for s in self.shards if s.name not in failed]
+            if not alive:
+                name, exc = next(reversed(failed.items()))
+                raise RuntimeError(
+                    f"Batch {batch_tag}: all shards failed, {len(queue)} config(s) not "
+                    f"run (last failure on shard '{name}': {exc})") from exc
+            total_capacity = sum(s.capacity for s in alive)
+            threads = [threading.Thread(target=_work, args=(shard, total_capacity),
+                                        name=f"robovast-shard-{shard.name}", daemon=True)
+                       for shard in alive]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        if failed:
+            logger.warning("Batch %s completed without failed shard(s) %s",
+                           batch_tag, sorted(failed))
+
+    def finalize_campaign(self, campaign_root: str) -> None:
+        for shard in self.shards:
+            shard.backend.finalize_campaign(campaign_root)
+
+    def results_moved(self, campaign_root: str, moves: dict[str, str]) -> None:
+        # Each backend only touches the runs it holds; re-keying the shared
+        # job-link manifest a second time finds nothing left to move.
+        for shard in self.shards:
+            shard.backend.results_moved(campaign_root, moves)
+
+    def count_run_artifacts(self, campaign_id: str) -> int | None:
+        """Runs published by the shards that can count them, plus runs of
+        finished sub-batches on the shards that cannot (local backends)."""
+        counts = [s.backend.count_run_artifacts(campaign_id) for s in self.shards]
+        if all(c is None for c in counts):
+            return None
+        with self._lock:
+            return sum(c for c in counts if c is not None) + self._finished_uncounted
@@ -0,0 +1,164 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Controller-side work queue for warm-pool execution.
+
+In warm-pool mode (``execution.warm_pool``) a batch is not one Kubernetes Job per
+:class:`~robovast.execution.packer.JobSpec`. Instead a fixed number of long-lived
+worker pods each pay the container / ROS / virtual-display bring-up once and
+then pull JobSpecs from this queue — served over the controller's control
+channel (:mod:`robovast.execution.control_server`) — until the batch is done.
+Fast pods simply pull more, so the batch has no straggling tail of queued jobs.
+
+A claimed unit is *leased*: if its worker does not complete it within
+``lease_s`` (the pod died, was evicted …) it goes back to the queue for another
+worker, and a completion the original worker reports afterwards is ignored. A
+unit whose lease expired ``max_attempts`` times (it keeps killing or stalling its
+workers) is marked failed instead of being handed out again. Workers keep
+polling while units are leased elsewhere and stop once every unit is complete
+or failed. Completions carry the worker's per-item timings (see
+``data/warm_worker.py``), which :meth:`WorkQueue.write_timings` publishes as a
+CSV under the campaign's ``_execution/`` directory.
+"""
+
+import csv
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Columns of the per-item timing CSV (one row per completed work item).
+TIMING_FIELDS = ("unit", "worker", "config", "run", "startup_s", "run_s", "teardown_s")
+
+# Leases a unit may lose before it is marked failed.
+MAX_ATTEMPTS = 3
+
+
+@dataclass
+class QueueUnit:
+    """One claimable unit: a packed job's parameter file content.
+
+    Attributes:
+        id: Unique within the queue (e.g. ``"batch-3-job-7"``).
+        documents: The job's multi-document scenario-parameter YAML.
+        items: ``[config_name, run_number]`` of each work item, in order.
+    """
+    id: str
+    documents: str
+    items: list[list] = field(default_factory=list)
+
+
+class WorkQueue:
+    """Thread-safe queue of :class:`QueueUnit` with leases (see module doc)."""
+
+    def __init__(self, units: list[QueueUnit], lease_s: float = 3600.0,
+                 max_attempts: int = MAX_ATTEMPTS):
+        self.lease_s = lease_s
+        self.max_attempts = max_attempts
+        self._units = {u.id: u for u in units}
+        self._pending = deque(u.id for u in units)
+        self._leases: dict[str, tuple[str, float]] = {}   # unit -> (worker, expiry)
+        self._attempts: dict[str, int] = {}                # unit -> leases handed out
+        self._done: set[str] = set()
+        self._failed: list[str] = []
+        self._timings: list[dict] = []
+        self._lock = threading.Lock()
+        self._all_done = threading.Event()
+        if not units:
+            self._all_done.set()
+
+    def _finished(self) -> bool:
+        return len(self._done) + len(self._failed) == len(self._units)
+
+    def _expire(self, now: float) -> None:
+        for unit_id, (_worker, expiry) in list(self._leases.items()):
+            if expiry <= now:
+                del self._leases[unit_id]
+                if self._attempts[unit_id] >= self.max_attempts:
+                    self._failed.append(unit_id)
+                else:
+                    self._pending.appendleft(unit_id)
+        if self._finished():
+            self._all_done.set()
+
+    def claim(self, worker: str) -> tuple[Optional[QueueUnit], bool]:
+        """Lease the next unit to *worker*.
+
+        Returns ``(unit, done)``: ``(None, False)`` means nothing is pending but
+        units are leased elsewhere (poll again), ``(None, True)`` that the
+        queue is finished.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            if not self._pending:
+                return None, self._finished()
+            unit_id = self._pending.popleft()
+            self._leases[unit_id] = (worker, now + self.lease_s)
+            self._attempts[unit_id] = self._attempts.get(unit_id, 0) + 1
+            return self._units[unit_id], False
+
+    def complete(self, worker: str, unit_id: str, timings: list[dict]) -> bool:
+        """Mark *unit_id* done with its per-item *timings*.
+
+        Returns ``False`` (and ignores the report) unless *worker* holds an
+        unexpired lease on the unit: late reports from a worker whose lease
+        expired are dropped, as the unit is re-run (or was already) elsewhere.
+        """
+        with self._lock:
+            lease = self._leases.get(unit_id)
+            if lease is None or lease[0] != worker or lease[1] <= time.monotonic():
+                return False
+            del self._leases[unit_id]
+            self._done.add(unit_id)
+            self._timings.extend({**t, "unit": unit_id, "worker": worker} for t in timings)
+            if self._finished():
+                self._all_done.set()
+            return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every unit is complete or failed (``False`` on timeout)."""
+        with self._lock:
+            self._expire(time.monotonic())
+        return self._all_done.wait(timeout)
+
+    @property
+    def remaining(self) -> int:
+        """Units neither complete nor failed."""
+        with self._lock:
+            return len(self._units) - len(self._done) - len(self._failed)
+
+    @property
+    def failed(self) -> list[str]:
+        """Ids of units given up after ``max_attempts`` expired leases."""
+        with self._lock:
+            return list(self._failed)
+
+    def timings(self) -> list[dict]:
+        with self._lock:
+            return list(self._timings)
+
+    def write_timings(self, path: str) -> int:
+        """Write the collected per-item timings as CSV; returns the row count."""
+        rows = self.timings()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=TIMING_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+        return len(rows)
@@ -21,7 +21,9 @@ import fnmatch
 import os
 import sys
 import tarfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -32,9 +34,12 @@ from robovast.common import fmt_size as _fmt_size, make_download_progress_callba
 from robovast.common.cli import get_project_config, handle_cli_exception
 from robovast.common.cli.project_config import ProjectConfig
 from robovast.common.execution import is_campaign_dir
-from robovast.results_processing.merge_results import merge_results
+from robovast.results_processing.merge_results import (MERGE_MODES,
+                                                       merge_results)
 from robovast.execution.cluster_execution.share_providers import \
     load_share_provider_plugins
+from robovast.execution.cluster_execution.share_providers.segmented import (
+    STATE_SUFFIX, download_segmented, verify_archive)
 from robovast.results_processing import run_postprocessing
 from robovast.results_processing.fair_metadata import generate_prov_metadata
 from robovast.results_processing.metadata import generate_campaign_metadata
@@ -227,13 +232,25 @@ def publish_cmd(results_dir, force, skip_postprocessing, skip_upload, campaign):
 @click.argument('merged_campaign_dir', type=click.Path())
 @click.option('--results-dir', '-r', default=None,
               help='Source directory containing run-\\* directories (uses project results directory if not specified)')
-def merge_results_cmd(merged_campaign_dir, results_dir):
+@click.option('--mode', type=click.Choice(MERGE_MODES), default='copy', show_default=True,
+              help='How run files are placed: copied, reflinked (copy-on-write, where the '
+                   'filesystem supports it) or hardlinked. Files that cannot be linked are copied.')
+@click.option('--rebuild', is_flag=True, default=False,
+              help='Rebuild the merged campaign instead of only adding new runs to it.')
+@click.option('--workers', type=int, default=None,
+              help='Concurrent file operations (default: CPU count + 4, at most 32).')
+def merge_results_cmd(merged_campaign_dir, results_dir, mode, rebuild, workers):
     """Merge campaign directories with identical configs into one merged_campaign_dir.
 
     Groups campaign-directory/config-directory by config_identifier from config.yaml.
     Run folders (0, 1, 2, ...) from all campaigns are renumbered and copied.
     Original campaign directories are not modified.
 
+    Re-running after new campaigns were added only places the new runs; runs
+    merged before keep their numbers. With ``--mode hardlink`` the merged files
+    share storage with the sources, so tools that rewrite files in place must
+    not be run on the merged campaign.
+
     Requires project initialization with ``vast init`` first (unless ``--results-dir`` is specified).
     """
     if results_dir is not None:
@@ -244,7 +261,8 @@ def merge_results_cmd(merged_campaign_dir, results_dir):
 
     click.echo(f"Merging from {source_dir} into {merged_campaign_dir}...")
     try:
-        success, message = merge_results(source_dir, merged_campaign_dir)
+        success, message = merge_results(source_dir, merged_campaign_dir, mode=mode,
+                                         incremental=not rebuild, workers=workers)
         if success:
             click.echo(f"\u2713 {message}")
         else:
@@ -464,9 +482,14 @@ def _load_share_dotenv() -> None:
               help='Re-download and re-extract even if the campaign directory already exists')
 @click.option('--keep-archive', is_flag=True,
               help='Keep the downloaded .tar.gz file after extraction')
+@click.option('--segments', '-s', type=int, default=1, show_default=True,
+              help='Download each archive over this many parallel connections (HTTP range '
+                   'requests or parallel SFTP reads); finished segments survive interruptions')
+@click.option('--parallel', '-p', type=int, default=1, show_default=True,
+              help='Number of archives downloaded at the same time')
 @click.option('--debug', is_flag=True,
               help='Print HTTP request/response details (URL, status, headers) for debugging')
-def download_from_share_cmd(output, campaigns, force, keep_archive, debug):
+def download_from_share_cmd(output, campaigns, force, keep_archive, segments, parallel, debug):
     """Download campaign archives from the configured share service.
 
     Reads the same ``.env`` configuration as ``cluster upload-to-share``.
@@ -475,9 +498,13 @@ def download_from_share_cmd(output, campaigns, force, keep_archive, debug):
     \b
     1. Checks whether the campaign directory already exists locally
        (skips the download if it does, unless ``--force`` is given).
-    2. Streams the archive to a temporary file with a live progress bar.
-    3. Extracts the archive into the output directory.
-    4. Removes the temporary archive (unless ``--keep-archive``).
+    2. Streams the archive to a temporary file with a live progress bar
+       (with ``--segments N`` over N connections, resumable per segment).
+    3. Verifies its size and, where the share reports one, its checksum.
+    4. Extracts the archive into the output directory.
+    5. Removes the temporary archive (unless ``--keep-archive``).
+
+    With ``--parallel N`` up to N archives are downloaded at the same time.
 
     Required ``.env`` variables:
 
@@ -571,84 +598,144 @@ def download_from_share_cmd(output, campaigns, force, keep_archive, debug):
                 f"Requested: {', '.join(sorted(requested))}"
             )
 
-    downloaded = 0
-    skipped = 0
+    segmented = segments > 1 and provider.supports_segmented_download()
+    if segments > 1 and not segmented:
+        click.echo(f"{share_type} does not support segmented downloads; using one stream per archive.")
 
+    skipped = 0
+    todo = []
     for object_name in archives:
-        base = os.path.basename(object_name)
-        campaign_id = base[: -len(".tar.gz")] if base.endswith(".tar.gz") else base
-        campaign_dir = output_path / campaign_id
-
-        if campaign_dir.exists() and not force:
+        campaign_id = _archive_campaign_id(object_name)
+        if (output_path / campaign_id).exists() and not force:
             click.echo(f"  {campaign_id}  already exists, skipping (use --force to re-download)")
             skipped += 1
             continue
+        todo.append(object_name)
+
+    def _download(object_name, progress_cb):
+        _download_and_extract(provider, object_name, output_path, keep_archive,
+                              segments if segmented else 1, progress_cb)
+
+    if parallel <= 1 or len(todo) <= 1:
+        for object_name in todo:
+            progress_cb = make_download_progress_callback(_archive_campaign_id(object_name),
+                                                          time.monotonic())
+            try:
+                _download(object_name, progress_cb)
+            except (click.UsageError, click.ClickException):
+                raise
+            except Exception as exc:  # pylint: disable=broad-except
+                handle_cli_exception(exc)
+    else:
+        # One progress bar over all concurrent downloads.
+        lock = threading.Lock()
+        progress = {}
+        overall_cb = make_download_progress_callback(f"{len(todo)} archives", time.monotonic())
+
+        def _archive_cb(object_name):
+            def _cb(received, total):
+                with lock:
+                    progress[object_name] = (received, total)
+                    overall_cb(sum(r for r, _ in progress.values()),
+                               sum(t for _, t in progress.values()))
+            return _cb
+
+        with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="robovast-download") as pool:
+            futures = {name: pool.submit(_download, name, _archive_cb(name)) for name in todo}
+        failures = [f"{_archive_campaign_id(name)}: {future.exception()}"
+                    for name, future in futures.items() if future.exception() is not None]
+        if failures:
+            raise click.ClickException("Some downloads failed (run again to resume):\n  "
+                                       + "\n  ".join(failures))
+
+    click.echo()
+    parts = [f"✓ Downloaded {len(todo)} campaign(s)"]
+    if skipped:
+        parts.append(f"{skipped} skipped")
+    click.echo("  ".join(parts))
 
-        # Use a deterministic partial-download path so we can resume
-        tmp_path = str(output_path / f".{base}.part")
-        resume_offset = 0
-        if os.path.exists(tmp_path):
-            resume_offset = os.path.getsize(tmp_path)
-            click.echo(f"  {campaign_id}  resuming from {resume_offset / 1024 / 1024:.1f} MiB...")
-        else:
-            click.echo(f"  {campaign_id}  downloading...")
 
-        start = time.monotonic()
-        progress_cb = make_download_progress_callback(campaign_id, start)
+def _archive_campaign_id(object_name):
+    base = os.path.basename(object_name)
+    return base[: -len(".tar.gz")] if base.endswith(".tar.gz") else base
 
-        # Keep the .part file when the download fails mid-transfer so the
-        # next invocation can resume from where it left off.
-        download_complete = False
+
+def _download_and_extract(provider, object_name, output_path, keep_archive, segments, progress_cb):
+    """Download one campaign archive (resuming a partial one), verify and extract it."""
+    base = os.path.basename(object_name)
+    campaign_id = _archive_campaign_id(object_name)
+
+    # Use a deterministic partial-download path so we can resume
+    tmp_path = str(output_path / f".{base}.part")
+    state_path = tmp_path + STATE_SUFFIX
+    start = time.monotonic()
+
+    # Keep the .part file when the download fails mid-transfer so the
+    # next invocation can resume from where it left off.
+    download_complete = False
+    try:
         try:
-            try:
+            if segments > 1:
+                click.echo(f"  {campaign_id}  {'resuming' if os.path.exists(state_path) else 'downloading'}"
+                           f" over {segments} connections...")
+                download_segmented(provider, object_name, tmp_path, progress_cb, connections=segments)
+            else:
+                if os.path.exists(state_path):
+                    # A segmented .part is sparse: it cannot be appended to.
+                    os.unlink(state_path)
+                    os.unlink(tmp_path)
+                resume_offset = 0
+                if os.path.exists(tmp_path):
+                    resume_offset = os.path.getsize(tmp_path)
+                    click.echo(f"  {campaign_id}  resuming from {resume_offset / 1024 / 1024:.1f} MiB...")
+                else:
+                    click.echo(f"  {campaign_id}  downloading...")
                 provider.download_archive(
                     object_name, tmp_path, progress_cb,
                     resume_offset=resume_offset,
                 )
-            except Exception as exc:
-                if isinstance(exc, (click.UsageError, click.ClickException)):
-                    raise
-                handle_cli_exception(exc)
-                continue
-            finally:
-                sys.stdout.write("\n")
-                sys.stdout.flush()
+                # Verification is best-effort: a share that cannot be asked
+                # (or does not report a size) still yields a usable download.
+                try:
+                    size, checksum = provider.archive_info(object_name)
+                except NotImplementedError:
+                    pass
+                except Exception as exc:  # pylint: disable=broad-except
+                    click.echo(f"\n  Warning: cannot verify '{base}': {exc}")
+                else:
+                    verify_archive(tmp_path, size, checksum)
+        finally:
+            sys.stdout.write("\n")
+            sys.stdout.flush()
 
-            # Extract
-            click.echo(f"  {campaign_id}  extracting...")
-            try:
-                with tarfile.open(tmp_path, "r:gz") as tf:
-                    tf.extractall(output_path)
-            except tarfile.TarError as exc:
-                raise click.ClickException(
-                    f"Failed to extract '{base}': {exc}"
-                ) from exc
-
-            elapsed = time.monotonic() - start
-            size_mib = os.path.getsize(tmp_path) / 1024 / 1024
-            click.echo(
-                f"  {campaign_id}  ✓  {size_mib:.1f} MiB in {elapsed:.0f}s"
-            )
-            downloaded += 1
+        # Extract
+        click.echo(f"  {campaign_id}  extracting...")
+        try:
+            with tarfile.open(tmp_path, "r:gz") as tf:
+                tf.extractall(output_path)
+        except tarfile.TarError as exc:
+            raise click.ClickException(
+                f"Failed to extract '{base}': {exc}"
+            ) from exc
 
-            if keep_archive:
-                dest_archive = output_path / base
-                os.replace(tmp_path, dest_archive)
-                tmp_path = ""  # don't delete below
-            download_complete = True
-        finally:
-            # Only remove the .part file after a fully successful
-            # download+extraction.  Any other exit path — network error,
-            # click exception, or Ctrl+C (KeyboardInterrupt) — leaves the
-            # partial file in place so the next run can resume.
-            if tmp_path and os.path.exists(tmp_path) and download_complete:
-                os.unlink(tmp_path)
+        elapsed = time.monotonic() - start
+        size_mib = os.path.getsize(tmp_path) / 1024 / 1024
+        click.echo(
+            f"  {campaign_id}  ✓  {size_mib:.1f} MiB in {elapsed:.0f}s"
+        )
 
-    click.echo()
-    parts = [f"✓ Downloaded {downloaded} campaign(s)"]
-    if skipped:
-        parts.append(f"{skipped} skipped")
-    click.echo("  ".join(parts))
+        if keep_archive:
+            dest_archive = output_path / base
+            os.replace(tmp_path, dest_archive)
+            tmp_path = ""  # don't delete below
+        download_complete = True
+    finally:
+        # Only remove the .part file after a fully successful
+        # download+extraction.  Any other exit path — network error,
+        # click exception, or Ctrl+C (KeyboardInterrupt) — leaves the
+        # partial file in place so the next run can resume.
+        if tmp_path and os.path.exists(tmp_path) and download_complete:
+            os.unlink(tmp_path)
 
 
 @results.command(name='list-share')
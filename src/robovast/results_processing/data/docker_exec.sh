@@ -36,6 +36,7 @@ OPTIONS:
     --image IMAGE           Use a custom Docker image (default: ghcr.io/cps-test-lab/robovast:latest)
     --compat-version VER    Required compatibility version to check against the image
     --provenance-file PATH  Mount dirname(PATH) at /provenance in the container (for provenance JSON output)
+    --interactive           Keep stdin attached (for long-lived scripts reading jobs from stdin)
     -h, --help              Show this help message
 
 EXAMPLE:
@@ -46,6 +47,7 @@ EOF
 # Provenance mount (optional)
 PROVENANCE_MOUNT=()
 COMPAT_VERSION=""
+INTERACTIVE=()
 
 # Parse command-line arguments
 while [ $# -gt 0 ]; do
@@ -62,6 +64,10 @@ while [ $# -gt 0 ]; do
             COMPAT_VERSION="$2"
             shift 2
             ;;
+        --interactive)
+            INTERACTIVE=(-i)
+            shift
+            ;;
         --provenance-file)
             if [ -z "${2:-}" ]; then
                 echo "Error: --provenance-file requires a path"
@@ -127,6 +133,7 @@ fi
 docker run \
     --name "$CONTAINER_NAME" \
     --rm \
+    "${INTERACTIVE[@]}" \
     --user $(id -u):$(id -g) \
     -e PYTHONUNBUFFERED=1 \
     -v "$SCRIPT_DIR:/scripts:ro" \
@@ -17,6 +17,7 @@
 
 import json
 import os
+import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Optional
 
@@ -132,3 +133,35 @@ def find_rosbags(directory, bag_dir_name="rosbag2"):
                 pending.extend(subdirs)
 
     return sorted(found)
+
+
+# Serve-mode protocol (see robovast.results_processing.rosbags_worker): the
+# worker prints WORKER_READY once, then reads one JSON job per stdin line —
+# {"id": ..., "input": <path relative to the served root>, "argv": [...]} —
+# streams the job's output and ends it with "<JOB_DONE_PREFIX><id> <exit code>".
+WORKER_READY = "Worker ready"
+JOB_DONE_PREFIX = "Job done: "
+
+
+def serve_jobs(root, run_job, stdin=None):
+    """Run jobs read from *stdin* until EOF.
+
+    Args:
+        root: Directory job inputs are relative to.
+        run_job: ``run_job(argv) -> exit code``; called with the job's argv
+            followed by its absolute input directory.
+        stdin: Line iterable to read jobs from (default: ``sys.stdin``).
+    """
+    print(WORKER_READY, flush=True)
+    for line in stdin if stdin is not None else sys.stdin:
+        if not line.strip():
+            continue
+        job_id, code = None, 1
+        try:
+            job = json.loads(line)
+            job_id = job.get("id")
+            input_dir = os.path.normpath(os.path.join(root, job.get("input", ".")))
+            code = run_job([*job.get("argv", []), input_dir])
+        except Exception as e:  # pylint: disable=broad-except
+            print(f"Error: job failed: {e}", flush=True)
+        print(f"{JOB_DONE_PREFIX}{job_id} {code}", flush=True)
@@ -34,6 +34,12 @@ Usage::
         --config '{"plugins": [{"type": "rosout_to_csv"}, {"type": "bt_to_csv"}]}' \\
         --workers 4 \\
         --provenance-file /provenance/process_provenance.json
+
+With ``--serve`` the script stays alive and runs one job per JSON line read
+from stdin (``{"id": ..., "input": <dir relative to INPUT_DIR>, "argv": [...]}``,
+where ``argv`` holds the options above), keeping ROS imports and the worker
+pool between jobs; each job's output ends with ``Job done: <id> <exit code>``.
+Used by ``robovast.results_processing.rosbags_worker``.
 """
 
 import argparse
@@ -59,7 +65,8 @@ from rclpy.serialization import deserialize_message
 from tf2_py import ConnectivityException, ExtrapolationException, LookupException
 import numpy as np
 
-from rosbags_common import find_rosbags, gen_msg_values, write_provenance_entry
+from rosbags_common import (find_rosbags, gen_msg_values, serve_jobs,
+                            write_provenance_entry)
 from rosidl_runtime_py.utilities import get_message
 
 
@@ -855,15 +862,14 @@ def process_rosbag_worker(args: tuple) -> Tuple[str, int, List[Tuple[int, List[s
 # Main
 # ---------------------------------------------------------------------------
 
-def main() -> int:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "input",
-        help="Input directory path to search for rosbags",
+        help="Input directory path to search for rosbags (with --serve: the root job inputs are relative to)",
     )
     parser.add_argument(
         "--config",
-        required=True,
         help='JSON config string: {"plugins": [{"type": "...", ...}, ...]}',
     )
     parser.add_argument(
@@ -892,8 +898,59 @@ def main() -> int:
         action="store_true",
         help="Reprocess all bags even if already cached",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--report-finished",
+        action="store_true",
+        help="Print 'Finished bag: <path relative to input>' as each bag completes",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Stay alive and run jobs read from stdin, one JSON object per line",
+    )
+    return parser
+
+
+def serve(parser: argparse.ArgumentParser, root: str) -> int:
+    """Serve jobs from stdin, keeping imports and the worker pool across jobs."""
+    pools: Dict[int, Any] = {}
+
+    def _run_job(argv: List[str]) -> int:
+        try:
+            args = parser.parse_args(argv)
+        except SystemExit as e:  # argparse exits on invalid arguments
+            return e.code if isinstance(e.code, int) else 2
+        if args.serve:
+            print("Error: --serve is not allowed in a job")
+            return 1
+        if args.workers not in pools:
+            for old in pools.values():
+                old.terminate()
+            pools.clear()
+            pools[args.workers] = Pool(processes=args.workers)
+        return process(args, pools[args.workers])
 
+    try:
+        serve_jobs(root, _run_job)
+    finally:
+        for pool in pools.values():
+            pool.terminate()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.serve:
+        return serve(parser, args.input)
+    return process(args)
+
+
+def process(args: argparse.Namespace, pool: Optional[Any] = None) -> int:
+    """Process the rosbags under ``args.input``, on *pool* if given (else a new one)."""
+    if args.config is None:
+        print("Error: --config is required")
+        return 1
     try:
         plugin_configs: List[dict] = json.loads(args.config)["plugins"]
     except (json.JSONDecodeError, KeyError) as e:
@@ -941,29 +998,36 @@ def main() -> int:
     completed = 0
     all_results: List[Tuple[str, int, List[Tuple[int, List[str]]]]] = []
 
+    own_pool = pool is None
+    if own_pool:
+        pool = Pool(processes=args.workers)
     try:
-        with Pool(processes=args.workers) as pool:
-            for bag_path, bag_total, handler_results in pool.imap_unordered(
-                process_rosbag_worker, process_args, chunksize=1
-            ):
-                completed += 1
-                elapsed = max(time.time() - start, 1e-6)
-                rate = completed / elapsed
-                filled = int(20 * completed / n_bags)
-                progressbar = "█" * filled + "░" * (20 - filled)
-                pct = completed / n_bags * 100
-                remaining = (n_bags - completed) / rate
-                eta_m, eta_s = divmod(int(remaining), 60)
-                eta_str = f"{eta_m}m{eta_s:02d}s" if eta_m else f"{eta_s}s"
-                print(
-                    f"Processing rosbags  [{progressbar}]  {pct:5.1f}%"
-                    f"  {completed}/{n_bags} bag  {rate:.1f} bag/s  ETA {eta_str}",
-                    flush=True,
-                )
-                all_results.append((bag_path, bag_total, handler_results))
+        for bag_path, bag_total, handler_results in pool.imap_unordered(
+            process_rosbag_worker, process_args, chunksize=1
+        ):
+            completed += 1
+            elapsed = max(time.time() - start, 1e-6)
+            rate = completed / elapsed
+            filled = int(20 * completed / n_bags)
+            progressbar = "█" * filled + "░" * (20 - filled)
+            pct = completed / n_bags * 100
+            remaining = (n_bags - completed) / rate
+            eta_m, eta_s = divmod(int(remaining), 60)
+            eta_str = f"{eta_m}m{eta_s:02d}s" if eta_m else f"{eta_s}s"
+            print(
+                f"Processing rosbags  [{progressbar}]  {pct:5.1f}%"
+                f"  {completed}/{n_bags} bag  {rate:.1f} bag/s  ETA {eta_str}",
+                flush=True,
+            )
+            all_results.append((bag_path, bag_total, handler_results))
+            if args.report_finished:
+                print(f"Finished bag: {os.path.relpath(bag_path, input_root)}", flush=True)
     except KeyboardInterrupt:
         print("Processing interrupted by user.")
         return 1
+    finally:
+        if own_pool:
+            pool.terminate()
 
     # Aggregate and write provenance
     for bag_path, bag_total, handler_results in all_results:
@@ -35,8 +35,9 @@ import yaml
 import logging
 import os
 import subprocess
+import textwrap
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import rdflib
 from pyld import jsonld
@@ -65,6 +66,9 @@ _ID = "@id"
 _CONTEXT = "@context"
 _TYPE = "@type"
 
+# Nodes compacted and written per chunk of metadata.prov.json.
+_CHUNK_NODES = 20000
+
 _BASE_CONTEXT = {
     _CONTEXT: [
         "https://secorolab.github.io/metamodels/prov.json",
@@ -361,10 +365,64 @@ def _build_dataset(dataset_iri, campaign_ns: Namespace, metadata: dict, vast_con
     return dataset
 
 
+class _JsonLdWriter:
+    """Writes a JSON-LD ``@graph`` chunk by chunk.
+
+    Each chunk is compacted, flattened and compacted against the IRI context
+    on its own; the nodes of all chunks go into one ``@graph``. A node that
+    several chunks contain (e.g. an entity shared by configurations) appears
+    once per chunk, which JSON-LD merges on load.
+    """
+
+    def __init__(self, path: Path, iri_context: dict):
+        self.path = Path(path)
+        self.iri_context = iri_context
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self._file = open(self._tmp, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+        self._nodes = 0
+        # Remote contexts are fetched once per file, not once per chunk.
+        loader = jsonld.get_document_loader()
+        documents: Dict[str, Any] = {}
+
+        def _load(url, options=None):
+            if url not in documents:
+                documents[url] = loader(url, options or {})
+            return documents[url]
+
+        self._options = {"documentLoader": _load}
+
+    def write(self, nodes: List[dict]) -> None:
+        if not nodes:
+            return
+        document = {"@graph": nodes}
+        document.update(self.iri_context)
+        compact = jsonld.compact(document, _BASE_CONTEXT,
+                                 {"expandContext": _BASE_CONTEXT, "graph": True, **self._options})
+        expanded = jsonld.expand(compact, self._options)
+        flattened = jsonld.flatten(expanded, None, self._options)
+        compact2 = jsonld.compact(flattened, self.iri_context, {"graph": True, **self._options})
+        if self._nodes == 0:
+            context = textwrap.indent(json.dumps(compact2[_CONTEXT], indent=2), "  ").lstrip()
+            self._file.write(f'{{\n  "{_CONTEXT}": {context},\n  "@graph": [')
+        for node in compact2.get("@graph", []):
+            self._file.write(",\n" if self._nodes else "\n")
+            self._file.write(textwrap.indent(json.dumps(node, indent=2), "    "))
+            self._nodes += 1
+
+    def close(self) -> None:
+        if self._nodes == 0:
+            self._file.write(f'{{\n  "{_CONTEXT}": {json.dumps(self.iri_context[_CONTEXT])},\n'
+                             '  "@graph": [')
+        self._file.write("\n  ]\n}\n")
+        self._file.close()
+        os.replace(self._tmp, self.path)
+
+
 def generate_prov_metadata(
     campaign_dir: Path,
     metadata: dict,
     generate_visualization: bool = True,
+    configurations: Optional[Iterable[dict]] = None,
 ) -> Tuple[bool, str]:
     """Generate a PROV-O provenance graph from campaign metadata.
 
@@ -391,6 +449,9 @@ def generate_prov_metadata(
         generate_visualization: When ``True`` (default), also write
             ``metadata.dot`` and render ``metadata.pdf`` via Graphviz.
             Set to ``False`` to skip DOT/PDF generation.
+        configurations: Configuration entries to use instead of
+            ``metadata["configurations"]``, sorted by name. Consumed one at
+            a time, so they can be streamed from disk.
 
     Returns:
         Tuple of ``(success, message)``.
@@ -497,22 +558,30 @@ def generate_prov_metadata(
     }
     graph.append(gen_activity)
 
-    # --- Per-configuration ---
-    all_configs = {c["name"]: c for c in metadata["configurations"]}
+    # The graph is compacted and written in chunks of configurations, so a
+    # large campaign is never held in memory as a whole.
+    prov_json_path = campaign_dir / "metadata.prov.json"
+    writer = _JsonLdWriter(prov_json_path, iri_context)
 
-    config_names = sorted(
+    # --- Per-configuration ---
+    if configurations is None:
+        configurations = sorted(metadata["configurations"], key=lambda c: c["name"])
+    config_dirs = {
         p.name
         for p in campaign_dir.iterdir()
         if p.is_dir() and not p.name.startswith("_")
-    )
+    }
 
-    for config_name in config_names:
-        config_path = config_name + "/"
-        config_ns = Namespace(f"{dataset_iri}{campaign}{config_path}")
+    for config_md in configurations:
+        if len(graph) >= _CHUNK_NODES:
+            writer.write(graph)
+            graph = []
 
-        config_md = all_configs.get(config_name)
-        if config_md is None:
+        config_name = config_md["name"]
+        if config_name not in config_dirs:
             continue
+        config_path = config_name + "/"
+        config_ns = Namespace(f"{dataset_iri}{campaign}{config_path}")
 
         # Concrete scenario node
         scenario_node = {
@@ -785,17 +854,8 @@ def generate_prov_metadata(
         graph.append(metadata_activity)
         graph.append(graph_activity)
 
-    # Compact the JSON-LD graph
-    document = {"@graph": graph}
-    document.update(iri_context)
-    compact = jsonld.compact(document, _BASE_CONTEXT, {"expandContext": _BASE_CONTEXT, "graph": True})
-    expanded = jsonld.expand(compact)
-    flattened = jsonld.flatten(expanded)
-    compact2 = jsonld.compact(flattened, iri_context, {"graph": True})
-
-    prov_json_path = campaign_dir / "metadata.prov.json"
-    with open(prov_json_path, "w", encoding="utf-8") as f:
-        json.dump(compact2, f, indent=2)
+    writer.write(graph)
+    writer.close()
 
     # Optional: generate DOT/PDF visualization via Graphviz
     dot_path = campaign_dir / "metadata.dot"
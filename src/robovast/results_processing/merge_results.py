@@ -18,7 +18,10 @@
 
 import hashlib
 import logging
+import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator
 
@@ -65,20 +68,140 @@ def _iter_campaign_configs(results_dir: str) -> Iterator[tuple[str, str, Path, s
             yield campaign, config_name, config_item, config_identifier
 
 
-def merge_results(results_dir: str, merged_campaign_dir: str) -> tuple[bool, str]:
+# Ways of placing a source file in the merged campaign (see merge_results).
+MERGE_MODES = ("copy", "reflink", "hardlink")
+
+# Records which source runs a merged campaign holds, for incremental merges.
+MANIFEST_PATH = Path("_execution") / "merge_manifest.yaml"
+
+_FICLONE = 0x40049409  # Linux ioctl: share the extents of another file (reflink)
+
+
+def _reflink(src: str, dst: str) -> None:
+    """Clone *src* to *dst* copy-on-write; raises OSError where unsupported."""
+    import fcntl  # pylint: disable=import-outside-toplevel
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+    except OSError:
+        Path(dst).unlink(missing_ok=True)
+        raise
+    shutil.copystat(src, dst)
+
+
+class _FilePlacer:
+    """Places files by *mode*, falling back to a copy where linking fails."""
+
+    def __init__(self, mode: str):
+        if mode not in MERGE_MODES:
+            raise ValueError(f"Unknown merge mode '{mode}', expected one of {', '.join(MERGE_MODES)}")
+        self.mode = mode
+        self._reflink_ok = mode == "reflink"
+        self._hardlink_ok = mode == "hardlink"
+        self._lock = threading.Lock()
+        self.counts = {"reflink": 0, "hardlink": 0, "copy": 0}
+
+    def _count(self, how: str) -> None:
+        with self._lock:
+            self.counts[how] += 1
+
+    def place(self, src: str, dst: str) -> None:
+        # Never write through an existing file: it may be a hardlink to a source.
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        if self._reflink_ok:
+            try:
+                _reflink(src, dst)
+                self._count("reflink")
+                return
+            except (ImportError, OSError) as e:
+                logger.debug("Reflink %s failed (%s); copying instead", src, e)
+                self._reflink_ok = False
+        if self._hardlink_ok:
+            try:
+                os.link(src, dst)
+                self._count("hardlink")
+                return
+            except OSError as e:   # e.g. another filesystem
+                logger.debug("Hardlink %s failed (%s); copying instead", src, e)
+                self._hardlink_ok = False
+        shutil.copy2(src, dst)
+        self._count("copy")
+
+
+def _up_to_date(src: str, dst: str) -> bool:
+    """Whether *dst* already holds *src* (same inode, or same size and mtime)."""
+    try:
+        s, d = os.stat(src), os.stat(dst)
+    except OSError:
+        return False
+    return (s.st_dev, s.st_ino) == (d.st_dev, d.st_ino) or \
+        (s.st_size == d.st_size and s.st_mtime_ns == d.st_mtime_ns)
+
+
+def _plan_tree(src_dir: Path, dst_dir: Path, pending: list[tuple[str, str]]) -> None:
+    """Create *dst_dir*'s directories and queue the files of *src_dir* it lacks."""
+    for root, _dirs, files in os.walk(src_dir):
+        rel = os.path.relpath(root, src_dir)
+        target = dst_dir / rel if rel != "." else dst_dir
+        target.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            src, dst = os.path.join(root, name), str(target / name)
+            if not _up_to_date(src, dst):
+                pending.append((src, dst))
+
+
+def _plan_file(src: Path, dst: Path, pending: list[tuple[str, str]]) -> None:
+    if src.exists() and not _up_to_date(str(src), str(dst)):
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        pending.append((str(src), str(dst)))
+
+
+def _read_manifest(merged_base: Path, sources: set[str]) -> tuple[Path | None, dict]:
+    """An earlier merged campaign under *merged_base* built from a subset of *sources*."""
+    for candidate in sorted(merged_base.glob("campaign-*")):
+        try:
+            with open(candidate / MANIFEST_PATH, encoding="utf-8") as f:
+                manifest = yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError):
+            continue
+        if set(manifest.get("sources", [])) <= sources:
+            return candidate, manifest
+    return None, {}
+
+
+def merge_results(results_dir: str, merged_campaign_dir: str, mode: str = "copy",
+                  incremental: bool = True, workers: int | None = None) -> tuple[bool, str]:
     """Merge campaign-dirs with identical configs into merged_campaign_dir.
 
     Groups campaign-dir/config-dir by config_identifier from config.yaml.
     Run folders (0, 1, 2, ...) from all campaigns are renumbered and copied.
     Original campaigns are not modified.
 
+    Files are placed according to *mode*: ``copy``; ``reflink`` (a
+    copy-on-write clone where the filesystem supports it, e.g. btrfs or XFS);
+    or ``hardlink`` (no extra space, but the merged files *are* the source
+    files, so rewriting one in place changes both). Files that cannot be
+    linked are copied. All files are placed by a thread pool.
+
+    With *incremental*, an earlier merge of a subset of the sources (found by
+    its ``_execution/merge_manifest.yaml``) is extended: existing runs keep
+    their numbers, new runs are appended and only missing or changed files are
+    placed. Otherwise, or if a previously merged run no longer exists, the
+    merged campaign is rebuilt from scratch.
+
     Args:
         results_dir: Source directory containing campaign-* dirs.
         merged_campaign_dir: Output directory for merged results.
+        mode: One of :data:`MERGE_MODES`.
+        incremental: Extend an earlier merge instead of rebuilding it.
+        workers: Concurrent file operations (default: CPU count + 4, at most 32).
 
     Returns:
         Tuple (success, message).
     """
+    placer = _FilePlacer(mode)
+
     # Discover and group by (config_identifier, config_name)
     groups: dict[tuple[str | None, str], list[tuple[str, Path, list[Path]]]] = {}
 
@@ -117,10 +240,31 @@ def merge_results(results_dir: str, merged_campaign_dir: str) -> tuple[bool, str
     pseudo_campaign_dir = f"campaign-{pseudo_id}"
     merged_path = merged_base / pseudo_campaign_dir
 
-    if merged_path.exists():
-        shutil.rmtree(merged_path)
+    # Runs of each merged config, in merged numbering: [campaign, source run name]
+    previous, manifest = (None, {})
+    if incremental and merged_base.is_dir():
+        previous, manifest = _read_manifest(merged_base, set(all_source_campaigns))
+    source_runs = {(campaign, config_name, run.name)
+                   for (_, config_name), sources in groups.items()
+                   for campaign, _, runs in sources for run in runs}
+    configs_manifest: dict[str, dict] = manifest.get("configs", {})
+    if any((campaign, entry["config_name"], run) not in source_runs
+           for entry in configs_manifest.values() for campaign, run in entry["runs"]):
+        logger.info("Previously merged runs are gone; rebuilding %s", merged_path)
+        previous, configs_manifest = None, {}
+
+    if previous is not None and previous != merged_path:
+        if merged_path.exists():
+            shutil.rmtree(merged_path)
+        previous.rename(merged_path)
+    elif previous is None:
+        configs_manifest = {}
+        if merged_path.exists():
+            shutil.rmtree(merged_path)
     merged_path.mkdir(parents=True, exist_ok=True)
 
+    pending: list[tuple[str, str]] = []
+
     # Use first run for run-level files
     first_campaign, first_config_path, _ = next(iter(groups.values()))[0]
     first_campaign_path = Path(results_dir) / first_campaign
@@ -134,35 +278,30 @@ def merge_results(results_dir: str, merged_campaign_dir: str) -> tuple[bool, str
         ("_transient", "collect_sysinfo.py"),
     ]
     for subdir, fname in run_level_files:
-        src = first_campaign_path / subdir / fname
-        if src.exists():
-            dst_dir = merged_path / subdir
-            dst_dir.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst_dir / fname)
-
-    # Copy vast file (stored in _config/)
-    for f in (first_campaign_path / "_config").iterdir():
-        if f.suffix == ".vast":
-            dst_dir = merged_path / "_config"
-            dst_dir.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(f, dst_dir / f.name)
-            break
-
-    # Copy run-level _config from first run
+        _plan_file(first_campaign_path / subdir / fname, merged_path / subdir / fname, pending)
+
+    # Copy run-level _config (including the vast file) from first run
     src_config = first_campaign_path / "_config"
     if src_config.exists():
-        dst_config = merged_path / "_config"
-        shutil.copytree(src_config, dst_config, dirs_exist_ok=True)
+        _plan_tree(src_config, merged_path / "_config", pending)
 
     # Merge each config group
     # Disambiguate when same config_name appears with different config_identifiers (avoids overwriting)
-    used_config_names: set[str] = set()
+    output_names = {(entry["identifier"], entry["config_name"]): name
+                    for name, entry in configs_manifest.items()}
+    used_config_names: set[str] = set(configs_manifest)
     total_runs = 0
+    new_runs = 0
     for (config_identifier, config_name), sources in groups.items():
-        output_dir_name = config_name
-        if output_dir_name in used_config_names:
-            output_dir_name = f"{config_name}_{config_identifier[:8]}"
-        used_config_names.add(output_dir_name)
+        output_dir_name = output_names.get((config_identifier, config_name))
+        if output_dir_name is None:
+            output_dir_name = config_name
+            if output_dir_name in used_config_names:
+                output_dir_name = f"{config_name}_{config_identifier[:8]}"
+            used_config_names.add(output_dir_name)
+            configs_manifest[output_dir_name] = {
+                "identifier": config_identifier, "config_name": config_name, "runs": []}
+        merged_runs = configs_manifest[output_dir_name]["runs"]
 
         merged_config_dir = merged_path / output_dir_name
         merged_config_dir.mkdir(parents=True, exist_ok=True)
@@ -170,24 +309,39 @@ def merge_results(results_dir: str, merged_campaign_dir: str) -> tuple[bool, str
         # Copy scenario.config, _config, config.yaml from first source
         _, first_config_path, _ = sources[0]
         for fname in ["scenario.config", "config.yaml"]:
-            src = first_config_path / fname
-            if src.exists():
-                shutil.copy2(src, merged_config_dir / fname)
+            _plan_file(first_config_path / fname, merged_config_dir / fname, pending)
         src_config = first_config_path / "_config"
         if src_config.exists():
-            dst_config = merged_config_dir / "_config"
-            shutil.copytree(src_config, dst_config, dirs_exist_ok=True)
+            _plan_tree(src_config, merged_config_dir / "_config", pending)
 
-        # Collect and copy run folders, renumbering
+        # Collect run folders; runs merged before keep their number, new ones are appended
         all_runs: list[tuple[str, str, Path]] = []
         for campaign, config_path, run_paths in sources:
             for tp in run_paths:
                 all_runs.append((campaign, tp.name, tp))
         all_runs.sort(key=lambda x: (x[0], int(x[1])))
-
-        for idx, (campaign, _, src_run_path) in enumerate(all_runs):
-            dst_run = merged_config_dir / str(idx)
-            shutil.copytree(src_run_path, dst_run, dirs_exist_ok=True)
+        known = {(campaign, run): idx for idx, (campaign, run) in enumerate(merged_runs)}
+        for campaign, run_name, _ in all_runs:
+            if (campaign, run_name) not in known:
+                known[(campaign, run_name)] = len(merged_runs)
+                merged_runs.append([campaign, run_name])
+                new_runs += 1
+
+        for campaign, run_name, src_run_path in all_runs:
+            _plan_tree(src_run_path, merged_config_dir / str(known[(campaign, run_name)]), pending)
             total_runs += 1
 
-    return True, f"Merged {len(groups)} config(s), {total_runs} run(s) into {merged_campaign_dir}/{pseudo_campaign_dir}"
+    n_workers = min(workers or min(32, (os.cpu_count() or 1) + 4), max(1, len(pending)))
+    with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="robovast-merge") as pool:
+        list(pool.map(lambda pair: placer.place(*pair), pending))
+
+    manifest_file = merged_path / MANIFEST_PATH
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_file, "w", encoding="utf-8") as f:
+        yaml.safe_dump({"sources": all_source_campaigns, "mode": mode,
+                        "configs": configs_manifest}, f, sort_keys=False)
+
+    placed = ", ".join(f"{n} {how}" for how, n in placer.counts.items() if n) or "nothing to place"
+    return True, (f"Merged {len(groups)} config(s), {total_runs} run(s) into "
+                  f"{merged_campaign_dir}/{pseudo_campaign_dir} "
+                  f"({new_runs} new run(s); files: {placed})")
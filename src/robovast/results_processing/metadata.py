@@ -28,13 +28,16 @@ This module provides:
   ``metadata.yaml`` into each campaign directory.
 """
 
+import hashlib
+import json
 import logging
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from importlib.metadata import entry_points
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
@@ -46,6 +49,7 @@ from robovast.common.campaign_data import (
 from robovast.common.common import load_config
 from robovast.common.execution import is_campaign_dir
 from robovast.common.results_utils import find_campaign_vast_file
+from robovast.common.run_summary import read_run_summaries
 from robovast.common.variation.loader import load_variation_classes
 
 logger = logging.getLogger(__name__)
@@ -98,6 +102,15 @@ class MetadataGenerator:
     def __init__(self, campaign_dir: str | Path):
         self.campaign_dir = Path(campaign_dir)
 
+    def read_configurations(self) -> Dict[str, Any]:
+        """Content of the campaign's ``_transient/configurations.yaml``."""
+        config_path = self.campaign_dir / "_transient" / "configurations.yaml"
+        if not config_path.exists():
+            raise FileNotFoundError(f"configurations.yaml not found at {config_path}")
+
+        with open(config_path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f)
+
     def generate_metadata(self) -> Dict[str, Any]:
         """Generate structural metadata for the campaign.
 
@@ -105,15 +118,20 @@ class MetadataGenerator:
             Dictionary containing configurations, test results, execution
             metadata, run files, and scenario file reference.
         """
-        metadata: Dict[str, Any] = {}
-
-        # --- read configurations.yaml ----------------------------------
-        config_path = self.campaign_dir / "_transient" / "configurations.yaml"
-        if not config_path.exists():
-            raise FileNotFoundError(f"configurations.yaml not found at {config_path}")
+        data = self.read_configurations()
+        metadata = self.generate_header(data)
+        metadata["configurations"] = []
+        metadata.update(self.generate_campaign_info())
+        expected_runs = metadata["execution"].get("runs")
+        metadata["configurations"] = [
+            self.generate_config_metadata(config_entry, data.get("created_at"), expected_runs)
+            for config_entry in data.get("configs", [])
+        ]
+        return metadata
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+    def generate_header(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Campaign-level keys preceding ``configurations`` in ``metadata.yaml``."""
+        metadata: Dict[str, Any] = {}
 
         # Run files
         run_files = data.get("_run_files", [])
@@ -124,43 +142,11 @@ class MetadataGenerator:
 
         # User-provided metadata section (title, description, etc.)
         metadata["metadata"] = data.get("metadata", {})
+        return metadata
 
-        # Configurations
-        metadata["configurations"] = data.get("configs", [])
-
-        # --- per-config processing ------------------------------------
-        for config_entry in metadata["configurations"]:
-            config_name = config_entry["name"]
-
-            # Validate and list config files attached by variations
-            config_files_list = []
-            for key, _value in config_entry.get("_config_files", []):
-                config_file_name = os.path.join(config_name, "_config", key)
-                config_file_path = self.campaign_dir / config_file_name
-                if not os.path.exists(config_file_path):
-                    raise FileNotFoundError(f"Config file not found: {config_file_name}")
-                config_files_list.append(config_file_name)
-            config_entry["config_files"] = config_files_list
-
-            # Timestamp
-            config_entry["created_at"] = data.get("created_at")
-
-            # Content of _config/config.yaml
-            config_yaml_path = self.campaign_dir / config_name / "_config" / "config.yaml"
-            if config_yaml_path.exists():
-                with open(config_yaml_path, "r", encoding="utf-8") as f:
-                    config_yaml_content = yaml.safe_load(f) or {}
-                config_entry.update(config_yaml_content)
-
-        # Strip internal fields (keys starting with "_"), preserving
-        # _variations for the metadata hooks phase.
-        for config_entry in metadata["configurations"]:
-            keys_to_remove = [
-                k for k in config_entry
-                if k.startswith("_") and k != "_variations"
-            ]
-            for k in keys_to_remove:
-                config_entry.pop(k)
+    def generate_campaign_info(self) -> Dict[str, Any]:
+        """Execution metadata and postprocessing provenance of the campaign."""
+        metadata: Dict[str, Any] = {}
 
         # --- execution metadata ----------------------------------------
         metadata["execution"] = read_execution_metadata(self.campaign_dir)
@@ -185,107 +171,156 @@ class MetadataGenerator:
             metadata["postprocessing"] = postprocessing
         else:
             metadata["postprocessing"] = {}
+        return metadata
 
-        # --- test results per config -----------------------------------
-        expected_runs = metadata["execution"].get("runs")
-        for config_entry in metadata["configurations"]:
-            config_name = config_entry.get("name", "")
-            config_dir_path = self.campaign_dir / config_name
-
-            # Discover run directories
-            test_dirs = []
-            if config_dir_path.exists() and config_dir_path.is_dir():
-                for item in config_dir_path.iterdir():
-                    if item.is_dir() and item.name.isdigit():
-                        test_dirs.append(int(item.name))
-            test_dirs.sort()
-
-            if expected_runs is not None and len(test_dirs) != expected_runs:
+    def generate_config_metadata(
+        self,
+        config_entry: Dict[str, Any],
+        created_at: Any = None,
+        expected_runs: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Structural metadata of one configuration and its runs.
+
+        Args:
+            config_entry: The config's entry in ``configurations.yaml``
+                (not modified).
+            created_at: The campaign's ``created_at`` timestamp.
+            expected_runs: Number of runs each config must have, if known.
+
+        Returns:
+            The configuration entry of ``metadata.yaml``.
+        """
+        config_entry = dict(config_entry)
+        config_name = config_entry["name"]
+
+        # Validate and list config files attached by variations
+        config_files_list = []
+        for key, _value in config_entry.get("_config_files", []):
+            config_file_name = os.path.join(config_name, "_config", key)
+            config_file_path = self.campaign_dir / config_file_name
+            if not os.path.exists(config_file_path):
+                raise FileNotFoundError(f"Config file not found: {config_file_name}")
+            config_files_list.append(config_file_name)
+        config_entry["config_files"] = config_files_list
+
+        # Timestamp
+        config_entry["created_at"] = created_at
+
+        # Content of _config/config.yaml
+        config_yaml_path = self.campaign_dir / config_name / "_config" / "config.yaml"
+        if config_yaml_path.exists():
+            with open(config_yaml_path, "r", encoding="utf-8") as f:
+                config_yaml_content = yaml.safe_load(f) or {}
+            config_entry.update(config_yaml_content)
+
+        # Strip internal fields (keys starting with "_"), preserving
+        # _variations for the metadata hooks phase.
+        keys_to_remove = [
+            k for k in config_entry
+            if k.startswith("_") and k != "_variations"
+        ]
+        for k in keys_to_remove:
+            config_entry.pop(k)
+
+        # --- test results ----------------------------------------------
+        config_dir_path = self.campaign_dir / config_name
+
+        # Discover run directories
+        test_dirs = []
+        if config_dir_path.exists() and config_dir_path.is_dir():
+            for item in config_dir_path.iterdir():
+                if item.is_dir() and item.name.isdigit():
+                    test_dirs.append(int(item.name))
+        test_dirs.sort()
+
+        if expected_runs is not None and len(test_dirs) != expected_runs:
+            raise ValueError(
+                f"Config '{config_name}' has {len(test_dirs)} run directories "
+                f"but expected {expected_runs} runs"
+            )
+
+        # Transient files
+        transient_dir = config_dir_path / "_transient"
+        transient_files = []
+        if transient_dir.exists() and transient_dir.is_dir():
+            for file_path in transient_dir.rglob("*"):
+                if file_path.is_file():
+                    relative_path = file_path.relative_to(self.campaign_dir)
+                    transient_files.append(str(relative_path))
+        transient_files.sort()
+        config_entry["transient_files"] = transient_files
+
+        config_entry["test_results"] = []
+        # Warm the run summary cache for the whole config in one parallel pass.
+        read_run_summaries([self.campaign_dir / config_name / str(n) for n in test_dirs])
+        for test_num in test_dirs:
+            run_dir = self.campaign_dir / config_name / str(test_num)
+            entry = {"dir": f"{config_name}/{test_num}"}
+
+            # test.xml
+            try:
+                result = read_test_result(run_dir)
+                entry["success"] = "true" if result["success"] else "false"
+                entry["start_time"] = result["start_time"]
+                if result["start_time"] and result["duration_sec"] is not None:
+                    start_dt = datetime.fromisoformat(result["start_time"])
+                    end_dt = start_dt + timedelta(seconds=result["duration_sec"])
+                    entry["end_time"] = end_dt.isoformat()
+            except Exception as e:
                 raise ValueError(
-                    f"Config '{config_name}' has {len(test_dirs)} run directories "
-                    f"but expected {expected_runs} runs"
-                )
+                    f"Failed to parse test.xml in {run_dir}: {e}"
+                ) from e
+
+            # Output files
+            output_files = []
+            if run_dir.exists() and run_dir.is_dir():
+                for file_path in run_dir.rglob("*"):
+                    if file_path.is_file() and file_path.name not in (
+                        "test.xml"
+                    ):
+                        relative_path = file_path.relative_to(
+                            run_dir.parent.parent
+                        )
+                        output_files.append(str(relative_path))
+            output_files.sort()
+            entry["output_files"] = output_files
 
-            # Transient files
-            transient_dir = config_dir_path / "_transient"
-            transient_files = []
-            if transient_dir.exists() and transient_dir.is_dir():
-                for file_path in transient_dir.rglob("*"):
-                    if file_path.is_file():
-                        relative_path = file_path.relative_to(self.campaign_dir)
-                        transient_files.append(str(relative_path))
-            transient_files.sort()
-            config_entry["transient_files"] = transient_files
-
-            config_entry["test_results"] = []
-            for test_num in test_dirs:
-                run_dir = self.campaign_dir / config_name / str(test_num)
-                entry = {"dir": f"{config_name}/{test_num}"}
-
-                # test.xml
+            # sysinfo
+            try:
+                entry["sysinfo"] = read_sysinfo(run_dir)
+            except FileNotFoundError as exc:
+                raise FileNotFoundError(
+                    f"sysinfo.yaml not found in {run_dir}"
+                ) from exc
+
+            # rosbag2 metadata
+            rosbag2_meta_path = run_dir / "rosbag2" / "metadata.yaml"
+            if rosbag2_meta_path.exists():
                 try:
-                    result = read_test_result(run_dir)
-                    entry["success"] = "true" if result["success"] else "false"
-                    entry["start_time"] = result["start_time"]
-                    if result["start_time"] and result["duration_sec"] is not None:
-                        start_dt = datetime.fromisoformat(result["start_time"])
-                        end_dt = start_dt + timedelta(seconds=result["duration_sec"])
-                        entry["end_time"] = end_dt.isoformat()
+                    with open(rosbag2_meta_path, "r", encoding="utf-8") as f:
+                        bag_meta = yaml.safe_load(f) or {}
+                    bag_info = bag_meta.get("rosbag2_bagfile_information", {})
+                    ros_distro = bag_info.get("ros_distro", "")
+                    message_types = sorted({
+                        t["topic_metadata"]["type"]
+                        for t in bag_info.get("topics_with_message_count", [])
+                        if "topic_metadata" in t and "type" in t["topic_metadata"]
+                    })
+                    mcap_files = bag_info.get("relative_file_paths", [])
+                    entry["rosbag2"] = {
+                        "ros_distro": ros_distro,
+                        "message_types": message_types,
+                        "files": mcap_files,
+                    }
                 except Exception as e:
-                    raise ValueError(
-                        f"Failed to parse test.xml in {run_dir}: {e}"
-                    ) from e
-
-                # Output files
-                output_files = []
-                if run_dir.exists() and run_dir.is_dir():
-                    for file_path in run_dir.rglob("*"):
-                        if file_path.is_file() and file_path.name not in (
-                            "test.xml"
-                        ):
-                            relative_path = file_path.relative_to(
-                                run_dir.parent.parent
-                            )
-                            output_files.append(str(relative_path))
-                output_files.sort()
-                entry["output_files"] = output_files
-
-                # sysinfo
-                try:
-                    entry["sysinfo"] = read_sysinfo(run_dir)
-                except FileNotFoundError as exc:
-                    raise FileNotFoundError(
-                        f"sysinfo.yaml not found in {run_dir}"
-                    ) from exc
-
-                # rosbag2 metadata
-                rosbag2_meta_path = run_dir / "rosbag2" / "metadata.yaml"
-                if rosbag2_meta_path.exists():
-                    try:
-                        with open(rosbag2_meta_path, "r", encoding="utf-8") as f:
-                            bag_meta = yaml.safe_load(f) or {}
-                        bag_info = bag_meta.get("rosbag2_bagfile_information", {})
-                        ros_distro = bag_info.get("ros_distro", "")
-                        message_types = sorted({
-                            t["topic_metadata"]["type"]
-                            for t in bag_info.get("topics_with_message_count", [])
-                            if "topic_metadata" in t and "type" in t["topic_metadata"]
-                        })
-                        mcap_files = bag_info.get("relative_file_paths", [])
-                        entry["rosbag2"] = {
-                            "ros_distro": ros_distro,
-                            "message_types": message_types,
-                            "files": mcap_files,
-                        }
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to read rosbag2 metadata %s: %s",
-                            rosbag2_meta_path, e,
-                        )
+                    logger.warning(
+                        "Failed to read rosbag2 metadata %s: %s",
+                        rosbag2_meta_path, e,
+                    )
 
-                config_entry["test_results"].append(entry)
+            config_entry["test_results"].append(entry)
 
-        return metadata
+        return config_entry
 
 
 # ---------------------------------------------------------------------------
@@ -296,6 +331,7 @@ def generate_campaign_metadata(
     results_dir: str,
     vast_file: Optional[str] = None,
     output_callback=None,
+    workers: Optional[int] = None,
 ) -> tuple[bool, str]:
     """Run the full metadata generation pipeline for all campaigns.
 
@@ -306,12 +342,23 @@ def generate_campaign_metadata(
 
     Writes ``metadata.yaml`` into each campaign directory.
 
+    Phases 1 and 2 run per configuration on a thread pool. Each
+    configuration's result is cached as a fragment under
+    ``<campaign>/.cache/metadata/`` and reused while the files of its
+    configuration directory (and its entry in ``configurations.yaml``) are
+    unchanged, so re-generation only processes changed configurations.
+    Without ``MetadataProcessor`` plugins (which need the whole document),
+    ``metadata.yaml`` and ``metadata.prov.json`` are written by streaming the
+    fragments, one configuration at a time.
+
     Args:
         results_dir: Path to the results directory containing
             ``campaign-<id>`` subdirectories.
         vast_file: Optional explicit ``.vast`` file path.  When ``None``,
             the ``.vast`` file is discovered from the most recent campaign.
         output_callback: Optional callable for status messages.
+        workers: Configurations processed concurrently (default: CPU count
+            + 4, at most 32).
 
     Returns:
         Tuple ``(success, message)``.
@@ -351,48 +398,55 @@ def generate_campaign_metadata(
 
             # Phase 1: Generic metadata
             generator = MetadataGenerator(campaign_dir)
-            metadata = generator.generate_metadata()
-
-            # Phase 2: Variation plugin metadata hooks
-            _apply_variation_metadata(metadata, campaign_dir, variation_classes)
-
-            # Resolve config-file references inside each "config" block now that
-            # variation hooks have had a chance to run first.
-            for config_entry in metadata.get("configurations", []):
-                config_name = config_entry.get("name", "")
-                if "config" in config_entry and isinstance(config_entry["config"], dict):
-                    _replace_file_urls(config_entry["config"])
-
-                    _resolve_file_strings(
-                        config_entry["config"],
-                        [os.path.join(config_name, "_config"), "_config"],
-                        config_entry.get("config_files", []) + (metadata.get("run_files", [])),
-                    )
-
-            # Phase 3: User-defined metadata processors
-            _apply_user_metadata_processors(
-                metadata, campaign_dir, metadata_processing_commands, metadata_plugins
+            data = generator.read_configurations()
+            header = generator.generate_header(data)
+            info = generator.generate_campaign_info()
+
+            # Phases 1 and 2 per configuration, cached
+            fragments, rebuilt = _build_config_fragments(
+                generator, data, header["run_files"], info["execution"].get("runs"),
+                variation_classes, workers,
             )
+            output(f"{rebuilt} of {len(fragments)} configuration(s) regenerated")
 
-            # Phase 4: Add explicit derivation from scenario family
-            _apply_derivation_metadata(metadata, campaign_dir)
-
-            # Write metadata.yaml
             output_path = campaign_dir / "metadata.yaml"
-            with open(output_path, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    metadata, f,
-                    default_flow_style=False,
-                    sort_keys=False,
-                    allow_unicode=True,
+            if metadata_processing_commands:
+                metadata = {
+                    **header,
+                    "configurations": [_load_fragment(f) for _name, f in fragments],
+                    **info,
+                }
+
+                # Phase 3: User-defined metadata processors
+                _apply_user_metadata_processors(
+                    metadata, campaign_dir, metadata_processing_commands, metadata_plugins
                 )
+
+                # Phase 4: Add explicit derivation from scenario family
+                _apply_derivation_metadata(metadata, campaign_dir)
+
+                # Write metadata.yaml
+                with open(output_path, "w", encoding="utf-8") as f:
+                    yaml.dump(
+                        metadata, f,
+                        default_flow_style=False,
+                        sort_keys=False,
+                        allow_unicode=True,
+                    )
+                configurations = None
+            else:
+                metadata = {**header, **info}
+                _write_metadata_stream(output_path, header, info, fragments)
+                configurations = (_derived(_load_fragment(f))
+                                  for _name, f in sorted(fragments, key=lambda nf: nf[0]))
             output(f"Wrote {output_path}")
 
             # Generate PROV-O provenance graph (metadata.prov.json)
             try:
                 from .fair_metadata import generate_prov_metadata  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
                 prov_success, prov_msg = generate_prov_metadata(
-                    campaign_dir, metadata, generate_visualization=False
+                    campaign_dir, metadata, generate_visualization=False,
+                    configurations=configurations,
                 )
                 if prov_success:
                     output(prov_msg)
@@ -407,6 +461,149 @@ def generate_campaign_metadata(
     return True, f"Metadata generated for {len(campaign_dirs)} campaign(s)"
 
 
+# ---------------------------------------------------------------------------
+# Per-configuration fragments
+# ---------------------------------------------------------------------------
+
+# Fragment cache directory, relative to the campaign directory.
+FRAGMENT_CACHE_DIR = os.path.join(".cache", "metadata")
+
+# Part of every fragment fingerprint; bump when the fragment content changes.
+_FRAGMENT_VERSION = 1
+
+# Fastest available safe loader/dumper (libyaml when installed).
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+class _NoAliasDumper(yaml.Dumper):  # pylint: disable=too-many-ancestors
+    """Dumper without anchors, so separately dumped fragments can be concatenated."""
+
+    def ignore_aliases(self, data):
+        return True
+
+
+def _config_fingerprint(campaign_dir: Path, config_entry: dict, salt: list) -> str:
+    """Hash of a config's entry, *salt* and the stat of every file in its directory."""
+    h = hashlib.md5()
+    h.update(json.dumps([_FRAGMENT_VERSION, salt, config_entry],
+                        sort_keys=True, default=str).encode())
+    for root, dirs, names in os.walk(campaign_dir / config_entry["name"]):
+        dirs.sort()
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            h.update(f"{os.path.relpath(path, campaign_dir)}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+    return h.hexdigest()
+
+
+def _build_config_fragments(
+    generator: MetadataGenerator,
+    data: dict,
+    run_files: List[str],
+    expected_runs: Optional[int],
+    variation_classes: Dict[str, type],
+    workers: Optional[int],
+) -> Tuple[List[Tuple[str, Union[Path, dict]]], int]:
+    """Configuration entries after phases 1 and 2, in ``configurations.yaml`` order.
+
+    Returns ``([(config name, fragment file or entry), ...], number rebuilt)``;
+    entries that cannot be cached as safe YAML are returned as dicts.
+    """
+    campaign_dir = generator.campaign_dir
+    cache_dir = campaign_dir / FRAGMENT_CACHE_DIR
+    created_at = data.get("created_at")
+    salt = [created_at, expected_runs, run_files, sorted(variation_classes)]
+
+    def _fragment(config_entry: dict) -> Tuple[str, Union[Path, dict], bool]:
+        name = config_entry["name"]
+        path = cache_dir / f"{name}.yaml"
+        fingerprint = _config_fingerprint(campaign_dir, config_entry, salt)
+        if _fragment_fingerprint(path) == fingerprint:
+            return name, path, False
+        entry = generator.generate_config_metadata(config_entry, created_at, expected_runs)
+        _apply_config_variation_metadata(entry, campaign_dir, variation_classes)
+        _resolve_config_file_references(entry, run_files)
+        return name, _write_fragment(path, fingerprint, entry), True
+
+    configs = data.get("configs", [])
+    if not configs:
+        return [], 0
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    n_workers = min(workers or min(32, (os.cpu_count() or 1) + 4), len(configs))
+    with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="robovast-metadata") as pool:
+        results = list(pool.map(_fragment, configs))
+    return [(name, f) for name, f, _ in results], sum(rebuilt for *_, rebuilt in results)
+
+
+def _fragment_fingerprint(path: Path) -> Optional[str]:
+    """Fingerprint a cached fragment was built for (its first line), if any."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.readline().removeprefix("# fingerprint: ").strip() or None
+    except OSError:
+        return None
+
+
+def _write_fragment(path: Path, fingerprint: str, entry: dict) -> Union[Path, dict]:
+    """Cache *entry* at *path*; returns the path, or *entry* if it cannot be cached."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        text = yaml.dump(entry, Dumper=_YamlDumper, default_flow_style=False,
+                         sort_keys=False, allow_unicode=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(f"# fingerprint: {fingerprint}\n")
+            f.write(text)
+        os.replace(tmp, path)
+    except (yaml.YAMLError, OSError) as e:
+        logger.debug("Could not cache metadata fragment %s: %s", path, e)
+        return entry
+    return path
+
+
+def _load_fragment(fragment: Union[Path, dict]) -> dict:
+    if isinstance(fragment, dict):
+        return fragment
+    with open(fragment, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)  # nosec B506 - safe loader
+
+
+def _derived(config_entry: dict) -> dict:
+    """Apply phase 4 (derivation) to a single configuration entry."""
+    _apply_derivation_metadata({"configurations": [config_entry]}, None)
+    return config_entry
+
+
+def _write_metadata_stream(
+    output_path: Path,
+    header: dict,
+    info: dict,
+    fragments: List[Tuple[str, Union[Path, dict]]],
+) -> None:
+    """Write ``metadata.yaml`` loading one configuration fragment at a time.
+
+    Produces the same document as dumping the assembled dictionary.
+    """
+    def _dump(obj) -> str:
+        return yaml.dump(obj, Dumper=_NoAliasDumper, default_flow_style=False,
+                         sort_keys=False, allow_unicode=True)
+
+    tmp = output_path.with_name(output_path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(_dump(header))
+        if fragments:
+            f.write("configurations:\n")
+            for _name, fragment in fragments:
+                f.write(_dump([_derived(_load_fragment(fragment))]))
+        else:
+            f.write("configurations: []\n")
+        f.write(_dump(info))
+    os.replace(tmp, output_path)
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -533,37 +730,52 @@ def _apply_derivation_metadata(
         derivation = config_entry.pop("_config_name", [])
         config_entry["derived_from"] = derivation
 
-def _apply_variation_metadata(
-    metadata: dict,
+def _apply_config_variation_metadata(
+    config_entry: dict,
     campaign_dir: Path,
     variation_classes: Dict[str, type],
 ) -> None:
-    """Call variation-plugin metadata hooks and merge results."""
-    for config_entry in metadata.get("configurations", []):
-        config_name = config_entry.get("name", "")
-        config_dir = campaign_dir / config_name
+    """Call variation-plugin metadata hooks for one configuration entry."""
+    config_name = config_entry.get("name", "")
+    config_dir = campaign_dir / config_name
+
+    # Read and consume _variations, expose as public "variations"
+    variation_data = config_entry.pop("_variations", [])
+    config_entry["variations"] = variation_data
+
+    for vdata in variation_data:
+        vtype_name = vdata["name"]
+        cls = variation_classes.get(vtype_name)
+        if cls is None:
+            continue
 
-        # Read and consume _variations, expose as public "variations"
-        variation_data = config_entry.pop("_variations", [])
-        config_entry["variations"] = variation_data
+        # Config-level metadata
+        if hasattr(cls, "collect_config_metadata"):
+            try:
+                extra = cls.collect_config_metadata(config_entry, config_dir, campaign_dir)
+                if extra and isinstance(extra, dict):
+                    config_entry.update(extra)
+            except Exception as e:
+                logger.warning(
+                    "Variation '%s' collect_config_metadata failed for '%s': %s",
+                    vtype_name, config_name, e,
+                )
 
-        for vdata in variation_data:
-            vtype_name = vdata["name"]
-            cls = variation_classes.get(vtype_name)
-            if cls is None:
-                continue
 
-            # Config-level metadata
-            if hasattr(cls, "collect_config_metadata"):
-                try:
-                    extra = cls.collect_config_metadata(config_entry, config_dir, campaign_dir)
-                    if extra and isinstance(extra, dict):
-                        config_entry.update(extra)
-                except Exception as e:
-                    logger.warning(
-                        "Variation '%s' collect_config_metadata failed for '%s': %s",
-                        vtype_name, config_name, e,
-                    )
+def _resolve_config_file_references(config_entry: dict, run_files: List[str]) -> None:
+    """Resolve config-file references inside a configuration's "config" block.
+
+    Runs after the variation hooks so that they see the original values.
+    """
+    config_name = config_entry.get("name", "")
+    if "config" in config_entry and isinstance(config_entry["config"], dict):
+        _replace_file_urls(config_entry["config"])
+
+        _resolve_file_strings(
+            config_entry["config"],
+            [os.path.join(config_name, "_config"), "_config"],
+            config_entry.get("config_files", []) + run_files,
+        )
 
 
 def _apply_user_metadata_processors(
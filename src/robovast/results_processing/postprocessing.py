@@ -15,10 +15,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 """Postprocessing functionality for run result data."""
+import functools
 import inspect
 import json
 import os
 import tempfile
+import threading
+import time
 from importlib.metadata import entry_points
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -28,7 +31,10 @@ import yaml
 from robovast.common.common import load_config
 from robovast.common.plugin_ref import is_file_ref, load_ref
 from robovast.results_processing.metadata import generate_campaign_metadata
-from robovast.results_processing.postprocessing_plugins import generate_data_db
+from robovast.results_processing.postprocessing_dag import (Step, execute_steps,
+                                                            find_run_dirs)
+from robovast.results_processing.postprocessing_plugins import (
+    _CAMPAIGN_RESERVED_DIRS, DataDbBuilder, campaign_run_dirs)
 from robovast.common.results_utils import find_campaign_vast_file
 
 POSTPROCESSING_GROUP = "robovast.postprocessing_commands"
@@ -98,50 +104,145 @@ def resolve_postprocessing_plugin(plugin_name: str, config_dir: str,
     return plugins[plugin_name]
 
 
+# Command parameters that declare a step's files for the DAG executor (see
+# BasePostprocessingPlugin.get_io); passed on only to plugins that accept them.
+_IO_PARAMS = ("inputs", "outputs")
+
+
+def _accepts(plugin_func: callable, name: str) -> bool:
+    """Whether *plugin_func* takes a keyword argument *name*."""
+    try:
+        parameters = inspect.signature(plugin_func).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in parameters or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+
+
+def _parse_command(command) -> Tuple[str, dict]:
+    """Split a command into ``(plugin_name, params)``; ``ValueError`` if malformed."""
+    if isinstance(command, str):
+        return command, {}
+    if isinstance(command, dict):
+        if len(command) != 1:
+            raise ValueError("Invalid command format: dict must have exactly one key")
+        plugin_name = next(iter(command))
+        params = command[plugin_name] or {}
+        if not isinstance(params, dict):
+            raise ValueError("Invalid command format: parameters must be a dict")
+        return plugin_name, params
+    raise ValueError(f"Invalid command format: must be string or dict, got {type(command)}")
+
+
+def build_plugin_steps(commands, results_dir: str, config_dir: str, temp_dir: str,
+                       entries: List[dict], output=print,
+                       plugins: Optional[Dict[str, callable]] = None,
+                       execution_image: Optional[str] = None,
+                       debug: bool = False, force: bool = False) -> Tuple[bool, List[Step]]:
+    """Turn postprocessing commands into DAG :class:`Step` s.
+
+    Each step runs its plugin via :func:`execute_postprocessing_plugin` and
+    appends its provenance to *entries*. Inputs/outputs come from the plugin's
+    :meth:`get_io` (which honours ``inputs`` / ``outputs`` in the command's
+    params), or from those params alone for plain callables. Plugins accepting
+    an ``output_callback`` get *output* to stream progress into. Returns ``(success, steps)``; commands that cannot be parsed or
+    resolved are reported and skipped (``success`` is then ``False``).
+    """
+    if plugins is None:
+        plugins = load_postprocessing_plugins()
+
+    def _run(run_done, plugin_name, plugin_func, params, i):
+        call_params = dict(params)
+        if getattr(plugin_func, "reports_runs", False):
+            call_params["run_done"] = run_done
+        if _accepts(plugin_func, "output_callback"):
+            call_params["output_callback"] = output
+        ok, message, prov = execute_postprocessing_plugin(
+            plugin_name=plugin_name, plugin_func=plugin_func, params=call_params,
+            results_dir=results_dir, config_dir=config_dir,
+            provenance_file=os.path.join(temp_dir, f"{i}_provenance.json"),
+            execution_image=execution_image, debug=debug, force=force)
+        entries.extend(prov)
+        if ok and not debug and message:
+            message = message.splitlines()[0]
+        return ok, message
+
+    success = True
+    steps: List[Step] = []
+    for i, command in enumerate(commands, 1):
+        try:
+            plugin_name, params = _parse_command(command)
+            plugin_func = resolve_postprocessing_plugin(plugin_name, config_dir, plugins)
+        except (KeyError, ValueError, ImportError, FileNotFoundError, AttributeError) as e:
+            output(f"[{i}/{len(commands)}] ✗ {e}")
+            success = False
+            continue
+        params = dict(params)
+        io = {k: params.pop(k) for k in _IO_PARAMS if k in params}
+        get_io = getattr(plugin_func, "get_io", None)
+        if get_io is not None:
+            inputs, outputs = get_io({**params, **io})
+        else:
+            inputs, outputs = io.get("inputs"), io.get("outputs")
+        display_cmd = f"{plugin_name} (params: {params})" if params else plugin_name
+        for k, v in io.items():
+            if _accepts(plugin_func, k):
+                params[k] = v
+
+        fn = functools.partial(_run, plugin_name=plugin_name, plugin_func=plugin_func,
+                               params=params, i=i)
+        steps.append(Step(name=f"[{i}/{len(commands)}] {display_cmd}", fn=fn,
+                          inputs=inputs, outputs=outputs))
+    return success, steps
+
+
 def run_postprocessing_commands(commands, results_dir: str, config_dir: str,
                                 output=print, execution_image: Optional[str] = None,
                                 debug: bool = False, force: bool = False
                                 ) -> Tuple[bool, List[dict]]:
     """Resolve and run a list of postprocessing commands over *results_dir*.
 
-    Shared by ``run_postprocessing`` (the ``results_processing.postprocessing``
-    path) and the campaign controller (the ``search.postprocessing`` path), so
-    both load plugins identically (entry-point name or local file ref) and apply
-    the same execution contract. Returns ``(success, provenance_entries)``.
+    Used by the campaign controller for the ``search.postprocessing`` path, so
+    it loads plugins identically to ``run_postprocessing`` (entry-point name or
+    local file ref) and runs them through the same DAG executor. Returns
+    ``(success, provenance_entries)``.
     """
-    plugins = load_postprocessing_plugins()
-    success = True
     entries: List[dict] = []
     with tempfile.TemporaryDirectory(prefix="robovast_provenance_") as temp_dir:
-        for i, command in enumerate(commands, 1):
-            if isinstance(command, str):
-                plugin_name, params = command, {}
-            elif isinstance(command, dict) and len(command) == 1:
-                plugin_name = next(iter(command))
-                params = command[plugin_name] or {}
-            else:
-                output(f"[{i}/{len(commands)}] ✗ Invalid command format: {command!r}")
-                success = False
-                continue
-            try:
-                plugin_func = resolve_postprocessing_plugin(plugin_name, config_dir, plugins)
-            except (KeyError, ValueError, ImportError, FileNotFoundError, AttributeError) as e:
-                output(f"[{i}/{len(commands)}] ✗ {e}")
-                success = False
-                continue
-            output(f"[{i}/{len(commands)}] Executing: {plugin_name}")
-            ok, message, prov = execute_postprocessing_plugin(
-                plugin_name=plugin_name, plugin_func=plugin_func, params=params,
-                results_dir=results_dir, config_dir=config_dir,
-                provenance_file=os.path.join(temp_dir, f"{i}_provenance.json"),
-                execution_image=execution_image, debug=debug, force=force)
-            entries.extend(prov)
-            if not ok:
-                output(f"✗ {message}")
-                success = False
-            else:
-                output(f"✓ {message.splitlines()[0] if message else 'done'}")
-    return success, entries
+        success, steps = build_plugin_steps(
+            commands, results_dir, config_dir, temp_dir, entries, output=output,
+            execution_image=execution_image, debug=debug, force=force)
+        steps_ok, _timings = execute_steps(steps, find_run_dirs(results_dir), output=output)
+    return success and steps_ok, entries
+
+
+def _data_db_step(campaign_dir: str, output_callback=None) -> Step:
+    """Per-run step ingesting each of the campaign's runs into ``data.db``."""
+    campaign = os.path.abspath(campaign_dir)
+    builder: List[DataDbBuilder] = []
+    # Runs are ingested from several pool threads; only one may (re)create data.db.
+    lock = threading.Lock()
+
+    def _builder() -> DataDbBuilder:
+        with lock:
+            if not builder:
+                total = len(campaign_run_dirs(campaign))
+                (output_callback or print)(f"  Building data.db from {total} run(s)...")
+                builder.append(DataDbBuilder(campaign, output_callback, total_runs=total))
+            return builder[0]
+
+    def _ingest(run_dir: str) -> Tuple[bool, str]:
+        config_dir = os.path.dirname(run_dir)
+        if (os.path.dirname(config_dir) != campaign
+                or os.path.basename(config_dir) in _CAMPAIGN_RESERVED_DIRS
+                or os.path.basename(config_dir).startswith(".")):
+            return True, ""     # a run of another campaign under results_dir
+        _builder().add_run(os.path.basename(config_dir), run_dir)
+        return True, ""
+
+    # Runs are ingested as soon as the steps writing their CSVs are done with them.
+    return Step(name="data.db", fn=_ingest, scope="run", inputs=["*.csv"],
+                outputs=["../../_execution/data.db"], finish=lambda: _builder().close())
 
 
 def execute_postprocessing_plugin(
@@ -347,12 +448,15 @@ def get_postprocessing_commands(config_path: str) -> List[dict]:
 def _write_postprocessing_provenance_yaml(
     campaign_dir: str,
     entries: List[dict],
+    timings: Optional[List[dict]] = None,
 ) -> None:
     """Write postprocessing.yaml under campaign-<id>/_transient/ with all provenance entries.
 
     Args:
         campaign_dir: Path to the campaign-<id> directory.
         entries: List of provenance entry dicts.
+        timings: Optional per-step timings (see
+            :func:`~robovast.results_processing.postprocessing_dag.execute_steps`).
     """
     transient_dir = Path(campaign_dir) / "_transient"
     try:
@@ -386,6 +490,8 @@ def _write_postprocessing_provenance_yaml(
         "generated_by": "robovast",
         "entries": relative_entries,
     }
+    if timings is not None:
+        data["timings"] = timings
     try:
         with open(yaml_path, "w", encoding="utf-8") as f:
             yaml.dump(
@@ -546,87 +652,44 @@ def run_postprocessing(  # pylint: disable=too-many-return-statements
 
     all_provenance_entries: List[dict] = []
 
+    # Plugin steps and per-run data.db ingestion run as one DAG: steps that
+    # touch disjoint files run concurrently (see postprocessing_dag).
     with tempfile.TemporaryDirectory(prefix="robovast_provenance_") as temp_dir:
-        # Execute each postprocessing command
-        success = True
-
-        for i, command in enumerate(commands, 1):
-            # Parse command to get plugin name and parameters
-            if isinstance(command, str):
-                plugin_name = command
-                params = {}
-            elif isinstance(command, dict):
-                if len(command) != 1:
-                    output(f"[{i}/{len(commands)}] ✗ Invalid command format: dict must have exactly one key")
-                    success = False
-                    continue
-                plugin_name = list(command.keys())[0]
-                params = command[plugin_name] or {}
-                if not isinstance(params, dict):
-                    output(f"[{i}/{len(commands)}] ✗ Invalid command format: parameters must be a dict")
-                    success = False
-                    continue
-            else:
-                output(f"[{i}/{len(commands)}] ✗ Invalid command format: must be string or dict, got {type(command)}")
-                success = False
-                continue
-
-            display_cmd = f"{plugin_name} (params: {params})" if params else plugin_name
-
-            try:
-                plugin_func = resolve_postprocessing_plugin(plugin_name, config_dir, plugins)
-            except (KeyError, ValueError, ImportError, FileNotFoundError, AttributeError) as e:
-                output(f"[{i}/{len(commands)}] ✗ {e}")
-                success = False
-                continue
-
-            output(f"[{i}/{len(commands)}] Executing: {display_cmd}")
-
-            provenance_file = os.path.join(temp_dir, f"{plugin_name}_provenance.json")
-
-            plugin_success, message, entries = execute_postprocessing_plugin(
-                plugin_name=plugin_name,
-                plugin_func=plugin_func,
-                params=params,
-                results_dir=results_dir,
-                config_dir=config_dir,
-                provenance_file=provenance_file,
-                execution_image=execution_image,
-                debug=debug,
-                force=force,
-            )
-
-            all_provenance_entries.extend(entries)
-
-            if not plugin_success:
-                output(f"✗ {message}")
-                success = False
-                continue
-            display_message = message if debug else message.splitlines()[0]
-            output(f"✓ {display_message}")
+        success, steps = build_plugin_steps(
+            commands, results_dir, config_dir, temp_dir, all_provenance_entries,
+            output=output, plugins=plugins, execution_image=execution_image,
+            debug=debug, force=force)
+        db_index = None
+        if skip_db:
+            output("Skipping data.db creation")
+        else:
+            db_index = len(steps)
+            steps.append(_data_db_step(campaign_dir, output_callback=output_callback))
+        _, timings = execute_steps(steps, find_run_dirs(results_dir), output=output)
 
-    # Write postprocessing.yaml in campaign/_transient/
-    _write_postprocessing_provenance_yaml(campaign_dir, all_provenance_entries)
+    if db_index is not None and not timings[db_index]["success"]:
+        raise RuntimeError("data.db generation failed")
+    success = success and all(t["success"] for i, t in enumerate(timings) if i != db_index)
 
-    # Build SQLite data.db for the campaign
-    if skip_db:
-        output("Skipping data.db creation")
-    else:
-        db_success, db_msg = generate_data_db(campaign_dir, output_callback=output_callback)
-        if db_success:
-            output(f"✓ {db_msg}")
-        else:
-            raise RuntimeError(f"data.db generation failed: {db_msg}")
+    # Write postprocessing.yaml in campaign/_transient/ (read by the metadata step)
+    _write_postprocessing_provenance_yaml(campaign_dir, all_provenance_entries, timings)
 
     # Generate metadata.yaml in each campaign directory
     if skip_metadata:
         output("Skipping metadata generation")
     else:
+        start = time.monotonic()
         meta_success, meta_msg = generate_campaign_metadata(
             results_dir, vast_file=vast_file, output_callback=output_callback,
         )
         if not meta_success:
             output(f"Warning: Metadata generation failed: {meta_msg}")
+        offset = max((t["end_s"] for t in timings), default=0.0)
+        wall = round(time.monotonic() - start, 3)
+        timings.append({"step": "metadata", "scope": "campaign", "tasks": 1,
+                        "start_s": offset, "end_s": round(offset + wall, 3),
+                        "busy_s": wall, "success": meta_success, "wall_s": wall})
+        _write_postprocessing_provenance_yaml(campaign_dir, all_provenance_entries, timings)
 
     if success:
         return True, "Postprocessing completed successfully!"
@@ -0,0 +1,298 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Dependency-aware execution of postprocessing steps.
+
+Each :class:`Step` declares the files it reads and writes as glob lists —
+relative to the results directory for ``scope="campaign"`` steps, relative to
+each run directory for ``scope="run"`` steps (``../`` reaches campaign-level
+files, e.g. ``../../_execution/data.db``). A step depends on every earlier
+step (in configuration order) it conflicts with: one writes what the other
+reads or writes. A step with undeclared inputs or outputs (``None``) conflicts
+with everything, so it runs alone in order exactly as before.
+
+Independent steps run concurrently. ``run`` steps are scheduled run by run: a
+run's task starts as soon as that run's predecessors are done with it, so e.g.
+``data.db`` ingestion of finished runs overlaps with rosbag extraction of
+others. A campaign step may release runs before it finishes by calling the
+``run_done(run_dir)`` callback it is given (``RosbagsProcess`` does so per
+processed bag). :func:`execute_steps` returns per-step timings, written to
+``_transient/postprocessing.yaml``.
+"""
+
+import fnmatch
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from robovast.common.results_utils import iter_run_folders
+
+_WILDCARDS = "*?["
+
+
+@dataclass
+class Step:
+    """One node of the postprocessing DAG.
+
+    Attributes:
+        name: Label for output and timings.
+        fn: ``fn(run_done) -> (success, message)`` for campaign steps,
+            ``fn(run_dir) -> (success, message)`` for run steps.
+        scope: ``"campaign"`` (called once) or ``"run"`` (called per run).
+        inputs: Globs the step reads, ``None`` if unknown.
+        outputs: Globs the step writes, ``None`` if unknown.
+        finish: Optional ``finish() -> (success, message)`` called once after
+            all of a run step's runs (e.g. to close a database).
+    """
+    name: str
+    fn: Callable
+    scope: str = "campaign"
+    inputs: Optional[Sequence[str]] = None
+    outputs: Optional[Sequence[str]] = None
+    finish: Optional[Callable[[], Tuple[bool, str]]] = None
+
+    def __post_init__(self):
+        if self.scope not in ("campaign", "run"):
+            raise ValueError(f"Step '{self.name}': scope must be 'campaign' or 'run', "
+                             f"got {self.scope!r}")
+
+
+def _literal_ends(pattern: str) -> Tuple[str, str]:
+    """Literal prefix (before the first wildcard) and suffix (after the last)."""
+    first = min(pattern.index(c) for c in _WILDCARDS if c in pattern)
+    last = max(pattern.rfind(c) for c in "*?]")
+    return pattern[:first], pattern[last + 1:]
+
+
+def globs_may_overlap(a: str, b: str) -> bool:
+    """Whether some path may match both globs (conservative: never a false ``False``)."""
+    # No normpath: "*/../x" must keep its wildcard, "*" may span several levels.
+    a, b = a.removeprefix("./"), b.removeprefix("./")
+    a_wild = any(c in a for c in _WILDCARDS)
+    b_wild = any(c in b for c in _WILDCARDS)
+    if not a_wild and not b_wild:
+        return a == b
+    if not a_wild:
+        return fnmatch.fnmatchcase(a, b)
+    if not b_wild:
+        return fnmatch.fnmatchcase(b, a)
+    a_pre, a_suf = _literal_ends(a)
+    b_pre, b_suf = _literal_ends(b)
+    return ((a_pre.startswith(b_pre) or b_pre.startswith(a_pre))
+            and (a_suf.endswith(b_suf) or b_suf.endswith(a_suf)))
+
+
+def _campaign_globs(run_glob: str) -> List[str]:
+    """Results-relative globs a run-relative *run_glob* may stand for.
+
+    Runs sit at ``<config>/<run>`` below the campaign root, which is either
+    the results directory itself or one level below it. Leading ``../``
+    segments are resolved against that layout, so ``../../_execution/data.db``
+    becomes ``_execution/data.db`` (or ``*/_execution/data.db``).
+    """
+    parts = run_glob.removeprefix("./").split("/")
+    ups = next((i for i, part in enumerate(parts) if part != ".."), len(parts))
+    rest = "/".join(parts[ups:])
+    if ups < 2:
+        return [f"*/{rest}"]
+    return [rest, f"*/{rest}"]
+
+
+def _any_overlap(xs: Sequence[str], ys: Sequence[str]) -> bool:
+    return any(globs_may_overlap(x, y) for x in xs for y in ys)
+
+
+def _conflicts(a: Step, b: Step) -> bool:
+    if None in (a.inputs, a.outputs, b.inputs, b.outputs):
+        return True
+
+    def _globs(step: Step, globs: Sequence[str]) -> List[str]:
+        # Run-relative globs compared with a campaign step's become results-relative.
+        if step.scope == "run" and a.scope != b.scope:
+            return [c for g in globs for c in _campaign_globs(g)]
+        return list(globs)
+
+    a_in, a_out = _globs(a, a.inputs), _globs(a, a.outputs)
+    b_in, b_out = _globs(b, b.inputs), _globs(b, b.outputs)
+    return (_any_overlap(a_out, b_in) or _any_overlap(a_in, b_out)
+            or _any_overlap(a_out, b_out))
+
+
+def plan_dependencies(steps: Sequence[Step]) -> List[Set[int]]:
+    """For each step, the indices of the earlier steps it must wait for."""
+    return [{j for j in range(i) if _conflicts(steps[j], steps[i])}
+            for i in range(len(steps))]
+
+
+def find_run_dirs(results_dir: str) -> List[str]:
+    """Run directories under a results dir (``<campaign>/<config>/<run>``) or a
+    single campaign dir (``<config>/<run>``)."""
+    runs = [str(path) for _c, _cfg, _r, path in iter_run_folders(results_dir)]
+    if runs or not os.path.isdir(results_dir):
+        return runs
+    for config in sorted(os.listdir(results_dir)):
+        config_dir = os.path.join(results_dir, config)
+        if config.startswith((".", "_")) or not os.path.isdir(config_dir):
+            continue
+        runs.extend(os.path.join(config_dir, r) for r in sorted(os.listdir(config_dir))
+                    if r.isdigit() and os.path.isdir(os.path.join(config_dir, r)))
+    return runs
+
+
+def execute_steps(steps: Sequence[Step], run_dirs: Iterable[str], *,
+                  max_workers: Optional[int] = None,
+                  output: Callable[[str], None] = print) -> Tuple[bool, List[dict]]:
+    """Run *steps* over *run_dirs* as a DAG (see module doc).
+
+    A failed step does not stop its dependents, matching the sequential
+    behaviour. Returns ``(success, timings)`` with one timing dict per step:
+    ``step``, ``scope``, ``tasks``, ``start_s`` / ``end_s`` (relative to the
+    start of execution), ``wall_s``, ``busy_s`` (summed task time) and
+    ``success``.
+    """
+    steps = list(steps)
+    runs = [os.path.abspath(r) for r in run_dirs]
+    known_runs = set(runs)
+    deps = plan_dependencies(steps)
+    dependents: List[List[int]] = [[] for _ in steps]
+    for i, preds in enumerate(deps):
+        for p in preds:
+            dependents[p].append(i)
+
+    events: "queue.Queue[tuple]" = queue.Queue()
+    released: List[Set[str]] = [set() for _ in steps]
+    submitted: List[Set[Optional[str]]] = [set() for _ in steps]
+    remaining = [len(runs) if s.scope == "run" else 1 for s in steps]
+    done = [False] * len(steps)
+    finishing: Set[int] = set()
+    ok = [True] * len(steps)
+    failures: Dict[int, List[str]] = {i: [] for i in range(len(steps))}
+    timing = [{"step": s.name, "scope": s.scope, "tasks": 0, "start_s": None,
+               "end_s": None, "busy_s": 0.0} for s in steps]
+    t0 = time.monotonic()
+
+    def _call(i: int, kind: str, run: Optional[str]) -> None:
+        step = steps[i]
+        start = time.monotonic()
+        try:
+            if kind == "finish":
+                result = step.finish()
+            elif step.scope == "run":
+                result = step.fn(run)
+            else:
+                result = step.fn(lambda r, i=i: events.put(("release", i, os.path.abspath(r))))
+            success, message = result[0], result[1]
+        except Exception as e:  # pylint: disable=broad-except
+            success, message = False, f"Step '{step.name}' execution error: {e}"
+        events.put((kind, i, run, bool(success), message or "", start, time.monotonic()))
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(32, (os.cpu_count() or 1) + 4),
+                            thread_name_prefix="robovast-pp") as pool:
+
+        def _submit(i: int, kind: str, run: Optional[str] = None) -> None:
+            if kind == "finish":
+                finishing.add(i)
+            else:
+                submitted[i].add(run)
+            pool.submit(_call, i, kind, run)
+
+        def _ready(i: int, run: Optional[str]) -> bool:
+            return all(done[p] or (run is not None and run in released[p]) for p in deps[i])
+
+        def _try_run(i: int, run: str) -> None:
+            if run not in submitted[i] and _ready(i, run):
+                _submit(i, "task", run)
+
+        def _complete(i: int) -> None:
+            """All tasks of step *i* ran: run its finish hook, then release dependents."""
+            if steps[i].finish is not None and i not in finishing:
+                _submit(i, "finish")
+                return
+            done[i] = True
+            if steps[i].scope == "run":
+                if failures[i]:
+                    output(f"✗ {steps[i].name}: {len(failures[i])}/{len(runs)} run(s) failed; "
+                           f"first: {failures[i][0]}")
+                elif ok[i]:
+                    output(f"✓ {steps[i].name}: {len(runs)} run(s)")
+            for d in dependents[i]:
+                _try_step(d)
+
+        def _try_step(i: int) -> None:
+            if done[i]:
+                return
+            if steps[i].scope == "campaign":
+                if None not in submitted[i] and _ready(i, None):
+                    output(f"Executing: {steps[i].name}")
+                    _submit(i, "task")
+            elif not runs:
+                if i not in finishing and _ready(i, None):
+                    _complete(i)
+            else:
+                for run in runs:
+                    _try_run(i, run)
+
+        for i in range(len(steps)):
+            _try_step(i)
+        while not all(done):
+            event = events.get()
+            if event[0] == "release":
+                _, i, run = event
+                if run in known_runs and run not in released[i]:
+                    released[i].add(run)
+                    for d in dependents[i]:
+                        if steps[d].scope == "run":
+                            _try_run(d, run)
+                continue
+            kind, i, run, success, message, start, end = event
+            t = timing[i]
+            t["tasks"] += 1
+            t["busy_s"] += end - start
+            t["start_s"] = round(start - t0, 3) if t["start_s"] is None \
+                else min(t["start_s"], round(start - t0, 3))
+            t["end_s"] = round(end - t0, 3) if t["end_s"] is None else max(t["end_s"], round(end - t0, 3))
+            if not success:
+                ok[i] = False
+            if kind == "finish":
+                if not success:
+                    output(f"✗ {steps[i].name}: {message}")
+                _complete(i)
+                continue
+            if steps[i].scope == "campaign":
+                first = message.splitlines()[0] if message else "done"
+                output(f"✓ {first}" if success else f"✗ {message}")
+                _complete(i)
+                continue
+            if not success:
+                failures[i].append(f"{run}: {message}")
+            released[i].add(run)
+            remaining[i] -= 1
+            for d in dependents[i]:
+                if steps[d].scope == "run":
+                    _try_run(d, run)
+            if remaining[i] == 0:
+                _complete(i)
+
+    for i, t in enumerate(timing):
+        if t["start_s"] is None:   # a run step over no runs
+            t["start_s"] = t["end_s"] = 0.0
+        t["wall_s"] = round(t["end_s"] - t["start_s"], 3)
+        t["busy_s"] = round(t["busy_s"], 3)
+        t["success"] = ok[i]
+    return all(ok), timing
@@ -40,17 +40,23 @@ Configuration format:
       - simple_plugin_name
 """
 import csv
+import fnmatch
+import hashlib
 import json
 import os
 import re
 import sqlite3
 import subprocess
 import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from importlib.resources import files
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 from robovast.common.execution import COMPAT_VERSION, is_campaign_dir
+from robovast.results_processing.rosbags_worker import (get_worker,
+                                                        warm_workers_enabled)
 
 
 class BasePostprocessingPlugin:
@@ -60,8 +66,34 @@ class BasePostprocessingPlugin:
     signature.  Override :meth:`get_files_to_copy` to declare additional files
     that should be copied into the campaign ``_config/`` directory before
     execution (e.g. helper scripts referenced by the plugin).
+
+    Set :attr:`inputs` / :attr:`outputs` (or override :meth:`get_io`) so the
+    postprocessing executor can run the plugin concurrently with steps that
+    touch other files (see :mod:`~robovast.results_processing.postprocessing_dag`).
+    A plugin that sets :attr:`reports_runs` receives a ``run_done(run_dir)``
+    callback to release each run to dependent per-run steps as soon as the
+    run's outputs are final.
     """
 
+    #: Files the plugin reads / writes, as globs relative to the directory it
+    #: is called with. ``None`` (the default) means unknown: the step then runs
+    #: on its own, after every earlier step and before every later one. The
+    #: ``inputs`` / ``outputs`` command parameters override these.
+    inputs: Optional[Tuple[str, ...]] = None
+    outputs: Optional[Tuple[str, ...]] = None
+    #: Whether ``__call__`` accepts a ``run_done`` callback.
+    reports_runs = False
+
+    def get_io(self, params: dict) -> Tuple[Optional[List[str]], Optional[List[str]]]:
+        """Return ``(inputs, outputs)`` globs for a call with *params*.
+
+        Globs are matched with :mod:`fnmatch` (``*`` also matches ``/``).
+        """
+        inputs = params.get("inputs", self.inputs)
+        outputs = params.get("outputs", self.outputs)
+        return (None if inputs is None else list(inputs),
+                None if outputs is None else list(outputs))
+
     def __call__(
         self,
         results_dir: str,
@@ -123,8 +155,36 @@ class Command(BasePostprocessingPlugin):
               args: [custom_script.py, --arg, value]
           - command:
               script: /absolute/path/to/script.sh
+          - command:
+              script: summarize.py
+              inputs: ["*/metrics.csv"]     # lets independent steps run alongside
+              outputs: ["summary.csv"]
+          - command:
+              script: metrics.py            # called as: metrics.py <run-dir>
+              per_run: true
+              inputs: [trajectory.csv]      # relative to each run directory
+              outputs: [metrics.csv]
+
+    With ``per_run: true`` the script is called once per run directory (with
+    the run directory as working directory and last argument) on a pool of
+    ``workers`` threads, and its output is streamed line by line. A run whose
+    declared ``inputs`` are unchanged since the script last succeeded there
+    (same file sizes and modification times, same script and ``args``) and
+    whose ``outputs`` all exist is skipped, so re-running postprocessing only
+    processes new or modified runs. ``force: true`` (or ``--force``) processes
+    every run.
     """
 
+    reports_runs = True
+
+    def get_io(self, params: dict) -> Tuple[Optional[List[str]], Optional[List[str]]]:
+        """In per-run mode, declared globs are run-relative."""
+        inputs, outputs = super().get_io(params)
+        if not params.get("per_run"):
+            return inputs, outputs
+        return (None if inputs is None else [f"*/{g}" for g in inputs],
+                None if outputs is None else [f"*/{g}" for g in outputs])
+
     def get_files_to_copy(self, config_dir: str, params: dict) -> List[str]:
         """Return the script path if it is a relative path that exists.
 
@@ -152,6 +212,14 @@ class Command(BasePostprocessingPlugin):
         args: Optional[List[str]] = None,
         provenance_file: Optional[str] = None,
         execution_image: Optional[str] = None,
+        per_run: bool = False,
+        workers: Optional[int] = None,
+        inputs: Optional[List[str]] = None,
+        outputs: Optional[List[str]] = None,
+        force: bool = False,
+        debug: bool = False,
+        run_done: Optional[Callable[[str], None]] = None,
+        output_callback: Optional[Callable[[str], None]] = None,
     ) -> Tuple[bool, str]:
         """Execute the configured script.
 
@@ -162,6 +230,14 @@ class Command(BasePostprocessingPlugin):
             args: Optional list of command-line arguments to pass to the script
             provenance_file: Optional path for provenance JSON (passed to script if it supports it)
             execution_image: Ignored by this plugin (accepted for interface compatibility)
+            per_run: Call the script once per run directory (see class doc)
+            workers: Concurrent per-run calls (default: ``min(8, cpu count)``)
+            inputs: Run-relative globs the script reads; unchanged runs are skipped
+            outputs: Run-relative globs the script writes; runs missing one are re-processed
+            force: Process every run, ignoring the fingerprints of earlier calls
+            debug: Ignored by this plugin (accepted for interface compatibility)
+            run_done: Optional callback, called with each processed or skipped run directory
+            output_callback: Optional callback receiving the per-run output lines
 
         Returns:
             Tuple of (success, message)
@@ -174,6 +250,10 @@ class Command(BasePostprocessingPlugin):
         if not os.path.exists(script_path):
             return False, f"Script not found: {script_path}"
 
+        if per_run:
+            return self._run_per_run(results_dir, script_path, args or [], workers,
+                                     inputs, outputs, force, run_done, output_callback)
+
         # Build full command (optionally pass provenance to docker_exec and script)
         full_command = [script_path]
         if provenance_file:
@@ -201,6 +281,104 @@ class Command(BasePostprocessingPlugin):
         except Exception as e:
             return False, f"Error executing command: {e}"
 
+    def _run_per_run(self, results_dir, script_path, args, workers, inputs, outputs,
+                     force, run_done, output_callback):
+        from robovast.results_processing.postprocessing_dag import \
+            find_run_dirs  # pylint: disable=import-outside-toplevel
+
+        run_dirs = find_run_dirs(results_dir)
+        if not run_dirs:
+            return True, "Command: no run directories found"
+        output_callback = output_callback or (lambda _line: None)
+        # One fingerprint file per script + args, so several per-run commands coexist.
+        key = hashlib.md5(json.dumps([os.path.basename(script_path), args]).encode()).hexdigest()[:8]
+        cache_name = f"{_COMMAND_CACHE_PREFIX}{key}"
+        script_stat = os.stat(script_path)
+
+        def _fingerprint(run_dir):
+            entries = [script_stat.st_mtime_ns, script_stat.st_size, args]
+            for rel in _glob_run_files(run_dir, inputs):
+                st = os.stat(os.path.join(run_dir, rel))
+                entries.append([rel, st.st_mtime_ns, st.st_size])
+            return hashlib.md5(json.dumps(entries).encode()).hexdigest()
+
+        def _process(run_dir):
+            cache_file = os.path.join(run_dir, cache_name)
+            fingerprint = _fingerprint(run_dir) if inputs else None
+            if fingerprint and not force and all(_glob_run_files(run_dir, [g]) for g in outputs or []):
+                try:
+                    with open(cache_file, encoding="utf-8") as f:
+                        if f.read().strip() == fingerprint:
+                            return run_dir, None
+                except OSError:
+                    pass
+            label = os.path.relpath(run_dir, results_dir)
+            proc = subprocess.Popen(  # nosec B603 - the configured postprocessing script
+                [script_path, *args, run_dir], cwd=run_dir, stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT, text=True, bufsize=1,
+                env={**os.environ, 'PYTHONUNBUFFERED': '1'})
+            last = []
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                output_callback(f"{label}: {line}")
+                last = (last + [line])[-5:]
+            returncode = proc.wait()
+            if returncode != 0:
+                return run_dir, f"exit code {returncode}" + (f": {last[-1]}" if last else "")
+            if fingerprint:
+                with open(cache_file, "w", encoding="utf-8") as f:
+                    f.write(fingerprint)
+            return run_dir, ""
+
+        processed, skipped, failed = 0, 0, []
+        with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1),
+                                thread_name_prefix="robovast-command") as pool:
+            futures = [pool.submit(_process, r) for r in run_dirs]
+            for future in as_completed(futures):
+                try:
+                    run_dir, error = future.result()
+                except Exception as e:  # pylint: disable=broad-except
+                    failed.append(f"error: {e}")
+                    continue
+                if error:
+                    failed.append(f"{os.path.relpath(run_dir, results_dir)}: {error}")
+                    continue
+                if error is None:
+                    skipped += 1
+                else:
+                    processed += 1
+                if run_done is not None:
+                    run_done(run_dir)
+
+        summary = f"{processed} run(s) processed, {skipped} unchanged run(s) skipped"
+        if failed:
+            return False, (f"Command failed on {len(failed)}/{len(run_dirs)} run(s) ({summary})\n"
+                           + "\n".join(sorted(failed)))
+        return True, f"Command executed successfully: {summary}"
+
+
+# Per-run fingerprint file prefix of Command's per_run mode.
+_COMMAND_CACHE_PREFIX = ".robovast_command_"
+
+
+def _glob_run_files(run_dir: str, globs: Optional[List[str]]) -> List[str]:
+    """Sorted run-relative paths of the files under *run_dir* matching any of *globs*."""
+    if not globs:
+        return []
+    matches = []
+    for root, dirs, filenames in os.walk(run_dir):
+        dirs.sort()
+        for name in filenames:
+            rel = os.path.relpath(os.path.join(root, name), run_dir)
+            if not name.startswith(_COMMAND_CACHE_PREFIX) and \
+                    any(fnmatch.fnmatchcase(rel, g) for g in globs):
+                matches.append(rel)
+    return sorted(matches)
+
+
+# Line prefix rosbags_process.py --report-finished prints per finished bag.
+_FINISHED_PREFIX = "Finished bag: "
+
 
 class RosbagsProcess(BasePostprocessingPlugin):
     """Unified single-pass rosbag processor with internal plugin system.
@@ -229,8 +407,21 @@ class RosbagsProcess(BasePostprocessingPlugin):
                 - type: to_csv
                   topics: [/cmd_vel, /odom]
                 - type: rosout_to_csv
+
+    While warm workers are enabled (see
+    :mod:`robovast.results_processing.rosbags_worker`), bags are processed by a
+    long-lived container instead of a new one per call.
     """
 
+    reports_runs = True
+
+    def get_io(self, params: dict) -> Tuple[Optional[List[str]], Optional[List[str]]]:
+        if "inputs" in params or "outputs" in params:
+            return super().get_io(params)
+        bag_dir = params.get("bag_dir") or "rosbag2"
+        # Handlers write next to the bag (CSV, webm) plus a per-bag cache file.
+        return [f"*/{bag_dir}/*"], ["*.csv", "*.webm", "*/.robovast_rosbags_process_cache"]
+
     def __call__(
         self,
         results_dir: str,
@@ -242,6 +433,7 @@ class RosbagsProcess(BasePostprocessingPlugin):
         execution_image: Optional[str] = None,
         debug: bool = False,
         force: bool = False,
+        run_done: Optional[Callable[[str], None]] = None,
     ) -> Tuple[bool, str]:
         """Execute rosbags_process plugin.
 
@@ -254,6 +446,8 @@ class RosbagsProcess(BasePostprocessingPlugin):
             provenance_file: Optional path for provenance JSON.
             execution_image: Optional Docker image override.
             debug: If True, print all per-bag output; otherwise show only progress/summary.
+            run_done: Optional callback, called with each run directory whose
+                bag has been processed (or was cached).
 
         Returns:
             Tuple of (success, message).
@@ -261,54 +455,47 @@ class RosbagsProcess(BasePostprocessingPlugin):
         if not plugins:
             return False, "rosbags_process requires at least one entry under 'plugins'"
 
-        script_path = str(files('robovast.results_processing.data').joinpath('docker_exec.sh'))
-        config_json = json.dumps({"plugins": plugins})
-
-        cmd = [script_path, "--compat-version", str(COMPAT_VERSION)]
-        if execution_image:
-            cmd.extend(["--image", execution_image])
-        if provenance_file:
-            cmd.extend(["--provenance-file", provenance_file])
-        cmd.append("rosbags_process.py")
-        if provenance_file:
-            cmd.extend(["--provenance-file", f"/provenance/{os.path.basename(provenance_file)}"])
-        cmd.extend(["--config", config_json])
+        script_args = ["--config", json.dumps({"plugins": plugins})]
         if workers is not None:
-            cmd.extend(["--workers", str(workers)])
+            script_args.extend(["--workers", str(workers)])
         if bag_dir is not None:
-            cmd.extend(["--bag-dir", bag_dir])
+            script_args.extend(["--bag-dir", bag_dir])
         if debug:
-            cmd.append("--debug")
+            script_args.append("--debug")
         if force:
-            cmd.append("--force")
-        cmd.append(results_dir)
+            script_args.append("--force")
+        if run_done is not None:
+            script_args.append("--report-finished")
+        bag_depth = len(Path(bag_dir or "rosbag2").parts)
+
+        output_lines: List[str] = []
+        _last_was_progress = False
+
+        def _on_line(line: str) -> None:
+            nonlocal _last_was_progress
+            if run_done is not None and line.startswith(_FINISHED_PREFIX):
+                bag = Path(results_dir, line[len(_FINISHED_PREFIX):])
+                run_done(str(bag.parents[bag_depth - 1]))
+                return
+            output_lines.append(line)
+            is_progress = line.startswith("Processing rosbags")
+            if is_progress and not debug:
+                print(f"\r{line}", end="", flush=True)
+            else:
+                if _last_was_progress and not debug:
+                    print()
+                print(line, flush=True)
+            _last_was_progress = is_progress
 
         try:
-            # Stream output line-by-line so progress is visible in real-time.
-            process = subprocess.Popen(
-                cmd,
-                cwd=os.path.dirname(script_path),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # merge stderr into stdout to avoid deadlock
-                text=True,
-                env={**os.environ, 'PYTHONUNBUFFERED': '1'},
-            )
-            output_lines: List[str] = []
-            _last_was_progress = False
-            for line in process.stdout:
-                line = line.rstrip("\n")
-                output_lines.append(line)
-                is_progress = line.startswith("Processing rosbags")
-                if is_progress and not debug:
-                    print(f"\r{line}", end="", flush=True)
-                else:
-                    if _last_was_progress and not debug:
-                        print()
-                    print(line, flush=True)
-                _last_was_progress = is_progress
+            worker = get_worker(results_dir, execution_image) if warm_workers_enabled() else None
+            if worker is not None:
+                returncode = worker.run(script_args, results_dir, provenance_file, _on_line)
+            else:
+                returncode = self._run_container(script_args, results_dir, provenance_file,
+                                                 execution_image, _on_line)
             if _last_was_progress and not debug:
                 print()
-            returncode = process.wait()
             output = "\n".join(output_lines)
             if returncode != 0:
                 return False, f"rosbags_process failed with exit code {returncode}\n{output}"
@@ -320,6 +507,33 @@ class RosbagsProcess(BasePostprocessingPlugin):
         except Exception as e:
             return False, f"Error executing rosbags_process: {e}"
 
+    @staticmethod
+    def _run_container(script_args, results_dir, provenance_file, execution_image, on_line) -> int:
+        """Run rosbags_process.py in a one-off container; returns its exit code."""
+        script_path = str(files('robovast.results_processing.data').joinpath('docker_exec.sh'))
+        cmd = [script_path, "--compat-version", str(COMPAT_VERSION)]
+        if execution_image:
+            cmd.extend(["--image", execution_image])
+        if provenance_file:
+            cmd.extend(["--provenance-file", provenance_file])
+        cmd.append("rosbags_process.py")
+        if provenance_file:
+            cmd.extend(["--provenance-file", f"/provenance/{os.path.basename(provenance_file)}"])
+        cmd.extend(script_args)
+        cmd.append(results_dir)
+        # Stream output line-by-line so progress is visible in real-time.
+        process = subprocess.Popen(
+            cmd,
+            cwd=os.path.dirname(script_path),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # merge stderr into stdout to avoid deadlock
+            text=True,
+            env={**os.environ, 'PYTHONUNBUFFERED': '1'},
+        )
+        for line in process.stdout:
+            on_line(line.rstrip("\n"))
+        return process.wait()
+
 
 class Compress(BasePostprocessingPlugin):
     """Create a gzipped tarball for each campaign-* directory (runs on host).
@@ -345,6 +559,10 @@ class Compress(BasePostprocessingPlugin):
              overwrite: false
     """
 
+    # Reads everything; writes only outside the results directory.
+    inputs = ("*",)
+    outputs = ()
+
     def __call__(
         self,
         results_dir: str,
@@ -448,6 +666,238 @@ def _csv_to_table_name(filename: str) -> str:
     return sanitized or "t_unknown"
 
 
+def _scenario_end(rows: list) -> tuple:
+    """``(timestamp, status, message)`` of the scenario-end rosout entry, if any."""
+    for row in rows:
+        if str(row.get("name", "")) != "scenario_execution_ros":
+            continue
+        msg_val = str(row.get("msg", ""))
+        if msg_val.startswith("Scenario '") and msg_val.endswith("' succeeded."):
+            status = "succeeded"
+        elif ": execution failed." in msg_val:
+            status = "failed"
+        else:
+            continue
+        try:
+            ts_str = row.get("timestamp", "")
+            ts = float(ts_str) if ts_str else None
+        except (ValueError, TypeError):
+            ts = None
+        return ts, status, msg_val
+    return None, None, None
+
+
+class DataDbBuilder:
+    """Incrementally consolidate per-run CSV files into ``_execution/data.db``.
+
+    The engine behind :func:`generate_data_db`, usable run by run so the
+    postprocessing executor can ingest finished runs while other steps still
+    process the rest. :meth:`add_run` may be called from several threads: each
+    run's CSVs are parsed in the calling thread and only the inserts are
+    serialised on the single SQLite connection. Runs added out of
+    ``(config_name, run_id)`` order are sorted into it by :meth:`close`, so
+    the database does not depend on which run finished first.
+
+    Args:
+        campaign_dir: Path to a ``campaign-<id>`` directory.
+        output_callback: Optional callback for progress messages.
+        total_runs: Expected number of runs, for progress percentages.
+    """
+
+    _COMMIT_BATCH = 500  # commit every N runs to reduce fsync overhead
+    _SCENARIO_TIMESTAMPS_DDL = (
+        "CREATE TABLE {table} ("
+        "config_name TEXT NOT NULL, "
+        "run_id INTEGER NOT NULL, "
+        "timestamp REAL, "
+        "status TEXT, "
+        "message TEXT, "
+        "PRIMARY KEY (config_name, run_id)"
+        ")"
+    )
+
+    def __init__(self, campaign_dir: str, output_callback=None,
+                 total_runs: Optional[int] = None):
+        self._log = output_callback or print
+        self.total_runs = total_runs
+        exec_dir = Path(campaign_dir) / "_execution"
+        exec_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = exec_dir / "data.db"
+
+        # Remove existing DB for clean rebuild
+        if self.db_path.exists():
+            self.db_path.unlink()
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        # Metadata table: display_name -> sql_table_name
+        self._conn.execute(
+            "CREATE TABLE _table_name_map "
+            "(display_name TEXT PRIMARY KEY, sql_name TEXT NOT NULL)"
+        )
+        # Scenario timestamps
+        self._conn.execute(self._SCENARIO_TIMESTAMPS_DDL.format(table="scenario_timestamps"))
+        self._conn.commit()
+
+        # sql_table_name -> set of column names already in the schema
+        self._created_tables: dict[str, set[str]] = {}
+        # display_name -> sql_table_name
+        self._name_map: dict[str, str] = {}
+        # display_name -> total row count across all runs
+        self.table_rows: dict[str, int] = {}
+        self.completed_runs = 0
+        # Last (config_name, run_id) added; whether runs came in sorted order
+        self._last_run: Optional[tuple[str, int]] = None
+        self._in_order = True
+
+    @staticmethod
+    def _read_run(config_name: str, run_dir: Path) -> tuple[list, tuple]:
+        """Parse a run's CSVs: ``([(display, sql, cols, rows), ...], scenario_end)``."""
+        tables = []
+        scenario = (None, None, None)
+        # Track stems seen within this run to detect duplicate table names
+        run_stem_to_path: dict[str, Path] = {}
+        for csv_path in sorted(run_dir.rglob("*.csv")):
+            display_name = csv_path.stem
+            # Raise an error if two CSV files in the same run would map to the same table
+            if display_name in run_stem_to_path:
+                raise ValueError(
+                    f"Duplicate table name '{display_name}' in run {run_dir.name} of config "
+                    f"'{config_name}': '{csv_path.relative_to(run_dir)}' conflicts with "
+                    f"'{run_stem_to_path[display_name].relative_to(run_dir)}'"
+                )
+            run_stem_to_path[display_name] = csv_path
+            try:
+                with open(csv_path, encoding="utf-8", newline="") as f:
+                    rows = list(csv.DictReader(f))
+            except Exception:
+                rows = None
+            tables.append((display_name, _csv_to_table_name(csv_path.name), rows))
+            # Extract scenario timestamp from rosout rows
+            if rows and display_name == "rosout" and scenario[0] is None:
+                scenario = _scenario_end(rows)
+        return tables, scenario
+
+    def add_run(self, config_name: str, run_dir) -> None:
+        """Ingest the CSV files of one run directory."""
+        run_dir = Path(run_dir)
+        run_id = int(run_dir.name)
+        tables, scenario = self._read_run(config_name, run_dir)
+        with self._lock:
+            conn = self._conn
+            if self._last_run is not None and (config_name, run_id) < self._last_run:
+                self._in_order = False
+            self._last_run = (config_name, run_id)
+            for display_name, sql_name, rows in tables:
+                if display_name not in self._name_map:
+                    self._name_map[display_name] = sql_name
+                    conn.execute(
+                        "INSERT OR IGNORE INTO _table_name_map (display_name, sql_name) VALUES (?, ?)",
+                        (display_name, sql_name),
+                    )
+                if not rows:
+                    continue
+
+                csv_cols = [c for c in rows[0].keys() if isinstance(c, str)]
+                all_data_cols = ["config_name", "run_id"] + csv_cols
+
+                if sql_name not in self._created_tables:
+                    col_defs = ", ".join(f'"{c}" TEXT' for c in all_data_cols)
+                    conn.execute(f'CREATE TABLE "{sql_name}" ({col_defs})')
+                    conn.execute(
+                        f'CREATE INDEX IF NOT EXISTS "idx_{sql_name}_ctx" '
+                        f'ON "{sql_name}" (config_name, run_id)'
+                    )
+                    self._created_tables[sql_name] = set(all_data_cols)
+                    conn.commit()
+                else:
+                    # Add any new columns from this CSV
+                    existing = self._created_tables[sql_name]
+                    altered = False
+                    for col in csv_cols:
+                        if col not in existing:
+                            conn.execute(f'ALTER TABLE "{sql_name}" ADD COLUMN "{col}" TEXT')
+                            existing.add(col)
+                            altered = True
+                    if altered:
+                        conn.commit()
+
+                placeholders = ", ".join("?" for _ in all_data_cols)
+                col_list = ", ".join(f'"{c}"' for c in all_data_cols)
+                insert_sql = f'INSERT INTO "{sql_name}" ({col_list}) VALUES ({placeholders})'
+                batch = [
+                    [config_name, run_id] + [
+                        json.dumps(v) if isinstance(v, (list, dict)) else v
+                        for v in (row.get(c) for c in csv_cols)
+                    ]
+                    for row in rows
+                ]
+                conn.executemany(insert_sql, batch)
+                self.table_rows[display_name] = self.table_rows.get(display_name, 0) + len(rows)
+
+            # Record scenario timestamp (even if None)
+            conn.execute(
+                "INSERT OR REPLACE INTO scenario_timestamps "
+                "(config_name, run_id, timestamp, status, message) VALUES (?, ?, ?, ?, ?)",
+                (config_name, run_id, *scenario),
+            )
+
+            self.completed_runs += 1
+            if self.completed_runs % self._COMMIT_BATCH == 0:
+                conn.commit()
+                if self.total_runs:
+                    pct = self.completed_runs / self.total_runs * 100
+                    self._log(f"  {self.completed_runs}/{self.total_runs} runs ({pct:.0f}%)")
+                else:
+                    self._log(f"  {self.completed_runs} runs")
+
+    def _sort_tables(self) -> None:
+        """Rewrite every table in ``(config_name, run_id)`` order (keeping row order within a run)."""
+        conn = self._conn
+        order = "config_name, CAST(run_id AS INTEGER), rowid"
+        for sql_name in self._created_tables:
+            conn.execute(f'CREATE TABLE "{sql_name}__sorted" AS SELECT * FROM "{sql_name}" ORDER BY {order}')
+            conn.execute(f'DROP TABLE "{sql_name}"')
+            conn.execute(f'ALTER TABLE "{sql_name}__sorted" RENAME TO "{sql_name}"')
+            conn.execute(f'CREATE INDEX "idx_{sql_name}_ctx" ON "{sql_name}" (config_name, run_id)')
+        conn.execute(self._SCENARIO_TIMESTAMPS_DDL.format(table="scenario_timestamps__sorted"))
+        conn.execute(f"INSERT INTO scenario_timestamps__sorted SELECT * FROM scenario_timestamps ORDER BY {order}")
+        conn.execute("DROP TABLE scenario_timestamps")
+        conn.execute("ALTER TABLE scenario_timestamps__sorted RENAME TO scenario_timestamps")
+
+    def close(self) -> tuple[bool, str]:
+        """Commit, close the database and return ``(success, message)``."""
+        with self._lock:
+            if not self._in_order:
+                self._sort_tables()
+            self._conn.commit()
+            self._conn.close()
+        for display_name, row_count in sorted(self.table_rows.items()):
+            self._log(f"  table: {display_name} ({row_count} rows)")
+        return True, f"Created data.db with {len(self._created_tables)} table(s) in {self.db_path}"
+
+
+def campaign_run_dirs(campaign_dir: str) -> list[tuple[str, Path]]:
+    """``(config_name, run_dir)`` of every run of a campaign, sorted."""
+    campaign_path = Path(campaign_dir)
+    config_dirs = sorted(
+        d for d in campaign_path.iterdir()
+        if d.is_dir()
+        and d.name not in _CAMPAIGN_RESERVED_DIRS
+        and not d.name.startswith(".")
+    )
+    return [
+        (config_dir.name, run_dir)
+        for config_dir in config_dirs
+        for run_dir in sorted(
+            (d for d in config_dir.iterdir() if d.is_dir() and d.name.isdigit()),
+            key=lambda d: int(d.name),
+        )
+    ]
+
+
 def generate_data_db(campaign_dir: str, output_callback=None) -> tuple[bool, str]:
     """Consolidate all per-run CSV files into a single SQLite database.
 
@@ -469,204 +919,17 @@ def generate_data_db(campaign_dir: str, output_callback=None) -> tuple[bool, str
     Returns:
         Tuple of (success, message).
     """
-    def _log(msg: str) -> None:
-        if output_callback:
-            output_callback(msg)
-        else:
-            print(msg)
-
-    campaign_path = Path(campaign_dir)
-    if not campaign_path.is_dir():
+    log = output_callback or print
+    if not Path(campaign_dir).is_dir():
         return False, f"Campaign directory does not exist: {campaign_dir}"
 
-    exec_dir = campaign_path / "_execution"
-    exec_dir.mkdir(parents=True, exist_ok=True)
-    db_path = exec_dir / "data.db"
-
-    # Remove existing DB for clean rebuild
-    if db_path.exists():
-        db_path.unlink()
-
-    conn = sqlite3.connect(str(db_path))
+    runs = campaign_run_dirs(campaign_dir)
+    n_configs = len({config_name for config_name, _ in runs})
+    builder = DataDbBuilder(campaign_dir, output_callback, total_runs=len(runs))
+    log(f"  Building data.db from {len(runs)} run(s) across {n_configs} config(s)...")
     try:
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=OFF")
-
-        # Metadata table: display_name -> sql_table_name
-        conn.execute(
-            "CREATE TABLE _table_name_map "
-            "(display_name TEXT PRIMARY KEY, sql_name TEXT NOT NULL)"
-        )
-        # Scenario timestamps
-        conn.execute(
-            "CREATE TABLE scenario_timestamps ("
-            "config_name TEXT NOT NULL, "
-            "run_id INTEGER NOT NULL, "
-            "timestamp REAL, "
-            "status TEXT, "
-            "message TEXT, "
-            "PRIMARY KEY (config_name, run_id)"
-            ")"
-        )
-        conn.commit()
-
-        # Track which SQL tables have been created and their current columns
-        # sql_table_name -> set of column names already in the schema
-        created_tables: dict[str, set[str]] = {}
-        # display_name -> sql_table_name
-        name_map: dict[str, str] = {}
-        # display_name -> total row count across all runs
-        table_rows: dict[str, int] = {}
-
-        config_dirs = sorted(
-            d for d in campaign_path.iterdir()
-            if d.is_dir()
-            and d.name not in _CAMPAIGN_RESERVED_DIRS
-            and not d.name.startswith(".")
-        )
-
-        # Count total runs upfront for progress reporting
-        all_run_dirs: list = []
-        for config_dir in config_dirs:
-            for d in config_dir.iterdir():
-                if d.is_dir() and d.name.isdigit():
-                    all_run_dirs.append((config_dir.name, d))
-        total_runs = len(all_run_dirs)
-        _log(f"  Building data.db from {total_runs} run(s) across {len(config_dirs)} config(s)...")
-
-        _commit_batch = 500  # commit every N runs to reduce fsync overhead
-        completed_runs = 0
-
-        for config_dir in config_dirs:
-            config_name = config_dir.name
-            run_dirs = sorted(
-                (d for d in config_dir.iterdir() if d.is_dir() and d.name.isdigit()),
-                key=lambda d: int(d.name),
-            )
-            for run_dir in run_dirs:
-                run_id = int(run_dir.name)
-                scenario_ts: float | None = None
-                scenario_status: str | None = None
-                scenario_msg: str | None = None
-                # Track stems seen within this run to detect duplicate table names
-                run_stem_to_path: dict[str, Path] = {}
-
-                for csv_path in sorted(run_dir.rglob("*.csv")):
-                    display_name = csv_path.stem
-                    sql_name = _csv_to_table_name(csv_path.name)
-
-                    # Raise an error if two CSV files in the same run would map to the same table
-                    if display_name in run_stem_to_path:
-                        raise ValueError(
-                            f"Duplicate table name '{display_name}' in run {run_id} of config "
-                            f"'{config_name}': '{csv_path.relative_to(run_dir)}' conflicts with "
-                            f"'{run_stem_to_path[display_name].relative_to(run_dir)}'"
-                        )
-                    run_stem_to_path[display_name] = csv_path
-
-                    if display_name not in name_map:
-                        name_map[display_name] = sql_name
-                        conn.execute(
-                            "INSERT OR IGNORE INTO _table_name_map (display_name, sql_name) VALUES (?, ?)",
-                            (display_name, sql_name),
-                        )
-
-                    try:
-                        with open(csv_path, encoding="utf-8", newline="") as f:
-                            reader = csv.DictReader(f)
-                            rows = list(reader)
-                    except Exception:
-                        continue
-
-                    if not rows:
-                        continue
-
-                    csv_cols = [c for c in rows[0].keys() if isinstance(c, str)]
-
-                    # Extract scenario timestamp from rosout rows
-                    if csv_path.stem == "rosout" and scenario_ts is None:
-                        for row in rows:
-                            name_val = str(row.get("name", ""))
-                            msg_val = str(row.get("msg", ""))
-                            if name_val == "scenario_execution_ros":
-                                if msg_val.startswith("Scenario '") and msg_val.endswith("' succeeded."):
-                                    try:
-                                        ts_str = row.get("timestamp", "")
-                                        scenario_ts = float(ts_str) if ts_str else None
-                                    except (ValueError, TypeError):
-                                        scenario_ts = None
-                                    scenario_status = "succeeded"
-                                    scenario_msg = msg_val
-                                    break
-                                if ": execution failed." in msg_val:
-                                    try:
-                                        ts_str = row.get("timestamp", "")
-                                        scenario_ts = float(ts_str) if ts_str else None
-                                    except (ValueError, TypeError):
-                                        scenario_ts = None
-                                    scenario_status = "failed"
-                                    scenario_msg = msg_val
-                                    break
-
-                    context_cols = ["config_name", "run_id"]
-                    all_data_cols = context_cols + csv_cols
-
-                    if sql_name not in created_tables:
-                        col_defs = ", ".join(
-                            f'"{c}" TEXT' for c in all_data_cols
-                        )
-                        conn.execute(f'CREATE TABLE "{sql_name}" ({col_defs})')
-                        conn.execute(
-                            f'CREATE INDEX IF NOT EXISTS "idx_{sql_name}_ctx" '
-                            f'ON "{sql_name}" (config_name, run_id)'
-                        )
-                        created_tables[sql_name] = set(all_data_cols)
-                        conn.commit()
-                    else:
-                        # Add any new columns from this CSV
-                        existing = created_tables[sql_name]
-                        altered = False
-                        for col in csv_cols:
-                            if col not in existing:
-                                conn.execute(f'ALTER TABLE "{sql_name}" ADD COLUMN "{col}" TEXT')
-                                existing.add(col)
-                                altered = True
-                        if altered:
-                            conn.commit()
-
-                    placeholders = ", ".join("?" for _ in all_data_cols)
-                    col_list = ", ".join(f'"{c}"' for c in all_data_cols)
-                    insert_sql = f'INSERT INTO "{sql_name}" ({col_list}) VALUES ({placeholders})'
-                    batch = [
-                        [config_name, run_id] + [
-                            json.dumps(v) if isinstance(v, (list, dict)) else v
-                            for v in (row.get(c) for c in csv_cols)
-                        ]
-                        for row in rows
-                    ]
-                    conn.executemany(insert_sql, batch)
-                    table_rows[display_name] = table_rows.get(display_name, 0) + len(rows)
-
-                # Record scenario timestamp (even if None)
-                conn.execute(
-                    "INSERT OR REPLACE INTO scenario_timestamps "
-                    "(config_name, run_id, timestamp, status, message) VALUES (?, ?, ?, ?, ?)",
-                    (config_name, run_id, scenario_ts, scenario_status, scenario_msg),
-                )
-
-                completed_runs += 1
-                if completed_runs % _commit_batch == 0:
-                    conn.commit()
-                    pct = completed_runs / total_runs * 100 if total_runs else 100
-                    _log(f"  {completed_runs}/{total_runs} runs ({pct:.0f}%)")
-
-        # Final commit and persist name map
-        conn.commit()
-        table_count = len(created_tables)
+        for config_name, run_dir in runs:
+            builder.add_run(config_name, run_dir)
     finally:
-        conn.close()
-
-    for display_name, row_count in sorted(table_rows.items()):
-        _log(f"  table: {display_name} ({row_count} rows)")
-
-    return True, f"Created data.db with {table_count} table(s) in {db_path}"
+        result = builder.close()
+    return result
@@ -47,15 +47,19 @@ See ``docs/zenodo.rst`` for instructions on creating an access token with the
 ``deposit:write`` scope.
 """
 
+import hashlib
 import json
 import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+import requests.adapters
 import yaml
 
 from robovast.common.progress import make_download_progress_callback
@@ -74,9 +78,26 @@ def _auth(token: str) -> Dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
-def _get_deposition(base: str, record_id: int, token: str) -> dict:
+def _make_session(pool_size: int) -> requests.Session:
+    """A session whose connection pool serves *pool_size* concurrent uploads."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _raise_for(resp: requests.Response) -> None:
+    if not resp.ok:
+        raise requests.HTTPError(
+            f"{resp.status_code} {resp.reason}: {resp.text}", response=resp
+        )
+
+
+def _get_deposition(base: str, record_id: int, token: str,
+                    session: Optional[requests.Session] = None) -> dict:
     """Fetch draft record from the InvenioRDM API."""
-    resp = requests.get(
+    resp = (session or requests).get(
         f"{base}/records/{record_id}/draft",
         headers=_auth(token),
         timeout=30,
@@ -85,120 +106,340 @@ def _get_deposition(base: str, record_id: int, token: str) -> dict:
     return resp.json()
 
 
-def _delete_file(base: str, record_id: int, filename: str, token: str) -> None:
+def _delete_file(base: str, record_id: int, filename: str, token: str,
+                 session: Optional[requests.Session] = None) -> None:
     """Delete a file from an InvenioRDM draft (required before re-uploading)."""
-    resp = requests.delete(
+    resp = (session or requests).delete(
         f"{base}/records/{record_id}/draft/files/{filename}",
         headers=_auth(token),
         timeout=30,
     )
-    if not resp.ok and resp.status_code != 404:
-        raise requests.HTTPError(
-            f"{resp.status_code} {resp.reason}: {resp.text}", response=resp
-        )
+    if resp.status_code != 404:
+        _raise_for(resp)
 
 
-def _list_deposition_files(base: str, record_id: int, token: str) -> List[str]:
-    """Return filenames already present in the draft."""
-    resp = requests.get(
+def _list_deposition_files(base: str, record_id: int, token: str,
+                           session: Optional[requests.Session] = None) -> Dict[str, dict]:
+    """Return the draft's file entries (``status``, ``checksum``, ...) by filename."""
+    resp = (session or requests).get(
         f"{base}/records/{record_id}/draft/files",
         headers=_auth(token),
         timeout=30,
     )
     resp.raise_for_status()
     entries = resp.json().get("entries", [])
-    return [e.get("key", "") for e in entries]
+    return {e.get("key", ""): e for e in entries}
 
 
 class _ProgressFile:
-    """File-like wrapper that reports read progress via a callback.
+    """File-like view of ``length`` bytes of *path* from *offset*, reporting
+    every read to *on_read* (number of bytes).
 
     Using a file-like object (rather than a generator) lets ``requests``
     honour the ``Content-Length`` header and avoid chunked transfer encoding,
-    which the Zenodo files API does not accept.
+    which the Zenodo files API does not accept.  Bytes read are also fed to
+    *digest*, if given.
     """
 
-    def __init__(self, path: Path, callback, file_size: int) -> None:
+    def __init__(self, path: Path, on_read: Callable[[int], None],
+                 offset: int = 0, length: Optional[int] = None,
+                 digest: Optional["_RunningMD5"] = None) -> None:
         self._fh = open(path, "rb")  # noqa: WPS515
-        self._callback = callback
-        self._file_size = file_size
-        self._sent = 0
+        self._fh.seek(offset)
+        self._on_read = on_read
+        self._length = path.stat().st_size - offset if length is None else length
+        self._left = self._length
+        self._pos = offset
+        self._digest = digest
 
     def read(self, size: int = -1) -> bytes:
+        size = self._left if size is None or size < 0 else min(size, self._left)
         chunk = self._fh.read(size)
         if chunk:
-            self._sent += len(chunk)
-            self._callback(self._sent, self._file_size)
+            if self._digest is not None:
+                self._digest.update(self._pos, chunk)
+            self._pos += len(chunk)
+            self._left -= len(chunk)
+            self._on_read(len(chunk))
         return chunk
 
     def __len__(self) -> int:
-        return self._file_size
+        return self._length
 
     def close(self) -> None:
         self._fh.close()
 
 
-def _upload_file(base: str, record_id: int, filename: str, file_path: Path, token: str) -> None:
+class _RunningMD5:
+    """MD5 of a file computed from the bytes sent while uploading it.
+
+    Bytes arrive in file order, but a retried request sends a range again;
+    only bytes past the hashed prefix are added.  If a range is skipped
+    (parts finished by an earlier run), the digest stays incomplete.
+    """
+
+    def __init__(self) -> None:
+        self._md5 = hashlib.md5()
+        self.position = 0
+
+    def update(self, offset: int, chunk: bytes) -> None:
+        if offset <= self.position < offset + len(chunk):
+            self._md5.update(chunk[self.position - offset:])
+            self.position = offset + len(chunk)
+
+    def hexdigest(self) -> str:
+        return self._md5.hexdigest()
+
+
+class _Progress:
+    """One progress bar for all concurrent uploads."""
+
+    def __init__(self, total: int) -> None:
+        self._lock = threading.Lock()
+        self._sent = 0
+        self._total = total
+        self._callback = make_download_progress_callback("upload", time.monotonic())
+
+    def add(self, n: int) -> None:
+        with self._lock:
+            self._sent += n
+            self._callback(self._sent, self._total)
+
+
+_ZENODO_UPLOADS_FILE = ".robovast_zenodo_uploads.json"
+_PART_READ_SIZE = 8 * 1024 * 1024
+
+
+class _UploadState:
+    """Upload progress per file, persisted next to the Zenodo project file.
+
+    An entry records the file it belongs to (size and mtime, and the MD5 if
+    it was known) and, for a multipart upload, the part size, part URLs and
+    finished parts, so an interrupted upload resumes with the missing parts.
+    Entries are removed once a file is committed. MD5 sums are cached by size
+    and mtime so large archives are hashed once.
+    """
+
+    def __init__(self, path: Path, scope: str) -> None:
+        self.path = path
+        self.scope = scope
+        self._lock = threading.Lock()
+        try:
+            self._data: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._data = {}
+
+    def _save(self) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(self._data, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def _key(self, filename: str) -> str:
+        return f"{self.scope}/{filename}"
+
+    @staticmethod
+    def signature(file_path: Path) -> List[int]:
+        st = file_path.stat()
+        return [st.st_size, st.st_mtime_ns]
+
+    def md5(self, file_path: Path) -> str:
+        signature = self.signature(file_path)
+        with self._lock:
+            cached = self._data.get("checksums", {}).get(str(file_path.resolve()))
+        if cached and cached[:2] == signature:
+            return cached[2]
+        digest = hashlib.md5()
+        with open(file_path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(_PART_READ_SIZE), b""):
+                digest.update(chunk)
+        self.remember_md5(file_path, signature, digest.hexdigest())
+        return digest.hexdigest()
+
+    def remember_md5(self, file_path: Path, signature: List[int], md5: str) -> None:
+        """Cache *md5* of *file_path* as it was when it had *signature*."""
+        with self._lock:
+            self._data.setdefault("checksums", {})[str(file_path.resolve())] = [*signature, md5]
+            self._save()
+
+    def get(self, filename: str, file_path: Path) -> Optional[Dict[str, Any]]:
+        """The recorded upload of *filename*, if *file_path* is unchanged since."""
+        with self._lock:
+            entry = self._data.get("uploads", {}).get(self._key(filename))
+        if entry and entry.get("signature") == self.signature(file_path):
+            return entry
+        return None
+
+    def put(self, filename: str, entry: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            uploads = self._data.setdefault("uploads", {})
+            if entry is None:
+                uploads.pop(self._key(filename), None)
+            else:
+                uploads[self._key(filename)] = entry
+            self._save()
+
+    def part_done(self, filename: str, part: int) -> None:
+        with self._lock:
+            entry = self._data.get("uploads", {}).get(self._key(filename))
+            if entry is not None:
+                entry["done"] = sorted(set(entry["done"]) | {part})
+                self._save()
+
+
+def _with_retries(action: Callable[[], None], retries: int, what: str,
+                  on_retry: Optional[Callable[[], None]] = None) -> None:
+    """Call *action*, retrying network errors and 5xx responses with backoff."""
+    for attempt in range(retries + 1):
+        try:
+            action()
+            return
+        except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as exc:
+            response = getattr(exc, "response", None)
+            if attempt == retries or (response is not None and response.status_code < 500):
+                raise
+            if on_retry is not None:
+                on_retry()
+            delay = min(60, 2 ** attempt)
+            print(f"    {what} failed ({exc}); retrying in {delay} s", file=sys.stderr)
+            time.sleep(delay)
+
+
+def _upload_file(  # pylint: disable=too-many-arguments,too-many-locals
+    base: str,
+    record_id: int,
+    filename: str,
+    file_path: Path,
+    token: str,
+    session: Optional[requests.Session] = None,
+    state: Optional[_UploadState] = None,
+    md5: Optional[str] = None,
+    resume: bool = False,
+    part_size: int = 100 * 1024 * 1024,
+    retries: int = 5,
+    progress: Optional[_Progress] = None,
+) -> None:
     """Upload *file_path* using the InvenioRDM 3-step files API.
 
-    Steps: initialise → upload content → commit.
-    Uses a file-like progress wrapper so that ``requests`` sends a proper
-    ``Content-Length`` header instead of chunked transfer encoding.
+    Steps: initialise → upload content → commit.  Files larger than
+    *part_size* are sent as a multipart transfer, one ``PUT`` per part; each
+    finished part is recorded in *state*, and with *resume* an earlier,
+    uncommitted upload of the same content continues with its missing parts.
+    If the server does not offer multipart transfers the file is sent in one
+    ``PUT``.  Failed requests are retried *retries* times.  The committed
+    file's checksum is compared with *md5*; without one, the MD5 is computed
+    from the bytes as they are sent.
     """
+    http = session or requests
     auth = _auth(token)
+    signature = _UploadState.signature(file_path)
+    file_size = signature[0]
+    files_url = f"{base}/records/{record_id}/draft/files"
+    content_url = f"{files_url}/{filename}/content"
+    on_read = progress.add if progress is not None else (lambda n: None)
+    entry = state.get(filename, file_path) if (state is not None and resume) else None
+    if entry is not None:
+        md5 = md5 or entry.get("md5")
+    digest = _RunningMD5() if md5 is None else None
 
     # 1. Initialise the file entry
-    init_resp = requests.post(
-        f"{base}/records/{record_id}/draft/files",
-        json=[{"key": filename}],
-        headers={**auth, "Content-Type": "application/json"},
-        timeout=30,
-    )
-    if not init_resp.ok:
-        raise requests.HTTPError(
-            f"{init_resp.status_code} {init_resp.reason}: {init_resp.text}",
-            response=init_resp,
-        )
+    if entry is None:
+        entry = {"md5": md5, "signature": signature, "size": file_size,
+                 "parts": 0, "links": [], "done": []}
+        init_resp = None
+        if file_size > part_size:
+            parts = -(-file_size // part_size)
+            init_resp = http.post(
+                files_url,
+                json=[{"key": filename, "size": file_size,
+                       "transfer": {"type": "M", "parts": parts, "part_size": part_size}}],
+                headers={**auth, "Content-Type": "application/json"},
+                timeout=30,
+            )
+            if init_resp.ok:
+                links = next((e.get("links", {}) for e in init_resp.json().get("entries", [])
+                              if e.get("key") == filename), {})
+                urls = {p["part"]: p["url"] for p in links.get("parts", [])}
+                entry.update(parts=parts, part_size=part_size,
+                             links=[urls.get(i, f"{content_url}/{i}") for i in range(1, parts + 1)])
+            elif init_resp.status_code >= 500:
+                _raise_for(init_resp)
+            else:
+                init_resp = None  # no multipart support: single upload below
+        if init_resp is None:
+            init_resp = http.post(
+                files_url,
+                json=[{"key": filename}],
+                headers={**auth, "Content-Type": "application/json"},
+                timeout=30,
+            )
+            _raise_for(init_resp)
+        if state is not None:
+            state.put(filename, entry)
 
     # 2. Upload content
-    file_size = file_path.stat().st_size
-    start = time.monotonic()
-    progress_cb = make_download_progress_callback(filename, start)
+    def _put(url: str, offset: int, length: int) -> None:
+        sent = [0]
 
-    pf = _ProgressFile(file_path, progress_cb, file_size)
-    try:
-        content_resp = requests.put(
-            f"{base}/records/{record_id}/draft/files/{filename}/content",
-            data=pf,
-            headers={
-                **auth,
-                "Content-Type": "application/octet-stream",
-                "Content-Length": str(file_size),
-            },
-            timeout=None,
-        )
-    finally:
-        pf.close()
+        def _count(n: int) -> None:
+            sent[0] += n
+            on_read(n)
 
-    sys.stdout.write("\n")
-    sys.stdout.flush()
-    if not content_resp.ok:
-        raise requests.HTTPError(
-            f"{content_resp.status_code} {content_resp.reason}: {content_resp.text}",
-            response=content_resp,
-        )
+        def _attempt() -> None:
+            sent[0] = 0
+            pf = _ProgressFile(file_path, _count, offset, length, digest)
+            try:
+                resp = http.put(
+                    url,
+                    data=pf,
+                    headers={
+                        # Part URLs may be pre-signed storage URLs: no token there.
+                        **(auth if url.startswith(base) else {}),
+                        "Content-Type": "application/octet-stream",
+                        "Content-Length": str(length),
+                    },
+                    timeout=(30, None),
+                )
+            finally:
+                pf.close()
+            _raise_for(resp)
+
+        _with_retries(_attempt, retries, f"{filename}: upload at byte {offset}",
+                      on_retry=lambda: on_read(-sent[0]))
+
+    if entry["parts"]:
+        for part in range(1, entry["parts"] + 1):
+            offset = (part - 1) * entry["part_size"]
+            length = min(entry["part_size"], file_size - offset)
+            if part in entry["done"]:
+                on_read(length)
+                continue
+            _put(entry["links"][part - 1], offset, length)
+            if state is not None:
+                state.part_done(filename, part)
+    else:
+        _put(content_url, 0, file_size)
 
     # 3. Commit
-    commit_resp = requests.post(
-        f"{base}/records/{record_id}/draft/files/{filename}/commit",
-        headers=auth,
-        timeout=30,
-    )
-    if not commit_resp.ok:
+    result: Dict[str, Any] = {}
+
+    def _commit() -> None:
+        commit_resp = http.post(f"{files_url}/{filename}/commit", headers=auth, timeout=30)
+        _raise_for(commit_resp)
+        result.update(commit_resp.json() if commit_resp.content else {})
+
+    _with_retries(_commit, retries, f"{filename}: commit")
+    if state is not None:
+        state.put(filename, None)
+    if md5 is None and digest is not None and digest.position == file_size:
+        md5 = digest.hexdigest()
+        if state is not None:
+            state.remember_md5(file_path, signature, md5)
+    elif md5 is None and state is not None:
+        md5 = state.md5(file_path)  # resumed: earlier parts were sent by another run
+    checksum = result.get("checksum")
+    if md5 and checksum and checksum != f"md5:{md5}":
         raise requests.HTTPError(
-            f"{commit_resp.status_code} {commit_resp.reason}: {commit_resp.text}",
-            response=commit_resp,
-        )
+            f"checksum mismatch after upload: Zenodo has {checksum}, local file is md5:{md5}")
 
 
 def _load_vast_data(vast_path: str) -> Dict[str, Any]:
@@ -211,9 +452,9 @@ def _load_vast_data(vast_path: str) -> Dict[str, Any]:
         return {}
 
 
-def _create_deposition(base: str, token: str) -> dict:
+def _create_deposition(base: str, token: str, session: Optional[requests.Session] = None) -> dict:
     """Create a new empty Zenodo draft record and return its JSON response."""
-    resp = requests.post(
+    resp = (session or requests).post(
         f"{base}/records",
         json={
             "metadata": {"resource_type": {"id": "dataset"}},
@@ -524,6 +765,10 @@ class Zenodo(BasePublicationPlugin):
     The deposition is **not** submitted or published.  After uploading, log in
     to Zenodo, review the files, and publish manually.
 
+    Several files are uploaded at a time; large files go up in parts, and an
+    interrupted upload resumes where it stopped on the next run.  Files whose
+    checksum matches the deposition's copy are skipped.
+
     Dataset metadata from the ``.vast`` file (title, description, keywords,
     creators) is also pushed to the deposition.
 
@@ -557,6 +802,9 @@ class Zenodo(BasePublicationPlugin):
         record_id: Optional[int] = None,
         sandbox: bool = False,
         overwrite: Optional[bool] = None,
+        parallel_uploads: int = 4,
+        part_size_mb: int = 100,
+        retries: int = 5,
         _artifacts: Optional[List[str]] = None,
         _vast_file: Optional[str] = None,
         **_kwargs,
@@ -581,7 +829,18 @@ class Zenodo(BasePublicationPlugin):
                 * ``False`` – silently skip existing files.
 
                 When running with ``--force`` on the CLI this is automatically
-                set to ``True``.
+                set to ``True``.  Files whose content is already in the
+                deposition (same MD5 checksum) are skipped without asking.
+            parallel_uploads: Number of files uploaded concurrently over one
+                pooled HTTP session.  Defaults to ``4``.
+            part_size_mb: Files larger than this are uploaded in parts of
+                this size (MiB), if the Zenodo instance supports multipart
+                transfers.  Finished parts are recorded in
+                ``.robovast_zenodo_uploads.json`` next to the project file,
+                so an interrupted upload resumes with the missing parts on the
+                next run.  Defaults to ``100``.
+            retries: How often a failed request (network error or server
+                error) is retried, with exponential backoff.  Defaults to ``5``.
             _artifacts: List of absolute file paths produced by preceding
                 publication plugins.  Injected automatically by the
                 publication runner.
@@ -605,6 +864,7 @@ class Zenodo(BasePublicationPlugin):
             return True, "No artifacts to upload.", []
 
         base = _base_url(sandbox)
+        session = _make_session(max(1, parallel_uploads))
 
         # ------------------------------------------------------------------ #
         # Resolve record_id: config → project file → create new
@@ -626,7 +886,7 @@ class Zenodo(BasePublicationPlugin):
                 if answer not in ("", "y", "yes"):
                     return True, "Zenodo upload skipped (no record_id).", []
                 try:
-                    deposition = _create_deposition(base, token)
+                    deposition = _create_deposition(base, token, session)
                 except requests.HTTPError as exc:
                     return False, f"Failed to create Zenodo deposition: {exc}", []
                 except requests.RequestException as exc:
@@ -645,7 +905,7 @@ class Zenodo(BasePublicationPlugin):
         # Fetch draft record
         # ------------------------------------------------------------------ #
         try:
-            deposition = _get_deposition(base, record_id, token)
+            deposition = _get_deposition(base, record_id, token, session)
         except requests.HTTPError as exc:
             if exc.response is not None and exc.response.status_code == 404:
                 return (
@@ -662,7 +922,7 @@ class Zenodo(BasePublicationPlugin):
         # Get existing filenames in the deposition
         # ------------------------------------------------------------------ #
         try:
-            existing = set(_list_deposition_files(base, record_id, token))
+            existing = _list_deposition_files(base, record_id, token, session)
         except requests.HTTPError as exc:
             return False, f"Failed to list files for deposition {record_id}: {exc}", []
 
@@ -674,10 +934,11 @@ class Zenodo(BasePublicationPlugin):
             return True, "No artifact files found on disk.", []
 
         # ------------------------------------------------------------------ #
-        # Upload
+        # Decide per file: skip unchanged, resume, (re)upload
         # ------------------------------------------------------------------ #
         uploaded: List[str] = []
         skipped: List[str] = []
+        unchanged: List[str] = []
         errors: List[str] = []
 
         print(
@@ -685,11 +946,40 @@ class Zenodo(BasePublicationPlugin):
             + (" [sandbox]" if sandbox else "")
         )
 
+        # Only files already in the deposition are hashed up front, to compare
+        # them with the remote checksum; new files are hashed while uploading.
+        state = _UploadState(project_path.with_name(_ZENODO_UPLOADS_FILE), f"{instance}/{record_id}")
+        resumable = {
+            path for path in artifact_paths
+            if existing.get(path.name, {}).get("status") == "pending"
+            and state.get(path.name, path) is not None
+        }
+        to_hash = [path for path in artifact_paths
+                   if path.name in existing and path not in resumable]
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, parallel_uploads)) as pool:
+                checksums = dict(zip(to_hash, pool.map(state.md5, to_hash)))
+        except OSError as exc:
+            return False, f"Failed to checksum artifacts: {exc}", []
+
+        jobs: List[Tuple[Path, Optional[str], bool]] = []
         for idx, file_path in enumerate(artifact_paths, 1):
             filename = file_path.name
             print(f"  [{idx}/{len(artifact_paths)}] {filename}")
 
-            if filename in existing:
+            if file_path in resumable:
+                print("    Resuming interrupted upload.")
+                jobs.append((file_path, None, True))
+                continue
+            remote = existing.get(filename)
+            md5 = checksums.get(file_path)
+            if remote is not None and remote.get("checksum") == f"md5:{md5}" \
+                    and remote.get("status", "completed") == "completed":
+                print("    Already uploaded (checksum matches), skipped.")
+                unchanged.append(filename)
+                continue
+
+            if remote is not None:
                 eff_overwrite = overwrite
                 if eff_overwrite is None:
                     try:
@@ -709,21 +999,41 @@ class Zenodo(BasePublicationPlugin):
                 # InvenioRDM does not allow re-initialising an existing key —
                 # delete the old file before uploading the new one.
                 try:
-                    _delete_file(base, record_id, filename, token)
+                    _delete_file(base, record_id, filename, token, session)
                 except requests.HTTPError as exc:
                     print(f"    Error deleting existing file: {exc}", file=sys.stderr)
                     errors.append(f"{filename}: could not delete existing file: {exc}")
                     continue
+            jobs.append((file_path, md5, False))
+
+        # ------------------------------------------------------------------ #
+        # Upload, several files at a time
+        # ------------------------------------------------------------------ #
+        progress = _Progress(sum(path.stat().st_size for path, _, _ in jobs))
+        part_size = max(1, part_size_mb) * 1024 * 1024
 
+        def _upload(job: Tuple[Path, Optional[str], bool]) -> Optional[str]:
+            file_path, md5, resume = job
             try:
-                _upload_file(base, record_id, filename, file_path, token)
-                uploaded.append(filename)
-            except requests.HTTPError as exc:
-                print(f"    Error: {exc}", file=sys.stderr)
-                errors.append(f"{filename}: {exc}")
-            except OSError as exc:
-                print(f"    Error: {exc}", file=sys.stderr)
-                errors.append(f"{filename}: {exc}")
+                _upload_file(base, record_id, file_path.name, file_path, token, session=session,
+                             state=state, md5=md5, resume=resume, part_size=part_size,
+                             retries=retries, progress=progress)
+            except (requests.RequestException, OSError) as exc:
+                return str(exc)
+            return None
+
+        if jobs:
+            with ThreadPoolExecutor(max_workers=max(1, parallel_uploads),
+                                    thread_name_prefix="robovast-zenodo") as pool:
+                results = list(pool.map(_upload, jobs))
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+            for (file_path, _, _), error in zip(jobs, results):
+                if error is None:
+                    uploaded.append(file_path.name)
+                else:
+                    print(f"    Error ({file_path.name}): {error}", file=sys.stderr)
+                    errors.append(f"{file_path.name}: {error}")
 
         # ------------------------------------------------------------------ #
         # Update Zenodo metadata from .vast file
@@ -750,6 +1060,8 @@ class Zenodo(BasePublicationPlugin):
         parts: List[str] = []
         if uploaded:
             parts.append(f"uploaded: {', '.join(uploaded)}")
+        if unchanged:
+            parts.append(f"unchanged: {', '.join(unchanged)}")
         if skipped:
             parts.append(f"skipped (already exist): {', '.join(skipped)}")
         if meta_msg:
@@ -35,21 +35,29 @@ Configuration format:
            - "/_config/*"
            destination: archives/
            overwrite: true
+           workers: 8
 """
 
 import datetime
 import fnmatch
+import multiprocessing
 import os
 import re
+import shutil
 import stat
+import tempfile
 import time
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import yaml
 
 from robovast.common.execution import get_campaign_timestamp, is_campaign_dir
+from robovast.common.progress import fmt_rate, fmt_size
 from robovast.results_processing.publication_plugins.base import \
     BasePublicationPlugin
 
@@ -60,6 +68,19 @@ _ALWAYS_EXCLUDE: List[str] = [
     ".DS_Store"
 ]
 
+# Already-compressed formats: deflating them costs CPU and saves nothing, so
+# they are stored as-is (see the ``store_extensions`` parameter).
+_STORED_EXTENSIONS: List[str] = [
+    ".mcap", ".webm", ".mp4", ".mkv", ".png", ".jpg", ".jpeg",
+    ".gz", ".tgz", ".bz2", ".xz", ".zst", ".zip", ".7z",
+]
+
+_CHUNK_SIZE = 1024 * 1024
+# Deflated members up to this size are passed back from the worker in memory;
+# larger ones are spooled to a temporary file next to the archive.
+_INLINE_LIMIT = 8 * 1024 * 1024
+_ZIP_EPOCH = 315532800  # January 1, 1980 00:00:00 (ZIP epoch floor)
+
 
 class _FormattableTimestamp(str):
     """A ``str`` subclass that supports datetime format specs.
@@ -291,6 +312,89 @@ def _plan_campaign_members(
     return files, symlinks, errors
 
 
+def _deflate_member(path: str, spool_dir: str) -> Tuple[int, int, int, Optional[bytes], Optional[str]]:
+    """Deflate one file the way :mod:`zipfile` does (raw deflate stream).
+
+    Runs in a worker process. Returns ``(crc, size, compress_size, data,
+    spool_path)``: the compressed bytes are either *data* or, above
+    ``_INLINE_LIMIT``, a file in *spool_dir* the caller must delete.
+    """
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    crc = size = compress_size = 0
+    buffer: List[bytes] = []
+    spool = None
+    spool_path = None
+    try:
+        with open(path, "rb") as src:
+            while True:
+                chunk = src.read(_CHUNK_SIZE)
+                tail = compressor.compress(chunk) if chunk else compressor.flush()
+                if chunk:
+                    crc = zlib.crc32(chunk, crc)
+                    size += len(chunk)
+                compress_size += len(tail)
+                if spool is None and compress_size > _INLINE_LIMIT:
+                    fd, spool_path = tempfile.mkstemp(dir=spool_dir, suffix=".deflate")
+                    spool = os.fdopen(fd, "wb")
+                    spool.writelines(buffer)
+                    buffer = []
+                if spool is not None:
+                    spool.write(tail)
+                else:
+                    buffer.append(tail)
+                if not chunk:
+                    break
+    finally:
+        if spool is not None:
+            spool.close()
+    return crc, size, compress_size, (None if spool_path else b"".join(buffer)), spool_path
+
+
+def _write_deflated(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo,
+                    result: Tuple[int, int, int, Optional[bytes], Optional[str]]) -> None:
+    """Append a member deflated by :func:`_deflate_member` to *zf*.
+
+    Does what ``ZipFile.open(zinfo, "w")`` does, but with the sizes and CRC
+    known up front, so the compressed stream is copied instead of recompressed.
+    :mod:`zipfile` has no public API for that, so this relies on its internals
+    (``_writecheck``, ``start_dir``, ``FileHeader``) as of CPython 3.12 and
+    3.13, the versions ``pyproject.toml`` allows; the zip publication tests,
+    including one with ZIP64 headers, must pass before that range is widened.
+    """
+    crc, size, compress_size, data, spool_path = result
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.CRC, zinfo.file_size, zinfo.compress_size = crc, size, compress_size
+    zf._writecheck(zinfo)  # pylint: disable=protected-access
+    zf._didModify = True  # pylint: disable=protected-access
+    zf.fp.seek(zf.start_dir)
+    zinfo.header_offset = zf.fp.tell()
+    zf.fp.write(zinfo.FileHeader(size > zipfile.ZIP64_LIMIT or compress_size > zipfile.ZIP64_LIMIT))
+    if spool_path is None:
+        zf.fp.write(data)
+    else:
+        with open(spool_path, "rb") as src:
+            shutil.copyfileobj(src, zf.fp, _CHUNK_SIZE)
+        os.unlink(spool_path)
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _write_stored(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, path: Path) -> None:
+    """Append *path* to *zf* uncompressed, streaming it in chunks."""
+    zinfo.compress_type = zipfile.ZIP_STORED
+    zinfo.file_size = os.path.getsize(path)
+    with open(path, "rb") as src, zf.open(zinfo, "w") as dst:
+        shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+
+
+def _member_zinfo(arcname: str, mtime: float, mode: int) -> zipfile.ZipInfo:
+    # Clamp mtime to the ZIP-supported range (1980-2107)
+    zinfo = zipfile.ZipInfo(filename=arcname, date_time=time.gmtime(max(mtime, _ZIP_EPOCH))[:6])
+    zinfo.external_attr = mode << 16
+    return zinfo
+
+
 class Zip(BasePublicationPlugin):
     """Create a zip archive for each campaign directory.
 
@@ -340,6 +444,8 @@ class Zip(BasePublicationPlugin):
         overwrite: Optional[bool] = None,
         omit_hidden: bool = False,
         metadata: Optional[Dict[str, Any]] = None,
+        workers: int = 1,
+        store_extensions: Optional[List[str]] = None,
         _vast_file: Optional[str] = None,
         _campaign_filter: Optional[str] = None,
     ) -> Tuple[bool, str, List[str]]:
@@ -392,6 +498,14 @@ class Zip(BasePublicationPlugin):
                 of *include_filter* / *exclude_filter*.  If no campaign
                 ``metadata.yaml`` exists the provided dict is used as the sole
                 content of that section.
+            workers: Number of worker processes deflating members in
+                parallel; ``1`` (default) deflates in this process, ``0`` uses
+                one per CPU.  The archive content is the same either way.
+                Several archives of one entry are always built concurrently.
+            store_extensions: File extensions stored without compression
+                because they are already compressed.  Defaults to
+                ``.mcap``, ``.webm``, ``.mp4``, ``.tar.gz`` and similar
+                formats; ``[]`` deflates every file.
             _vast_file: Internal – absolute path to the .vast file, injected by
                 the publication runner.  Used to load ``metadata:`` for filename
                 template substitution.  Not intended for manual configuration.
@@ -415,6 +529,7 @@ class Zip(BasePublicationPlugin):
                    omit_hidden: true
                    overwrite: true
                    destination: archives/
+                   workers: 8
         """
         # Resolve destination directory relative to results_dir
         if destination:
@@ -458,7 +573,8 @@ class Zip(BasePublicationPlugin):
         if not groups:
             return True, "No campaign directories found (expected pattern: <name>-YYYY-MM-DD-HHMMSS)", []
 
-        created = []
+        # Resolve overwrite prompts up front; the archives are then built concurrently.
+        pending_groups: List[Tuple[Path, List[Path]]] = []
         for zip_path, campaign_items in groups.items():
             # Handle existing zip file — prompt at most once per output file
             if zip_path.exists():
@@ -473,10 +589,16 @@ class Zip(BasePublicationPlugin):
                         answer = ""
                     if answer not in ("", "y", "yes"):
                         continue
+            pending_groups.append((zip_path, campaign_items))
+
+        if not pending_groups:
+            return True, "Skipped all zip archives (already exist).", []
 
-            try:
-                # Plan and validate every campaign's members before opening the
-                # archive, so a failed symlink check never leaves a partial zip.
+        # Plan and validate every campaign's members before opening any
+        # archive, so a failed symlink check never leaves a partial zip.
+        plans = []
+        try:
+            for zip_path, campaign_items in pending_groups:
                 plan: List[Tuple[Path, List[Tuple[Path, str]], List[Tuple[Path, str, str]]]] = []
                 for campaign_item in campaign_items:
                     files, symlinks, errors = _plan_campaign_members(
@@ -487,46 +609,103 @@ class Zip(BasePublicationPlugin):
                             + "; ".join(errors)
                         ), []
                     plan.append((campaign_item, files, symlinks))
+                plans.append((zip_path, plan))
+            dest_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            return False, f"Failed to plan zip archives: {e}", []
+
+        stored = tuple(ext.lower() for ext in
+                       (_STORED_EXTENSIONS if store_extensions is None else store_extensions))
+        n_workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+        pool: Optional[Executor] = None
+        if n_workers > 1:
+            pool = ProcessPoolExecutor(max_workers=n_workers,
+                                       mp_context=multiprocessing.get_context("spawn"))
+        spool_dir = tempfile.mkdtemp(prefix=".robovast-zip-", dir=dest_dir)
+        try:
+            with ThreadPoolExecutor(max_workers=len(plans), thread_name_prefix="robovast-zip") as builders:
+                futures = [builders.submit(self._build_zip, zip_path, plan, omit_hidden, metadata,
+                                           stored, pool, 2 * n_workers, spool_dir)
+                           for zip_path, plan in plans]
+                results = [f.exception() or f.result() for f in futures]
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            shutil.rmtree(spool_dir, ignore_errors=True)
 
-                min_timestamp = 315532800  # January 1, 1980 00:00:00 (ZIP epoch floor)
-                dest_dir.mkdir(parents=True, exist_ok=True)
-                with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-                    for campaign_item, files, symlinks in plan:
-                        for entry, rel_str in files:
-                            member_path = self.get_arcname(rel_str, omit_hidden)
-                            arcname = f"{campaign_item.name}/{member_path}"
-
-                            # Clamp mtime to the ZIP-supported range (1980-2107)
-                            clamped_mtime = max(os.path.getmtime(entry), min_timestamp)
-
-                            zinfo = zipfile.ZipInfo(filename=arcname, date_time=time.gmtime(clamped_mtime)[:6])
-                            zinfo.external_attr = os.stat(entry).st_mode << 16
-
-                            with open(entry, 'rb') as f:
-                                zf.writestr(zinfo, f.read(), compress_type=zipfile.ZIP_DEFLATED)
-
-                        # Store validated symlinks as real symlink entries. The
-                        # stored target is recomputed relative to the link's
-                        # in-archive location so it stays valid under omit_hidden
-                        # (which can shift where the target lands in the archive).
-                        for entry, rel_str, target_rel_str in symlinks:
-                            link_arc = f"{campaign_item.name}/{self.get_arcname(rel_str, omit_hidden)}"
-                            target_arc = f"{campaign_item.name}/{self.get_arcname(target_rel_str, omit_hidden)}"
-                            link_value = os.path.relpath(target_arc, os.path.dirname(link_arc))
-
-                            clamped_mtime = max(os.lstat(entry).st_mtime, min_timestamp)
-                            zinfo = zipfile.ZipInfo(filename=link_arc, date_time=time.gmtime(clamped_mtime)[:6])
-                            zinfo.external_attr = (stat.S_IFLNK | 0o777) << 16
-                            zinfo.create_system = 3  # Unix — so extractors restore the symlink bit
-                            zf.writestr(zinfo, link_value)
-
-                        if metadata:
-                            merged_yaml = _merge_zip_metadata(campaign_item, metadata)
-                            zf.writestr(f"{campaign_item.name}/metadata.yaml", merged_yaml)
-                created.append(zip_path.name)
-            except OSError as e:
-                return False, f"Failed to create {zip_path}: {e}", []
-
-        if not created:
-            return True, "Skipped all zip archives (already exist).", []
-        return True, f"Created zip archives: {', '.join(created)}", [str(dest_dir / name) for name in created]
+        created = []
+        for (zip_path, _plan), result in zip(plans, results):
+            if isinstance(result, BaseException):
+                return False, f"Failed to create {zip_path}: {result}", []
+            size, seconds = result
+            created.append(f"{zip_path.name} ({fmt_size(size)} in {seconds:.1f} s, "
+                           f"{fmt_rate(size / seconds if seconds > 0 else 0)})")
+        return True, f"Created zip archives: {', '.join(created)}", [str(zip_path) for zip_path, _ in plans]
+
+    def _build_zip(
+        self,
+        zip_path: Path,
+        plan: List[Tuple[Path, List[Tuple[Path, str]], List[Tuple[Path, str, str]]]],
+        omit_hidden: bool,
+        metadata: Optional[Dict[str, Any]],
+        stored: Tuple[str, ...],
+        pool: Optional[Executor],
+        window: int,
+        spool_dir: str,
+    ) -> Tuple[int, float]:
+        """Write one archive; returns ``(input bytes, seconds)``.
+
+        Members are deflated by *pool* (in this thread if ``None``), at most
+        *window* ahead of the writer, and appended in plan order. Members with
+        an extension in *stored* are stored uncompressed. A failed archive is
+        removed.
+        """
+        start = time.monotonic()
+        total = 0
+        pending: Deque[Callable[[], None]] = deque()
+
+        def _queue(write: Callable[[], None]) -> None:
+            pending.append(write)
+            while len(pending) > window:
+                pending.popleft()()
+
+        try:
+            with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                for campaign_item, files, symlinks in plan:
+                    for entry, rel_str in files:
+                        st = os.stat(entry)
+                        total += st.st_size
+                        zinfo = _member_zinfo(
+                            f"{campaign_item.name}/{self.get_arcname(rel_str, omit_hidden)}",
+                            st.st_mtime, st.st_mode)
+                        if entry.name.lower().endswith(stored):
+                            _queue(lambda zinfo=zinfo, entry=entry: _write_stored(zf, zinfo, entry))
+                            continue
+                        future = pool.submit(_deflate_member, str(entry), spool_dir) if pool else None
+                        _queue(lambda zinfo=zinfo, entry=entry, future=future: _write_deflated(
+                            zf, zinfo,
+                            future.result() if future else _deflate_member(str(entry), spool_dir)))
+
+                    # Store validated symlinks as real symlink entries. The
+                    # stored target is recomputed relative to the link's
+                    # in-archive location so it stays valid under omit_hidden
+                    # (which can shift where the target lands in the archive).
+                    for entry, rel_str, target_rel_str in symlinks:
+                        link_arc = f"{campaign_item.name}/{self.get_arcname(rel_str, omit_hidden)}"
+                        target_arc = f"{campaign_item.name}/{self.get_arcname(target_rel_str, omit_hidden)}"
+                        link_value = os.path.relpath(target_arc, os.path.dirname(link_arc))
+
+                        zinfo = _member_zinfo(link_arc, os.lstat(entry).st_mtime, stat.S_IFLNK | 0o777)
+                        zinfo.create_system = 3  # Unix — so extractors restore the symlink bit
+                        _queue(lambda zinfo=zinfo, link_value=link_value: zf.writestr(zinfo, link_value))
+
+                    if metadata:
+                        merged_yaml = _merge_zip_metadata(campaign_item, metadata)
+                        _queue(lambda name=campaign_item.name, data=merged_yaml:
+                               zf.writestr(f"{name}/metadata.yaml", data))
+                while pending:
+                    pending.popleft()()
+        except BaseException:
+            zip_path.unlink(missing_ok=True)
+            raise
+        return total, time.monotonic() - start
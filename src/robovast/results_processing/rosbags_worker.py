@@ -0,0 +1,249 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Long-lived rosbag processing worker for repeated postprocessing.
+
+Each :class:`~robovast.results_processing.postprocessing_plugins.RosbagsProcess`
+call normally starts a fresh ROS container through ``docker_exec.sh``, which
+sources ROS and imports ``rosbag2_py`` and the message packages again. Search
+campaigns postprocess after every batch, so that start-up is paid once per
+batch. Once :func:`enable_warm_workers` has been called (the campaign controller
+does so), calls are instead sent to a :class:`RosbagsWorker`: one container per
+results root and image running ``rosbags_process.py --serve``, which keeps its
+imports and worker pool and reads one JSON job per line from stdin. Later calls
+only pay the per-bag cost.
+
+A worker that cannot be started, or that dies, is dropped and the call falls
+back to a one-off container. Workers stop with :func:`shutdown_warm_workers`, at
+interpreter exit, or when their stdin is closed.
+"""
+
+import atexit
+import json
+import logging
+import os
+import posixpath
+import shutil
+import subprocess
+import tempfile
+import threading
+from importlib.resources import files
+from typing import Callable, Dict, List, Optional, Tuple
+
+from robovast.common.execution import COMPAT_VERSION
+from robovast.results_processing.data.rosbags_common import (JOB_DONE_PREFIX,
+                                                             WORKER_READY)
+
+logger = logging.getLogger(__name__)
+
+# Seconds a worker may take to print WORKER_READY (includes a Docker image pull).
+STARTUP_TIMEOUT_S = 600.0
+
+
+class RosbagsWorker:
+    """A running ``rosbags_process.py --serve`` process.
+
+    Args:
+        root: Directory the worker serves; job inputs must lie below it.
+        image: Docker image (``None``: the ``docker_exec.sh`` default).
+        command: Command to start the worker instead of the Docker container
+            (``--serve <root>`` is appended); its provenance files are then
+            written to host paths directly.
+        startup_timeout: Seconds to wait for the worker to become ready
+            before it is killed.
+
+    Raises:
+        RuntimeError: If the worker exits, or does not become ready within
+            *startup_timeout*.
+    """
+
+    def __init__(self, root: str, image: Optional[str] = None,
+                 command: Optional[List[str]] = None,
+                 startup_timeout: float = STARTUP_TIMEOUT_S):
+        self.root = os.path.abspath(root)
+        self.image = image
+        self._provenance_dir = tempfile.mkdtemp(prefix="robovast_rosbags_worker_")
+        self._lock = threading.Lock()
+        self._next_job = 0
+        if command is None:
+            script_path = str(files('robovast.results_processing.data').joinpath('docker_exec.sh'))
+            command = [script_path, "--interactive", "--compat-version", str(COMPAT_VERSION)]
+            if image:
+                command.extend(["--image", image])
+            # docker_exec.sh mounts the provenance file's directory at /provenance.
+            command.extend(["--provenance-file", os.path.join(self._provenance_dir, "provenance.json"),
+                            "rosbags_process.py"])
+            self._provenance_mount = "/provenance"
+            cwd = os.path.dirname(script_path)
+        else:
+            self._provenance_mount = self._provenance_dir
+            cwd = None
+        self.process = subprocess.Popen(  # nosec B603 - our own worker script
+            [*command, "--serve", self.root],
+            cwd=cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env={**os.environ, 'PYTHONUNBUFFERED': '1'},
+        )
+        startup: List[str] = []
+        expired = threading.Event()
+
+        def _expire():
+            # Killing the process ends the stdout loop below.
+            expired.set()
+            self.process.kill()
+
+        watchdog = threading.Timer(startup_timeout, _expire)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            for line in self.process.stdout:
+                line = line.rstrip("\n")
+                if line == WORKER_READY:
+                    return
+                startup.append(line)
+        finally:
+            watchdog.cancel()
+        self.close()
+        reason = (f"did not become ready within {startup_timeout:g}s" if expired.is_set()
+                  else "exited during start-up")
+        raise RuntimeError(f"rosbags worker {reason}:\n" + "\n".join(startup[-20:]))
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def covers(self, path: str) -> bool:
+        """Whether *path* lies in the served root."""
+        path = os.path.abspath(path)
+        return os.path.commonpath([self.root, path]) == self.root
+
+    def run(self, argv: List[str], input_dir: str, provenance_file: Optional[str] = None,
+            on_line: Optional[Callable[[str], None]] = None) -> int:
+        """Run ``rosbags_process.py <argv> <input_dir>`` in the worker.
+
+        Output lines are passed to *on_line* as they arrive. Provenance is
+        written to *provenance_file* as with a one-off call. Jobs of one worker
+        run one at a time. Returns the job's exit code.
+
+        Raises:
+            RuntimeError: If the worker dies during the job.
+        """
+        with self._lock:
+            job_id = self._next_job
+            self._next_job += 1
+            job_argv = list(argv)
+            worker_provenance = os.path.join(self._provenance_dir, f"{job_id}.json")
+            if provenance_file:
+                job_argv.extend(["--provenance-file",
+                                 posixpath.join(self._provenance_mount, f"{job_id}.json")])
+            job = {"id": job_id, "input": os.path.relpath(os.path.abspath(input_dir), self.root),
+                   "argv": job_argv}
+            try:
+                self.process.stdin.write(json.dumps(job) + "\n")
+                self.process.stdin.flush()
+            except OSError as e:
+                raise RuntimeError(f"rosbags worker is gone: {e}") from e
+            for line in self.process.stdout:
+                line = line.rstrip("\n")
+                if line.startswith(JOB_DONE_PREFIX):
+                    done_id, _, code = line[len(JOB_DONE_PREFIX):].partition(" ")
+                    if done_id == str(job_id):
+                        break
+                if on_line is not None:
+                    on_line(line)
+            else:
+                raise RuntimeError(f"rosbags worker exited with code {self.process.wait()}")
+            if provenance_file and os.path.isfile(worker_provenance):
+                shutil.move(worker_provenance, provenance_file)
+            return int(code)
+
+    def close(self) -> None:
+        """Stop the worker (closing stdin ends its job loop)."""
+        try:
+            if self.process.stdin:
+                self.process.stdin.close()
+            self.process.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+        shutil.rmtree(self._provenance_dir, ignore_errors=True)
+
+
+_lock = threading.Lock()
+_warm_enabled = threading.Event()
+_workers: Dict[Tuple[str, Optional[str]], RosbagsWorker] = {}
+# Workers being started, by (root, image); set once the start has finished.
+_starting: Dict[Tuple[str, Optional[str]], threading.Event] = {}
+
+
+def enable_warm_workers() -> None:
+    """Route later :class:`RosbagsProcess` calls to long-lived workers."""
+    _warm_enabled.set()
+
+
+def warm_workers_enabled() -> bool:
+    return _warm_enabled.is_set()
+
+
+def get_worker(results_dir: str, image: Optional[str] = None) -> Optional[RosbagsWorker]:
+    """A live worker covering *results_dir* for *image*, started if needed.
+
+    Returns ``None`` (after logging why) if no worker could be started. The
+    start runs outside the module lock, so calls for other results roots are
+    not held up by it; concurrent calls for the same root wait for it.
+    """
+    start_key = (os.path.abspath(results_dir), image)
+    while True:
+        with _lock:
+            for key, worker in list(_workers.items()):
+                if not worker.alive:
+                    worker.close()
+                    del _workers[key]
+                elif worker.image == image and worker.covers(results_dir):
+                    return worker
+            started = _starting.get(start_key)
+            if started is None:
+                started = _starting[start_key] = threading.Event()
+                break
+        started.wait()
+    try:
+        worker = RosbagsWorker(results_dir, image)
+    except (OSError, RuntimeError) as e:
+        logger.warning("Could not start a warm rosbags worker, using a one-off container: %s", e)
+        worker = None
+    with _lock:
+        if worker is not None:
+            _workers[(worker.root, image)] = worker
+        del _starting[start_key]
+        started.set()
+    return worker
+
+
+def shutdown_warm_workers() -> None:
+    """Stop all workers and return to one-off containers."""
+    with _lock:
+        _warm_enabled.clear()
+        workers = list(_workers.values())
+        _workers.clear()
+    for worker in workers:
+        worker.close()
+
+
+atexit.register(shutdown_warm_workers)
@@ -18,10 +18,17 @@
 
 This is the bridge from search to the existing generation/packing/execution
 path: each :class:`ParamSet` is turned into one ``configuration`` block, then the
-existing ``generate_scenario_variations`` chain runs to produce
+existing variation chain (:func:`~robovast.common.config_generation.generate_configs`,
+the core of ``generate_scenario_variations``) runs to produce
 ``campaign_data["configs"]`` — exactly the structure the packer and launchers
 already consume. No rewrite of the variation plugins is required.
 
+Composition happens in memory: the base ``.vast`` is parsed, and its run files,
+scenario parameters and variation plugins resolved, once per :class:`Compose`;
+the blocks of a batch are generated in parallel; and each variation step's
+output is cached across batches (:class:`_VariationStepCache`), so a step whose
+inputs did not change between parameter sets is not re-run.
+
 How a sampled value reaches a config:
 
 * **Variation template** — the ``search:`` block may carry a ``variations:`` (and
@@ -41,17 +48,20 @@ reports a clear error if a variation expands combinatorially.
 """
 
 import copy
+import hashlib
+import json
 import logging
 import os
+import shutil
 import tempfile
+import threading
+import weakref
 from collections import defaultdict
 from typing import Any
 
-import yaml
-
 from robovast.common.common import load_config
-from robovast.common.config import match_var_marker
-from robovast.common.config_generation import generate_scenario_variations
+from robovast.common.config import match_var_marker, validate_config
+from robovast.common.config_generation import GenerationContext, generate_configs
 
 from .types import ParamSet
 
@@ -104,10 +114,127 @@ def _substitute_vars(node: Any, values: dict[str, Any], used: set[str]) -> Any:
     return node
 
 
+def _rebase_paths(node: Any, old: str, new: str, found: set | None = None) -> Any:
+    """Deep-copy ``node`` replacing the *old* directory prefix of string leaves
+    with *new*; collects the rebased relative paths in *found*."""
+    if isinstance(node, dict):
+        return {k: _rebase_paths(v, old, new, found) for k, v in node.items()}
+    if isinstance(node, (list, tuple)):
+        out = [_rebase_paths(v, old, new, found) for v in node]
+        return tuple(out) if isinstance(node, tuple) else out
+    if isinstance(node, str) and node.startswith(old + os.sep):
+        rel = node[len(old) + 1:]
+        if found is not None:
+            found.add(rel)
+        return os.path.join(new, rel)
+    return copy.deepcopy(node)
+
+
+class _VariationStepCache:
+    """Outputs of variation steps, reused across the batches of one search.
+
+    A step's output depends on the variation class, its (substituted)
+    parameters and the config it is applied to — but not on the config's name,
+    which embeds the :class:`ParamSet` id. Steps that start from a single
+    config and declare no campaign-level transient files are cached under that
+    key. Files the output references inside the batch's output directory are
+    copied into a cache directory and restored into later batches' output
+    directories on a hit; the output's config names are rewritten to the new
+    block's name. Like the ``.vast``-level generation cache, this relies on a
+    variation being a deterministic function of its parameters (seeded via its
+    parameters, not via the config name); steps of variations with an unset
+    ``seed`` parameter draw fresh values every time and are never cached.
+    """
+
+    _OUTPUT_DIR = "\0output_dir"
+
+    def __init__(self):
+        self._entries: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._dir = tempfile.mkdtemp(prefix="robovast_compose_cache_")
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self._dir, True)
+        self.hits = 0
+
+    def close(self) -> None:
+        self._finalizer()
+
+    @staticmethod
+    def _key(variation_class, variation_parameters, source: dict) -> str:
+        inputs = {k: v for k, v in source.items() if k not in ("name", "_variations")}
+        payload = json.dumps(
+            [variation_class.__module__, variation_class.__qualname__,
+             variation_parameters, inputs],
+            sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def _unseeded(variation_class, variation_parameters) -> bool:
+        fields = getattr(variation_class.CONFIG_CLASS, "model_fields", {})
+        return "seed" in fields and (variation_parameters or {}).get("seed") is None
+
+    def run(self, variation_class, variation_parameters, current_configs, output_dir, execute):
+        """``step_runner`` for :func:`generate_configs` (see there)."""
+        if len(current_configs) != 1 or self._unseeded(variation_class, variation_parameters):
+            return execute()
+        source = current_configs[0]
+        output_dir = os.path.abspath(output_dir)
+        key = self._key(variation_class, variation_parameters, source)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            out = execute()
+            result, input_files, campaign_transient, _ = out
+            if result and not campaign_transient:
+                self._store(key, source["name"], result, input_files, output_dir)
+            return out
+        source_name, result, input_files = entry
+        with self._lock:
+            self.hits += 1
+        files: set[str] = set()
+        result = _rebase_paths(result, self._OUTPUT_DIR, output_dir, files)
+        for rel in files:
+            self._restore(os.path.join(self._dir, key, rel), os.path.join(output_dir, rel))
+        for cfg in result:
+            if cfg.get("name", "").startswith(source_name):
+                cfg["name"] = source["name"] + cfg["name"][len(source_name):]
+            cfg["_variations"] = copy.deepcopy(source.get("_variations", []))
+            if not cfg["_variations"]:
+                del cfg["_variations"]
+        return result, list(input_files), [], []
+
+    def _store(self, key, source_name, result, input_files, output_dir) -> None:
+        files: set[str] = set()
+        stored = _rebase_paths(result, output_dir, self._OUTPUT_DIR, files)
+        try:
+            for rel in files:
+                self._restore(os.path.join(output_dir, rel), os.path.join(self._dir, key, rel))
+        except OSError as e:
+            logger.debug("Not caching variation step %s: %s", key[:12], e)
+            return
+        with self._lock:
+            self._entries[key] = (source_name, stored, list(input_files))
+
+    @staticmethod
+    def _restore(src: str, dst: str) -> None:
+        if os.path.exists(dst):
+            return
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        if os.path.isdir(src):
+            shutil.copytree(src, dst, dirs_exist_ok=True)
+        else:
+            shutil.copy2(src, dst)
+
+
 class Compose:
-    """Turns parameter sets into ``campaign_data`` using a base ``.vast``."""
+    """Turns parameter sets into ``campaign_data`` using a base ``.vast``.
 
-    def __init__(self, vast_file: str):
+    Args:
+        vast_file: The ``.vast`` holding the ``search:`` block.
+        max_workers: Configuration blocks generated concurrently per batch
+            (default: CPU count, at most 8).
+    """
+
+    def __init__(self, vast_file: str, max_workers: int | None = None):
         self.vast_file = os.path.abspath(vast_file)
         self.vast_dir = os.path.dirname(self.vast_file)
         self.base = load_config(self.vast_file)
@@ -116,6 +243,16 @@ class Compose:
         search = self.base.get("search") or {}
         self.variations_template = search.get("variations")
         self.fixed_parameters = search.get("parameters")
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        # Drop the closed-loop block so each composed batch is a plain batch of
+        # the composed configs; everything else is resolved once here.
+        self._params = {k: v for k, v in self.base.items() if k != "search"}
+        self._context = GenerationContext(self.vast_file, self._params)
+        self._step_cache = _VariationStepCache()
+
+    def close(self) -> None:
+        """Remove the cached variation artifacts (also done at garbage collection)."""
+        self._step_cache.close()
 
     def compose(self, param_sets: list[ParamSet], output_dir: str) -> tuple[dict, dict]:
         """Generate configs for ``param_sets``.
@@ -143,40 +280,18 @@ class Compose:
             blocks.append(block)
             id_by_block[block_name] = ps.id
 
-        params = copy.deepcopy(self.base)
-        params["configuration"] = blocks
-        # Drop any closed-loop block so the generated temp campaign is a plain
-        # batch of the composed configs.
-        params.pop("search", None)
-
-        # Write the temp .vast in the original dir so relative paths
-        # (scenario_file, run_files, …) resolve identically.
-        fd, temp_vast = tempfile.mkstemp(
-            prefix=".robovast_search_", suffix=".vast", dir=self.vast_dir
-        )
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                yaml.safe_dump(params, f, sort_keys=False)
-            campaign_data, _ = generate_scenario_variations(
-                variation_file=temp_vast,
-                output_dir=output_dir,
-                use_cache=False,
-            )
-            # Repoint "vast" at the persistent original (same dir, so relative
-            # scenario_file/run_files still resolve) so downstream consumers that
-            # read or copy the file (e.g. prepare_campaign_configs) don't depend
-            # on the temp file we are about to delete.
-            campaign_data["vast"] = self.vast_file
-        finally:
-            try:
-                os.remove(temp_vast)
-            except OSError:
-                pass
+        # The same schema check a .vast gets on load, now for the composed blocks.
+        validate_config({**self._params, "configuration": blocks})
+        hits = self._step_cache.hits
+        campaign_data, _ = generate_configs(
+            self._context, blocks, output_dir, max_workers=self.max_workers,
+            step_runner=self._step_cache.run)
 
         name_by_id = self._resolve_names(campaign_data, id_by_block)
 
-        logger.debug("Composed %d param set(s) into %d config(s)",
-                     len(param_sets), len(campaign_data.get("configs", [])))
+        logger.debug("Composed %d param set(s) into %d config(s) (%d cached variation step(s))",
+                     len(param_sets), len(campaign_data.get("configs", [])),
+                     self._step_cache.hits - hits)
         return campaign_data, name_by_id
 
     @staticmethod
@@ -20,15 +20,26 @@ Strategy-independent. Instantiates the one configured :class:`Extractor` (built-
 or a local file, parameterized from the ``.vast``), runs it per config, and wraps
 its objectives + measures into an :class:`Evaluation`. The framework counts
 ``n_samples`` so it always matches what the extractor aggregated over.
+
+A batch is scored with :meth:`Evaluator.evaluate_many`, which runs the extractor
+for its configs in a thread pool (``extract.workers``); the extractor's
+:class:`~robovast.search.extractor.RunResultCache` is shared across them. Time
+spent in the extractor is accumulated per hook (:meth:`Evaluator.timings`).
 """
 
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 from robovast.common.config import SearchConfig
 
-from .extractor import Extractor, completed_run_dirs
+from .extractor import Extractor, RunResultCache, completed_run_dirs
 from .plugins import EXTRACTOR_GROUP, load_ref
+from .racing import confidence_interval
 from .types import Evaluation, ParamSet
 
 logger = logging.getLogger(__name__)
@@ -40,10 +51,62 @@ class Evaluator:
     def __init__(self, cfg: SearchConfig, vast_dir: str = ""):
         extractor_cls = load_ref(cfg.extract.plugin, EXTRACTOR_GROUP, vast_dir)
         self.extractor: Extractor = extractor_cls(**cfg.extract.params)
+        if not hasattr(self.extractor, "run_cache"):
+            # Subclass __init__ that does not call Extractor.__init__.
+            self.extractor.run_cache = RunResultCache()
         self.objective_names = [o.name for o in cfg.objectives]
+        self.workers = cfg.extract.workers or min(8, os.cpu_count() or 1)
+        self._timings: dict[str, list] = {}
+        self._timings_lock = threading.Lock()
+
+    def _timed(self, hook: str, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._timings_lock:
+                entry = self._timings.setdefault(hook, [0, 0.0, 0.0])
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[2] = max(entry[2], elapsed)
+
+    def timings(self) -> dict:
+        """Time spent in the extractor so far, per hook, plus run-cache stats.
+
+        ``{"extractor": <class>, "extract": {"calls", "total_s", "max_s"},
+        "run_objectives": {...}, "run_cache": {"hits", "misses"}}``; hooks never
+        called are omitted.
+        """
+        with self._timings_lock:
+            out = {"extractor": type(self.extractor).__name__}
+            for hook, (calls, total, peak) in self._timings.items():
+                out[hook] = {"calls": calls, "total_s": total, "max_s": peak}
+        cache = self.extractor.run_cache
+        out["run_cache"] = {"hits": cache.hits, "misses": cache.misses}
+        return out
+
+    def evaluate_many(self, items: list[tuple[Path, ParamSet]]) -> list[Evaluation]:
+        """Score several configs, concurrently up to ``workers``; results in order.
+
+        The first extractor error is raised once all submitted configs finished.
+        """
+        workers = min(self.workers, len(items))
+        if workers <= 1:
+            return [self.evaluate(config_dir, params) for config_dir, params in items]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="robovast-evaluate") as pool:
+            futures = [pool.submit(self.evaluate, config_dir, params)
+                       for config_dir, params in items]
+            evaluations = [f.result() for f in futures]
+        logger.debug("Scored %d config(s) with %d worker(s) in %.2fs",
+                     len(items), workers, time.perf_counter() - start)
+        return evaluations
 
     def evaluate(self, config_dir: Path, params: ParamSet) -> Evaluation:
-        result = self.extractor.extract(config_dir)
+        start = time.perf_counter()
+        result = self._timed("extract", self.extractor.extract, config_dir)
         missing = [n for n in self.objective_names if n not in result.objectives]
         if missing:
             raise ValueError(
@@ -54,4 +117,21 @@ class Evaluator:
                      params.id, result.objectives, result.measures, n_samples)
         return Evaluation(params=params, objectives=result.objectives,
                           measures=result.measures, n_samples=n_samples,
-                          raw={"config_dir": str(config_dir)})
+                          raw={"config_dir": str(config_dir),
+                               "extract_s": time.perf_counter() - start})
+
+    def interval(self, config_dir: Path, confidence: float) -> Optional[tuple[float, float]]:
+        """Confidence interval of the first objective over the config's runs.
+
+        Built from the extractor's per-run values
+        (:meth:`~robovast.search.extractor.Extractor.run_objectives`); ``None``
+        when the extractor does not provide them.
+        """
+        name = self.objective_names[0]
+        samples = []
+        for run_dir in completed_run_dirs(config_dir):
+            values = self._timed("run_objectives", self.extractor.run_objectives, run_dir)
+            if values is None or name not in values:
+                return None
+            samples.append(float(values[name]))
+        return confidence_interval(samples, confidence)
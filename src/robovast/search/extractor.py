@@ -22,11 +22,18 @@ returns exactly what the search needs: the **objectives** (optimized) and the
 It is the one place SUT-specific evaluation lives — and is parameterized from the
 ``.vast`` (``extract.params``) and loadable from a local file. ``objectives`` and
 ``measures`` are named dicts so single- and multi-objective use the same shape.
+Per-run file reads go through the extractor's :class:`RunResultCache`, which the
+evaluator shares across all configs it scores (concurrently, see
+:meth:`~robovast.search.evaluator.Evaluator.evaluate_many`).
 """
 
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Callable, Optional
 
 
 def run_dirs(config_dir: Path) -> list[Path]:
@@ -48,6 +55,49 @@ def completed_run_dirs(config_dir: Path) -> list[Path]:
     return [d for d in run_dirs(config_dir) if (d / "test.xml").exists()]
 
 
+class RunResultCache:
+    """Thread-safe memo of parsed per-run files, keyed on path and ``stat``.
+
+    ``load(path, loader)`` returns ``loader(path)``, parsing each file once
+    until its mtime or size changes — so re-scoring a config after a racing
+    top-up, or asking for per-run objectives after :meth:`Extractor.extract`,
+    only parses the new runs. Entries are keyed per loader (pass a module-level
+    function, not a fresh lambda), so one file can be read in two shapes.
+    Least recently used entries beyond ``max_entries`` are dropped. A missing
+    file is passed to the loader uncached.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, path: Path, loader: Callable[[Path], Any]) -> Any:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return loader(path)
+        key = (str(path), loader)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        # Parse outside the lock; two threads racing on one file both parse it.
+        value = loader(path)
+        with self._lock:
+            self._entries[key] = (stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+
 @dataclass
 class ExtractResult:
     """What an :class:`Extractor` returns for one parameter set.
@@ -66,11 +116,25 @@ class Extractor(ABC):
     Constructed with the ``extract.params`` from the ``.vast`` (so thresholds /
     column names / aggregation can be swept without editing code). Aggregation
     over the config's runs is the extractor's responsibility.
+
+    Configs may be scored concurrently from a thread pool, so :meth:`extract`
+    must not keep per-call state on ``self``; read per-run files through
+    ``self.run_cache`` to share the parsing work.
     """
 
     def __init__(self, **params):
         self.params = params
+        self.run_cache = RunResultCache()
 
     @abstractmethod
     def extract(self, config_dir: Path) -> ExtractResult:
         ...
+
+    def run_objectives(self, run_dir: Path) -> Optional[dict[str, float]]:
+        """Objective values of a single run, or ``None`` if not available.
+
+        Optional hook for ``search.racing``: implement it when :meth:`extract`'s
+        objectives are the mean of per-run values, so the framework can put a
+        confidence interval on them and allocate repetitions adaptively.
+        """
+        return None
@@ -25,18 +25,30 @@ which every scenario produces. No measures (use a custom extractor for QD).
 import logging
 from pathlib import Path
 
-from robovast.common.campaign_data import read_test_result
+from robovast.common.run_summary import read_run_summary
 
 from ..extractor import Extractor, ExtractResult, completed_run_dirs
 
 logger = logging.getLogger(__name__)
 
 
+def _run_summary(xml_path: Path):
+    """``run_cache`` loader: the run's summary from the campaign summary cache."""
+    return read_run_summary(xml_path.parent)
+
+
 class FailureRate(Extractor):
+    def _succeeded(self, run_dir: Path) -> bool:
+        summary = self.run_cache.load(run_dir / "test.xml", _run_summary)
+        return summary is not None and summary["success"]
+
     def extract(self, config_dir: Path) -> ExtractResult:
         completed = completed_run_dirs(config_dir)
         if not completed:
             logger.warning("No completed runs with results in %s; failure_rate=0.0", config_dir)
             return ExtractResult(objectives={"failure_rate": 0.0})
-        failures = sum(1 for run_dir in completed if not read_test_result(run_dir)["success"])
+        failures = sum(1 for run_dir in completed if not self._succeeded(run_dir))
         return ExtractResult(objectives={"failure_rate": failures / len(completed)})
+
+    def run_objectives(self, run_dir: Path) -> dict[str, float]:
+        return {"failure_rate": 0.0 if self._succeeded(run_dir) else 1.0}
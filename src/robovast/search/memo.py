@@ -0,0 +1,172 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Memoization of evaluations for parameter sets proposed more than once.
+
+:attr:`ParamSet.id` is a content hash of the sampled values, so a strategy that
+re-proposes an assignment (discrete dimensions, Optuna re-suggesting the same
+categorical combination, a new search over the same ``.vast``) produces the same
+id. An :class:`EvaluationMemo` remembers, per id, the evaluation with the most
+repetitions seen so far, keyed additionally by :func:`vast_content_hash` — the
+``.vast`` and the files it pulls in (scenario, run files, files referenced by
+variations, local extractor/strategy/postprocessing plugins) — so editing any
+of them never reuses stale results.
+
+The memo is backed by :class:`~robovast.common.store.CampaignStore`: every
+recorded unit carries its requested ``n_reps`` and every campaign its
+``vast_hash``, so with scope ``all`` the memo is seeded from the stores of the
+sibling campaigns in the same results directory. Within the running campaign
+it is fed live by the controller; only its own configs are topped up with more
+repetitions, an earlier campaign's results are reused as they are.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from robovast.common.config_generation import collect_filtered_files
+from robovast.common.config_identifier import (collect_paths_from_config,
+                                               hash_run_files)
+from robovast.common.plugin_ref import is_file_ref
+from robovast.common.store import STORE_FILENAME, CampaignStore
+
+logger = logging.getLogger(__name__)
+
+
+def _input_files(campaign_config, vast_dir: str) -> list[str]:
+    """``.vast``-relative paths of the files a search campaign reads."""
+    execution = campaign_config.execution
+    paths = set(collect_filtered_files(execution.run_files or [], vast_dir))
+    if execution.scenario_file:
+        paths.add(execution.scenario_file)
+    blocks = [c.model_dump() for c in campaign_config.configuration or []]
+    search_cfg = campaign_config.search
+    if search_cfg is not None:
+        blocks += [search_cfg.variations or [], search_cfg.parameters or []]
+        refs = [search_cfg.strategy, search_cfg.extract.plugin]
+        for command in search_cfg.postprocessing or []:
+            refs.extend(command if isinstance(command, dict) else [command])
+        paths.update(ref.partition(":")[0] for ref in refs
+                     if isinstance(ref, str) and is_file_ref(ref))
+    for rel_path in collect_paths_from_config(blocks, vast_dir):
+        full_path = os.path.join(vast_dir, rel_path)
+        if os.path.isdir(full_path):
+            paths.update(os.path.relpath(os.path.join(root, name), vast_dir)
+                         for root, _, files in os.walk(full_path) for name in files)
+        else:
+            paths.add(rel_path)
+    return sorted(paths)
+
+
+def vast_content_hash(vast_file: str, campaign_config=None) -> str:
+    """Content hash of a search's inputs (the memo's campaign-level key).
+
+    Covers the ``.vast`` file's bytes and, given its parsed *campaign_config*,
+    the scenario file, the files matched by ``execution.run_files``, the files
+    referenced by the configuration and search variation blocks, and local
+    ``<path>.py:<Class>`` plugins of the strategy, extractor and
+    postprocessing.
+    """
+    hasher = hashlib.sha256()
+    with open(vast_file, "rb") as f:
+        hasher.update(f.read())
+    if campaign_config is not None:
+        vast_dir = os.path.dirname(os.path.abspath(vast_file))
+        hasher.update(hash_run_files(vast_dir, _input_files(campaign_config, vast_dir)).encode())
+    return hasher.hexdigest()
+
+
+@dataclass
+class MemoEntry:
+    """A previously scored parameter set.
+
+    Attributes:
+        n_reps: Repetitions requested when it was evaluated.
+        n_samples: Completed runs the values were aggregated over.
+        objectives: Named objective values.
+        measures: Named quality-diversity measures.
+        result_dir: Absolute path of its config result directory.
+    """
+    n_reps: int
+    n_samples: int
+    objectives: dict[str, float]
+    measures: dict[str, float] = field(default_factory=dict)
+    result_dir: Path = Path()
+
+
+class EvaluationMemo:
+    """Per-``ParamSet.id`` record of the best-replicated evaluation.
+
+    Args:
+        vast_hash: Content hash of the ``.vast`` driving the search.
+        campaign_root: Root directory of the running campaign.
+        scope: ``campaign`` remembers only this campaign's evaluations;
+            ``all`` also loads earlier campaigns under the same results
+            directory (the parent of *campaign_root*).
+    """
+
+    def __init__(self, vast_hash: str, campaign_root: str, scope: str = "all"):
+        self.vast_hash = vast_hash
+        self.campaign_root = Path(campaign_root)
+        self._entries: dict[str, MemoEntry] = {}
+        if scope == "all":
+            self._load_previous_campaigns()
+
+    def _load_previous_campaigns(self) -> None:
+        loaded = 0
+        for db in sorted(self.campaign_root.parent.glob(f"*/{STORE_FILENAME}")):
+            if db.parent == self.campaign_root:
+                continue
+            try:
+                with CampaignStore(db, read_only=True) as store:
+                    rows = store.evaluated_units(self.vast_hash)
+            except sqlite3.Error as e:
+                # Older stores lack the memo columns; they are simply skipped.
+                logger.debug("Skipping %s for evaluation reuse: %s", db, e)
+                continue
+            for row in rows:
+                entry = MemoEntry(
+                    n_reps=row["n_reps"], n_samples=row["n_samples"] or 0,
+                    objectives=json.loads(row["objectives_json"] or "{}"),
+                    measures=json.loads(row["measures_json"] or "{}"),
+                    result_dir=db.parent / row["result_dir"])
+                if entry.result_dir.is_dir() and self._offer(row["paramset_id"], entry):
+                    loaded += 1
+        if loaded:
+            logger.info("Reusing %d evaluation(s) from earlier campaigns of this .vast", loaded)
+
+    def _offer(self, paramset_id: str, entry: MemoEntry) -> bool:
+        current = self._entries.get(paramset_id)
+        if current is not None and current.n_reps >= entry.n_reps:
+            return False
+        self._entries[paramset_id] = entry
+        return True
+
+    def lookup(self, paramset_id: str) -> Optional[MemoEntry]:
+        """The best-replicated evaluation of *paramset_id*, or ``None``."""
+        return self._entries.get(paramset_id)
+
+    def add(self, paramset_id: str, n_reps: int, n_samples: int, objectives: dict,
+            measures: dict, result_dir: Path) -> None:
+        """Remember an evaluation (kept only if it has the most repetitions)."""
+        self._offer(paramset_id, MemoEntry(
+            n_reps=n_reps, n_samples=n_samples, objectives=dict(objectives),
+            measures=dict(measures), result_dir=Path(result_dir)))
@@ -0,0 +1,102 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Adaptive replicate allocation ("racing") for noisy objectives.
+
+Instead of running every parameter set ``execution.runs`` times up front, the
+controller starts each one with a few repetitions and asks :class:`Racing`
+whether more are worthwhile: only while the objective's confidence interval
+still contains the incumbent (best value so far) or the configured threshold
+can more samples change a decision. Clearly-good and clearly-bad candidates
+stop early, which is where the simulation hours are saved.
+
+Intervals come from per-run objective values
+(:meth:`~robovast.search.extractor.Extractor.run_objectives`): a Wilson score
+interval when every value is 0/1 (e.g. ``failure_rate``), a Student-t interval
+on the mean otherwise.
+"""
+
+import math
+import statistics
+from statistics import NormalDist
+from typing import Optional, Sequence
+
+from robovast.common.config import RacingConfig
+
+
+def confidence_interval(samples: Sequence[float], confidence: float) -> tuple[float, float]:
+    """Two-sided *confidence* interval for the mean of *samples*.
+
+    Binary samples use the Wilson score interval (well-behaved for few runs and
+    for all-pass / all-fail outcomes); other samples a Student-t interval.
+    Fewer than two non-binary samples give an unbounded interval.
+    """
+    n = len(samples)
+    if n == 0:
+        return -math.inf, math.inf
+    mean = statistics.fmean(samples)
+    if all(v in (0.0, 1.0) for v in samples):
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        denom = 1 + z * z / n
+        center = (mean + z * z / (2 * n)) / denom
+        half = z * math.sqrt(mean * (1 - mean) / n + z * z / (4 * n * n)) / denom
+        return max(0.0, center - half), min(1.0, center + half)
+    if n < 2:
+        return -math.inf, math.inf
+    from scipy.stats import t  # pylint: disable=import-outside-toplevel
+    half = t.ppf(0.5 + confidence / 2, n - 1) * statistics.stdev(samples) / math.sqrt(n)
+    return mean - half, mean + half
+
+
+class Racing:
+    """Replicate-allocation policy built from ``search.racing``.
+
+    Args:
+        cfg: The validated racing block.
+        default_max: Repetition cap when ``cfg.max_reps`` is unset
+            (``execution.runs``).
+    """
+
+    def __init__(self, cfg: RacingConfig, default_max: int):
+        self.confidence = cfg.confidence
+        self.threshold = cfg.threshold
+        self.step = cfg.step
+        self.max_reps = cfg.max_reps or default_max
+        self.initial_reps = min(cfg.initial_reps, self.max_reps)
+
+    def decide(self, interval: Optional[tuple[float, float]], n_reps: int,
+               incumbent: Optional[float]) -> tuple[bool, str]:
+        """Whether a candidate with *interval* after *n_reps* needs more runs.
+
+        Returns ``(more, reason)``; *reason* is logged with the unit.
+        """
+        if n_reps >= self.max_reps:
+            return False, "max_reps reached"
+        if interval is None:
+            return True, "no per-run objective values"
+        lo, hi = interval
+        if incumbent is not None and lo <= incumbent <= hi:
+            return True, "interval overlaps incumbent"
+        if self.threshold is not None and lo <= self.threshold <= hi:
+            return True, "interval overlaps threshold"
+        return False, "decided"
+
+    def next_reps(self, n_reps: int, interval: Optional[tuple[float, float]]) -> int:
+        """Repetition count for the next round (straight to the cap when the
+        extractor cannot provide per-run values)."""
+        if interval is None:
+            return self.max_reps
+        return min(n_reps + self.step, self.max_reps)
@@ -93,6 +93,12 @@ class StopConditions:
     def has_budget(self) -> bool:
         return bool(self.budget)
 
+    @property
+    def max_batches(self) -> Optional[int]:
+        """The tightest ``batches`` budget, or ``None`` when uncapped."""
+        caps = [c.value for c in self.budget if c.type == 'batches']
+        return min(caps) if caps else None
+
     def _improved_by(self, recent: float, past: float, min_delta: float) -> bool:
         """Whether ``recent`` strictly beats ``past`` by more than min_delta
         (direction-aware); strict so min_delta=0 treats an equal value as no gain."""
@@ -24,7 +24,9 @@ Multi-objective (NSGA-II) is a future addition (the objectives list already
 supports it).
 """
 
+import json
 import logging
+import math
 from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -36,6 +38,8 @@ from ..types import Evaluation, ParamSet, SearchReport
 
 logger = logging.getLogger(__name__)
 
+_STATE_VERSION = 1
+
 
 class OptunaParams(BaseModel):
     """``strategy_parameters`` schema for the Optuna strategy."""
@@ -59,8 +63,28 @@ def _suggest(trial, path, dim):
     raise TypeError(f"Unsupported search dimension type: {type(dim).__name__}")
 
 
+def _distribution(dim):
+    """The Optuna distribution :func:`_suggest` samples *dim* from."""
+    from optuna.distributions import (CategoricalDistribution,
+                                      FloatDistribution, IntDistribution)
+    if isinstance(dim, BoolDim):
+        return CategoricalDistribution([False, True])
+    if isinstance(dim, ChoiceDim):
+        return CategoricalDistribution(dim.values)
+    if isinstance(dim, FloatDim):
+        return FloatDistribution(dim.low, dim.high, log=dim.log)
+    if isinstance(dim, IntDim):
+        if dim.log:
+            return IntDistribution(dim.low, dim.high, log=True)
+        return IntDistribution(dim.low, dim.high, step=dim.step or 1)
+    raise TypeError(f"Unsupported search dimension type: {type(dim).__name__}")
+
+
 class OptunaStrategy(SearchStrategy):
     PARAMS_MODEL = OptunaParams
+    # Trials are told individually; pending ones stay open in the study (TPE's
+    # constant_liar accounts for them), so asks may overlap outstanding trials.
+    INCREMENTAL_TELL = True
 
     def __init__(self, cfg, params: OptunaParams):
         super().__init__(cfg, params)
@@ -87,30 +111,34 @@ class OptunaStrategy(SearchStrategy):
         self._study = optuna.create_study(direction=spec.direction, sampler=sampler)
         self._objective_name = spec.name
         self._batches_done = 0
-        self._trials: dict[str, object] = {}     # ParamSet.id -> Trial (current batch)
+        self._trials: dict[str, list] = {}       # ParamSet.id -> pending Trials
         self._history: list[Evaluation] = []
 
     def ask(self, n: int) -> list[ParamSet]:
-        self._trials = {}
         proposals = []
         for _ in range(n):
             trial = self._study.ask()
             values = {path: _suggest(trial, path, dim)
                       for path, dim in self.search_space.items()}
             ps = ParamSet(values=values)
-            self._trials[ps.id] = trial
+            self._trials.setdefault(ps.id, []).append(trial)
             proposals.append(ps)
         logger.debug("Optuna proposed %d trial(s)", len(proposals))
         return proposals
 
     def tell(self, evaluations: list[Evaluation]) -> None:
         for ev in evaluations:
-            trial = self._trials.get(ev.params.id)
-            if trial is None:
+            pending = self._trials.get(ev.params.id)
+            if not pending:
                 continue
+            trial = pending.pop(0)
+            if not pending:
+                del self._trials[ev.params.id]
             self._study.tell(trial, float(ev.objectives[self._objective_name]))
         self._history.extend(evaluations)
-        self._batches_done += 1
+        # Asynchronous scheduling tells evaluations as they finish, so count
+        # batches of per_batch evaluations rather than calls.
+        self._batches_done = math.ceil(len(self._history) / self.cfg.per_batch)
 
     def report(self) -> SearchReport:
         ranked = sorted(self._history, key=self.objective_value, reverse=True)
@@ -120,3 +148,31 @@ class OptunaStrategy(SearchStrategy):
             bt = self._study.best_trials[0]
             extra["optuna_best"] = {"value": bt.value, "params": bt.params}
         return SearchReport(evaluations=list(self._history), best=best, extra=extra)
+
+    # -- persistence --------------------------------------------------------
+
+    def get_state(self) -> bytes:
+        return json.dumps({
+            "version": _STATE_VERSION,
+            "history": [ev.to_dict() for ev in self._history],
+        }, default=float).encode("utf-8")
+
+    def set_state(self, state: bytes) -> None:
+        """Replay the saved evaluations into the study as completed trials.
+
+        Trials that were still pending when the state was saved are dropped;
+        the sampler's own random state starts over from ``seed``.
+        """
+        from optuna.trial import create_trial
+        data = json.loads(state)
+        if data.get("version") != _STATE_VERSION:
+            raise ValueError(f"Unsupported optuna strategy state version: "
+                             f"{data.get('version')}")
+        distributions = {path: _distribution(dim) for path, dim in self.search_space.items()}
+        self._history = [Evaluation.from_dict(h) for h in data["history"]]
+        for ev in self._history:
+            self._study.add_trial(create_trial(
+                params=ev.params.values, distributions=distributions,
+                value=float(ev.objectives[self._objective_name])))
+        self._trials = {}
+        self._batches_done = math.ceil(len(self._history) / self.cfg.per_batch)
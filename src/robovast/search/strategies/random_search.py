@@ -22,6 +22,7 @@ failures are captured. A legitimate failure-finding baseline that exercises the
 full ask/tell/report loop. Single-objective; no ``strategy_parameters``.
 """
 
+import json
 import logging
 import math
 import random
@@ -35,6 +36,8 @@ from ..types import Evaluation, ParamSet, SearchReport
 
 logger = logging.getLogger(__name__)
 
+_STATE_VERSION = 1
+
 
 def _sample_dim(dim: SearchDim, rng: random.Random) -> Any:
     if isinstance(dim, BoolDim):
@@ -61,6 +64,7 @@ class RandomSearch(SearchStrategy):
     """Memoryless uniform sampler over the declared search space."""
 
     PARAMS_MODEL = None
+    INCREMENTAL_TELL = True
 
     def __init__(self, cfg, params):
         super().__init__(cfg, params)
@@ -79,7 +83,9 @@ class RandomSearch(SearchStrategy):
 
     def tell(self, evaluations: list[Evaluation]) -> None:
         self._history.extend(evaluations)
-        self._batches_done += 1
+        # Asynchronous scheduling tells evaluations as they finish, so count
+        # batches of per_batch evaluations rather than calls.
+        self._batches_done = math.ceil(len(self._history) / self.cfg.per_batch)
 
     def report(self) -> SearchReport:
         ranked = sorted(self._history, key=self.objective_value, reverse=True)
@@ -88,3 +94,23 @@ class RandomSearch(SearchStrategy):
             best=ranked[0] if ranked else None,
             extra={"batches": self._batches_done},
         )
+
+    # -- persistence --------------------------------------------------------
+
+    def get_state(self) -> bytes:
+        return json.dumps({
+            "version": _STATE_VERSION,
+            "batches": self._batches_done,
+            "rng": self._rng.getstate(),
+            "history": [ev.to_dict() for ev in self._history],
+        }, default=float).encode("utf-8")
+
+    def set_state(self, state: bytes) -> None:
+        data = json.loads(state)
+        if data.get("version") != _STATE_VERSION:
+            raise ValueError(f"Unsupported random strategy state version: "
+                             f"{data.get('version')}")
+        self._batches_done = data["batches"]
+        version, internal, gauss = data["rng"]
+        self._rng.setstate((version, tuple(internal), gauss))
+        self._history = [Evaluation.from_dict(h) for h in data["history"]]
@@ -0,0 +1,273 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Surrogate-assisted (Bayesian) optimization with a Gaussian-process model.
+
+Fits a GP (Matérn-5/2 kernel, numpy/scipy only, CPU) to every evaluation so far
+on the :class:`~robovast.search.space.SearchSpaceCodec` unit cube and proposes
+the next batch by optimizing an acquisition function over a few thousand
+candidates at once, so simulations go where the model is either promising or
+uncertain instead of into regions it can already predict:
+
+* ``ei`` — batch expected improvement by the *kriging believer* heuristic: pick
+  the EI maximizer, pretend its outcome equals the model's mean, refit and pick
+  again (a cheap, standard approximation of q-EI);
+* ``thompson`` — one joint posterior sample per proposal over a random candidate
+  subset, taking its maximizer.
+
+Until ``n_initial`` evaluations exist, proposals come from a Latin hypercube.
+Observation noise is scaled by ``1 / n_samples``, so averages over more
+repetitions are trusted more. Parameter sets still pending (asynchronous
+scheduling) are treated like believer points, which keeps overlapping asks
+apart. Single-objective; ``choice`` dimensions are modelled on their codec
+buckets.
+"""
+
+import json
+import logging
+import math
+from typing import Literal
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+from scipy.stats import norm, qmc
+
+from ..space import SearchSpaceCodec
+from ..strategy import SearchStrategy
+from ..types import Evaluation, ParamSet, SearchReport
+
+logger = logging.getLogger(__name__)
+
+_LENGTHSCALES = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6)
+_NOISES = (1e-4, 1e-2, 1e-1)
+_STATE_VERSION = 1
+
+
+class SurrogateParams(BaseModel):
+    """``strategy_parameters`` schema for the surrogate strategy."""
+    model_config = ConfigDict(extra='forbid')
+    acquisition: Literal['ei', 'thompson'] = 'ei'
+    n_initial: int = Field(default=8, ge=1)        # space-filling proposals before the model
+    candidates: int = Field(default=2048, ge=16)   # candidates scored per proposal
+    thompson_candidates: int = Field(default=512, ge=16)
+    max_history: int = Field(default=400, ge=8)    # GP fit on the best/most recent points
+    local_fraction: float = Field(default=0.5, ge=0.0, le=1.0)  # candidates near the best
+
+
+def _matern52(a: np.ndarray, b: np.ndarray, lengthscale: float) -> np.ndarray:
+    d = np.sqrt(np.maximum(
+        (a * a).sum(1)[:, None] + (b * b).sum(1)[None, :] - 2.0 * a @ b.T, 0.0)) / lengthscale
+    s5 = math.sqrt(5.0) * d
+    return (1.0 + s5 + 5.0 / 3.0 * d * d) * np.exp(-s5)
+
+
+class _GaussianProcess:
+    """Zero-mean GP on standardized targets with per-point noise weights."""
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, noise_weights: np.ndarray):
+        self.x = x
+        self.mean = float(y.mean())
+        self.scale = float(y.std()) or 1.0
+        self.z = (y - self.mean) / self.scale
+        self.noise_weights = noise_weights
+        self.lengthscale, self.noise = max(
+            ((ls, nz) for ls in _LENGTHSCALES for nz in _NOISES),
+            key=lambda h: self._log_likelihood(*h))
+        self._factor()
+
+    def _kernel(self, lengthscale, noise):
+        k = _matern52(self.x, self.x, lengthscale)
+        k[np.diag_indices_from(k)] += noise * self.noise_weights + 1e-8
+        return k
+
+    def _log_likelihood(self, lengthscale, noise) -> float:
+        try:
+            c, low = cho_factor(self._kernel(lengthscale, noise), lower=True)
+        except np.linalg.LinAlgError:
+            return -math.inf
+        alpha = cho_solve((c, low), self.z)
+        return float(-0.5 * self.z @ alpha - np.log(np.diag(c)).sum())
+
+    def _factor(self):
+        self._chol = cho_factor(self._kernel(self.lengthscale, self.noise), lower=True)
+        self._alpha = cho_solve(self._chol, self.z)
+
+    def add_believer(self, x: np.ndarray) -> None:
+        """Append *x* with the posterior mean as its outcome (kriging believer)."""
+        mu, _ = self.predict(x[None, :])
+        self.x = np.vstack([self.x, x])
+        self.z = np.append(self.z, (mu[0] - self.mean) / self.scale)
+        self.noise_weights = np.append(self.noise_weights, 1.0)
+        self._factor()
+
+    def predict(self, xs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Posterior mean and standard deviation at *xs*, in target units."""
+        k = _matern52(xs, self.x, self.lengthscale)
+        mu = k @ self._alpha
+        v = solve_triangular(self._chol[0], k.T, lower=True)
+        var = np.maximum(1.0 - (v * v).sum(0), 1e-12)
+        return self.mean + self.scale * mu, self.scale * np.sqrt(var)
+
+    def sample(self, xs: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """One joint posterior sample at *xs*."""
+        k = _matern52(xs, self.x, self.lengthscale)
+        v = solve_triangular(self._chol[0], k.T, lower=True)
+        cov = _matern52(xs, xs, self.lengthscale) - v.T @ v
+        cov[np.diag_indices_from(cov)] += 1e-6
+        mu = k @ self._alpha
+        try:
+            draw = mu + np.linalg.cholesky(cov) @ rng.standard_normal(len(xs))
+        except np.linalg.LinAlgError:
+            draw = mu + np.sqrt(np.clip(np.diag(cov), 0.0, None)) * rng.standard_normal(len(xs))
+        return self.mean + self.scale * draw
+
+
+class SurrogateStrategy(SearchStrategy):
+    """GP-based Bayesian optimization with batch acquisition (EI or Thompson)."""
+
+    PARAMS_MODEL = SurrogateParams
+    # Pending proposals enter the model as believer points, so asks may overlap.
+    INCREMENTAL_TELL = True
+
+    def __init__(self, cfg, params: SurrogateParams):
+        super().__init__(cfg, params)
+        self._objective_name = self.single_objective.name
+        self.codec = SearchSpaceCodec(cfg.search_space)
+        self._rng = np.random.default_rng(cfg.seed)
+        self._history: list[Evaluation] = []
+        self._pending: dict[str, np.ndarray] = {}
+        self._batches_done = 0
+        self._model_info: dict = {}
+
+    # -- ask ----------------------------------------------------------------
+
+    def ask(self, n: int) -> list[ParamSet]:
+        n_initial = max(0, self.params.n_initial - len(self._history) - len(self._pending))
+        vecs = list(self._space_filling(min(n, n_initial)))
+        if len(vecs) < n:
+            vecs.extend(self._acquire(n - len(vecs), vecs))
+        proposals = []
+        for vec in vecs:
+            ps = ParamSet(values=self.codec.decode(vec))
+            self._pending[ps.id] = self.codec.encode(ps.values)
+            proposals.append(ps)
+        logger.debug("Surrogate proposed %d parameter set(s) (%d space-filling)",
+                     len(proposals), min(n, n_initial))
+        return proposals
+
+    def _space_filling(self, n: int) -> np.ndarray:
+        if n <= 0:
+            return np.empty((0, self.codec.dim))
+        sampler = qmc.LatinHypercube(d=self.codec.dim, seed=self._rng)
+        return sampler.random(n)
+
+    def _training_data(self):
+        history = self._history
+        if len(history) > self.params.max_history:
+            # Keep the best half and the most recent rest: the incumbent region
+            # matters most for the acquisition, recent points for coverage.
+            keep = self.params.max_history // 2
+            best = sorted(range(len(history)), key=lambda i: self.objective_value(history[i]),
+                          reverse=True)[:keep]
+            recent = range(len(history) - (self.params.max_history - keep), len(history))
+            history = [history[i] for i in sorted(set(best) | set(recent))]
+        x = np.array([self.codec.encode(ev.params.values) for ev in history])
+        y = np.array([self.objective_value(ev) for ev in history])
+        weights = np.array([1.0 / max(ev.n_samples, 1) for ev in history])
+        return x, y, weights
+
+    def _candidates(self, size: int, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        n_local = int(size * self.params.local_fraction) if len(x) else 0
+        uniform = self._rng.random((size - n_local, self.codec.dim))
+        if not n_local:
+            return uniform
+        top = x[np.argsort(-y)[:5]]
+        centers = top[self._rng.integers(0, len(top), n_local)]
+        local = np.clip(centers + 0.1 * self._rng.standard_normal(centers.shape), 0.0, 1.0)
+        return np.vstack([uniform, local])
+
+    def _acquire(self, n: int, planned: list) -> list[np.ndarray]:
+        x, y, weights = self._training_data()
+        if len(x) < 2:
+            return list(self._space_filling(n))
+        gp = _GaussianProcess(x, y, weights)
+        self._model_info = {"lengthscale": gp.lengthscale, "noise": gp.noise,
+                            "n_train": len(x)}
+        for vec in [*self._pending.values(), *planned]:
+            gp.add_believer(vec)
+        taken = {ev.params.id for ev in self._history} | set(self._pending)
+        out = []
+        for _ in range(n):
+            if self.params.acquisition == 'thompson':
+                cands = self._candidates(self.params.thompson_candidates, x, y)
+                scores = gp.sample(cands, self._rng)
+            else:
+                cands = self._candidates(self.params.candidates, x, y)
+                mu, sd = gp.predict(cands)
+                gamma = (mu - y.max()) / sd
+                scores = sd * (gamma * norm.cdf(gamma) + norm.pdf(gamma))
+            vec = None
+            for idx in np.argsort(-scores):
+                ps_id = ParamSet(values=self.codec.decode(cands[idx])).id
+                if ps_id not in taken:
+                    vec = cands[idx]
+                    taken.add(ps_id)
+                    break
+            if vec is None:
+                vec = self._rng.random(self.codec.dim)
+            out.append(vec)
+            if self.params.acquisition == 'ei':
+                gp.add_believer(vec)
+        return out
+
+    # -- tell / report ------------------------------------------------------
+
+    def tell(self, evaluations: list[Evaluation]) -> None:
+        for ev in evaluations:
+            self._pending.pop(ev.params.id, None)
+        self._history.extend(evaluations)
+        # Asynchronous scheduling tells evaluations as they finish, so count
+        # batches of per_batch evaluations rather than calls.
+        self._batches_done = math.ceil(len(self._history) / self.cfg.per_batch)
+
+    def report(self) -> SearchReport:
+        ranked = sorted(self._history, key=self.objective_value, reverse=True)
+        extra = {"batches": self._batches_done}
+        if self._model_info:
+            extra["model"] = dict(self._model_info)
+        return SearchReport(evaluations=list(self._history),
+                            best=ranked[0] if ranked else None, extra=extra)
+
+    # -- persistence --------------------------------------------------------
+
+    def get_state(self) -> bytes:
+        return json.dumps({
+            "version": _STATE_VERSION,
+            "batches": self._batches_done,
+            "rng": self._rng.bit_generator.state,
+            "history": [ev.to_dict() for ev in self._history],
+        }, default=float).encode("utf-8")
+
+    def set_state(self, state: bytes) -> None:
+        data = json.loads(state)
+        if data.get("version") != _STATE_VERSION:
+            raise ValueError(f"Unsupported surrogate strategy state version: "
+                             f"{data.get('version')}")
+        self._batches_done = data["batches"]
+        self._rng.bit_generator.state = data["rng"]
+        self._history = [Evaluation.from_dict(h) for h in data["history"]]
+        self._pending = {}
@@ -38,9 +38,16 @@ class SearchStrategy(ABC):
     Subclasses may set ``PARAMS_MODEL`` to a Pydantic model; ``build_strategy``
     validates ``search.strategy_parameters`` against it and passes the parsed
     object as ``params``.
+
+    Subclasses set ``INCREMENTAL_TELL`` when ``tell`` accepts any subset of the
+    outstanding proposals and ``ask`` may be called while earlier proposals are
+    still pending; the asynchronous scheduler then refills each freed slot
+    immediately. Otherwise it tells whole ``ask`` generations and asks again only
+    once the previous generation has been told.
     """
 
     PARAMS_MODEL: Optional[type] = None
+    INCREMENTAL_TELL: bool = False
 
     def __init__(self, cfg: SearchConfig, params: Any):
         self.cfg = cfg
@@ -70,12 +77,29 @@ class SearchStrategy(ABC):
 
     @abstractmethod
     def tell(self, evaluations: list[Evaluation]) -> None:
-        """Ingest the evaluations of a previously proposed generation."""
+        """Ingest the evaluations of a previously proposed generation (or, for
+        ``INCREMENTAL_TELL`` strategies, of any subset of pending proposals)."""
 
     @abstractmethod
     def report(self) -> SearchReport:
         """Return the current deliverable (ranked best, archive, Pareto front)."""
 
+    def get_state(self) -> Optional[bytes]:
+        """Serialized strategy state, persisted after every batch via
+        :meth:`~robovast.common.store.CampaignStore.save_strategy_state`.
+
+        ``None`` (the default) means the strategy keeps nothing worth saving.
+        """
+        return None
+
+    def set_state(self, state: bytes) -> None:
+        """Restore a state previously returned by :meth:`get_state`.
+
+        Called on a fresh strategy when a campaign is re-run under the same id
+        (see :meth:`~robovast.common.store.CampaignStore.latest_strategy_state`).
+        The default ignores the state, matching the default :meth:`get_state`.
+        """
+
 
 def build_strategy(cfg: SearchConfig, vast_dir: str = "") -> SearchStrategy:
     """Instantiate the strategy plugin named by ``cfg.strategy``.
@@ -79,6 +79,17 @@ class Evaluation:
     n_samples: int = 0
     raw: dict = field(default_factory=dict)
 
+    def to_dict(self) -> dict:
+        """JSON-able form for saved strategy state (without ``raw``)."""
+        return {"values": self.params.values, "objectives": self.objectives,
+                "measures": self.measures, "n_samples": self.n_samples}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Evaluation":
+        """Inverse of :meth:`to_dict`."""
+        return cls(params=ParamSet(values=data["values"]), objectives=data["objectives"],
+                   measures=data["measures"], n_samples=data["n_samples"])
+
 
 @dataclass
 class SearchReport:
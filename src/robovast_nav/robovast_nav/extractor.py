@@ -0,0 +1,73 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Search extractor over the precomputed per-run ``nav_metrics.csv``.
+
+Requires the ``nav_metrics`` postprocessing plugin in ``search.postprocessing``.
+Every numeric metric column is aggregated over the config's completed runs and
+returned as an objective of the same name, so the ``.vast`` objectives simply
+name the metric (e.g. ``max_cross_track_error_m``). Metrics without data in
+any run are left out rather than defaulted, so a config that produced no
+metrics fails scoring instead of looking like a perfect (zero) result.
+``params``:
+
+- ``agg``: ``mean`` (default), ``max``, ``min`` or ``median``.
+- ``measures``: metric columns to return as quality-diversity measures.
+- ``frame``: only use rows computed for this TF frame (default: any).
+"""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+
+from robovast.search.extractor import Extractor, ExtractResult, completed_run_dirs
+
+from .metrics import METRIC_COLUMNS, read_run_metrics
+
+logger = logging.getLogger(__name__)
+
+_AGGREGATIONS = {"mean": np.mean, "max": np.max, "min": np.min, "median": np.median}
+
+
+class NavMetricsExtractor(Extractor):
+    def __init__(self, **params):
+        super().__init__(**params)
+        agg = params.get("agg", "mean")
+        if agg not in _AGGREGATIONS:
+            raise ValueError(f"nav_metrics extractor: unknown agg '{agg}' (use {sorted(_AGGREGATIONS)})")
+        self._agg = _AGGREGATIONS[agg]
+        self._measures = list(params.get("measures") or [])
+        self._frame = params.get("frame")
+
+    def extract(self, config_dir: Path) -> ExtractResult:
+        rows = [r for r in (read_run_metrics(d, self._frame) for d in completed_run_dirs(config_dir))
+                if r is not None]
+        if not rows:
+            logger.warning("No nav_metrics.csv in completed runs of %s; was nav_metrics postprocessing run?",
+                           config_dir)
+        values = {}
+        for col in METRIC_COLUMNS:
+            if col == "frame":
+                continue
+            col_values = [float(r[col]) for r in rows if r.get(col) is not None]
+            if col_values:
+                values[col] = float(self._agg(col_values))
+        missing = [m for m in self._measures if m not in values]
+        if missing:
+            raise ValueError(f"nav_metrics extractor: no data for measure(s) {missing} in {config_dir}")
+        measures = {m: values[m] for m in self._measures}
+        return ExtractResult(objectives=values, measures=measures)
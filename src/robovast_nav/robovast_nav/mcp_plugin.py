@@ -33,7 +33,7 @@ from fastmcp import FastMCP
 from fastmcp.utilities.types import Image
 
 from robovast.common.campaign_data import (
-    read_resolved_configurations,
+    read_resolved_configuration,
     read_scenario_config,
 )
 from robovast.evaluation.mcp_server.plugin_common import _get_config_by_identifier_or_name
@@ -43,6 +43,13 @@ from robovast.evaluation.mcp_server.results_resolver import (
     resolve_run_path,
 )
 
+from robovast_nav.metrics import (
+    load_poses,
+    path_deviation,
+    precomputed_run_metrics,
+    trajectory_stats,
+)
+
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt  # noqa: E402  # pylint: disable=wrong-import-position,ungrouped-imports
 
@@ -94,22 +101,15 @@ def _read_poses_csv(path: Path, frame: str) -> list[dict]:
     return rows
 
 
-def _point_to_segment_distance(
-    px: float, py: float,
-    ax: float, ay: float,
-    bx: float, by: float,
-) -> float:
-    """Compute the distance from point (px,py) to line segment (ax,ay)-(bx,by)."""
-    dx = bx - ax
-    dy = by - ay
-    length_sq = dx * dx + dy * dy
-    if length_sq == 0:
-        return math.sqrt((px - ax) ** 2 + (py - ay) ** 2)
+def _precomputed_metrics(campaign: str, config: str, run: int, frame: str) -> dict | None:
+    """Return the precomputed ``nav_metrics`` row of a run, or ``None``."""
+    return precomputed_run_metrics(resolve_campaign_path(campaign), config, run, frame)
+
 
-    t = max(0, min(1, ((px - ax) * dx + (py - ay) * dy) / length_sq))
-    proj_x = ax + t * dx
-    proj_y = ay + t * dy
-    return math.sqrt((px - proj_x) ** 2 + (py - proj_y) ** 2)
+def _planned_path(campaign: str, config: str) -> list | None:
+    """Return the planned ``_path`` of *config* from ``configurations.yaml``."""
+    cfg = read_resolved_configuration(resolve_campaign_path(campaign), config)
+    return cfg.get("_path") if cfg else None
 
 
 # ---------------------------------------------------------------------------
@@ -144,22 +144,20 @@ def nav_get_planned_path(campaign: str, config: str) -> dict:
     """
     campaign_path = resolve_campaign_path(campaign)
     try:
-        configurations = read_resolved_configurations(campaign_path)
+        cfg = read_resolved_configuration(campaign_path, config)
     except FileNotFoundError:
         return {"error": "no planned path found."}
 
-    for cfg in configurations.get("configs", []):
-        if cfg.get("name") == config:
-            path = cfg.get("_path")
-            if path:
-                return {
-                    "num_waypoints": len(path),
-                    "path_length": cfg.get("_path_length"),
-                    "waypoints": path,
-                }
-            return {"error": "Data source is available, but no path found. May not be a navigation config."}
-
-    return {"error": f"Config '{config}' not found in configurations."}
+    if cfg is None:
+        return {"error": f"Config '{config}' not found in configurations."}
+    path = cfg.get("_path")
+    if path:
+        return {
+            "num_waypoints": len(path),
+            "path_length": cfg.get("_path_length"),
+            "waypoints": path,
+        }
+    return {"error": "Data source is available, but no path found. May not be a navigation config."}
 
 
 def nav_get_obstacles(campaign: str, config: str) -> list[dict]:
@@ -260,7 +258,8 @@ def nav_get_trajectory_stats(
     """Compute trajectory statistics for a run.
 
     Returns total distance, duration, average/max speed, start/end
-    pose, and bounding box.
+    pose, and bounding box. Uses the precomputed ``nav_metrics`` row
+    when the ``nav_metrics`` postprocessing plugin has run.
 
     Requires ``rosbags_tf_to_csv`` postprocessing.
 
@@ -270,64 +269,34 @@ def nav_get_trajectory_stats(
         run: Run number.
         frame: TF frame name (default ``base_link``).
     """
-    run_path = resolve_run_path(campaign, config, run)
-    csv_path = run_path / "poses.csv"
-    if not csv_path.exists():
-        return {
-            "error": (
-                "poses.csv not found. Run 'vast analysis postprocess' "
-                "with rosbags_tf_to_csv configured in the .vast file."
-            )
-        }
-
-    rows = _read_poses_csv(csv_path, frame)
-    if not rows:
-        return {"error": f"No data found for frame '{frame}' in poses.csv."}
-
-    xs = [float(r.get("position.x", 0)) for r in rows]
-    ys = [float(r.get("position.y", 0)) for r in rows]
-    ts = [float(r.get("timestamp", 0)) for r in rows]
-
-    total_dist = 0.0
-    speeds = []
-    for i in range(1, len(xs)):
-        dx = xs[i] - xs[i - 1]
-        dy = ys[i] - ys[i - 1]
-        dt = ts[i] - ts[i - 1]
-        dist = math.sqrt(dx * dx + dy * dy)
-        total_dist += dist
-        if dt > 0:
-            speeds.append(dist / dt)
-
-    duration = ts[-1] - ts[0] if len(ts) > 1 else 0.0
-    avg_speed = total_dist / duration if duration > 0 else 0.0
-    max_speed = max(speeds) if speeds else 0.0
-
-    start_yaw = _quaternion_to_yaw(
-        float(rows[0].get("orientation.x", 0)),
-        float(rows[0].get("orientation.y", 0)),
-        float(rows[0].get("orientation.z", 0)),
-        float(rows[0].get("orientation.w", 1)),
-    )
-    end_yaw = _quaternion_to_yaw(
-        float(rows[-1].get("orientation.x", 0)),
-        float(rows[-1].get("orientation.y", 0)),
-        float(rows[-1].get("orientation.z", 0)),
-        float(rows[-1].get("orientation.w", 1)),
-    )
+    stats = _precomputed_metrics(campaign, config, run, frame)
+    if stats is None:
+        run_path = resolve_run_path(campaign, config, run)
+        csv_path = run_path / "poses.csv"
+        if not csv_path.exists():
+            return {
+                "error": (
+                    "poses.csv not found. Run 'vast analysis postprocess' "
+                    "with rosbags_tf_to_csv configured in the .vast file."
+                )
+            }
+        poses = load_poses(csv_path, frame)
+        if poses.empty:
+            return {"error": f"No data found for frame '{frame}' in poses.csv."}
+        stats = trajectory_stats(poses)
 
     return {
         "frame": frame,
-        "num_points": len(rows),
-        "total_distance_m": total_dist,
-        "duration_sec": duration,
-        "avg_speed_m_s": avg_speed,
-        "max_speed_m_s": max_speed,
-        "start_pose": {"x": xs[0], "y": ys[0], "yaw": start_yaw},
-        "end_pose": {"x": xs[-1], "y": ys[-1], "yaw": end_yaw},
+        "num_points": int(stats["num_points"]),
+        "total_distance_m": stats["total_distance_m"],
+        "duration_sec": stats["duration_sec"],
+        "avg_speed_m_s": stats["avg_speed_m_s"],
+        "max_speed_m_s": stats["max_speed_m_s"],
+        "start_pose": {"x": stats["start_x"], "y": stats["start_y"], "yaw": stats["start_yaw"]},
+        "end_pose": {"x": stats["end_x"], "y": stats["end_y"], "yaw": stats["end_yaw"]},
         "bounding_box": {
-            "min_x": min(xs), "max_x": max(xs),
-            "min_y": min(ys), "max_y": max(ys),
+            "min_x": stats["min_x"], "max_x": stats["max_x"],
+            "min_y": stats["min_y"], "max_y": stats["max_y"],
         },
     }
 
@@ -390,7 +359,9 @@ def nav_get_path_deviation(
 
     Compares the actual trajectory from ``poses.csv`` against the
     planned path from ``configurations.yaml``.  Returns cross-track
-    error statistics and efficiency ratio.
+    error statistics and efficiency ratio. Uses the precomputed
+    ``nav_metrics`` row when the ``nav_metrics`` postprocessing plugin
+    has run.
 
     Requires ``rosbags_tf_to_csv`` postprocessing.
 
@@ -400,6 +371,16 @@ def nav_get_path_deviation(
         run: Run number.
         frame: TF frame name (default ``base_link``).
     """
+    metrics = _precomputed_metrics(campaign, config, run, frame)
+    if metrics is not None and metrics.get("planned_distance_m") is not None:
+        return {
+            "mean_cross_track_error_m": metrics["mean_cross_track_error_m"],
+            "max_cross_track_error_m": metrics["max_cross_track_error_m"],
+            "actual_distance_m": metrics["total_distance_m"],
+            "planned_distance_m": metrics["planned_distance_m"],
+            "efficiency_ratio": metrics["efficiency_ratio"],
+        }
+
     run_path = resolve_run_path(campaign, config, run)
     csv_path = run_path / "poses.csv"
     if not csv_path.exists():
@@ -410,62 +391,19 @@ def nav_get_path_deviation(
             )
         }
 
-    rows = _read_poses_csv(csv_path, frame)
-    if not rows:
+    poses = load_poses(csv_path, frame)
+    if poses.empty:
         return {"error": f"No data found for frame '{frame}' in poses.csv."}
 
-    campaign_path = resolve_campaign_path(campaign)
     try:
-        configurations = read_resolved_configurations(campaign_path)
+        planned_path = _planned_path(campaign, config)
     except FileNotFoundError:
         return {"error": "configurations.yaml not found."}
 
-    planned_path = None
-    for cfg in configurations.get("configs", []):
-        if cfg.get("name") == config:
-            planned_path = cfg.get("_path")
-            break
-
     if not planned_path:
         return {"error": "No planned path found for this config."}
 
-    actual_xs = [float(r.get("position.x", 0)) for r in rows]
-    actual_ys = [float(r.get("position.y", 0)) for r in rows]
-    actual_dist = sum(
-        math.sqrt((actual_xs[i] - actual_xs[i - 1]) ** 2 + (actual_ys[i] - actual_ys[i - 1]) ** 2)
-        for i in range(1, len(actual_xs))
-    )
-
-    planned_dist = sum(
-        math.sqrt(
-            (planned_path[i]["x"] - planned_path[i - 1]["x"]) ** 2 +
-            (planned_path[i]["y"] - planned_path[i - 1]["y"]) ** 2
-        )
-        for i in range(1, len(planned_path))
-    )
-
-    cross_track_errors = []
-    for ax, ay in zip(actual_xs, actual_ys):
-        min_dist = float("inf")
-        for i in range(len(planned_path) - 1):
-            d = _point_to_segment_distance(
-                ax, ay,
-                planned_path[i]["x"], planned_path[i]["y"],
-                planned_path[i + 1]["x"], planned_path[i + 1]["y"],
-            )
-            min_dist = min(min_dist, d)
-        cross_track_errors.append(min_dist)
-
-    mean_cte = sum(cross_track_errors) / len(cross_track_errors) if cross_track_errors else 0.0
-    max_cte = max(cross_track_errors) if cross_track_errors else 0.0
-
-    return {
-        "mean_cross_track_error_m": mean_cte,
-        "max_cross_track_error_m": max_cte,
-        "actual_distance_m": actual_dist,
-        "planned_distance_m": planned_dist,
-        "efficiency_ratio": planned_dist / actual_dist if actual_dist > 0 else None,
-    }
+    return path_deviation(poses, planned_path)
 
 
 def nav_get_map_info(campaign: str, config: str) -> dict:
@@ -0,0 +1,301 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Vectorized per-run navigation metrics.
+
+One row of metrics per run: trajectory statistics (from ``poses.csv``), path
+deviation against the planned ``_path`` of the config, and a summary of the
+``navigate_to_pose`` action feedback. The ``nav_metrics`` postprocessing plugin
+writes the row to ``<run>/nav_metrics.csv``; ``generate_data_db`` consolidates
+those files into the ``nav_metrics`` table of ``_execution/data.db``, which the
+MCP tools, notebooks and search extractors read instead of recomputing.
+"""
+
+import math
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+NAV_METRICS_FILENAME = "nav_metrics.csv"
+NAV_METRICS_TABLE = "nav_metrics"
+
+# Columns of a metrics row, in file order. ``None`` values are written as empty
+# cells (NULL after data.db ingestion).
+METRIC_COLUMNS = [
+    "frame",
+    "num_points",
+    "total_distance_m",
+    "duration_sec",
+    "avg_speed_m_s",
+    "max_speed_m_s",
+    "start_x", "start_y", "start_yaw",
+    "end_x", "end_y", "end_yaw",
+    "min_x", "max_x", "min_y", "max_y",
+    "mean_cross_track_error_m",
+    "max_cross_track_error_m",
+    "planned_distance_m",
+    "efficiency_ratio",
+    "feedback_rows",
+    "feedback_max_recoveries",
+    "feedback_final_distance_remaining_m",
+]
+
+# Upper bound on the (points x segments) distance matrix evaluated at once.
+_MAX_PAIRS = 4_000_000
+
+
+def find_feedback_csv(run_dir: Path) -> Optional[Path]:
+    """Return the navigation action feedback CSV of a run, if any."""
+    candidates = sorted(run_dir.glob("*navigate_to_pose*feedback*.csv")) + sorted(
+        run_dir.glob("*nav*feedback*.csv"))
+    return candidates[0] if candidates else None
+
+
+def load_poses(csv_path: Path, frame: str = "base_link") -> pd.DataFrame:
+    """Load ``poses.csv`` rows of *frame* with ``timestamp``, ``x``, ``y``, ``yaw`` columns.
+
+    Accepts both the ``orientation.yaw`` layout written by ``rosbags_tf_to_csv``
+    and the quaternion layout (``orientation.x`` .. ``orientation.w``).
+    """
+    with open(csv_path, "r", encoding="utf-8", errors="replace") as f:
+        skiprows = 1 if f.readline().startswith("#") else 0
+    df = pd.read_csv(csv_path, skiprows=skiprows)
+    if "frame" in df.columns:
+        df = df[df["frame"] == frame]
+    if "orientation.yaw" in df.columns:
+        yaw = df["orientation.yaw"].to_numpy(dtype=float)
+    elif "orientation.w" in df.columns:
+        qx = df["orientation.x"].to_numpy(dtype=float)
+        qy = df["orientation.y"].to_numpy(dtype=float)
+        qz = df["orientation.z"].to_numpy(dtype=float)
+        qw = df["orientation.w"].to_numpy(dtype=float)
+        yaw = np.arctan2(2.0 * (qw * qz + qx * qy), 1.0 - 2.0 * (qy * qy + qz * qz))
+    else:
+        yaw = np.zeros(len(df))
+    return pd.DataFrame({
+        "timestamp": df["timestamp"].to_numpy(dtype=float),
+        "x": df["position.x"].to_numpy(dtype=float),
+        "y": df["position.y"].to_numpy(dtype=float),
+        "yaw": yaw,
+    })
+
+
+def trajectory_stats(poses: pd.DataFrame) -> dict[str, Any]:
+    """Distance, duration, speeds, start/end pose and bounding box of a trajectory."""
+    ts = poses["timestamp"].to_numpy()
+    xy = poses[["x", "y"]].to_numpy()
+    yaw = poses["yaw"].to_numpy()
+
+    step = np.hypot(*np.diff(xy, axis=0).T) if len(xy) > 1 else np.zeros(0)
+    dt = np.diff(ts)
+    moving = dt > 0
+    speeds = step[moving] / dt[moving]
+    total_dist = float(step.sum())
+    duration = float(ts[-1] - ts[0]) if len(ts) > 1 else 0.0
+
+    return {
+        "num_points": int(len(xy)),
+        "total_distance_m": total_dist,
+        "duration_sec": duration,
+        "avg_speed_m_s": total_dist / duration if duration > 0 else 0.0,
+        "max_speed_m_s": float(speeds.max()) if speeds.size else 0.0,
+        "start_x": float(xy[0, 0]), "start_y": float(xy[0, 1]), "start_yaw": float(yaw[0]),
+        "end_x": float(xy[-1, 0]), "end_y": float(xy[-1, 1]), "end_yaw": float(yaw[-1]),
+        "min_x": float(xy[:, 0].min()), "max_x": float(xy[:, 0].max()),
+        "min_y": float(xy[:, 1].min()), "max_y": float(xy[:, 1].max()),
+    }
+
+
+def cross_track_errors(points: np.ndarray, path: np.ndarray) -> np.ndarray:
+    """Distance of every point (N, 2) to the closest segment of a polyline (M, 2).
+
+    Evaluated as a broadcast (points x segments) matrix, chunked over the points
+    so memory stays bounded for long trajectories and dense paths.
+    """
+    if len(path) == 1:
+        return np.hypot(*(points - path[0]).T)
+    a = path[:-1]
+    ab = path[1:] - a
+    len_sq = np.einsum("ij,ij->i", ab, ab)
+    safe_len_sq = np.where(len_sq > 0, len_sq, 1.0)
+    chunk = max(1, _MAX_PAIRS // len(a))
+    out = np.empty(len(points))
+    for start in range(0, len(points), chunk):
+        p = points[start:start + chunk, None, :]
+        ap = p - a[None, :, :]
+        t = np.clip(np.einsum("nmj,mj->nm", ap, ab) / safe_len_sq, 0.0, 1.0)
+        t = np.where(len_sq > 0, t, 0.0)
+        diff = ap - t[..., None] * ab[None, :, :]
+        out[start:start + chunk] = np.sqrt(np.einsum("nmj,nmj->nm", diff, diff).min(axis=1))
+    return out
+
+
+def path_deviation(poses: pd.DataFrame, planned_path: list[dict]) -> dict[str, Any]:
+    """Cross-track error statistics and efficiency ratio against *planned_path*."""
+    path = np.array([[float(p["x"]), float(p["y"])] for p in planned_path])
+    points = poses[["x", "y"]].to_numpy()
+    errors = cross_track_errors(points, path)
+    actual_dist = float(np.hypot(*np.diff(points, axis=0).T).sum()) if len(points) > 1 else 0.0
+    planned_dist = float(np.hypot(*np.diff(path, axis=0).T).sum()) if len(path) > 1 else 0.0
+    return {
+        "mean_cross_track_error_m": float(errors.mean()) if errors.size else 0.0,
+        "max_cross_track_error_m": float(errors.max()) if errors.size else 0.0,
+        "actual_distance_m": actual_dist,
+        "planned_distance_m": planned_dist,
+        "efficiency_ratio": planned_dist / actual_dist if actual_dist > 0 else None,
+    }
+
+
+def feedback_stats(csv_path: Path) -> dict[str, Any]:
+    """Row count, maximum recoveries and final remaining distance of an action feedback CSV."""
+    df = pd.read_csv(csv_path)
+    result: dict[str, Any] = {
+        "feedback_rows": int(len(df)),
+        "feedback_max_recoveries": None,
+        "feedback_final_distance_remaining_m": None,
+    }
+    if df.empty:
+        return result
+    recoveries = [c for c in df.columns if c.endswith("number_of_recoveries")]
+    if recoveries:
+        values = pd.to_numeric(df[recoveries[0]], errors="coerce").dropna()
+        if not values.empty:
+            result["feedback_max_recoveries"] = int(values.max())
+    remaining = [c for c in df.columns if c.endswith("distance_remaining")]
+    if remaining:
+        values = pd.to_numeric(df[remaining[0]], errors="coerce").dropna()
+        if not values.empty:
+            result["feedback_final_distance_remaining_m"] = float(values.iloc[-1])
+    return result
+
+
+def compute_run_metrics(
+    run_dir: Path,
+    planned_path: Optional[list[dict]] = None,
+    frame: str = "base_link",
+) -> Optional[dict[str, Any]]:
+    """Compute the full metrics row of one run, or ``None`` without ``poses.csv`` data."""
+    poses_csv = run_dir / "poses.csv"
+    if not poses_csv.exists():
+        return None
+    poses = load_poses(poses_csv, frame)
+    if poses.empty:
+        return None
+
+    row: dict[str, Any] = dict.fromkeys(METRIC_COLUMNS)
+    row["frame"] = frame
+    row.update(trajectory_stats(poses))
+    if planned_path:
+        deviation = path_deviation(poses, planned_path)
+        deviation.pop("actual_distance_m")
+        row.update(deviation)
+    feedback_csv = find_feedback_csv(run_dir)
+    if feedback_csv is not None:
+        try:
+            row.update(feedback_stats(feedback_csv))
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, ValueError):
+            pass
+    return row
+
+
+def write_run_metrics(run_dir: Path, row: dict[str, Any]) -> Path:
+    """Write a metrics row to ``<run_dir>/nav_metrics.csv`` (header + one row)."""
+    path = run_dir / NAV_METRICS_FILENAME
+    pd.DataFrame([row], columns=METRIC_COLUMNS).to_csv(path, index=False)
+    return path
+
+
+def _first_row(df: pd.DataFrame) -> dict[str, Any]:
+    """First row of *df* as plain Python values (NaN/NA -> ``None``)."""
+    row = {}
+    for key, value in df.iloc[0].to_dict().items():
+        if value is pd.NA or (isinstance(value, float) and math.isnan(value)):
+            value = None
+        elif isinstance(value, np.generic):
+            value = value.item()
+        row[key] = value
+    return row
+
+
+def read_run_metrics(run_dir: Path, frame: Optional[str] = None) -> Optional[dict[str, Any]]:
+    """Read the precomputed metrics row of one run (``None`` if absent or for another frame)."""
+    path = run_dir / NAV_METRICS_FILENAME
+    if not path.exists():
+        return None
+    df = pd.read_csv(path)
+    if df.empty:
+        return None
+    row = _first_row(df)
+    if frame is not None and row.get("frame") != frame:
+        return None
+    return row
+
+
+def query_nav_metrics(
+    campaign_dir: Path,
+    config_name: Optional[str] = None,
+    run_id: Optional[int] = None,
+) -> Optional[pd.DataFrame]:
+    """Read the ``nav_metrics`` table from ``_execution/data.db`` as a typed DataFrame.
+
+    data.db stores every column as TEXT; metric columns are converted back to
+    numbers here. Returns ``None`` when the database or the table does not exist.
+    """
+    db_path = Path(campaign_dir) / "_execution" / "data.db"
+    if not db_path.exists():
+        return None
+    clauses, params = [], []
+    if config_name is not None:
+        clauses.append("config_name = ?")
+        params.append(config_name)
+    if run_id is not None:
+        clauses.append("CAST(run_id AS INTEGER) = ?")
+        params.append(int(run_id))
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        df = pd.read_sql_query(f'SELECT * FROM "{NAV_METRICS_TABLE}"{where}', conn, params=params)
+    except (sqlite3.OperationalError, pd.errors.DatabaseError):
+        return None
+    finally:
+        conn.close()
+    df["run_id"] = pd.to_numeric(df["run_id"], errors="coerce").astype("Int64")
+    for col in METRIC_COLUMNS:
+        if col in df.columns and col != "frame":
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+def precomputed_run_metrics(
+    campaign_dir: Path,
+    config_name: str,
+    run_id: int,
+    frame: str = "base_link",
+) -> Optional[dict[str, Any]]:
+    """Precomputed metrics row of one run, or ``None`` if not computed yet.
+
+    Prefers the ``nav_metrics`` table of ``_execution/data.db`` and falls back
+    to the run's ``nav_metrics.csv`` (e.g. before data.db has been rebuilt).
+    """
+    df = query_nav_metrics(campaign_dir, config_name, run_id)
+    if df is not None:
+        df = df[df["frame"] == frame]
+        if not df.empty:
+            return _first_row(df)
+    return read_run_metrics(Path(campaign_dir) / config_name / str(run_id), frame)
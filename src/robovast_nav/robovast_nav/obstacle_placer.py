@@ -34,6 +34,17 @@ class ObstaclePlacer(QObject):
 
     status_update = Signal(str)
 
+    def __init__(self, rng=None, np_rng=None, parent=None):
+        """
+        Args:
+            rng: ``random.Random`` to draw from (default: the global ``random`` state)
+            np_rng: ``np.random.RandomState`` to draw from (default: ``np.random``)
+            parent: Optional Qt parent object
+        """
+        super().__init__(parent)
+        self._rng = rng if rng is not None else random
+        self._np_rng = np_rng if np_rng is not None else np.random
+
     def place_obstacles(
         self,
         path: List[Position],
@@ -102,7 +113,7 @@ class ObstaclePlacer(QObject):
             # obstacles)
             segment = self._select_random_segment(path_segments, total_length)
             # Find a random point along the segment
-            t = random.random()  # Random parameter between 0 and 1
+            t = self._rng.random()  # Random parameter between 0 and 1
             path_point = Position(
                 x=segment["start"].x + t * (segment["end"].x - segment["start"].x),
                 y=segment["start"].y + t * (segment["end"].y - segment["start"].y),
@@ -121,7 +132,7 @@ class ObstaclePlacer(QObject):
                 robot_diameter,
             ):
                 # Generate random yaw angle (rotation) for the obstacle
-                yaw = random.uniform(
+                yaw = self._rng.uniform(
                     -math.pi, math.pi
                 )  # Random rotation from -180° to +180°
                 name = f"obstacle_{len(obstacle_objects)}"
@@ -192,7 +203,7 @@ class ObstaclePlacer(QObject):
             attempts += 1
 
             # Select random free space coordinate
-            random_idx = np.random.randint(0, len(free_coords))
+            random_idx = self._np_rng.randint(0, len(free_coords))
             grid_y, grid_x = free_coords[random_idx]
 
             # Convert grid coordinates to world coordinates using map_loader's conversion
@@ -208,7 +219,7 @@ class ObstaclePlacer(QObject):
                 robot_diameter,
             ):
                 # Generate random yaw angle (rotation) for the obstacle
-                yaw = np.random.uniform(-math.pi, math.pi)  # Random rotation from -180° to +180°
+                yaw = self._np_rng.uniform(-math.pi, math.pi)  # Random rotation from -180° to +180°
                 name = f"obstacle_{len(obstacle_objects)}"
 
                 obstacle = StaticObject(
@@ -254,7 +265,7 @@ class ObstaclePlacer(QObject):
             return segments[0]
 
         # Generate random value between 0 and total_length
-        random_length = random.random() * total_length
+        random_length = self._rng.random() * total_length
 
         # Find the segment corresponding to this length
         current_length = 0.0
@@ -287,8 +298,8 @@ class ObstaclePlacer(QObject):
 
         if path_length == 0:
             # Degenerate case - place obstacle randomly around point
-            angle = random.random() * 2 * math.pi
-            distance = random.random() * max_distance
+            angle = self._rng.random() * 2 * math.pi
+            distance = self._rng.random() * max_distance
             return Position(
                 x=path_point.x + distance * math.cos(angle),
                 y=path_point.y + distance * math.sin(angle),
@@ -303,13 +314,13 @@ class ObstaclePlacer(QObject):
         normal_dy = path_dx
 
         # Choose random side (left or right of path)
-        side = random.choice([-1, 1])
+        side = self._rng.choice([-1, 1])
 
         # Choose random distance from path
-        distance = random.random() * max_distance
+        distance = self._rng.random() * max_distance
 
         # Add some randomness along the path direction as well
-        along_path_offset = (random.random() - 0.5) * min(
+        along_path_offset = (self._rng.random() - 0.5) * min(
             max_distance, path_length * 0.3
         )
 
@@ -0,0 +1,182 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Navigation postprocessing plugins."""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from robovast.common.campaign_data import read_resolved_configuration
+from robovast.results_processing.postprocessing_plugins import BasePostprocessingPlugin
+
+from .metrics import (NAV_METRICS_FILENAME, compute_run_metrics,
+                      find_feedback_csv, write_run_metrics)
+
+_CACHE_FILENAME = ".robovast_nav_metrics_cache"
+
+
+def _find_pose_runs(results_dir: Path) -> List[Path]:
+    """Run directories below *results_dir* that contain a ``poses.csv``."""
+    return sorted(p.parent for p in results_dir.rglob("poses.csv") if (p.parent / "test.xml").exists())
+
+
+def _planned_path(campaign_dir: Path, config_name: str):
+    """Planned ``_path`` of one config (``None`` if unavailable)."""
+    try:
+        cfg = read_resolved_configuration(campaign_dir, config_name)
+    except FileNotFoundError:
+        return None
+    return cfg.get("_path") if cfg else None
+
+
+def _run_fingerprint(run_dir: Path, planned_path, frame: str) -> str:
+    """Fingerprint of a run's metric inputs (file mtime + size, planned path, frame)."""
+    parts = [f"frame:{frame}", f"path:{json.dumps(planned_path, sort_keys=True)}"]
+    for path in (run_dir / "poses.csv", find_feedback_csv(run_dir)):
+        if path is None:
+            continue
+        stat = path.stat()
+        parts.append(f"{path.name}:{stat.st_mtime:.6f}:{stat.st_size}")
+    return hashlib.md5("|".join(parts).encode()).hexdigest()
+
+
+def _metrics_worker(args: tuple) -> Tuple[str, str]:
+    """Compute and write the metrics of one run; returns ``(run_dir, outcome)``.
+
+    *outcome* is ``written``, ``cached``, ``no_data`` or ``error: <message>``.
+    """
+    run_dir_str, planned_path, frame, force = args
+    run_dir = Path(run_dir_str)
+    cache_file = run_dir / _CACHE_FILENAME
+    try:
+        fingerprint = _run_fingerprint(run_dir, planned_path, frame)
+        if (not force and (run_dir / NAV_METRICS_FILENAME).exists() and cache_file.exists()
+                and cache_file.read_text(encoding="utf-8").strip() == fingerprint):
+            return run_dir_str, "cached"
+        row = compute_run_metrics(run_dir, planned_path, frame)
+        if row is None:
+            return run_dir_str, "no_data"
+        write_run_metrics(run_dir, row)
+        cache_file.write_text(fingerprint, encoding="utf-8")
+        return run_dir_str, "written"
+    except Exception as e:  # pylint: disable=broad-except
+        return run_dir_str, f"error: {e}"
+
+
+class NavMetrics(BasePostprocessingPlugin):
+    """Compute navigation metrics once per run for the whole campaign.
+
+    Reads each run's ``poses.csv`` (from ``rosbags_tf_to_csv``), the planned
+    ``_path`` of its config and, if present, the ``navigate_to_pose`` action
+    feedback CSV, and writes one row of trajectory statistics, path deviation and
+    feedback summary to ``<run>/nav_metrics.csv``. ``generate_data_db`` collects
+    these into the ``nav_metrics`` table of ``_execution/data.db``.
+
+    Runs are processed in parallel worker processes. Processing is incremental:
+    a run is skipped when its inputs (poses/feedback CSV, planned path, frame)
+    are unchanged since the last invocation, unless ``force`` is set.
+
+    Example usage in .vast config:
+
+    .. code-block:: yaml
+
+        postprocessing:
+          - rosbags_tf_to_csv:
+              frames: [base_link]
+          - nav_metrics:
+              frame: base_link
+    """
+
+    def __call__(
+        self,
+        results_dir: str,
+        config_dir: str,
+        frame: str = "base_link",
+        workers: Optional[int] = None,
+        provenance_file: Optional[str] = None,
+        execution_image: Optional[str] = None,
+        debug: bool = False,
+        force: bool = False,
+    ) -> Tuple[bool, str, List[dict]]:
+        """Execute the nav_metrics plugin.
+
+        Args:
+            results_dir: Path to the results directory or a campaign-<id> directory.
+            config_dir: Directory containing the .vast config file (unused).
+            frame: TF frame of ``poses.csv`` to evaluate (default ``base_link``).
+            workers: Number of worker processes (default: CPU count).
+            provenance_file: Ignored; provenance entries are returned directly.
+            execution_image: Ignored by this plugin (accepted for interface compatibility).
+            debug: If True, list every run that failed.
+            force: If True, recompute all runs regardless of the per-run cache.
+
+        Returns:
+            Tuple of (success, message, provenance_entries).
+        """
+        root = Path(results_dir)
+        if not root.is_dir():
+            return False, f"Results directory does not exist: {results_dir}", []
+
+        run_dirs = _find_pose_runs(root)
+        if not run_dirs:
+            return True, "nav_metrics: no runs with poses.csv found", []
+
+        planned_paths: dict = {}
+        tasks = []
+        for run_dir in run_dirs:
+            config_dir = run_dir.parent
+            if config_dir not in planned_paths:
+                planned_paths[config_dir] = _planned_path(config_dir.parent, config_dir.name)
+            tasks.append((str(run_dir), planned_paths[config_dir], frame, force))
+
+        n_workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(tasks))) as pool:
+            results = list(pool.map(_metrics_worker, tasks, chunksize=max(1, len(tasks) // (n_workers * 4))))
+
+        counts = {"written": 0, "cached": 0, "no_data": 0, "error": 0}
+        errors: List[str] = []
+        entries: List[dict] = []
+        results_parent = root.parent if (root / "_config").is_dir() else root
+        for run_dir_str, outcome in results:
+            if outcome.startswith("error"):
+                counts["error"] += 1
+                errors.append(f"{run_dir_str}: {outcome[len('error: '):]}")
+                continue
+            counts[outcome] += 1
+            if outcome == "written":
+                run_dir = Path(run_dir_str)
+                sources = [run_dir / "poses.csv"]
+                feedback_csv = find_feedback_csv(run_dir)
+                if feedback_csv is not None:
+                    sources.append(feedback_csv)
+                entries.append({
+                    "output": os.path.relpath(run_dir / NAV_METRICS_FILENAME, results_parent),
+                    "sources": [os.path.relpath(s, results_parent) for s in sources],
+                    "plugin": "nav_metrics",
+                    "params": {"frame": frame},
+                })
+
+        message = (
+            f"nav_metrics: {len(run_dirs)} runs ({counts['written']} computed, "
+            f"{counts['cached']} cached, {counts['no_data']} no-data, {counts['error']} errors)"
+        )
+        if errors and debug:
+            message += "\n" + "\n".join(errors)
+        return counts["error"] == 0, message, entries
@@ -238,18 +238,27 @@ class ObstacleVariation(NavVariation):
 
         results = []
         for config in in_configs:
-            np.random.seed(self.parameters.seed)
-            random.seed(self.parameters.seed)
+            self._seed_generators(self.parameters.seed)
             for expanded_obstacle_configs in expanded_configs_list:
                 for _ in range(self.parameters.count):
                     result = self._generate_obstacles_for_config(self.base_path, config, expanded_obstacle_configs)
                     results.extend(result)
         return results
 
+    def _seed_generators(self, seed):
+        """Start this variation's own random generators from *seed*.
+
+        Configuration blocks may be generated concurrently, so draws never go
+        through the global ``random``/``np.random`` state; the sequences equal
+        those of ``random.seed``/``np.random.seed``.
+        """
+        self._rng = random.Random(seed)
+        self._np_rng = np.random.RandomState(seed)  # pylint: disable=no-member
+
     def _generate_obstacles_for_config(self, base_path, config, obstacle_configs):
         resulting_configs = []
 
-        placer = ObstaclePlacer()
+        placer = ObstaclePlacer(rng=self._rng, np_rng=self._np_rng)
 
         try:
             map_file_path = self.get_map_file(self.parameters.map_file, config)
@@ -29,10 +29,8 @@ output configuration is produced per value (multiplied with the normal count/in_
 """
 
 import copy
-import random
 from typing import List, Optional, Union
 
-import numpy as np
 from pydantic import ConfigDict, field_validator, model_validator
 
 from robovast.common import convert_dataclasses_to_dict
@@ -187,8 +185,7 @@ class ObstacleVariationWithDistanceTrigger(ObstacleVariation):
                 self._current_trigger_distance = td
                 for exp_idx, expanded_configs in enumerate(all_expanded):
                     seed = self.parameters.seed + td_idx * n_expanded + exp_idx
-                    np.random.seed(seed)
-                    random.seed(seed)
+                    self._seed_generators(seed)
                     effective_config = self._inject_poses(config)
                     for _ in range(self.parameters.count):
                         result = self._generate_obstacles_for_config(
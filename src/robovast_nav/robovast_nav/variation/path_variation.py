@@ -311,7 +311,9 @@ class PathVariationRandom(NavVariation):
         if num_goal_poses is None:
             num_goal_poses = self.parameters.num_goal_poses if self.parameters.num_goal_poses is not None else 1
 
-        waypoint_generator = WaypointGenerator(map_file_path)
+        # Own generator per path (same sequence as np.random.seed): blocks may
+        # be generated concurrently.
+        waypoint_generator = WaypointGenerator(map_file_path, rng=np.random.RandomState(seed))  # pylint: disable=no-member
 
         file_cache = FileCache(cache_path, "robovast_path_generation_", [self.parameters, seed, path_length, num_goal_poses])
         cache = file_cache.get_cached_file([map_file_path], binary=True)
@@ -326,7 +328,6 @@ class PathVariationRandom(NavVariation):
         max_attempts = 1000  # Maximum attempts to find a valid path
         path_found = False
 
-        np.random.seed(seed)
         while attempt < max_attempts and not path_found:
 
             self.progress_update(
@@ -26,14 +26,16 @@ from .map_loader import Map, load_map
 class WaypointGenerator:
     """Class for generating valid waypoints within a map considering robot size."""
 
-    def __init__(self, map_file_path: str):
+    def __init__(self, map_file_path: str, rng=None):
         """
         Initialize waypoint generator with a map file.
 
         Args:
             map_file_path: Path to the map YAML file
+            rng: ``np.random.RandomState`` to draw from (default: ``np.random``)
         """
         self.map_file_path = map_file_path
+        self.rng = rng if rng is not None else np.random
         self.map: Map = None
 
         self.load_map()
@@ -79,10 +81,10 @@ class WaypointGenerator:
 
                 # Generate point within annular region between min_distance and max_distance
                 # Use polar coordinates: random angle and random radius
-                angle = np.random.uniform(0, 2 * math.pi)
+                angle = self.rng.uniform(0, 2 * math.pi)
                 # Generate radius between min_distance and max_distance with uniform distribution
                 # Use sqrt for uniform distribution in annular region
-                radius = math.sqrt(np.random.uniform(min_distance**2, max_distance**2))
+                radius = math.sqrt(self.rng.uniform(min_distance**2, max_distance**2))
 
                 x = ref_x + radius * math.cos(angle)
                 y = ref_y + radius * math.sin(angle)
@@ -92,8 +94,8 @@ class WaypointGenerator:
                 y = np.clip(y, min_y, max_y)
             else:
                 # Generate first waypoint or no max_distance constraint
-                x = np.random.uniform(min_x, max_x)
-                y = np.random.uniform(min_y, max_y)
+                x = self.rng.uniform(min_x, max_x)
+                y = self.rng.uniform(min_y, max_y)
 
             # Check if position is valid (only collision checking needed now)
             if self.is_valid_position(x, y, robot_diameter/2.0):
@@ -101,7 +103,7 @@ class WaypointGenerator:
 
         result = []
         for x, y in waypoints:
-            yaw = np.random.uniform(-math.pi, math.pi)
+            yaw = self.rng.uniform(-math.pi, math.pi)
             result.append(Pose(position=Position(x=x, y=y), orientation=Orientation(yaw=yaw)))
         return result
 
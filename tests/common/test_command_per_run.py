@@ -0,0 +1,83 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per-run incremental mode of the command postprocessing plugin."""
+
+import sys
+
+from robovast.results_processing.postprocessing_plugins import Command
+
+SCRIPT = f"""#!{sys.executable}
+import os, sys
+run_dir = sys.argv[-1]
+print("processing", os.path.basename(run_dir))
+with open(os.path.join(run_dir, "trajectory.csv")) as f:
+    rows = f.read().splitlines()
+with open(os.path.join(run_dir, "metrics.csv"), "w") as f:
+    f.write(f"rows\\n{{len(rows)}}\\n")
+sys.exit(1 if rows and rows[0] == "fail" else 0)
+"""
+
+
+def _setup(tmp_path, n=3):
+    script = tmp_path / "metrics.py"
+    script.write_text(SCRIPT)
+    script.chmod(0o755)
+    campaign = tmp_path / "campaign-1"
+    for i in range(n):
+        run = campaign / "cfg" / str(i)
+        run.mkdir(parents=True)
+        (run / "trajectory.csv").write_text("a\nb\n")
+    return campaign
+
+
+def _call(campaign, tmp_path, **kwargs):
+    lines, done = [], []
+    ok, message = Command()(str(campaign), str(tmp_path), "metrics.py", per_run=True,
+                            inputs=["trajectory.csv"], outputs=["metrics.csv"],
+                            workers=2, run_done=done.append, output_callback=lines.append,
+                            **kwargs)
+    return ok, message, lines, done
+
+
+def test_only_changed_runs_are_reprocessed(tmp_path):
+    campaign = _setup(tmp_path)
+    ok, message, lines, done = _call(campaign, tmp_path)
+    assert ok, message
+    assert "3 run(s) processed, 0 unchanged" in message
+    assert sorted(lines) == [f"cfg/{i}: processing {i}" for i in range(3)]
+    assert len(done) == 3
+    assert (campaign / "cfg" / "0" / "metrics.csv").read_text() == "rows\n2\n"
+
+    ok, message, lines, done = _call(campaign, tmp_path)
+    assert ok and "0 run(s) processed, 3 unchanged" in message
+    assert not lines and len(done) == 3
+
+    (campaign / "cfg" / "1" / "trajectory.csv").write_text("a\nb\nc\n")
+    (campaign / "cfg" / "2" / "metrics.csv").unlink()
+    ok, message, lines, _done = _call(campaign, tmp_path)
+    assert ok and "2 run(s) processed, 1 unchanged" in message
+    assert sorted(lines) == ["cfg/1: processing 1", "cfg/2: processing 2"]
+
+    ok, message, _lines, _done = _call(campaign, tmp_path, force=True)
+    assert "3 run(s) processed" in message
+
+
+def test_failed_runs_are_reported_and_retried(tmp_path):
+    campaign = _setup(tmp_path, n=2)
+    (campaign / "cfg" / "1" / "trajectory.csv").write_text("fail\n")
+    ok, message, _lines, done = _call(campaign, tmp_path)
+    assert not ok
+    assert "failed on 1/2 run(s)" in message and "cfg/1: exit code 1" in message
+    assert done == [str(campaign / "cfg" / "0")]
+    # No fingerprint is stored for the failed run, so it is retried.
+    ok, message, _lines, _done = _call(campaign, tmp_path)
+    assert "0 run(s) processed" in message and "failed on 1/2" in message
+
+
+def test_per_run_io_is_run_relative():
+    command = Command()
+    assert command.get_io({"per_run": True, "inputs": ["trajectory.csv"], "outputs": []}) == \
+        (["*/trajectory.csv"], [])
+    assert command.get_io({"inputs": ["*/metrics.csv"]}) == (["*/metrics.csv"], None)
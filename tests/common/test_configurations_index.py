@@ -0,0 +1,68 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per-config index over _transient/configurations.yaml."""
+
+import datetime
+import os
+
+import pytest
+import yaml
+
+from robovast.common.campaign_data import (CONFIGURATIONS_INDEX_FILENAME,
+                                           list_resolved_configuration_names,
+                                           read_resolved_configuration,
+                                           read_resolved_configurations,
+                                           write_configurations_index)
+
+DOC = {
+    "vast": "/x/nav.vast",
+    "configs": [
+        {"name": "ca", "_path": [{"x": 0.0, "y": 1.0}, {"x": 2.0, "y": 3.0}], "config": {"a": 1}},
+        {"name": "cb", "_path": [], "config": {"a": 2}},
+    ],
+}
+
+
+def _campaign(tmp_path, doc=None):
+    campaign = tmp_path / "nav-2026-06-17-101010"
+    (campaign / "_transient").mkdir(parents=True)
+    (campaign / "_transient" / "configurations.yaml").write_text(
+        yaml.safe_dump(doc or DOC, sort_keys=False))
+    return campaign
+
+
+def test_single_config_read_matches_full_document(tmp_path):
+    campaign = _campaign(tmp_path)
+    write_configurations_index(campaign)
+    full = read_resolved_configurations(campaign)
+    for cfg in full["configs"]:
+        assert read_resolved_configuration(campaign, cfg["name"]) == cfg
+    assert read_resolved_configuration(campaign, "missing") is None
+    assert list_resolved_configuration_names(campaign) == ["ca", "cb"]
+
+
+def test_index_built_lazily_and_rebuilt_when_stale(tmp_path):
+    campaign = _campaign(tmp_path)
+    index = campaign / "_transient" / CONFIGURATIONS_INDEX_FILENAME
+    assert not index.exists()
+    assert read_resolved_configuration(campaign, "cb")["config"] == {"a": 2}
+    assert index.exists()
+
+    changed = {"configs": [{"name": "cb", "config": {"a": 3}}, {"name": "cc"}]}
+    yaml_path = campaign / "_transient" / "configurations.yaml"
+    yaml_path.write_text(yaml.safe_dump(changed))
+    st = yaml_path.stat()
+    os.utime(yaml_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert read_resolved_configuration(campaign, "cb")["config"] == {"a": 3}
+    assert list_resolved_configuration_names(campaign) == ["cb", "cc"]
+
+
+def test_non_json_values_fail_the_index_and_readers_use_the_yaml(tmp_path):
+    doc = {"configs": [{"name": "ca", "config": {"day": datetime.date(2026, 6, 17)}}]}
+    campaign = _campaign(tmp_path, doc)
+    with pytest.raises(ValueError, match="config 'ca' is not JSON-serializable"):
+        write_configurations_index(campaign)
+    assert not list((campaign / "_transient").glob("configurations.jsonl*"))
+    assert read_resolved_configuration(campaign, "ca")["config"]["day"] == datetime.date(2026, 6, 17)
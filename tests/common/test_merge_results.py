@@ -0,0 +1,73 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Link modes and incremental merging of merge_results."""
+
+import os
+
+import yaml
+
+from robovast.results_processing.merge_results import merge_results
+
+
+def _campaign(results, name, runs=2):
+    campaign = results / name
+    (campaign / "_config").mkdir(parents=True)
+    (campaign / "_config" / "scenario.osc").write_text("scenario\n")
+    config = campaign / "cfg"
+    config.mkdir()
+    (config / "config.yaml").write_text(yaml.safe_dump({"config_identifier": "abcdef1234"}))
+    for run in range(runs):
+        (config / str(run)).mkdir()
+        (config / str(run) / "test.xml").write_text(f"{name}/{run}\n")
+    return campaign
+
+
+def _merged(out):
+    (campaign,) = [p for p in out.iterdir() if p.name.startswith("campaign-")]
+    return campaign
+
+
+def test_hardlink_mode_shares_inodes(tmp_path):
+    results, out = tmp_path / "results", tmp_path / "merged"
+    _campaign(results, "campaign-2026-01-01-000000")
+    ok, message = merge_results(str(results), str(out), mode="hardlink")
+    assert ok and "2 run(s)" in message and "hardlink" in message
+    src = results / "campaign-2026-01-01-000000" / "cfg" / "1" / "test.xml"
+    dst = _merged(out) / "cfg" / "1" / "test.xml"
+    assert os.stat(src).st_ino == os.stat(dst).st_ino
+
+    ok, message = merge_results(str(results), str(out), mode="copy", incremental=False)
+    dst = _merged(out) / "cfg" / "1" / "test.xml"
+    assert ok and os.stat(src).st_ino != os.stat(dst).st_ino
+    assert dst.read_text() == src.read_text()
+
+
+def test_new_campaign_is_appended(tmp_path):
+    results, out = tmp_path / "results", tmp_path / "merged"
+    _campaign(results, "campaign-2026-01-01-000000")
+    ok, _message = merge_results(str(results), str(out))
+    assert ok
+    first = _merged(out)
+    marker = first / "cfg" / "0" / "postprocessed.csv"
+    marker.write_text("kept\n")
+
+    ok, message = merge_results(str(results), str(out))
+    assert ok and "0 new run(s)" in message and "nothing to place" in message
+
+    _campaign(results, "campaign-2026-01-02-000000", runs=1)
+    ok, message = merge_results(str(results), str(out))
+    assert ok and "3 run(s)" in message and "1 new run(s)" in message
+    merged = _merged(out)
+    assert merged != first and not first.exists()
+    assert (merged / "cfg" / "0" / "postprocessed.csv").read_text() == "kept\n"
+    assert (merged / "cfg" / "2" / "test.xml").read_text() == "campaign-2026-01-02-000000/0\n"
+    manifest = yaml.safe_load((merged / "_execution" / "merge_manifest.yaml").read_text())
+    assert manifest["configs"]["cfg"]["runs"] == [
+        ["campaign-2026-01-01-000000", "0"], ["campaign-2026-01-01-000000", "1"],
+        ["campaign-2026-01-02-000000", "0"]]
+
+    ok, message = merge_results(str(results), str(out), incremental=False)
+    assert ok and "3 new run(s)" in message
+    assert not (_merged(out) / "cfg" / "0" / "postprocessed.csv").exists()
@@ -0,0 +1,101 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Cached per-configuration metadata fragments and streamed metadata.yaml."""
+
+import yaml
+
+from robovast.results_processing import metadata as metadata_module
+from robovast.results_processing.metadata import (MetadataProcessor,
+                                                  generate_campaign_metadata)
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _campaign(root, configs=("c1", "c2"), runs=2):
+    campaign = root / "campaign-2026-01-01-000000"
+    _write(campaign / "_transient" / "configurations.yaml", yaml.safe_dump({
+        "created_at": "2026-01-01T00:00:00",
+        "_run_files": ["scenario.osc"],
+        "metadata": {"title": "test"},
+        "configs": [{"name": c, "config": {"speed": i}, "_variations": [{"name": "V"}]}
+                    for i, c in enumerate(configs)],
+    }))
+    _write(campaign / "_execution" / "execution.yaml",
+           yaml.safe_dump({"runs": runs, "robovast_version": "1"}))
+    for c in configs:
+        for run in range(runs):
+            run_dir = campaign / c / str(run)
+            _write(run_dir / "test.xml",
+                   '<testsuite errors="0" failures="0" tests="1">'
+                   '<testcase name="t" time="2"/></testsuite>')
+            _write(run_dir / "sysinfo.yaml", "cpus: 4\n")
+            _write(run_dir / "trajectory.csv", "x\n1\n")
+    return campaign
+
+
+def _generate(root):
+    messages = []
+    ok, message = generate_campaign_metadata(str(root), output_callback=messages.append)
+    assert ok, message
+    return messages
+
+
+def _load(campaign):
+    with open(campaign / "metadata.yaml", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def test_only_changed_configs_are_regenerated(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata_module, "_get_metadata_processing_commands", lambda *_: [])
+    campaign = _campaign(tmp_path)
+    assert "2 of 2 configuration(s) regenerated" in _generate(tmp_path)
+    first = _load(campaign)
+    assert list(first) == ["run_files", "scenario_file", "metadata", "configurations",
+                           "execution", "postprocessing"]
+    assert [c["name"] for c in first["configurations"]] == ["c1", "c2"]
+    c1 = first["configurations"][0]
+    assert c1["variations"] == [{"name": "V"}] and c1["derived_from"] == []
+    assert [r["dir"] for r in c1["test_results"]] == ["c1/0", "c1/1"]
+    assert c1["test_results"][0]["output_files"] == ["c1/0/sysinfo.yaml", "c1/0/trajectory.csv"]
+
+    assert "0 of 2 configuration(s) regenerated" in _generate(tmp_path)
+    assert _load(campaign) == first
+
+    _write(campaign / "c2" / "1" / "metrics.csv", "m\n1\n")
+    assert "1 of 2 configuration(s) regenerated" in _generate(tmp_path)
+    assert _load(campaign)["configurations"][1]["test_results"][1]["output_files"] == \
+        ["c2/1/metrics.csv", "c2/1/sysinfo.yaml", "c2/1/trajectory.csv"]
+
+
+class Passthrough(MetadataProcessor):
+    def process_metadata(self, metadata, campaign_dir):
+        return metadata
+
+
+def test_streamed_document_matches_in_memory_one(tmp_path, monkeypatch):
+    campaign = _campaign(tmp_path, configs=("b", "a"), runs=1)
+    monkeypatch.setattr(metadata_module, "_get_metadata_processing_commands", lambda *_: [])
+    _generate(tmp_path)
+    streamed = _load(campaign)
+
+    # A metadata processor needs the whole document: written in one piece.
+    monkeypatch.setattr(metadata_module, "_get_metadata_processing_commands",
+                        lambda *_: ["passthrough"])
+    monkeypatch.setattr(metadata_module, "_load_metadata_plugins",
+                        lambda: {"passthrough": Passthrough})
+    _generate(tmp_path)
+    assert _load(campaign) == streamed
+    assert [c["name"] for c in streamed["configurations"]] == ["b", "a"]
+
+
+def test_run_count_mismatch_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata_module, "_get_metadata_processing_commands", lambda *_: [])
+    campaign = _campaign(tmp_path, runs=2)
+    _write(campaign / "_execution" / "execution.yaml", yaml.safe_dump({"runs": 3}))
+    ok, message = generate_campaign_metadata(str(tmp_path))
+    assert not ok and "expected 3 runs" in message
@@ -0,0 +1,157 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Dependency-aware postprocessing execution (postprocessing_dag.execute_steps)."""
+
+import sqlite3
+import threading
+
+from robovast.results_processing import postprocessing
+from robovast.results_processing.postprocessing_dag import (Step, execute_steps,
+                                                            find_run_dirs,
+                                                            globs_may_overlap,
+                                                            plan_dependencies)
+from robovast.results_processing.postprocessing_plugins import (DataDbBuilder,
+                                                                generate_data_db)
+
+
+def _runs(root, n):
+    dirs = []
+    for i in range(n):
+        d = root / "cfg" / str(i)
+        d.mkdir(parents=True)
+        dirs.append(str(d))
+    return dirs
+
+
+def test_glob_overlap_is_conservative():
+    assert globs_may_overlap("*.csv", "*/rosbag2/tf.csv")
+    assert globs_may_overlap("*", "*/../../_execution/data.db")
+    assert globs_may_overlap("a*", "*b")
+    assert not globs_may_overlap("*.csv", "*.webm")
+    assert not globs_may_overlap("summary.csv", "*.png")
+
+
+def test_dependencies_follow_declared_files():
+    steps = [Step("bags", None, inputs=["*/rosbag2/*.mcap"], outputs=["*.csv"]),
+             Step("video", None, inputs=["*/camera/*.mp4"], outputs=["*.webm"]),
+             Step("db", None, scope="run", inputs=["*.csv"], outputs=[]),
+             Step("script", None),
+             Step("archive", None, inputs=["*"], outputs=[])]
+    assert plan_dependencies(steps) == [set(), set(), {0}, {0, 1, 2}, {0, 1, 3}]
+
+
+def test_run_outputs_above_the_run_are_resolved_against_the_campaign():
+    steps = [Step("db", None, scope="run", inputs=["*.csv"], outputs=["../../_execution/data.db"]),
+             Step("report", None, inputs=["_execution/data.db"], outputs=["report.html"]),
+             Step("other", None, inputs=["_execution/other.db"], outputs=["other.html"])]
+    assert plan_dependencies(steps) == [set(), {0}, set()]
+
+
+def test_independent_steps_run_concurrently(tmp_path):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _meet(_run_done):
+        barrier.wait()
+        return True, "met"
+
+    steps = [Step("a", _meet, inputs=[], outputs=["a.txt"]),
+             Step("b", _meet, inputs=[], outputs=["b.txt"])]
+    ok, timings = execute_steps(steps, [], output=lambda _m: None)
+    assert ok and [t["step"] for t in timings] == ["a", "b"]
+
+
+def test_run_steps_start_on_runs_released_early(tmp_path):
+    runs = _runs(tmp_path, 2)
+    first_ingested = threading.Event()
+    ingested = []
+
+    def _extract(run_done):
+        run_done(runs[0])
+        # Only finishes once the dependent run step has already handled run 0.
+        assert first_ingested.wait(5)
+        return True, "extracted"
+
+    def _ingest(run_dir):
+        ingested.append(run_dir)
+        first_ingested.set()
+        return True, ""
+
+    closed = []
+    steps = [Step("extract", _extract, inputs=["*/bag/*"], outputs=["*.csv"]),
+             Step("ingest", _ingest, scope="run", inputs=["*.csv"], outputs=[],
+                  finish=lambda: (closed.append(1) or True, "closed"))]
+    ok, timings = execute_steps(steps, runs, output=lambda _m: None)
+    assert ok and sorted(ingested) == sorted(runs) and closed == [1]
+    assert timings[1]["tasks"] == 3      # two runs plus the finish hook
+
+
+def test_failures_are_reported_without_stopping_dependents(tmp_path):
+    runs = _runs(tmp_path, 2)
+    seen = []
+    steps = [Step("broken", lambda _rd: (_ for _ in ()).throw(RuntimeError("boom"))),
+             Step("per-run", lambda rd: (rd.endswith("0"), "odd run"), scope="run"),
+             Step("after", lambda _rd: (seen.append(1) or True, "ran"))]
+    messages = []
+    ok, timings = execute_steps(steps, runs, output=messages.append)
+    assert not ok and seen == [1]
+    assert [t["success"] for t in timings] == [False, False, True]
+    assert any("boom" in m for m in messages)
+
+
+def test_find_run_dirs_accepts_campaign_or_results_dir(tmp_path):
+    campaign = tmp_path / "nav-2026-01-01-120000"
+    (campaign / "_config").mkdir(parents=True)
+    runs = _runs(campaign, 2)
+    assert find_run_dirs(str(tmp_path)) == runs
+    assert find_run_dirs(str(campaign)) == runs
+
+
+def test_generate_data_db_consolidates_runs(tmp_path):
+    for run, value in enumerate(("1", "2")):
+        d = tmp_path / "cfg" / str(run)
+        d.mkdir(parents=True)
+        (d / "metrics.csv").write_text(f"x\n{value}\n")
+    ok, _msg = generate_data_db(str(tmp_path), output_callback=lambda _m: None)
+    assert ok
+    with sqlite3.connect(tmp_path / "_execution" / "data.db") as conn:
+        rows = conn.execute("SELECT config_name, run_id, x FROM metrics ORDER BY run_id").fetchall()
+    assert rows == [("cfg", "0", "1"), ("cfg", "1", "2")]
+
+
+def test_data_db_rows_do_not_depend_on_ingest_order(tmp_path):
+    runs = []
+    for config, run in (("a", 0), ("a", 2), ("a", 10), ("b", 1)):
+        d = tmp_path / config / str(run)
+        d.mkdir(parents=True)
+        (d / "metrics.csv").write_text(f"x\n{config}{run}-0\n{config}{run}-1\n")
+        runs.append((config, d))
+    builder = DataDbBuilder(str(tmp_path), output_callback=lambda _m: None)
+    for config, run_dir in reversed(runs):
+        builder.add_run(config, run_dir)
+    assert builder.close()[0]
+    with sqlite3.connect(tmp_path / "_execution" / "data.db") as conn:
+        xs = [x for (x,) in conn.execute("SELECT x FROM metrics")]
+        stamps = conn.execute("SELECT config_name, run_id FROM scenario_timestamps").fetchall()
+        indexed = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' "
+                               "AND tbl_name = 'metrics'").fetchall()
+    assert xs == ["a0-0", "a0-1", "a2-0", "a2-1", "a10-0", "a10-1", "b1-0", "b1-1"]
+    assert stamps == [("a", 0), ("a", 2), ("a", 10), ("b", 1)]
+    assert indexed == [("idx_metrics_ctx",)]
+
+
+def test_data_db_step_ingests_concurrent_runs_into_one_database(tmp_path):
+    runs = []
+    for c in range(4):
+        for r in range(16):
+            d = tmp_path / f"cfg{c}" / str(r)
+            d.mkdir(parents=True)
+            (d / "metrics.csv").write_text(f"x\n{c}-{r}\n")
+            runs.append(str(d))
+    # No public factory: the step is built inside run_postprocessing.
+    step = postprocessing._data_db_step(str(tmp_path), output_callback=lambda _m: None)  # pylint: disable=protected-access
+    ok, _timings = execute_steps([step], runs, max_workers=16, output=lambda _m: None)
+    assert ok
+    with sqlite3.connect(tmp_path / "_execution" / "data.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM metrics").fetchone() == (64,)
@@ -0,0 +1,63 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Parallel read_output_files with per-config parameters and Parquet cache."""
+
+import pandas as pd
+import pytest
+
+from robovast.common.analysis import read_output_csv, read_output_files
+
+
+def _read_out(run_dir):
+    return read_output_csv(run_dir, "out.csv")
+
+
+@pytest.fixture(name="campaign")
+def _campaign(tmp_path):
+    for c in range(3):
+        cfg = tmp_path / f"cfg{c}"
+        (cfg / "_config").mkdir(parents=True)
+        (cfg / "_config" / "scenario.config").write_text(
+            f"scen:\n  speed: {c % 2}\n  goal: [1, {c}]\n", encoding="utf-8")
+        for r in range(2):
+            run = cfg / str(r)
+            run.mkdir()
+            (run / "test.xml").write_text("<testsuite/>", encoding="utf-8")
+            pd.DataFrame({"t": [0, 1, 2], "v": [c, r, c + r]}).to_csv(run / "out.csv", index=False)
+    (tmp_path / "cfg2" / "1" / "out.csv").unlink()  # unreadable run is skipped
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers,executor", [(1, "thread"), (4, "thread"), (2, "process")])
+def test_columns_and_categories(campaign, workers, executor):
+    df = read_output_files(str(campaign), _read_out, workers=workers, executor=executor)
+
+    assert len(df) == 5 * 3
+    assert list(df.columns) == ["t", "v", "run", "config", "speed", "goal"]
+    for col in ("run", "config", "speed", "goal"):
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+    assert list(df["speed"].cat.categories) == [0, 1]
+    row = df[(df["config"] == "cfg2") & (df["run"] == "0")]
+    assert list(row["v"]) == [2, 0, 2]
+    assert set(row["speed"]) == {0}
+    assert set(row["goal"]) == {"- 1\n- 2\n"}
+
+
+def test_parquet_cache_reused_until_inputs_change(campaign):
+    pytest.importorskip("pyarrow")
+    calls = []
+
+    def reader(run_dir):
+        calls.append(run_dir)
+        return _read_out(run_dir)
+
+    first = read_output_files(str(campaign), reader, cache_key="out")
+    n_calls = len(calls)
+    cached = read_output_files(str(campaign), reader, cache_key="out")
+    assert len(calls) == n_calls
+    pd.testing.assert_frame_equal(first, cached)
+
+    pd.DataFrame({"t": [0], "v": [9]}).to_csv(campaign / "cfg0" / "0" / "out.csv", index=False)
+    assert len(read_output_files(str(campaign), reader, cache_key="out")) == 13
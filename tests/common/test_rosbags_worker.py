@@ -0,0 +1,126 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Long-lived rosbag worker (rosbags_worker.RosbagsWorker) and its serve loop."""
+
+import json
+import sys
+import threading
+from importlib.resources import files
+
+import pytest
+
+from robovast.results_processing import rosbags_worker
+from robovast.results_processing.rosbags_worker import RosbagsWorker
+
+DATA_DIR = str(files("robovast.results_processing.data"))
+
+# Stands in for rosbags_process.py --serve: same serve loop, trivial job.
+FAKE_SERVER = f"""
+import json, os, sys
+sys.path.insert(0, {DATA_DIR!r})
+from rosbags_common import serve_jobs
+print("starting up")
+root = sys.argv[-1]
+def run_job(argv):
+    *options, input_dir = argv
+    print("pid", os.getpid(), "input", os.path.relpath(input_dir, root))
+    if "--fail" in options:
+        return 3
+    if "--provenance-file" in options:
+        path = options[options.index("--provenance-file") + 1]
+        with open(path, "w") as f:
+            json.dump({{"entries": [{{"output": "x.csv"}}]}}, f)
+    return 0
+serve_jobs(root, run_job)
+"""
+
+
+@pytest.fixture(name="worker")
+def _worker(tmp_path):
+    script = tmp_path / "server.py"
+    script.write_text(FAKE_SERVER)
+    (tmp_path / "campaign" / "cfg").mkdir(parents=True)
+    w = RosbagsWorker(str(tmp_path / "campaign"), command=[sys.executable, str(script)])
+    yield w
+    w.close()
+
+
+def test_jobs_reuse_one_process(worker, tmp_path):
+    lines = []
+    assert worker.run(["--config", "{}"], str(tmp_path / "campaign" / "cfg"),
+                      on_line=lines.append) == 0
+    assert worker.run([], str(tmp_path / "campaign"), on_line=lines.append) == 0
+    pids = {line.split()[1] for line in lines}
+    assert len(pids) == 1 and str(worker.process.pid) in pids
+    assert [line.split()[-1] for line in lines] == ["cfg", "."]
+    assert worker.run(["--fail"], str(tmp_path / "campaign")) == 3
+    assert worker.alive and worker.covers(str(tmp_path / "campaign" / "cfg"))
+    assert not worker.covers(str(tmp_path))
+
+
+def test_provenance_is_moved_to_requested_file(worker, tmp_path):
+    target = tmp_path / "0_provenance.json"
+    assert worker.run([], str(tmp_path / "campaign"), provenance_file=str(target)) == 0
+    assert json.loads(target.read_text())["entries"][0]["output"] == "x.csv"
+
+
+def test_failed_start_falls_back(tmp_path, monkeypatch):
+    with pytest.raises(RuntimeError, match="start-up"):
+        RosbagsWorker(str(tmp_path), command=[sys.executable, "-c", "print('no ros here')"])
+
+    def _broken(*_args, **_kwargs):
+        raise RuntimeError("no docker")
+
+    monkeypatch.setattr(rosbags_worker, "RosbagsWorker", _broken)
+    assert rosbags_worker.get_worker(str(tmp_path)) is None
+
+
+def test_worker_that_never_gets_ready_is_killed(tmp_path):
+    hang = [sys.executable, "-c", "print('pulling image', flush=True); import time; time.sleep(60)"]
+    with pytest.raises(RuntimeError, match="ready within 0.5s") as exc:
+        RosbagsWorker(str(tmp_path), command=hang, startup_timeout=0.5)
+    assert "pulling image" in str(exc.value)
+
+
+class _SlowWorker:
+    """Stands in for RosbagsWorker; starting the "slow" root blocks on *release*."""
+
+    starting = threading.Event()
+    release = threading.Event()
+    started = []
+
+    def __init__(self, root, image=None):
+        self.root, self.image, self.alive = root, image, True
+        _SlowWorker.started.append(root)
+        if root.endswith("slow"):
+            _SlowWorker.starting.set()
+            _SlowWorker.release.wait(10)
+
+    def covers(self, path):
+        return path == self.root
+
+    def close(self):
+        self.alive = False
+
+
+def test_slow_start_does_not_block_other_roots(tmp_path, monkeypatch):
+    monkeypatch.setattr(rosbags_worker, "RosbagsWorker", _SlowWorker)
+    slow, fast = str(tmp_path / "slow"), str(tmp_path / "fast")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(rosbags_worker.get_worker(slow)))
+               for _ in range(2)]
+    try:
+        for thread in threads:
+            thread.start()
+        assert _SlowWorker.starting.wait(10)
+        assert rosbags_worker.get_worker(fast).root == fast
+        _SlowWorker.release.set()
+        for thread in threads:
+            thread.join(10)
+        assert len(results) == 2 and results[0] is results[1]
+        assert sorted(_SlowWorker.started) == [fast, slow]
+    finally:
+        _SlowWorker.release.set()
+        rosbags_worker.shutdown_warm_workers()
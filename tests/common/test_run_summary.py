@@ -0,0 +1,90 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Campaign-level test.xml summary cache."""
+
+import os
+
+import pytest
+
+from robovast.common import run_summary
+from robovast.common.analysis import get_run_status, read_run_statuses
+from robovast.common.campaign_data import aggregate_run_status, read_test_result
+from robovast.common.run_summary import RUN_SUMMARY_FILENAME, read_run_summaries
+
+PASSED = """<?xml version="1.0"?>
+<testsuite errors="0" failures="0" tests="1">
+  <testcase name="t" time="12.5">
+    <properties><property name="start_time" value="1700000000"/></properties>
+  </testcase>
+</testsuite>
+"""
+
+FAILED = """<?xml version="1.0"?>
+<testsuite errors="0" failures="1" tests="1">
+  <testcase name="t" time="3">
+    <failure message="boom">step 1
+[✕] -- goal not reached
+</failure>
+  </testcase>
+</testsuite>
+"""
+
+
+@pytest.fixture(name="campaign")
+def _campaign(tmp_path):
+    campaign = tmp_path / "campaign-x"
+    for i, xml in enumerate([PASSED, FAILED, "<testsuite"]):
+        run = campaign / "cfg" / str(i)
+        run.mkdir(parents=True)
+        (run / "test.xml").write_text(xml, encoding="utf-8")
+    (campaign / "cfg" / "3").mkdir()
+    # The in-process memo would serve summaries cached by an earlier test.
+    run_summary._memo.clear()  # pylint: disable=protected-access
+    return campaign
+
+
+def test_summaries_match_parsed_results(campaign):
+    cfg = campaign / "cfg"
+    summaries = read_run_summaries([cfg / str(i) for i in range(4)])
+
+    assert summaries[cfg / "0"]["success"] is True
+    assert summaries[cfg / "0"]["duration_sec"] == 12.5
+    assert summaries[cfg / "0"]["start_time"].startswith("2023-11-14T22:13:20")
+    assert summaries[cfg / "1"]["status"] == "failed"
+    assert summaries[cfg / "1"]["summary"] == "goal not reached"
+    assert summaries[cfg / "1"]["failure_message"] == "boom"
+    assert summaries[cfg / "2"]["status"] == "unknown"
+    assert summaries[cfg / "3"] is None
+
+    assert get_run_status(cfg / "1") == ("failed", "goal not reached")
+    assert get_run_status(cfg / "3") == ("unknown", None)
+    assert aggregate_run_status([cfg / str(i) for i in range(4)]) == "mixed"
+    assert list(read_run_statuses(str(campaign))["status"]) == ["passed", "failed", "unknown"]
+    with pytest.raises(ValueError):
+        read_test_result(cfg / "2")
+    with pytest.raises(FileNotFoundError):
+        read_test_result(cfg / "3")
+
+
+def test_cache_persists_and_detects_changes(campaign, monkeypatch):
+    cfg = campaign / "cfg"
+    read_run_summaries([cfg / "0", cfg / "1"])
+    assert (campaign / ".cache" / RUN_SUMMARY_FILENAME).exists()
+
+    # A fresh process (empty memo) is served from the database without parsing.
+    run_summary._memo.clear()  # pylint: disable=protected-access
+    parsed = []
+    real_parse = run_summary.parse_test_xml
+    monkeypatch.setattr(run_summary, "parse_test_xml", lambda p: parsed.append(p) or real_parse(p))
+    assert read_run_summaries([cfg / "0", cfg / "1"])[cfg / "1"]["status"] == "failed"
+    assert not parsed
+
+    # Rewriting a test.xml invalidates only that run.
+    xml = cfg / "1" / "test.xml"
+    xml.write_text(PASSED, encoding="utf-8")
+    st = xml.stat()
+    os.utime(xml, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert read_run_summaries([cfg / "0", cfg / "1"])[cfg / "1"]["status"] == "passed"
+    assert parsed == [xml]
@@ -0,0 +1,182 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Resumable, concurrent uploads of the Zenodo publication plugin against a
+local stand-in for the InvenioRDM files API."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from robovast.results_processing.publication_plugins import zenodo
+from robovast.results_processing.publication_plugins.zenodo import Zenodo
+
+MIB = 1024 * 1024
+
+
+class FakeZenodo(ThreadingHTTPServer):
+    """Draft record 1 with the files endpoints the plugin uses."""
+
+    daemon_threads = True
+
+    def __init__(self, multipart=True):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.multipart = multipart
+        self.files = {}
+        self.requests = []
+        self.drop = set()   # (key, part) requests to cut off once
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/api"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):  # keep pytest output clean
+        pass
+
+    def _reply(self, status, body=None):
+        data = json.dumps(body or {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _entry(self, key):
+        f = self.server.files[key]
+        return {"key": key, "status": f["status"], "checksum": f.get("checksum")}
+
+    def do_GET(self):  # noqa: N802  # pylint: disable=invalid-name
+        if self.path.endswith("/draft"):
+            return self._reply(200, {"id": 1, "metadata": {}})
+        with self.server.lock:
+            return self._reply(200, {"entries": [self._entry(k) for k in self.server.files]})
+
+    def do_POST(self):  # noqa: N802  # pylint: disable=invalid-name
+        body = self._body()
+        srv = self.server
+        match = re.search(r"/draft/files/([^/]+)/commit$", self.path)
+        with srv.lock:
+            if match:
+                f = srv.files[match.group(1)]
+                data = b"".join(f["parts"][i] for i in sorted(f["parts"]))
+                f.update(status="completed", data=data,
+                         checksum=f"md5:{hashlib.md5(data).hexdigest()}")
+                return self._reply(200, self._entry(match.group(1)))
+            (item,) = json.loads(body)
+            if "transfer" in item and not srv.multipart:
+                return self._reply(400, {"message": "transfer type not supported"})
+            key = item["key"]
+            srv.files[key] = {"status": "pending", "parts": {}}
+            links = {}
+            if "transfer" in item:
+                links["parts"] = [{"part": i, "url": f"{srv.url}/records/1/draft/files/{key}/content/{i}"}
+                                  for i in range(1, item["transfer"]["parts"] + 1)]
+            return self._reply(201, {"entries": [{**self._entry(key), "links": links}]})
+
+    def do_PUT(self):  # noqa: N802  # pylint: disable=invalid-name
+        key, part = re.search(r"/draft/files/([^/]+)/content(?:/(\d+))?$", self.path).groups()
+        part = int(part or 0)
+        body = self._body()
+        with self.server.lock:
+            self.server.requests.append((key, part))
+            if (key, part) in self.server.drop:
+                self.server.drop.discard((key, part))
+                self.close_connection = True
+                self.connection.close()
+                return None
+            self.server.files[key]["parts"][part] = body
+        return self._reply(200, {})
+
+    def do_DELETE(self):  # noqa: N802  # pylint: disable=invalid-name
+        with self.server.lock:
+            self.server.files.pop(self.path.rsplit("/", 1)[1], None)
+        return self._reply(204)
+
+
+@pytest.fixture(name="server")
+def _server(monkeypatch):
+    srv = FakeZenodo()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(zenodo, "_ZENODO_BASE", srv.url)
+    monkeypatch.setattr(zenodo.time, "sleep", lambda _s: None)
+    monkeypatch.setenv("ZENODO_ACCESS_TOKEN", "token")
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _artifacts(tmp_path):
+    paths = []
+    for name, size in (("a.zip", int(2.5 * MIB)), ("b.zip", MIB // 2)):
+        path = tmp_path / name
+        path.write_bytes(os.urandom(size))
+        paths.append(str(path))
+    return paths
+
+
+def _publish(tmp_path, artifacts, **kwargs):
+    return Zenodo()(str(tmp_path), str(tmp_path), record_id=1, overwrite=True,
+                    part_size_mb=1, _artifacts=artifacts, **kwargs)
+
+
+def test_interrupted_multipart_upload_resumes(server, tmp_path):
+    artifacts = _artifacts(tmp_path)
+    server.drop.add(("a.zip", 2))
+    ok, message, _ = _publish(tmp_path, artifacts, retries=0)
+    assert not ok and "a.zip" in message and "uploaded: b.zip" in message
+    state = json.loads((tmp_path / ".robovast_zenodo_uploads.json").read_text())
+    assert [u["done"] for u in state["uploads"].values()] == [[1]]
+
+    server.requests.clear()
+    ok, message, _ = _publish(tmp_path, artifacts)
+    assert ok, message
+    assert "uploaded: a.zip" in message and "unchanged: b.zip" in message
+    assert server.requests == [("a.zip", 2), ("a.zip", 3)]
+    with open(artifacts[0], "rb") as f:
+        assert server.files["a.zip"]["data"] == f.read()
+
+    server.requests.clear()
+    ok, message, _ = _publish(tmp_path, artifacts)
+    assert ok and "unchanged: a.zip, b.zip" in message and not server.requests
+    assert json.loads((tmp_path / ".robovast_zenodo_uploads.json").read_text())["uploads"] == {}
+
+
+def test_single_request_upload_is_retried(server, tmp_path):
+    server.multipart = False
+    artifacts = _artifacts(tmp_path)
+    server.drop.add(("a.zip", 0))
+    ok, message, _ = _publish(tmp_path, artifacts, retries=1, parallel_uploads=2)
+    assert ok and "uploaded: a.zip, b.zip" in message
+    assert server.requests.count(("a.zip", 0)) == 2
+    assert server.files["a.zip"]["status"] == "completed"
+
+
+def test_new_files_are_hashed_while_uploading(server, tmp_path, monkeypatch):
+    artifacts = _artifacts(tmp_path)
+    hashed = []
+    md5 = zenodo._UploadState.md5  # pylint: disable=protected-access
+    monkeypatch.setattr(zenodo._UploadState, "md5",  # pylint: disable=protected-access
+                        lambda self, path: hashed.append(path.name) or md5(self, path))
+    server.drop.add(("b.zip", 0))
+    ok, message, _ = _publish(tmp_path, artifacts, retries=1)
+    assert ok and "uploaded: a.zip, b.zip" in message
+    assert not hashed
+    checksums = json.loads((tmp_path / ".robovast_zenodo_uploads.json").read_text())["checksums"]
+    for path in artifacts:
+        with open(path, "rb") as f:
+            assert checksums[os.path.realpath(path)][2] == hashlib.md5(f.read()).hexdigest()
@@ -0,0 +1,84 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Parallel deflating and store-only members of the zip publication plugin."""
+
+import os
+import struct
+import zipfile
+
+from robovast.results_processing.publication_plugins import zip as zip_module
+from robovast.results_processing.publication_plugins.zip import Zip
+
+
+def _campaign(results, name):
+    run = results / name / "cfg" / "0"
+    run.mkdir(parents=True)
+    (run / "trajectory.csv").write_text("x,y\n" + "1,2\n" * 50000)
+    (run / "rosbag2.mcap").write_bytes(os.urandom(200000))
+    (run / "empty.txt").write_bytes(b"")
+    os.symlink("trajectory.csv", run / "latest.csv")
+    return results / name
+
+
+def _contents(path):
+    with zipfile.ZipFile(path) as zf:
+        assert zf.testzip() is None
+        return {i.filename: (i.compress_type, zf.read(i)) for i in zf.infolist()}
+
+
+def test_parallel_archives_match_sequential_ones(tmp_path):
+    results = tmp_path / "results"
+    for name in ("campaign-2026-01-01-000000", "campaign-2026-01-02-000000"):
+        _campaign(results, name)
+
+    ok, message, artifacts = Zip()(str(results), str(tmp_path), destination="seq", overwrite=True)
+    assert ok, message
+    assert len(artifacts) == 2 and "B/s)" in message
+    ok, message, parallel = Zip()(str(results), str(tmp_path), destination="par",
+                                  overwrite=True, workers=2, metadata={"title": "t"})
+    assert ok, message
+
+    sequential = _contents(artifacts[0])
+    members = _contents(parallel[0])
+    prefix = "campaign-2026-01-01-000000/cfg/0/"
+    assert members[prefix + "rosbag2.mcap"][0] == zipfile.ZIP_STORED
+    assert members[prefix + "trajectory.csv"][0] == zipfile.ZIP_DEFLATED
+    assert members[prefix + "latest.csv"][1] == b"trajectory.csv"
+    assert {k: v for k, v in members.items() if not k.endswith("metadata.yaml")} == sequential
+    assert not [p for p in (results / "par").iterdir() if p.name.startswith(".robovast")]
+
+
+def test_large_members_are_spooled(tmp_path, monkeypatch):
+    monkeypatch.setattr(zip_module, "_INLINE_LIMIT", 1000)
+    results = tmp_path / "results"
+    campaign = _campaign(results, "campaign-2026-01-01-000000")
+    ok, message, artifacts = Zip()(str(results), str(tmp_path), overwrite=True, store_extensions=[])
+    assert ok, message
+    members = _contents(artifacts[0])
+    assert members["campaign-2026-01-01-000000/cfg/0/rosbag2.mcap"] == \
+        (zipfile.ZIP_DEFLATED, (campaign / "cfg" / "0" / "rosbag2.mcap").read_bytes())
+
+
+def test_copied_members_get_zip64_headers_past_the_limit(tmp_path, monkeypatch):
+    results = tmp_path / "results"
+    campaign = _campaign(results, "campaign-2026-01-01-000000")
+    with monkeypatch.context() as patch:
+        patch.setattr(zipfile, "ZIP64_LIMIT", 1000)    # members above 1000 bytes need ZIP64
+        ok, message, artifacts = Zip()(str(results), str(tmp_path), overwrite=True,
+                                       store_extensions=[], workers=2)
+    assert ok, message
+    members = _contents(artifacts[0])
+    member = "campaign-2026-01-01-000000/cfg/0/trajectory.csv"
+    assert members[member] == (zipfile.ZIP_DEFLATED,
+                               (campaign / "cfg" / "0" / "trajectory.csv").read_bytes())
+    with zipfile.ZipFile(artifacts[0]) as zf, open(artifacts[0], "rb") as raw:
+        info = zf.getinfo(member)
+        raw.seek(info.header_offset)
+        header = raw.read(30)
+        name_len, extra_len = struct.unpack("<HH", header[26:30])
+        raw.seek(name_len, os.SEEK_CUR)
+        extra = raw.read(extra_len)
+    assert struct.unpack("<II", header[18:26]) == (0xFFFFFFFF, 0xFFFFFFFF)
+    assert struct.unpack("<HH", extra[:4])[0] == 0x0001    # ZIP64 extended information
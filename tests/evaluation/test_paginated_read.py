@@ -0,0 +1,66 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the indexed paginated and streaming reads of MCP plugin files."""
+
+import pytest
+
+from robovast.evaluation.mcp_server import plugin_common
+from robovast.evaluation.mcp_server.plugin_common import (_read_text_paginated,
+                                                          _search_text)
+
+
+@pytest.fixture(autouse=True)
+def _small_blocks(monkeypatch):
+    # Force many index checkpoints on a small file; indexes cached by an
+    # earlier test were built with the default block size.
+    monkeypatch.setattr(plugin_common, "_INDEX_BLOCK_SIZE", 64)
+    plugin_common._line_index_cache.clear()  # pylint: disable=protected-access
+
+
+def _write_log(path, n=500, trailing_newline=True):
+    text = "\n".join(f"line {i} {'ERROR' if i % 50 == 0 else 'ok'}" + ("\r" if i % 7 == 0 else "")
+                     for i in range(n))
+    path.write_text(text + ("\n" if trailing_newline else ""), encoding="utf-8", newline="")
+    return text
+
+
+@pytest.mark.parametrize("trailing_newline", [True, False])
+@pytest.mark.parametrize("offset,lines", [(0, 10), (123, 40), (490, 100), (500, 5), (-25, 100)])
+def test_page_matches_full_read(tmp_path, trailing_newline, offset, lines):
+    path = tmp_path / "launch.log"
+    all_lines = _write_log(path, trailing_newline=trailing_newline).splitlines()
+
+    result = _read_text_paginated(path, lines, offset)
+
+    start = max(len(all_lines) + offset, 0) if offset < 0 else offset
+    assert result["total_lines"] == len(all_lines)
+    assert result["offset"] == start
+    assert result["content"] == "\n".join(all_lines[start:start + lines])
+    assert result["returned_lines"] == len(all_lines[start:start + lines])
+
+
+def test_index_rebuilt_when_file_changes(tmp_path):
+    path = tmp_path / "out.log"
+    _write_log(path, n=10)
+    assert _read_text_paginated(path, 5, -1)["content"] == "line 9 ok"
+    _write_log(path, n=300)
+    result = _read_text_paginated(path, 5, -1)
+    assert result["total_lines"] == 300
+    assert result["content"] == "line 299 ok"
+
+
+def test_search_streams_and_continues(tmp_path):
+    path = tmp_path / "rosout.log"
+    _write_log(path)
+
+    first = _search_text(path, r"ERROR", max_matches=4)
+    assert [m["line"] for m in first["matches"]] == [0, 50, 100, 150]
+    assert first["next_offset"] == 151
+
+    rest = _search_text(path, r"ERROR", max_matches=100, offset=first["next_offset"])
+    assert [m["line"] for m in rest["matches"]] == [200, 250, 300, 350, 400, 450]
+    assert rest["next_offset"] is None
+
+    assert "error" in _search_text(path, r"(")
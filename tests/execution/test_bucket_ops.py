@@ -0,0 +1,143 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Concurrent batched campaign deletion in bucket_ops against an in-memory S3."""
+
+import contextlib
+import threading
+
+import pytest
+
+from robovast.execution.cluster_execution import bucket_ops
+
+CAMP_A = "campaign-2026-01-01-000000"
+CAMP_B = "campaign-2026-01-02-000000"
+RUNNING = "campaign-2026-01-03-000000"
+
+
+class _Paginator:
+    def __init__(self, client):
+        self._s3 = client
+
+    def paginate(self, Bucket, Prefix="", Delimiter=None):  # noqa: N803  # pylint: disable=invalid-name
+        self._s3.listings.append((Bucket, Prefix, Delimiter))
+        keys = sorted(k for k in self._s3.buckets[Bucket] if k.startswith(Prefix))
+        contents, prefixes = [], []
+        for key in keys:
+            rest = key[len(Prefix):]
+            if Delimiter and Delimiter in rest:
+                sub = Prefix + rest.split(Delimiter, 1)[0] + Delimiter
+                if sub not in prefixes:
+                    prefixes.append(sub)
+            else:
+                contents.append({"Key": key})
+        for i in range(0, max(len(contents), 1), 1000):
+            yield {"Contents": contents[i:i + 1000],
+                   "CommonPrefixes": [{"Prefix": p} for p in prefixes] if i == 0 else []}
+
+
+class FakeS3:
+    """The subset of a boto3 S3 client that bucket_ops uses."""
+
+    def __init__(self, buckets):
+        self.buckets = {name: set(keys) for name, keys in buckets.items()}
+        self.listings = []
+        self.batches = []
+        self.fail_keys = set()
+        self.lock = threading.Lock()
+
+    def get_paginator(self, name):
+        assert name == "list_objects_v2"
+        return _Paginator(self)
+
+    def delete_objects(self, Bucket, Delete):  # noqa: N803  # pylint: disable=invalid-name
+        keys = [obj["Key"] for obj in Delete["Objects"]]
+        with self.lock:
+            self.batches.append(len(keys))
+            failed = [k for k in keys if k in self.fail_keys]
+            self.buckets[Bucket].difference_update(set(keys) - self.fail_keys)
+        return {"Errors": [{"Key": k, "Code": "AccessDenied"} for k in failed]}
+
+    def list_buckets(self):
+        return {"Buckets": [{"Name": name} for name in self.buckets]}
+
+    def delete_bucket(self, Bucket):  # noqa: N803  # pylint: disable=invalid-name
+        assert not self.buckets[Bucket]
+        del self.buckets[Bucket]
+
+
+class _Config:
+    def __init__(self, shared_bucket="results"):
+        self.shared_bucket = shared_bucket
+
+    def get_storage_backend(self):
+        return "s3"
+
+    def get_s3_bucket(self):
+        return self.shared_bucket
+
+
+def _campaign_keys(campaign, configs=3, runs=1200):
+    keys = {f"{campaign}/_execution/campaign.db"}
+    for c in range(configs):
+        keys |= {f"{campaign}/config{c}/{r}/test.xml" for r in range(runs)}
+    return keys
+
+
+@pytest.fixture(name="s3")
+def _s3(monkeypatch):
+    fake = FakeS3({"results": _campaign_keys(CAMP_A) | _campaign_keys(CAMP_B, 1, 10)
+                   | _campaign_keys(RUNNING, 1, 5) | {"other/keep.txt"}})
+    connections = []
+
+    @contextlib.contextmanager
+    def _connection(_config, _namespace, _context):
+        connections.append(1)
+        yield fake
+
+    monkeypatch.setattr(bucket_ops, "_s3_connection", _connection)
+    fake.connections = connections
+    return fake
+
+
+def test_cleanup_deletes_in_concurrent_batches_of_1000(s3, monkeypatch):
+    monkeypatch.setattr(bucket_ops, "_PROGRESS_INTERVAL", 0.0)
+    samples = []
+    removed = bucket_ops.cleanup_campaigns(
+        _Config(), running_campaigns={RUNNING}, workers=4,
+        progress_callback=lambda n, rate: samples.append(n))
+    assert removed == 2 and len(s3.connections) == 1
+    assert s3.buckets["results"] == _campaign_keys(RUNNING, 1, 5) | {"other/keep.txt"}
+    assert max(s3.batches) == 1000 and sum(s3.batches) == samples[-1] == 3601 + 11
+    # Campaigns and their sub-prefixes come from delimiter listings; only the
+    # leaves below a campaign's configs are listed recursively.
+    assert ("results", "", "/") in s3.listings
+    assert all(delim == "/" or prefix.count("/") == 2 for _b, prefix, delim in s3.listings)
+    assert not any(prefix.startswith((RUNNING, "other")) for _b, prefix, _d in s3.listings[1:])
+
+
+def test_failed_keys_fail_only_their_campaign(s3):
+    s3.fail_keys = {f"{CAMP_A}/config1/5/test.xml"}
+    assert bucket_ops.cleanup_campaigns(_Config(), running_campaigns={RUNNING}) == 1
+    assert s3.buckets["results"] & _campaign_keys(CAMP_A) == s3.fail_keys
+    assert not s3.buckets["results"] & _campaign_keys(CAMP_B, 1, 10)
+
+
+def test_per_bucket_campaign_is_emptied_and_removed(monkeypatch):
+    fake = FakeS3({CAMP_A: {f"config{c}/{r}/test.xml" for c in range(2) for r in range(1500)},
+                   "unrelated": {"x"}})
+
+    @contextlib.contextmanager
+    def _connection(_config, _namespace, _context):
+        yield fake
+
+    monkeypatch.setattr(bucket_ops, "_s3_connection", _connection)
+    bucket_ops.delete_campaign(CAMP_A, _Config(shared_bucket=None), workers=3)
+    assert set(fake.buckets) == {"unrelated"}
+    assert sorted(fake.batches) == [500, 500, 1000, 1000]
+
+
+def test_empty_prefix_is_refused():
+    with pytest.raises(ValueError, match="empty prefix"):
+        bucket_ops._delete_s3_prefix(FakeS3({"b": {"k"}}), "b", "")  # pylint: disable=protected-access
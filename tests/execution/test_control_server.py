@@ -118,3 +118,21 @@ def test_stop_abandons_pending_upload_wait():
     state.request_stop()
     action, overrides = state.wait_for_retrigger()
     assert action == "abandon" and not overrides
+
+
+def test_queue_endpoints_serve_registered_work_queue():
+    from robovast.execution.work_queue import QueueUnit, WorkQueue
+    state = ControllerState()
+    client = _client(state)
+    assert client.post("/queue/b0/claim", json={"worker": "w"}).status_code == 404
+
+    queue = WorkQueue([QueueUnit("b0-job-0", "doc", [["c0", 0]])])
+    state.register_queue("b0", queue)
+    claimed = client.post("/queue/b0/claim", json={"worker": "w"}).json()
+    assert claimed["unit"]["id"] == "b0-job-0" and claimed["done"] is False
+    body = {"worker": "w", "unit": "b0-job-0",
+            "timings": [{"config": "c0", "run": 0, "run_s": 1.5}]}
+    assert client.post("/queue/b0/complete", json=body).json() == {"accepted": True}
+    assert client.post("/queue/b0/claim", json={"worker": "w"}).json() == \
+        {"unit": None, "done": True}
+    assert queue.timings()[0]["run_s"] == 1.5
@@ -0,0 +1,144 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Duration-aware job packing (packer.LongestProcessingTimeFirst, DurationModel)."""
+
+import csv
+
+import pytest
+
+from robovast.execution.packer import (DURATION_KEY, DurationModel, FixedK,
+                                       LongestProcessingTimeFirst,
+                                       annotate_durations, build_jobs,
+                                       build_work_items, makespan_report,
+                                       select_packer)
+
+
+def _configs(durations):
+    return [{"name": f"c{i}", DURATION_KEY: d} for i, d in enumerate(durations)]
+
+
+def _write_run(root, config, run, seconds):
+    run_dir = root / config / str(run)
+    run_dir.mkdir(parents=True)
+    (run_dir / "test.xml").write_text(
+        f'<testsuite errors="0" failures="0" tests="1">'
+        f'<testcase name="t" time="{seconds}"/></testsuite>')
+
+
+def test_lpt_balances_against_config_order_chunks():
+    # One slow config among fast ones: FixedK puts it with three others.
+    items = build_work_items(_configs([50, 10, 10, 10, 10, 10, 10, 10]), runs=1)
+    fixed = max(sum(it.config[DURATION_KEY] for it in job.items)
+                for job in FixedK(4).pack(items))
+    jobs = LongestProcessingTimeFirst(target_s=60).pack(items)
+    assert len(jobs) == 2
+    assert sorted(job.predicted_s for job in jobs) == [60, 60]
+    assert max(job.predicted_s for job in jobs) < fixed == 80
+    assert sorted(it.config_name for job in jobs for it in job.items) == \
+        sorted(f"c{i}" for i in range(8))
+
+
+def test_lpt_keeps_config_major_order_and_caps_items():
+    items = build_work_items(_configs([5, 5]), runs=3)
+    jobs = LongestProcessingTimeFirst(target_s=100, max_items=2).pack(items)
+    assert len(jobs) == 3 and all(len(job) <= 2 for job in jobs)
+    for job in jobs:
+        keys = [(it.config_name, it.run_number) for it in job.items]
+        assert keys == sorted(keys)
+    assert [job.index for job in jobs] == [0, 1, 2]
+
+
+def test_select_packer_by_job_duration():
+    assert isinstance(select_packer({"job_duration": 300}), LongestProcessingTimeFirst)
+    assert select_packer({"job_duration": 300, "runs_per_job": 4}).max_items == 4
+    with pytest.raises(ValueError):
+        LongestProcessingTimeFirst(target_s=0)
+
+
+def test_model_uses_history_then_feature_fit_then_median(tmp_path):
+    for run, seconds in enumerate([10, 14]):
+        _write_run(tmp_path / "old", "near", run, seconds)
+    _write_run(tmp_path / "old", "far", 0, 32)
+    model = DurationModel.from_campaigns([tmp_path / "old"])
+
+    configs = [{"name": "near", "config": {"_path_length": 1.0}},
+               {"name": "far", "_path_length": 3.0},
+               {"name": "new", "_path_length": 2.0},
+               {"name": "plain"}]
+    model.annotate(configs)
+    assert [c[DURATION_KEY] for c in configs] == \
+        pytest.approx([12.0, 32.0, 22.0, 22.0])
+    assert DurationModel(default_s=7).predict([{"name": "x"}]) == {"x": 7}
+
+
+def test_makespan_report_compares_prediction_with_runs(tmp_path):
+    configs = _configs([30, 10, 10])
+    jobs = build_jobs(configs, 1, {"job_duration": 30})
+    for name, seconds in (("c0", 45), ("c1", 8), ("c2", 9)):
+        _write_run(tmp_path, name, 0, seconds)
+    report = makespan_report(jobs, str(tmp_path))
+    assert report["jobs"] == 2
+    assert report["predicted_s"] == 30 and report["actual_s"] == 45
+    assert report["run_s"] == {"c0": [45.0], "c1": [8.0], "c2": [9.0]}
+
+
+def _campaign(root, vast_text, config, seconds):
+    from robovast.common.store import STORE_FILENAME
+    _write_run(root, config, 0, seconds)
+    (root / STORE_FILENAME).touch()
+    (root / "_config").mkdir()
+    (root / "_config" / "campaign.vast").write_text(vast_text)
+
+
+def test_annotate_durations_outside_the_controller(tmp_path):
+    vast = tmp_path / "campaign.vast"
+    vast.write_text("version: 1\n")
+    results = tmp_path / "results"
+    _campaign(results / "camp-old", "version: 1\n", "c0", 40)
+    _campaign(results / "camp-other", "version: 2\n", "c1", 500)
+    _write_run(results / "not-a-campaign", "c1", 0, 5)
+
+    configs = [{"name": "c0"}, {"name": "c1"}]
+    assert annotate_durations(configs, {}, results, str(vast)) is None
+    assert not any(DURATION_KEY in c for c in configs)
+    assert annotate_durations(configs, {"job_duration": 60}, results, str(vast)) is not None
+    # "c1" of another .vast is not history: it gets the median of "c0".
+    assert [c[DURATION_KEY] for c in configs] == [40.0, 40.0]
+    # Configs the controller already annotated are left alone.
+    assert annotate_durations(configs, {"job_duration": 60}, None) is None
+    # Without the .vast nothing is comparable.
+    fresh = [{"name": "c0"}]
+    annotate_durations(fresh, {"job_duration": 60}, results)
+    assert fresh[0][DURATION_KEY] == 60.0
+
+def test_controller_annotates_and_learns_durations(tmp_path):
+    from robovast.common.store import STORE_FILENAME, CampaignStore
+    from robovast.execution.backends import RunOptions, StandInBackend
+    from robovast.execution.controller import CampaignController
+
+    seen = []
+
+    def _run(config, run_dir):
+        seen.append(config[DURATION_KEY])
+        with open(f"{run_dir}/test.xml", "w", encoding="utf-8") as f:
+            f.write('<testsuite errors="0" failures="0" tests="1">'
+                    '<testcase name="t" time="20"/></testsuite>')
+
+    store = CampaignStore(tmp_path / "camp" / STORE_FILENAME)
+    controller = CampaignController(
+        campaign_id="camp", results_dir=str(tmp_path), runs=2,
+        backend=StandInBackend(_run), options=RunOptions(), store=store,
+        campaign_config_dump={"version": 1}, vast_dir=str(tmp_path),
+        batch_campaign_data={"execution": {"job_duration": 30},
+                             "configs": [{"name": "c0"}, {"name": "c1"}]})
+    controller.run()
+    store.close()
+    assert seen == [60.0] * 4          # no history yet: the default prediction
+    assert controller._durations.known("c0") == 20.0  # pylint: disable=protected-access
+    with open(tmp_path / "camp" / "_execution" / "makespan.csv", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 1
+    assert rows[0]["jobs"] == "4" and float(rows[0]["predicted_s"]) == 60.0
+    assert float(rows[0]["actual_s"]) == 20.0
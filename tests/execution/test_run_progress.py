@@ -0,0 +1,83 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Incremental run-progress counting (in_pod_storage.RunProgressTracker)."""
+
+from robovast.execution.cluster_execution.in_pod_storage import \
+    RunProgressTracker
+
+
+class FakeStorage:
+    """In-memory keys with delimited listings; records every listed prefix
+    and how many entries each listing returned."""
+
+    def __init__(self):
+        self.keys = set()
+        self.listed = []
+        self.returned = 0
+
+    def list_children(self, bucket, prefix=""):
+        self.listed.append(prefix)
+        children = sorted({k[len(prefix):].split("/")[0] + ("/" if "/" in k[len(prefix):] else "")
+                           for k in self.keys if k.startswith(prefix)})
+        self.returned += len(children)
+        return children
+
+
+def _finish(storage, config, run, prefix="camp/"):
+    storage.keys.add(f"{prefix}{config}/{run}/test.xml")
+    storage.keys.add(f"{prefix}{config}/{run}/trajectory.csv")
+
+
+def test_counts_only_tracked_configs_incrementally():
+    storage = FakeStorage()
+    for run in range(50):
+        _finish(storage, "old", run)          # earlier batch, never tracked
+    tracker = RunProgressTracker(storage, "bucket", "camp/")
+    assert tracker.count() == 0 and not storage.listed
+
+    tracker.track(["a", "b"], runs=2)
+    _finish(storage, "a", 0)
+    assert tracker.count() == 1
+    _finish(storage, "a", 1)
+    _finish(storage, "b", 0)
+    assert tracker.count() == 3
+
+    # "a" is complete and no longer listed; of "b" only the unfinished run is.
+    storage.listed.clear()
+    assert tracker.count() == 3
+    assert storage.listed == ["camp/b/"]
+    _finish(storage, "b", 1)
+    storage.listed.clear()
+    assert tracker.count() == 4
+    assert storage.listed == ["camp/b/", "camp/b/1/"]
+
+
+def test_retire_takes_final_count_and_stops_listing():
+    storage = FakeStorage()
+    tracker = RunProgressTracker(storage, "bucket", "")
+    tracker.track(["c"], runs=3)
+    _finish(storage, "c", 0, prefix="")
+    tracker.retire(["c"])                      # one run failed to report
+    storage.listed.clear()
+    assert tracker.count() == 1
+    assert not storage.listed
+
+
+def test_ignores_nested_and_similarly_named_keys():
+    storage = FakeStorage()
+    tracker = RunProgressTracker(storage, "bucket", "")
+    tracker.track(["c"], runs=2)
+    storage.keys.update({"c/0/sub/test.xml", "c10/0/test.xml", "c/1/test.xml"})
+    assert tracker.count() == 1
+
+
+def test_artifact_trees_below_a_run_are_not_listed():
+    storage = FakeStorage()
+    tracker = RunProgressTracker(storage, "bucket", "")
+    tracker.track(["c"], runs=2)
+    storage.keys.update(f"c/0/rosbag/chunk_{i}.mcap" for i in range(500))
+    storage.keys.add("c/0/test.xml")
+    assert tracker.count() == 1
+    assert storage.returned < 10
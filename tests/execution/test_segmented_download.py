@@ -0,0 +1,152 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Segmented, resumable share downloads (share_providers.segmented)."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import click
+import pytest
+
+from robovast.execution.cluster_execution.share_providers import segmented
+from robovast.execution.cluster_execution.share_providers.segmented import (
+    STATE_SUFFIX, download_segmented)
+from robovast.execution.cluster_execution.share_providers.webdav import \
+    WebDavShareProvider
+
+PAYLOAD = os.urandom(300_000)
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Serves PAYLOAD as /dav/c.tar.gz with range and OC-Checksum support."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _headers(self, status, length):
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        self.send_header("OC-Checksum", f"MD5:{hashlib.md5(PAYLOAD).hexdigest()}")
+
+    def do_HEAD(self):  # noqa: N802  # pylint: disable=invalid-name
+        self._headers(200, len(PAYLOAD))
+        self.end_headers()
+
+    def do_GET(self):  # noqa: N802  # pylint: disable=invalid-name
+        start, end = map(int, re.match(r"bytes=(\d+)-(\d+)", self.headers["Range"]).groups())
+        self.server.ranges.append(start)
+        body = PAYLOAD[start:end + 1]
+        self._headers(206, len(body))
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(name="webdav")
+def _webdav(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    server.ranges = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("ROBOVAST_WEBDAV_URL", f"http://127.0.0.1:{server.server_address[1]}/dav/")
+    monkeypatch.setenv("ROBOVAST_WEBDAV_USER", "u")
+    monkeypatch.setenv("ROBOVAST_WEBDAV_PASSWORD", "p")
+    yield WebDavShareProvider(), server
+    server.shutdown()
+    server.server_close()
+
+
+def test_webdav_range_download_verifies(webdav, tmp_path):
+    provider, server = webdav
+    dest = tmp_path / "c.part"
+    samples = []
+    download_segmented(provider, "c.tar.gz", str(dest), lambda r, t: samples.append((r, t)),
+                       connections=4, segment_size=64 * 1024)
+    assert dest.read_bytes() == PAYLOAD
+    assert sorted(server.ranges) == list(range(0, len(PAYLOAD), 64 * 1024))
+    assert samples[-1] == (len(PAYLOAD), len(PAYLOAD))
+    assert not os.path.exists(str(dest) + STATE_SUFFIX)
+
+
+class _FlakyProvider:
+    """Serves PAYLOAD from memory; fails the ranges starting in ``broken``."""
+
+    def __init__(self, checksum=None):
+        self.checksum = checksum or f"md5:{hashlib.md5(PAYLOAD).hexdigest()}"
+        self.broken = set()
+        self.reads = []
+
+    def archive_info(self, _object_name):
+        return len(PAYLOAD), self.checksum
+
+    def read_archive_range(self, _object_name, start, end, write):
+        self.reads.append(start)
+        write(PAYLOAD[start:start + 10])
+        if start in self.broken:
+            raise ConnectionError("connection reset")
+        write(PAYLOAD[start + 10:end])
+
+
+def test_interrupted_download_resumes_missing_segments(tmp_path, monkeypatch):
+    monkeypatch.setattr(segmented.time, "sleep", lambda _s: None)
+    provider = _FlakyProvider()
+    provider.broken = {100_000, 200_000}
+    dest = str(tmp_path / "c.part")
+    with pytest.raises(click.ClickException, match="resume"):
+        download_segmented(provider, "c.tar.gz", dest, segment_size=100_000, retries=1)
+    with open(dest + STATE_SUFFIX, encoding="utf-8") as fh:
+        assert json.load(fh)["done"] == [0]
+
+    provider.broken, provider.reads = set(), []
+    download_segmented(provider, "c.tar.gz", dest, segment_size=100_000)
+    assert sorted(provider.reads) == [100_000, 200_000]
+    with open(dest, "rb") as fh:
+        assert fh.read() == PAYLOAD
+
+
+class _SizelessProvider(_FlakyProvider):
+    """Does not report a size; serves PAYLOAD through ``download_archive`` only."""
+
+    def archive_info(self, _object_name):
+        return -1, None
+
+    def download_archive(self, _object_name, dest_path, progress_callback=None):
+        with open(dest_path, "wb") as fh:
+            fh.write(PAYLOAD)
+        progress_callback(len(PAYLOAD), len(PAYLOAD))
+
+
+def test_unknown_size_falls_back_to_a_single_stream(tmp_path):
+    dest = tmp_path / "c.part"
+    dest.write_bytes(b"\0" * 10)                      # sparse leftover of a segmented attempt
+    (tmp_path / ("c.part" + STATE_SUFFIX)).write_text("{}")
+    samples = []
+    provider = _SizelessProvider()
+    download_segmented(provider, "c.tar.gz", str(dest), lambda r, t: samples.append((r, t)))
+    assert dest.read_bytes() == PAYLOAD and not provider.reads
+    assert samples == [(len(PAYLOAD), len(PAYLOAD))]
+    assert not os.path.exists(str(dest) + STATE_SUFFIX)
+
+
+def test_checksum_mismatch_discards_download(tmp_path):
+    dest = tmp_path / "c.part"
+    with pytest.raises(click.ClickException, match="corrupt"):
+        download_segmented(_FlakyProvider(checksum="md5:" + "0" * 32), "c.tar.gz", str(dest),
+                           segment_size=100_000)
+    assert not dest.exists() and not os.path.exists(str(dest) + STATE_SUFFIX)
+
+
+def test_unknown_size_skips_only_the_size_check(tmp_path):
+    dest = tmp_path / "c.part"
+    dest.write_bytes(PAYLOAD)
+    segmented.verify_archive(str(dest), -1, f"md5:{hashlib.md5(PAYLOAD).hexdigest()}")
+    with pytest.raises(click.ClickException, match="md5"):
+        segmented.verify_archive(str(dest), -1, "md5:" + "0" * 32)
+    assert not dest.exists()
@@ -0,0 +1,107 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Splitting a batch across several backends (sharding.ShardingBackend)."""
+
+import pytest
+
+from robovast.execution.backends import (ExecutionBackend, RunOptions,
+                                         StandInBackend)
+from robovast.execution.sharding import Shard, ShardingBackend
+
+
+def _data(n):
+    return {"execution": {"image": "img"}, "configs": [{"name": f"c{i}"} for i in range(n)]}
+
+
+def _ran(backend):
+    return [name for _tag, names, _runs in backend.batches for name in names]
+
+
+def _run(sharding, root, n, runs=1):
+    sharding.run_batch(_data(n), campaign_root=str(root), batch_tag="batch-0",
+                       runs=runs, options=RunOptions())
+
+
+def test_first_shards_follow_capacity_and_all_results_land(tmp_path):
+    big, small = StandInBackend(capacity=3), StandInBackend(capacity=1)
+    _run(ShardingBackend([Shard("big", big, 3), Shard("small", small, 1)]), tmp_path, 8)
+
+    assert len(big.batches[0][1]) == 3
+    assert len(small.batches[0][1]) == 1
+    assert sorted(_ran(big) + _ran(small)) == sorted(f"c{i}" for i in range(8))
+    assert all((tmp_path / f"c{i}" / "0" / "test.xml").exists() for i in range(8))
+    assert all(tag.startswith("batch-0-big-") for tag, _n, _r in big.batches)
+
+
+def test_faster_backend_takes_more_work(tmp_path):
+    fast, slow = StandInBackend(), StandInBackend(delay_s=0.2)
+    _run(ShardingBackend([Shard("fast", fast), Shard("slow", slow)]), tmp_path, 8)
+    assert len(_ran(fast)) > len(_ran(slow)) >= 1
+
+
+def test_small_batch_is_split_by_share(tmp_path):
+    a, b = StandInBackend(capacity=8), StandInBackend(capacity=8)
+    _run(ShardingBackend([Shard("a", a, 8), Shard("b", b, 8)]), tmp_path, 4, runs=2)
+    # Each shard may take 8 work items, but only its half of the batch (4).
+    assert [len(n) for _t, n, _r in a.batches] == [2]
+    assert [len(n) for _t, n, _r in b.batches] == [2]
+
+
+class Broken(ExecutionBackend):
+    def __init__(self):
+        self.calls = 0
+
+    def run_batch(self, campaign_data, *, campaign_root, batch_tag, runs, options):
+        self.calls += 1
+        raise RuntimeError("cluster unreachable")
+
+
+def test_failed_shard_work_moves_to_other_shards(tmp_path):
+    broken, ok = Broken(), StandInBackend(delay_s=0.05)
+    _run(ShardingBackend([Shard("broken", broken, 4), Shard("ok", ok)]), tmp_path, 6)
+    assert broken.calls == 1
+    assert sorted(_ran(ok)) == sorted(f"c{i}" for i in range(6))
+
+
+def test_all_shards_failing_raises(tmp_path):
+    sharding = ShardingBackend([Shard("a", Broken()), Shard("b", Broken())])
+    with pytest.raises(RuntimeError, match="all shards failed"):
+        _run(sharding, tmp_path, 3)
+
+
+class Counting(StandInBackend):
+    def count_run_artifacts(self, campaign_id):
+        return 5
+
+
+def test_counts_and_validation(tmp_path):
+    local = StandInBackend()
+    assert ShardingBackend([Shard("local", local)]).count_run_artifacts("camp") is None
+    # Published runs of the counting shard plus finished runs of the local one.
+    sharding = ShardingBackend([Shard("local", local, 4), Shard("remote", Counting(), 4)])
+    _run(sharding, tmp_path / "camp", 4, runs=2)
+    assert sharding.count_run_artifacts("camp") == 5 + len(_ran(local)) * 2
+    assert not ShardingBackend([Shard("a", local), Shard("b", Broken())]).supports_concurrent_batches
+    with pytest.raises(ValueError):
+        ShardingBackend([Shard("a", local), Shard("a", local)])
+    with pytest.raises(ValueError):
+        Shard("a", local, capacity=0)
+
+
+def test_stand_in_publishes_each_config_whole(tmp_path):
+    seen = []
+
+    def _run(config, run_dir):
+        seen.append((tmp_path / config["name"]).exists())
+        with open(f"{run_dir}/test.xml", "w", encoding="utf-8") as f:
+            f.write(run_dir)
+
+    backend = StandInBackend(_run, capacity=2)
+    for tag in ("batch-0", "batch-1"):
+        backend.run_batch(_data(2), campaign_root=str(tmp_path), batch_tag=tag,
+                          runs=3, options=RunOptions())
+    assert seen == [False] * 6 + [True] * 6
+    assert sorted(p.name for p in (tmp_path / "c1").iterdir()) == ["0", "1", "2"]
+    assert not any((tmp_path / "_transient" / "incoming").iterdir())
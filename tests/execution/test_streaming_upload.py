@@ -0,0 +1,245 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Streaming compress-and-upload of campaigns (share_providers.streaming)."""
+
+import gzip
+import os
+import re
+import shutil
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from robovast.execution.cluster_config import base_config
+from robovast.execution.cluster_execution import in_pod_upload
+from robovast.execution.cluster_execution.share_providers import streaming, webdav
+from robovast.execution.cluster_execution.share_providers.gcs import \
+    GcsShareProvider
+from robovast.execution.cluster_execution.share_providers.streaming import (
+    ArchiveStream, iter_parts)
+from robovast.execution.cluster_execution.share_providers.webdav import \
+    WebDavShareProvider
+
+PART = 256 * 1024
+RAW = os.urandom(700_000)
+CAMPAIGN = "camp-2026-01-01-000000"
+
+
+class _StreamingConfig:
+    """Cluster config stand-in that gzips RAW into the upload stream (or an archive)."""
+
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+        self.error = None
+
+    def supports_campaign_streaming(self):
+        return True
+
+    def stream_campaign(self, campaign_id, out, scratch_dir):
+        assert campaign_id == CAMPAIGN and os.path.isdir(scratch_dir)
+        try:
+            with gzip.GzipFile(fileobj=out, mode="wb", mtime=0) as gz:
+                for i in range(0, len(RAW), 10_000):
+                    if self.fail_after is not None and i >= self.fail_after:
+                        raise RuntimeError("storage went away")
+                    gz.write(RAW[i:i + 10_000])
+        except BaseException as exc:
+            self.error = exc
+            raise
+
+    def compress_campaign(self, campaign_id, archive_dir):
+        path = os.path.join(archive_dir, f"{campaign_id}.tar.gz")
+        with open(path, "wb") as fh:
+            self.stream_campaign(campaign_id, fh, archive_dir)
+        return path
+
+
+class _ResumableHandler(BaseHTTPRequestHandler):
+    """Stores PUT bodies by ``Content-Range``; cuts off requests listed in ``drop``.
+
+    Speaks the WebDAV partial-PUT dialect (``HEAD`` reports the stored size;
+    with ``partial_put`` off a ranged ``PUT`` is rejected like SabreDAV does)
+    and the GCS resumable-session one (``308`` + ``Range`` until the declared
+    total is reached).
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, headers=()):
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self):  # noqa: N802  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.server.data)))
+        self.end_headers()
+
+    def do_DELETE(self):  # noqa: N802  # pylint: disable=invalid-name
+        with self.server.lock:
+            self.server.requests.append("delete")
+            self.server.data.clear()
+        self._reply(204)
+
+    def do_PUT(self):  # noqa: N802  # pylint: disable=invalid-name
+        server = self.server
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        match = re.match(r"bytes (?:(\d+)-\d+|\*)/(\d+|\*)", self.headers.get("Content-Range", ""))
+        start = int(match.group(1)) if match and match.group(1) else 0
+        declared = match.group(2) if match else None
+        if start and not server.partial_put:
+            with server.lock:
+                server.requests.append(start)
+            self._reply(400)
+            return
+        with server.lock:
+            if match and not match.group(1):          # status query
+                server.requests.append("query")
+            elif start in server.drop:
+                server.requests.append(start)
+                server.drop.discard(start)
+                server.data[start:] = body[:len(body) // 2]
+                self.close_connection = True
+                self.connection.close()
+                return
+            else:
+                server.requests.append(start)
+                server.data[start:] = body
+            size = len(server.data)
+        if server.gcs and declared != str(size):
+            self._reply(308, [("Range", f"bytes=0-{size - 1}")] if size else [])
+        else:
+            self._reply(201)
+
+
+@pytest.fixture(name="server")
+def _server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _ResumableHandler)
+    srv.data, srv.requests, srv.drop, srv.gcs = bytearray(), [], set(), False
+    srv.partial_put = True
+    srv.lock = threading.Lock()
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture(name="dav")
+def _dav(server, monkeypatch, tmp_path):
+    monkeypatch.setenv("ROBOVAST_ARCHIVE_DIR", str(tmp_path))
+    monkeypatch.setenv("ROBOVAST_WEBDAV_URL", f"http://127.0.0.1:{server.server_address[1]}/dav/")
+    monkeypatch.setenv("ROBOVAST_WEBDAV_USER", "u")
+    monkeypatch.setenv("ROBOVAST_WEBDAV_PASSWORD", "p")
+    monkeypatch.setattr(streaming, "STREAM_PART_SIZE", PART)
+    monkeypatch.setattr(webdav.time, "sleep", lambda _s: None)
+    return WebDavShareProvider()
+
+
+def test_archive_stream_bounds_the_producer_and_yields_fixed_parts():
+    stream = ArchiveStream(max_bytes=2000)
+
+    def _produce():
+        for _ in range(10):
+            stream.write(b"x" * 1050)
+        stream.close()
+
+    threading.Thread(target=_produce, daemon=True).start()
+    time.sleep(0.2)
+    assert stream.bytes_written == 2100          # blocked once the buffer is full
+    parts = list(iter_parts(stream, 3000))
+    assert [(o, len(d), last) for o, d, last in parts] == \
+        [(0, 3000, False), (3000, 3000, False), (6000, 3000, False), (9000, 1500, True)]
+
+
+def test_webdav_stream_upload_resumes_a_dropped_part(dav, server, tmp_path):
+    server.drop.add(PART)
+    samples = []
+    assert in_pod_upload.upload_campaign(_StreamingConfig(), CAMPAIGN, dav,
+                                         progress_cb=lambda s, t: samples.append((s, t)))
+    assert gzip.decompress(bytes(server.data)) == RAW
+    assert server.requests.count(PART) == 1 and server.requests.count(PART + PART // 2) == 1
+    total = len(server.data)
+    assert samples[0] == (PART, 0) and samples[-1] == (total, total)
+    assert not os.listdir(tmp_path)              # nothing written to the archive dir
+
+
+def test_producer_failure_fails_the_upload(dav):
+    config = _StreamingConfig(fail_after=300_000)
+    assert not in_pod_upload.upload_campaign(config, CAMPAIGN, dav)
+    assert isinstance(config.error, RuntimeError)
+
+
+def test_upload_failure_stops_the_producer_and_fails(dav, server, tmp_path):
+    def _broken_put_part(*_args):
+        raise ConnectionError("share unreachable")
+
+    dav._put_part = _broken_put_part  # pylint: disable=protected-access
+    config = _StreamingConfig()
+    assert not in_pod_upload.upload_campaign(config, CAMPAIGN, dav)
+    assert isinstance(config.error, BrokenPipeError)
+    assert not server.requests                   # no second upload attempt
+    assert not os.listdir(tmp_path)
+
+
+def test_server_without_partial_put_gets_the_local_archive(dav, server):
+    server.partial_put = False
+    assert in_pod_upload.upload_campaign(_StreamingConfig(), CAMPAIGN, dav)
+    assert server.requests == [0, PART, "delete", 0]
+    assert gzip.decompress(bytes(server.data)) == RAW
+
+
+def test_streaming_can_be_disabled(dav, server, monkeypatch, tmp_path):
+    monkeypatch.setenv("ROBOVAST_STREAM_UPLOAD", "0")
+    assert in_pod_upload.upload_campaign(_StreamingConfig(), CAMPAIGN, dav)
+    assert server.requests == [0] and gzip.decompress(bytes(server.data)) == RAW
+    assert not os.listdir(tmp_path)
+
+
+def test_gcs_stream_upload_resumes_inside_a_part(server, monkeypatch):
+    server.gcs = True
+    server.drop.add(PART)
+    session = f"http://127.0.0.1:{server.server_address[1]}/session"
+    monkeypatch.setenv("ROBOVAST_GCS_BUCKET", "bucket")
+    monkeypatch.setattr(GcsShareProvider, "_access_token_for_verify", lambda self: "token")
+    monkeypatch.setattr(GcsShareProvider, "_gcs_initiate_resumable",
+                        staticmethod(lambda bucket, name, total, token: session))
+    monkeypatch.setattr(time, "sleep", lambda _s: None)
+
+    payload = os.urandom(3 * PART + 1000)
+    stream = ArchiveStream()
+    threading.Thread(target=lambda: (stream.write(payload), stream.close()), daemon=True).start()
+    samples = []
+    GcsShareProvider().upload_stream(stream, "c.tar.gz", lambda s, t: samples.append((s, t)),
+                                     part_size=PART)
+    assert bytes(server.data) == payload
+    assert server.requests == [0, PART, "query", PART + PART // 2, 2 * PART, 3 * PART]
+    assert samples[-1] == (len(payload), len(payload)) and samples[-2][1] == 0
+
+
+@pytest.mark.skipif(not shutil.which("pigz"), reason="pigz not installed")
+def test_pigz_output_is_pumped_into_the_stream():
+    stream = ArchiveStream(max_bytes=PART)
+    received = bytearray()
+
+    def _consume():
+        for _offset, data, _last in iter_parts(stream, PART):
+            received.extend(data)
+
+    consumer = threading.Thread(target=_consume)
+    consumer.start()
+    try:
+        with base_config._pigz(stream) as stdin:  # pylint: disable=protected-access
+            stdin.write(RAW)
+    finally:
+        stream.close()
+    consumer.join()
+    assert gzip.decompress(bytes(received)) == RAW
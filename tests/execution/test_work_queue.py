@@ -0,0 +1,160 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Warm-pool work queue (work_queue.WorkQueue) and worker (data/warm_worker.py)."""
+
+import csv
+import sys
+import time
+
+import pytest
+
+from robovast.execution.data import warm_worker
+from robovast.execution.work_queue import TIMING_FIELDS, QueueUnit, WorkQueue
+
+
+def _units(n):
+    return [QueueUnit(f"job-{i}", f"doc-{i}", [[f"c{i}", 0]]) for i in range(n)]
+
+
+def test_claim_complete_and_done():
+    queue = WorkQueue(_units(2))
+    a, _ = queue.claim("w0")
+    b, _ = queue.claim("w1")
+    assert (a.id, b.id) == ("job-0", "job-1")
+    assert queue.claim("w0") == (None, False)      # leased elsewhere: poll again
+    assert queue.complete("w0", "job-0", [{"config": "c0", "run": 0}])
+    assert not queue.complete("w0", "job-0", [])   # duplicate report ignored
+    assert not queue.wait(0)
+    assert queue.complete("w1", "job-1", [])
+    assert queue.wait(0) and queue.remaining == 0
+    assert queue.claim("w0") == (None, True)
+    assert WorkQueue([]).wait(0)
+
+
+def test_expired_lease_is_requeued():
+    queue = WorkQueue(_units(1), lease_s=0)
+    unit, _ = queue.claim("dead")
+    assert not queue.complete("dead", unit.id, [])   # late report from an expired lease
+    queue.lease_s = 60
+    again, _ = queue.claim("alive")
+    assert again.id == unit.id
+    assert not queue.complete("dead", unit.id, [])
+    assert queue.complete("alive", unit.id, [])
+
+
+def test_unit_is_failed_after_max_attempts():
+    queue = WorkQueue(_units(2), lease_s=0, max_attempts=2)
+    for _ in range(2):
+        unit, _ = queue.claim("crashing")         # lease expires at once
+        assert unit.id == "job-0"
+    queue.lease_s = 60
+    unit, done = queue.claim("w0")
+    assert unit.id == "job-1" and not done
+    assert queue.failed == ["job-0"]
+    assert queue.complete("w0", "job-1", [])
+    assert queue.wait(0) and queue.remaining == 0
+    assert queue.claim("w1") == (None, True)
+
+
+def test_warm_pool_requires_a_timeout():
+    from pydantic import ValidationError
+
+    from robovast.common.config import ExecutionConfig
+    with pytest.raises(ValidationError, match="requires execution.timeout"):
+        ExecutionConfig(image="img", runs=1, warm_pool=2)
+    assert ExecutionConfig(image="img", runs=1, warm_pool=2, timeout=60).warm_pool == 2
+
+
+def test_write_timings_csv(tmp_path):
+    queue = WorkQueue(_units(1))
+    queue.claim("w0")
+    queue.complete("w0", "job-0", [{"config": "c0", "run": 0, "startup_s": 3.0,
+                                    "run_s": 10.0, "teardown_s": None}])
+    path = tmp_path / "_execution" / "warm_pool" / "b0.csv"
+    assert queue.write_timings(str(path)) == 1
+    with open(path, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert tuple(rows[0]) == TIMING_FIELDS
+    assert rows[0]["worker"] == "w0" and rows[0]["startup_s"] == "3.0"
+
+
+def _write_result(root, config, run, start, seconds):
+    run_dir = root / config / str(run)
+    run_dir.mkdir(parents=True)
+    (run_dir / "test.xml").write_text(
+        f'<testsuite><testcase name="t" time="{seconds}"><properties>'
+        f'<property name="start_time" value="{start}"/></properties></testcase></testsuite>')
+
+
+def test_item_timings_split_startup_run_and_teardown(tmp_path):
+    _write_result(tmp_path, "c0", 0, start=105.0, seconds=10.0)
+    _write_result(tmp_path, "c0", 1, start=117.0, seconds=10.0)
+    timings = warm_worker.item_timings([["c0", 0], ["c0", 1], ["c1", 0]],
+                                       str(tmp_path), launched=100.0, finished=130.0)
+    assert [t["startup_s"] for t in timings] == [5.0, 2.0, None]
+    assert [t["run_s"] for t in timings] == [10.0, 10.0, None]
+    assert [t["teardown_s"] for t in timings] == [None, None, None]
+    timings = warm_worker.item_timings([["c0", 0], ["c0", 1]], str(tmp_path), 100.0, 130.0)
+    assert timings[-1]["teardown_s"] == 3.0
+
+
+class _FakeClient:
+    def __init__(self, queue):
+        self.queue = queue
+
+    def claim(self):
+        unit, done = self.queue.claim("w0")
+        return (None if unit is None else vars(unit)), done
+
+    def complete(self, unit_id, timings):
+        return self.queue.complete("w0", unit_id, timings)
+
+
+def test_worker_runs_every_unit_with_its_parameter_file(tmp_path):
+    # The "scenario command" copies the parameter file it is given to a log.
+    log = tmp_path / "log"
+    script = ("import sys; p = sys.argv[sys.argv.index('--scenario-parameter-file') + 1]; "
+              f"open({str(log)!r}, 'a').write(open(p).read() + '\\n')")
+    queue = WorkQueue(_units(3))
+    n = warm_worker.run(_FakeClient(queue), [sys.executable, "-c", script],
+                        str(tmp_path / "params.yaml"), str(tmp_path), poll_interval=0)
+    assert n == 3 and queue.remaining == 0
+    assert log.read_text().split() == ["doc-0", "doc-1", "doc-2"]
+    assert [t["config"] for t in queue.timings()] == ["c0", "c1", "c2"]
+
+
+def _script(tmp_path, name, body):
+    path = tmp_path / name
+    path.write_text(f"#!/bin/sh\n{body}\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+def test_worker_completes_a_unit_only_after_its_post_run(tmp_path):
+    log = tmp_path / "log"
+    upload = _script(tmp_path, "upload.sh", f"echo upload >> {log}")
+    queue = WorkQueue(_units(2))
+    n = warm_worker.run(_FakeClient(queue), [sys.executable, "-c", "pass"],
+                        str(tmp_path / "params.yaml"), str(tmp_path), poll_interval=0,
+                        unit_post_run=[upload])
+    assert n == 2 and log.read_text().split() == ["upload", "upload"]
+
+    queue = WorkQueue(_units(2))
+    broken = _script(tmp_path, "broken.sh", "exit 3")
+    with pytest.raises(RuntimeError, match="post-run of job-0"):
+        warm_worker.run(_FakeClient(queue), [sys.executable, "-c", "pass"],
+                        str(tmp_path / "params.yaml"), str(tmp_path), poll_interval=0,
+                        unit_post_run=[broken])
+    assert queue.remaining == 2
+
+
+def test_worker_kills_a_unit_past_its_timeout(tmp_path):
+    queue = WorkQueue(_units(1))
+    started = time.monotonic()
+    n = warm_worker.run(_FakeClient(queue), [sys.executable, "-c", "import time; time.sleep(60)"],
+                        str(tmp_path / "params.yaml"), str(tmp_path), poll_interval=0,
+                        run_timeout=0.5)
+    assert n == 1 and queue.remaining == 0
+    assert time.monotonic() - started < 30
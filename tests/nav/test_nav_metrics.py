@@ -0,0 +1,110 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Vectorized nav metrics, the incremental nav_metrics plugin and data.db readback."""
+
+import math
+
+import numpy as np
+import pytest
+import yaml
+
+pytest.importorskip("robovast_nav")
+
+# pylint: disable=wrong-import-position
+from robovast.results_processing.postprocessing_plugins import generate_data_db  # noqa: E402
+from robovast_nav.extractor import NavMetricsExtractor  # noqa: E402
+from robovast_nav.metrics import (NAV_METRICS_FILENAME, cross_track_errors,  # noqa: E402
+                                  precomputed_run_metrics, query_nav_metrics)
+from robovast_nav.postprocessing import NavMetrics  # noqa: E402
+
+PATH = [{"x": 0.0, "y": 0.0}, {"x": 4.0, "y": 0.0}, {"x": 4.0, "y": 4.0}]
+
+
+def _write_poses(run_dir, offset):
+    lines = ["frame,timestamp,position.x,position.y,position.z,"
+             "orientation.roll,orientation.pitch,orientation.yaw"]
+    for i in range(5):
+        lines.append(f"base_link,{float(i)},{float(i)},{offset},0.0,0.0,0.0,0.1")
+        lines.append(f"other,{float(i)},99.0,99.0,0.0,0.0,0.0,0.0")
+    (run_dir / "poses.csv").write_text("\n".join(lines) + "\n")
+
+
+def _make_campaign(root):
+    campaign = root / "nav-2026-06-17-101010"
+    (campaign / "_transient").mkdir(parents=True)
+    (campaign / "_transient" / "configurations.yaml").write_text(
+        yaml.safe_dump({"configs": [{"name": "ca", "_path": PATH}]}))
+    for run, offset in ((0, 0.5), (1, 1.0)):
+        run_dir = campaign / "ca" / str(run)
+        run_dir.mkdir(parents=True)
+        (run_dir / "test.xml").write_text('<testsuite errors="0" failures="0" tests="1"/>')
+        _write_poses(run_dir, offset)
+    return campaign
+
+
+def _reference_distance(px, py, path):
+    best = math.inf
+    for a, b in zip(path, path[1:]):
+        dx, dy = b[0] - a[0], b[1] - a[1]
+        t = max(0.0, min(1.0, ((px - a[0]) * dx + (py - a[1]) * dy) / (dx * dx + dy * dy)))
+        best = min(best, math.hypot(px - a[0] - t * dx, py - a[1] - t * dy))
+    return best
+
+
+def test_cross_track_errors_match_reference():
+    rng = np.random.default_rng(0)
+    path = rng.uniform(-5, 5, size=(7, 2))
+    points = rng.uniform(-6, 6, size=(50, 2))
+    expected = [_reference_distance(px, py, path.tolist()) for px, py in points]
+    assert np.allclose(cross_track_errors(points, path), expected)
+
+
+def test_plugin_writes_metrics_and_is_incremental(tmp_path):
+    campaign = _make_campaign(tmp_path)
+    ok, msg, entries = NavMetrics()(str(tmp_path), "", workers=2)
+    assert ok, msg
+    assert "2 computed" in msg and len(entries) == 2
+
+    metrics_csv = campaign / "ca" / "0" / NAV_METRICS_FILENAME
+    assert metrics_csv.exists()
+
+    ok, msg, entries = NavMetrics()(str(tmp_path), "", workers=2)
+    assert ok and "2 cached" in msg and not entries
+
+    _write_poses(campaign / "ca" / "1", 2.0)
+    ok, msg, _ = NavMetrics()(str(tmp_path), "", workers=2)
+    assert "1 computed" in msg and "1 cached" in msg
+
+
+def test_metrics_table_in_data_db(tmp_path):
+    campaign = _make_campaign(tmp_path)
+    NavMetrics()(str(tmp_path), "", workers=1)
+    ok, _ = generate_data_db(str(campaign), output_callback=lambda *_: None)
+    assert ok
+
+    df = query_nav_metrics(campaign)
+    assert sorted(df["run_id"].tolist()) == [0, 1]
+    row = precomputed_run_metrics(campaign, "ca", 0)
+    assert row["total_distance_m"] == pytest.approx(4.0)
+    # (4, 0.5) lies on the second segment, the other four points are 0.5 off.
+    assert row["mean_cross_track_error_m"] == pytest.approx(0.4)
+    assert row["planned_distance_m"] == pytest.approx(8.0)
+    assert row["num_points"] == 5
+
+
+def test_extractor_aggregates_precomputed_rows(tmp_path):
+    campaign = _make_campaign(tmp_path)
+    NavMetrics()(str(tmp_path), "", workers=1)
+    result = NavMetricsExtractor(agg="max", measures=["total_distance_m"]).extract(campaign / "ca")
+    assert result.objectives["max_cross_track_error_m"] == pytest.approx(1.0)
+    assert result.measures == {"total_distance_m": pytest.approx(4.0)}
+
+
+def test_extractor_leaves_out_metrics_without_data(tmp_path):
+    campaign = _make_campaign(tmp_path)
+    result = NavMetricsExtractor().extract(campaign / "ca")
+    assert "max_cross_track_error_m" not in result.objectives
+    with pytest.raises(ValueError, match="total_distance_m"):
+        NavMetricsExtractor(measures=["total_distance_m"]).extract(campaign / "ca")
@@ -0,0 +1,249 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Asynchronous (steady-state) search scheduling in CampaignController."""
+
+# pylint: disable=import-outside-toplevel
+
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from robovast.common.config import SearchConfig
+from robovast.common.store import STORE_FILENAME, CampaignStore
+from robovast.execution.backends import ExecutionBackend, RunOptions
+from robovast.execution.controller import CampaignController
+from robovast.search.evaluator import Evaluator
+from robovast.search.strategy import SearchStrategy, build_strategy
+from robovast.search.types import ParamSet, SearchReport
+
+
+def _cfg(strategy="random", batches=2, per_batch=3, max_in_flight=None, stopping=None):
+    return SearchConfig(
+        strategy=strategy,
+        search_space={"x": {"type": "float", "low": 0, "high": 1}},
+        extract={"plugin": "failure_rate"},
+        objectives=[{"name": "failure_rate", "direction": "maximize"}],
+        per_batch=per_batch, budget=[{"batches": batches}], seed=1, stopping=stopping,
+        scheduling="async", max_in_flight=max_in_flight,
+    )
+
+
+class SlowBackend(ExecutionBackend):
+    """Writes test.xml per run after a short delay; tracks peak concurrency."""
+
+    supports_concurrent_batches = True
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.tags = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def run_batch(self, campaign_data, *, campaign_root, batch_tag, runs, options):
+        with self._lock:
+            self.tags.append(batch_tag)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        for cfg in campaign_data["configs"]:
+            failures = int(cfg["name"][-1], 16) % 2
+            for run in range(runs):
+                run_dir = os.path.join(campaign_root, cfg["name"], str(run))
+                os.makedirs(run_dir, exist_ok=True)
+                with open(os.path.join(run_dir, "test.xml"), "w") as f:
+                    f.write(f'<testsuite errors="0" failures="{failures}" tests="1">'
+                            f'<testcase name="t" time="1.0"/></testsuite>')
+        with self._lock:
+            self.active -= 1
+
+
+class SerialBackend(SlowBackend):
+    supports_concurrent_batches = False
+
+
+class FakeCompose:
+    def compose(self, param_sets, output_dir):
+        name_by_id = {ps.id: f"c{ps.id}" for ps in param_sets}
+        campaign_data = {"execution": {"image": "img", "runs": 1},
+                         "configs": [{"name": n} for n in name_by_id.values()]}
+        return campaign_data, name_by_id
+
+
+def _controller(cfg, tmp_path, backend, strategy=None, runs=2):
+    from robovast.search.stopping import build_stop_conditions
+    store = CampaignStore(tmp_path / "camp" / STORE_FILENAME)
+    controller = CampaignController(
+        campaign_id="camp", results_dir=str(tmp_path), runs=runs, backend=backend,
+        options=RunOptions(), store=store, campaign_config_dump={"version": 1},
+        vast_dir=str(tmp_path), strategy=strategy or build_strategy(cfg),
+        evaluator=Evaluator(cfg, str(tmp_path)), compose=FakeCompose(),
+        per_batch=cfg.per_batch, stop_conditions=build_stop_conditions(cfg),
+        scheduling=cfg.scheduling, max_in_flight=cfg.max_in_flight)
+    return controller, store
+
+
+def _assert_recorded(store, units, batches):
+    conn = sqlite3.connect(store.db_path)
+    assert conn.execute("SELECT COUNT(*) FROM unit").fetchone()[0] == units
+    assert conn.execute("SELECT COUNT(*) FROM batch").fetchone()[0] == batches
+    assert conn.execute("SELECT COUNT(*) FROM inflight").fetchone()[0] == 0
+    assert conn.execute("SELECT stop_kind, batches FROM campaign").fetchone() == ("batches", batches)
+    conn.close()
+
+
+def test_async_random_overlaps_and_respects_budget(tmp_path):
+    cfg = _cfg(batches=2, per_batch=3, max_in_flight=3)
+    backend = SlowBackend()
+    controller, store = _controller(cfg, tmp_path, backend)
+    report = controller.run()
+
+    assert len(report.evaluations) == 6
+    assert len(backend.tags) == 6 and len(set(backend.tags)) == 6
+    assert backend.peak > 1
+    assert all(e.n_samples == 2 for e in report.evaluations)
+    assert report.extra["batches"] == 2
+    _assert_recorded(store, units=6, batches=2)
+    store.close()
+
+
+def test_async_falls_back_to_one_slot_without_concurrent_backend(tmp_path):
+    cfg = _cfg(batches=2, per_batch=2, max_in_flight=4)
+    backend = SerialBackend(delay=0.01)
+    controller, store = _controller(cfg, tmp_path, backend)
+    report = controller.run()
+
+    assert len(report.evaluations) == 4
+    assert backend.peak == 1
+    _assert_recorded(store, units=4, batches=2)
+    store.close()
+
+
+def test_async_optuna_tells_every_trial(tmp_path):
+    pytest.importorskip("optuna")
+    cfg = _cfg(strategy="optuna", batches=3, per_batch=2, max_in_flight=3)
+    controller, store = _controller(cfg, tmp_path, SlowBackend(delay=0.01))
+    report = controller.run()
+
+    assert len(report.evaluations) == 6
+    assert report.extra["n_trials"] == 6 and report.extra["batches"] == 3
+    assert not controller.strategy._trials  # pylint: disable=protected-access
+    _assert_recorded(store, units=6, batches=3)
+    store.close()
+
+
+class _Generations(SearchStrategy):
+    """Non-incremental strategy: records the size of every ``tell``."""
+
+    PARAMS_MODEL = None
+
+    def __init__(self, cfg, size):
+        super().__init__(cfg, {})
+        self._size = size
+        self._asked = 0
+        self.pending = set()
+        self.tells = []
+        self.history = []
+
+    def ask(self, n):
+        assert not self.pending, "asked again before the generation was told"
+        out = [ParamSet(values={"x": (self._asked + i) / 100}) for i in range(self._size)]
+        self._asked += self._size
+        self.pending = {ps.id for ps in out}
+        return out
+
+    def tell(self, evaluations):
+        assert {ev.params.id for ev in evaluations} == self.pending
+        self.pending = set()
+        self.tells.append(len(evaluations))
+        self.history.extend(evaluations)
+
+    def report(self):
+        return SearchReport(evaluations=list(self.history))
+
+
+def test_async_non_incremental_strategy_tells_whole_generations(tmp_path):
+    cfg = _cfg(batches=3, per_batch=4, max_in_flight=3)
+    strategy = _Generations(cfg, size=4)
+    controller, store = _controller(cfg, tmp_path, SlowBackend(delay=0.01), strategy=strategy)
+    controller.run()
+
+    assert strategy.tells == [4, 4, 4]
+    _assert_recorded(store, units=12, batches=3)
+    store.close()
+
+
+def test_inflight_rows_roundtrip(tmp_path):
+    with CampaignStore(tmp_path / STORE_FILENAME) as store:
+        cid = store.create_campaign("c", {})
+        row_id = store.record_inflight(cid, "abc", "cabc", {"x": 1}, 3)
+        rows = store.inflight(cid)
+        assert [(r["paramset_id"], r["n_reps"]) for r in rows] == [("abc", 3)]
+        store.clear_inflight(row_id)
+        assert not store.inflight(cid)
+
+
+def test_take_inflight_returns_rows_of_earlier_runs_once(tmp_path):
+    with CampaignStore(tmp_path / STORE_FILENAME) as store:
+        first = store.create_campaign("c", {})
+        second = store.create_campaign("c", {})
+        other = store.create_campaign("d", {})
+        store.record_inflight(first, "a", "ca", {"x": 1}, 2)
+        store.record_inflight(second, "b", "cb", {"x": 2}, 2)
+        store.record_inflight(other, "z", "cz", {"x": 3}, 2)
+        assert [r["paramset_id"] for r in store.take_inflight("c")] == ["a", "b"]
+        assert not store.take_inflight("c")
+        assert len(store.inflight(other)) == 1
+
+
+def test_async_resumes_sets_left_in_flight_by_an_earlier_run(tmp_path):
+    cfg = _cfg(batches=2, per_batch=3, max_in_flight=2)
+    controller, store = _controller(cfg, tmp_path, SlowBackend(delay=0.01))
+    earlier = store.create_campaign("camp", {"version": 1})
+    left = ParamSet(values={"x": 0.123})
+    store.record_inflight(earlier, left.id, f"c{left.id}", left.values, 2)
+    controller.run()
+
+    conn = sqlite3.connect(store.db_path)
+    assert conn.execute("SELECT COUNT(*) FROM inflight").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM unit WHERE paramset_id = ?",
+                        (left.id,)).fetchone()[0] == 1
+    conn.close()
+    store.close()
+
+
+class FailingBackend(SlowBackend):
+    """Fails the second batch while the first one is still running."""
+
+    def run_batch(self, campaign_data, *, campaign_root, batch_tag, runs, options):
+        with self._lock:
+            failing = len(self.tags) == 1
+        if failing:
+            with self._lock:
+                self.tags.append(batch_tag)
+            raise RuntimeError("backend down")
+        super().run_batch(campaign_data, campaign_root=campaign_root, batch_tag=batch_tag,
+                          runs=runs, options=options)
+
+
+def test_async_failure_waits_for_running_sets_and_keeps_them_for_resume(tmp_path):
+    cfg = _cfg(batches=2, per_batch=3, max_in_flight=2)
+    backend = FailingBackend(delay=0.2)
+    controller, store = _controller(cfg, tmp_path, backend)
+    with pytest.raises(RuntimeError, match="backend down"):
+        controller.run()
+
+    assert backend.active == 0
+    assert len(store.take_inflight("camp")) == 2
+    store.close()
+
+
+def test_max_in_flight_must_be_positive():
+    with pytest.raises(ValidationError):
+        _cfg(max_in_flight=0)
@@ -159,3 +159,65 @@ def test_compose_rejects_expanding_variation(template_vast, tmp_path):
             compose.compose([ParamSet(values={"tg": 2.0})], str(tmp_path / "art"))
     finally:
         os.remove(bad)
+
+
+def test_compose_reuses_unchanged_variation_steps_across_batches(tmp_path):
+    import yaml
+    cfg = yaml.safe_load(TEMPLATE_VAST)
+    cfg["search"]["search_space"]["m"] = {"type": "float", "low": 1.0, "high": 3.0}
+    cfg["search"]["variations"].append(
+        {"ParameterVariationList": {"name": "mass", "values": ["$m"]}})
+    vast = os.path.join(EXAMPLE, ".robovast_test_search_steps.vast")
+    with open(vast, "w") as f:
+        yaml.safe_dump(cfg, f)
+    try:
+        compose = Compose(vast)
+        first = ParamSet(values={"tg": 2.0, "m": 1.0})
+        second = ParamSet(values={"tg": 2.0, "m": 2.5})
+        compose.compose([first], str(tmp_path / "b0"))
+        campaign_data, name_by_id = compose.compose([second], str(tmp_path / "b1"))
+        compose.close()
+    finally:
+        os.remove(vast)
+
+    # The thrust_gain step saw identical inputs and was served from the cache;
+    # the mass step differed and ran.
+    assert compose._step_cache.hits == 1  # pylint: disable=protected-access
+    assert len(campaign_data["configs"]) == 1
+    config = campaign_data["configs"][0]
+    assert config["name"] == name_by_id[second.id]
+    assert config["name"].startswith(config_name_for(second))
+    assert config["config"] == {"thrust_gain": 2.0, "mass": 2.5}
+    assert [v["name"] for v in config["_variations"]] == ["ParameterVariationList"] * 2
+
+
+@pytest.mark.parametrize("seed", [None, 7])
+def test_compose_caches_only_seeded_random_steps(tmp_path, seed):
+    import random
+
+    import yaml
+    cfg = yaml.safe_load(TEMPLATE_VAST)
+    uniform = {"name": "mass", "num_variations": 1, "min": 1.0, "max": 3.0}
+    if seed is not None:
+        uniform["seed"] = seed
+    cfg["search"]["variations"].append({"ParameterVariationDistributionUniform": uniform})
+    vast = os.path.join(EXAMPLE, ".robovast_test_search_seeded.vast")
+    with open(vast, "w") as f:
+        yaml.safe_dump(cfg, f)
+    try:
+        compose = Compose(vast, max_workers=4)
+        batch = [ParamSet(values={"tg": tg}) for tg in (0.5, 1.0, 1.5, 2.0)]
+        compose.compose(batch, str(tmp_path / "b0"))
+        campaign_data, _ = compose.compose(batch, str(tmp_path / "b1"))
+        compose.close()
+    finally:
+        os.remove(vast)
+
+    masses = [c["config"]["mass"] for c in campaign_data["configs"]]
+    hits = compose._step_cache.hits  # pylint: disable=protected-access
+    if seed is None:
+        assert hits == len(batch)            # only the thrust_gain steps
+    else:
+        # Concurrently generated blocks each draw from their own generator.
+        assert hits == 2 * len(batch)
+        assert masses == [random.Random(seed).uniform(1.0, 3.0)] * len(batch)
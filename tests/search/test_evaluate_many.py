@@ -0,0 +1,118 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Batch scoring (Evaluator.evaluate_many), the shared run cache and timings."""
+
+import os
+import threading
+
+import pytest
+
+from robovast.common.config import SearchConfig
+from robovast.search.evaluator import Evaluator
+from robovast.search.extractor import (Extractor, ExtractResult, RunResultCache,
+                                       completed_run_dirs)
+from robovast.search.types import ParamSet
+
+
+def _cfg(workers=None):
+    return SearchConfig(
+        strategy="random", search_space={"x": {"type": "float", "low": 0, "high": 1}},
+        extract={"plugin": "failure_rate", "workers": workers},
+        objectives=[{"name": "score", "direction": "maximize"}],
+        per_batch=3, budget=[{"batches": 1}], seed=0)
+
+
+def _config(root, name, values):
+    for run, value in enumerate(values):
+        run_dir = root / name / str(run)
+        run_dir.mkdir(parents=True)
+        (run_dir / "test.xml").write_text(
+            '<testsuite errors="0" failures="0" tests="1"><testcase name="t"/></testsuite>')
+        (run_dir / "value.txt").write_text(str(value))
+    return root / name
+
+
+def _read_value(path):
+    return float(path.read_text())
+
+
+class MeanValue(Extractor):
+    """Mean of the per-run ``value.txt``; waits for *barrier* if given."""
+
+    def __init__(self, barrier=None, **params):
+        super().__init__(**params)
+        self.barrier = barrier
+
+    def extract(self, config_dir):
+        if self.barrier is not None:
+            self.barrier.wait()
+        values = [self.run_cache.load(r / "value.txt", _read_value)
+                  for r in completed_run_dirs(config_dir)]
+        return ExtractResult(objectives={"score": sum(values) / len(values)})
+
+    def run_objectives(self, run_dir):
+        return {"score": self.run_cache.load(run_dir / "value.txt", _read_value)}
+
+
+def _evaluator(tmp_path, extractor, workers=None):
+    evaluator = Evaluator(_cfg(workers), str(tmp_path))
+    evaluator.extractor = extractor
+    return evaluator
+
+
+def test_evaluate_many_scores_concurrently_in_order(tmp_path):
+    items = [(_config(tmp_path, f"c{i}", [i, i + 1]), ParamSet(values={"x": i / 10}))
+             for i in range(3)]
+    # Each extract blocks until all three run at once; serial scoring would time out.
+    evaluator = _evaluator(tmp_path, MeanValue(threading.Barrier(3, timeout=10)), workers=3)
+    evaluations = evaluator.evaluate_many(items)
+    assert [ev.params.id for ev in evaluations] == [ps.id for _d, ps in items]
+    assert [ev.objectives["score"] for ev in evaluations] == [0.5, 1.5, 2.5]
+    assert all(ev.n_samples == 2 and ev.raw["extract_s"] >= 0 for ev in evaluations)
+
+
+def test_evaluate_many_raises_extractor_errors(tmp_path):
+    class Broken(Extractor):
+        def extract(self, config_dir):
+            return ExtractResult(objectives={"other": 1.0})
+
+    items = [(_config(tmp_path, f"c{i}", [0]), ParamSet(values={"x": i / 10}))
+             for i in range(2)]
+    with pytest.raises(ValueError, match="did not return configured objective"):
+        _evaluator(tmp_path, Broken(), workers=2).evaluate_many(items)
+
+
+def test_run_cache_shared_across_hooks_and_rescoring(tmp_path):
+    config_dir = _config(tmp_path, "c0", [1, 3])
+    ps = ParamSet(values={"x": 0.1})
+    evaluator = _evaluator(tmp_path, MeanValue(), workers=1)
+    evaluator.evaluate(config_dir, ps)
+    evaluator.interval(config_dir, 0.95)
+
+    # A racing top-up adds a run and rewrites nothing else: only it is parsed.
+    _config(tmp_path / "more", "c0", [5])
+    os.rename(tmp_path / "more" / "c0" / "0", config_dir / "2")
+    assert evaluator.evaluate(config_dir, ps).objectives["score"] == 3.0
+
+    timings = evaluator.timings()
+    assert timings["extractor"] == "MeanValue"
+    assert timings["extract"]["calls"] == 2 and timings["run_objectives"]["calls"] == 2
+    assert timings["run_cache"] == {"hits": 4, "misses": 3}
+
+
+def test_run_cache_reparses_changed_files_and_evicts(tmp_path):
+    path = tmp_path / "v.txt"
+    path.write_text("1")
+    cache = RunResultCache(max_entries=1)
+    assert cache.load(path, _read_value) == 1.0
+    path.write_text("22")
+    assert cache.load(path, _read_value) == 22.0
+    assert cache.load(tmp_path / "missing", lambda p: None) is None
+
+    other = tmp_path / "w.txt"
+    other.write_text("7")
+    cache.load(other, _read_value)
+    cache.load(path, _read_value)
+    assert (cache.hits, cache.misses) == (0, 4)
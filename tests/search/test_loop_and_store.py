@@ -202,6 +202,23 @@ def test_store_strategy_state_roundtrip(tmp_path):
     store.close()
 
 
+def test_rerun_resumes_the_saved_strategy_state(tmp_path):
+    cfg = _cfg(batches=2, per_batch=3)
+    controller, store, _ = _search_controller(cfg, tmp_path)
+    first = controller.run()
+    store.close()
+
+    resumed = build_strategy(cfg)
+    controller, store, _ = _search_controller(cfg, tmp_path, strategy=resumed)
+    controller.run()
+    store.close()
+    # The second run continued from the six evaluations of the first.
+    evaluations = resumed.report().evaluations
+    assert len(evaluations) == 12
+    assert [e.params.id for e in evaluations[:6]] == [e.params.id for e in first.evaluations]
+    assert not {e.params.id for e in evaluations[6:]} & {e.params.id for e in evaluations[:6]}
+
+
 def test_fresh_store_stamps_schema_version(tmp_path):
     from robovast.common.store import SCHEMA_VERSION
     store = CampaignStore(tmp_path / "camp.db")
@@ -0,0 +1,231 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Evaluation memoization: reuse, top-up and cross-campaign lookups."""
+
+# pylint: disable=import-outside-toplevel
+
+import os
+import sqlite3
+
+import yaml
+
+from robovast.common.config import ConfigV1, SearchConfig
+from robovast.common.store import STORE_FILENAME, CampaignStore
+from robovast.execution.backends import ExecutionBackend, RunOptions
+from robovast.execution.controller import CampaignController
+from robovast.search.evaluator import Evaluator
+from robovast.search.memo import vast_content_hash
+from robovast.search.strategy import SearchStrategy
+from robovast.search.types import ParamSet, SearchReport
+
+
+def _cfg(batches, per_batch=2, scheduling="generational", extract="failure_rate"):
+    return SearchConfig(
+        strategy="random",
+        search_space={"x": {"type": "float", "low": 0, "high": 1}},
+        extract={"plugin": extract},
+        objectives=[{"name": "failure_rate", "direction": "maximize"}],
+        per_batch=per_batch, budget=[{"batches": batches}], seed=1,
+        scheduling=scheduling,
+    )
+
+
+class RecordingBackend(ExecutionBackend):
+    """Writes one failing test.xml per run; records (configs, runs) per call."""
+
+    supports_concurrent_batches = True
+
+    def __init__(self):
+        self.calls = []
+
+    def run_batch(self, campaign_data, *, campaign_root, batch_tag, runs, options):
+        names = [c["name"] for c in campaign_data["configs"]]
+        self.calls.append((names, runs))
+        for name in names:
+            for run in range(runs):
+                run_dir = os.path.join(campaign_root, name, str(run))
+                os.makedirs(run_dir, exist_ok=True)
+                with open(os.path.join(run_dir, "test.xml"), "w") as f:
+                    f.write('<testsuite errors="0" failures="1" tests="1">'
+                            '<testcase name="t" time="1.0"/></testsuite>')
+
+
+class LinkingBackend(RecordingBackend):
+    """Also records a ``job`` link per run in the campaign's link manifest."""
+
+    def run_batch(self, campaign_data, *, campaign_root, batch_tag, runs, options):
+        super().run_batch(campaign_data, campaign_root=campaign_root,
+                          batch_tag=batch_tag, runs=runs, options=options)
+        manifest = os.path.join(campaign_root, "_transient", "job_links.yaml")
+        os.makedirs(os.path.dirname(manifest), exist_ok=True)
+        links = {}
+        if os.path.isfile(manifest):
+            with open(manifest) as f:
+                links = yaml.safe_load(f)
+        for config in campaign_data["configs"]:
+            for run in range(runs):
+                links[f"{config['name']}/{run}/job"] = f"../../_execution/{batch_tag}-{run}"
+        with open(manifest, "w") as f:
+            yaml.dump(links, f)
+
+
+class FakeCompose:
+    def compose(self, param_sets, output_dir):
+        name_by_id = {ps.id: f"c{ps.id}" for ps in param_sets}
+        campaign_data = {"execution": {"image": "img", "runs": 1},
+                         "configs": [{"name": n} for n in name_by_id.values()]}
+        return campaign_data, name_by_id
+
+
+class _Script(SearchStrategy):
+    """Proposes a fixed list of parameter sets per batch."""
+
+    PARAMS_MODEL = None
+    INCREMENTAL_TELL = True
+
+    def __init__(self, cfg, batches):
+        super().__init__(cfg, {})
+        self._batches = list(batches)
+        self.history = []
+
+    def ask(self, n):
+        return self._batches.pop(0) if self._batches else []
+
+    def tell(self, evaluations):
+        self.history.extend(evaluations)
+
+    def report(self):
+        return SearchReport(evaluations=list(self.history))
+
+
+def _run(tmp_path, cfg, batches, campaign_id="camp", vast_hash="h1", memoize="all",
+         backend=None):
+    from robovast.search.stopping import build_stop_conditions
+    store = CampaignStore(tmp_path / campaign_id / STORE_FILENAME)
+    backend = backend or RecordingBackend()
+    controller = CampaignController(
+        campaign_id=campaign_id, results_dir=str(tmp_path), runs=2, backend=backend,
+        options=RunOptions(), store=store, campaign_config_dump={"version": 1},
+        vast_dir=str(tmp_path), strategy=_Script(cfg, batches),
+        evaluator=Evaluator(cfg, str(tmp_path)), compose=FakeCompose(),
+        per_batch=cfg.per_batch, stop_conditions=build_stop_conditions(cfg),
+        scheduling=cfg.scheduling, vast_hash=vast_hash, memoize=memoize)
+    report = controller.run()
+    statuses = [r[0] for r in sqlite3.connect(store.db_path).execute(
+        "SELECT status FROM unit ORDER BY id")]
+    store.close()
+    return report, backend, statuses
+
+
+A = {"x": 0.25}
+B = {"x": 0.5}
+
+
+def test_repeated_param_set_is_reused_within_campaign(tmp_path):
+    report, backend, statuses = _run(
+        tmp_path, _cfg(batches=2),
+        [[ParamSet(values=A), ParamSet(values=B)], [ParamSet(values=A), ParamSet(values=B)]],
+        memoize="campaign")
+    assert len(backend.calls) == 1
+    assert statuses == ["evaluated", "evaluated", "reused", "reused"]
+    assert [e.n_samples for e in report.evaluations] == [2, 2, 2, 2]
+
+
+def test_cross_campaign_reuse_is_opt_in():
+    assert _cfg(batches=1).memoize == "campaign"
+
+
+def test_memo_off_reexecutes(tmp_path):
+    _, backend, statuses = _run(
+        tmp_path, _cfg(batches=2, per_batch=1),
+        [[ParamSet(values=A)], [ParamSet(values=A)]], memoize="off")
+    assert len(backend.calls) == 2
+    assert statuses == ["evaluated", "evaluated"]
+
+
+def test_duplicate_within_batch_runs_once(tmp_path):
+    _, backend, statuses = _run(
+        tmp_path, _cfg(batches=1), [[ParamSet(values=A), ParamSet(values=A)]])
+    assert backend.calls == [([f"c{ParamSet(values=A).id}"], 2)]
+    assert statuses == ["evaluated", "reused"]
+
+
+def test_more_repetitions_are_topped_up(tmp_path):
+    report, backend, _ = _run(
+        tmp_path, _cfg(batches=2, per_batch=1),
+        [[ParamSet(values=A)], [ParamSet(values=A, n_reps=5)]])
+    assert [runs for _, runs in backend.calls] == [2, 3]
+    config_dir = tmp_path / "camp" / f"c{ParamSet(values=A).id}"
+    assert sorted(int(d.name) for d in config_dir.iterdir() if d.is_dir()) == [0, 1, 2, 3, 4]
+    assert [e.n_samples for e in report.evaluations] == [2, 5]
+    # The top-up config dir was merged away.
+    assert sorted(d.name for d in (tmp_path / "camp").iterdir()
+                  if d.is_dir() and d.name.startswith("c")) == [config_dir.name]
+
+
+def test_top_up_moves_job_links_with_the_runs(tmp_path):
+    _run(tmp_path, _cfg(batches=2, per_batch=1),
+         [[ParamSet(values=A)], [ParamSet(values=A, n_reps=3)]], backend=LinkingBackend())
+    with open(tmp_path / "camp" / "_transient" / "job_links.yaml") as f:
+        links = yaml.safe_load(f)
+    name = f"c{ParamSet(values=A).id}"
+    assert sorted(links) == [f"{name}/{run}/job" for run in range(3)]
+    assert links[f"{name}/2/job"] != links[f"{name}/0/job"]
+
+
+def test_top_up_of_another_campaigns_result_runs_fresh(tmp_path):
+    cfg = _cfg(batches=1, per_batch=1)
+    _run(tmp_path, cfg, [[ParamSet(values=A)]], campaign_id="first")
+
+    report, backend, statuses = _run(tmp_path, cfg, [[ParamSet(values=A, n_reps=3)]],
+                                     campaign_id="second")
+    assert [runs for _, runs in backend.calls] == [3] and statuses == ["evaluated"]
+    assert report.evaluations[0].n_samples == 3
+    # The earlier campaign is left untouched.
+    first_dir = tmp_path / "first" / f"c{ParamSet(values=A).id}"
+    assert sorted(d.name for d in first_dir.iterdir() if d.is_dir()) == ["0", "1"]
+
+
+def test_vast_content_hash_covers_input_files(tmp_path):
+    (tmp_path / "scenario.osc").write_text("scenario a")
+    (tmp_path / "extract.py").write_text("class E: pass")
+    (tmp_path / "maps").mkdir()
+    (tmp_path / "maps" / "map.yaml").write_text("map a")
+    vast = tmp_path / "demo.vast"
+    vast.write_text("version: 1\n")
+    config = ConfigV1(version=1, execution={
+        "image": "img", "runs": 1, "scenario_file": "scenario.osc", "run_files": ["maps/"]},
+        search=_cfg(1, extract="extract.py:E"))
+    hashes = {vast_content_hash(str(vast))}
+    for path, content in (("scenario.osc", "scenario b"), ("extract.py", "class E: x = 1"),
+                          ("maps/map.yaml", "map b")):
+        hashes.add(vast_content_hash(str(vast), config))
+        (tmp_path / path).write_text(content)
+    hashes.add(vast_content_hash(str(vast), config))
+    assert len(hashes) == 5
+
+
+def test_evaluations_reused_across_campaigns_of_same_vast(tmp_path):
+    cfg = _cfg(batches=1, per_batch=1)
+    _run(tmp_path, cfg, [[ParamSet(values=A)]], campaign_id="first")
+
+    _, backend, statuses = _run(tmp_path, cfg, [[ParamSet(values=A)]], campaign_id="second")
+    assert backend.calls == [] and statuses == ["reused"]
+    row = sqlite3.connect(tmp_path / "second" / STORE_FILENAME).execute(
+        "SELECT result_dir FROM unit").fetchone()
+    assert row[0] == os.path.join("..", "first", f"c{ParamSet(values=A).id}")
+
+    # A different .vast content hash never reuses.
+    _, backend, statuses = _run(tmp_path, cfg, [[ParamSet(values=A)]],
+                                campaign_id="third", vast_hash="h2")
+    assert len(backend.calls) == 1 and statuses == ["evaluated"]
+
+
+def test_async_scheduling_answers_repeats_from_memo(tmp_path):
+    _, backend, statuses = _run(
+        tmp_path, _cfg(batches=2, per_batch=1, scheduling="async"),
+        [[ParamSet(values=A)], [ParamSet(values=A)]])
+    assert len(backend.calls) == 1
+    assert statuses == ["evaluated", "reused"]
@@ -106,6 +106,19 @@ def test_optuna_tpe_improves_toward_optimum():
     assert rep.extra["n_trials"] == 40
 
 
+def test_optuna_state_is_replayed_into_a_fresh_study():
+    pytest.importorskip("optuna")
+    cfg = _cfg("optuna", QUAD_SPACE, [{"name": "obj", "direction": "maximize"}],
+               batches=2, per_batch=4)
+    s = build_strategy(cfg)
+    _drive(s, 2, lambda p, r: p.values["thrust"])
+    restored = build_strategy(cfg)
+    restored.set_state(s.get_state())
+    report = restored.report()
+    assert len(report.evaluations) == 8 and report.extra["batches"] == 2
+    assert report.extra["optuna_best"]["value"] == s.report().extra["optuna_best"]["value"]
+
+
 def test_optuna_rejects_bad_sampler():
     pytest.importorskip("optuna")
     from pydantic import ValidationError
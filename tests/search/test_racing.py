@@ -0,0 +1,144 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Adaptive replicate allocation (search.racing): intervals, policy, controller."""
+
+# pylint: disable=import-outside-toplevel
+
+import json
+import math
+import os
+import sqlite3
+
+import pytest
+from pydantic import ValidationError
+
+from robovast.common.config import RacingConfig, SearchConfig
+from robovast.common.store import STORE_FILENAME, CampaignStore
+from robovast.execution.backends import ExecutionBackend, RunOptions
+from robovast.execution.controller import CampaignController
+from robovast.search.evaluator import Evaluator
+from robovast.search.racing import Racing, confidence_interval
+from robovast.search.strategy import SearchStrategy
+from robovast.search.types import ParamSet, SearchReport
+
+
+def test_wilson_interval_for_binary_samples():
+    lo, hi = confidence_interval([1.0, 1.0], 0.95)
+    assert 0.0 < lo < 0.5 and hi == 1.0
+    lo, hi = confidence_interval([0.0] * 20, 0.95)
+    assert lo == pytest.approx(0.0, abs=1e-12) and hi < 0.2
+
+
+def test_t_interval_for_continuous_samples():
+    lo, hi = confidence_interval([1.0, 2.0, 3.0], 0.95)
+    assert lo < 2.0 < hi and math.isclose(2.0 - lo, hi - 2.0)
+    assert confidence_interval([1.5], 0.95) == (-math.inf, math.inf)
+
+
+def test_racing_decisions():
+    racing = Racing(RacingConfig(initial_reps=2, step=2, threshold=0.5), default_max=6)
+    assert racing.decide((0.2, 0.9), 2, incumbent=0.8) == (True, "interval overlaps incumbent")
+    assert racing.decide((0.1, 0.6), 2, incumbent=0.8) == (True, "interval overlaps threshold")
+    assert racing.decide((0.0, 0.3), 2, incumbent=0.8) == (False, "decided")
+    assert racing.decide((0.2, 0.9), 6, incumbent=0.8) == (False, "max_reps reached")
+    assert racing.next_reps(4, (0.0, 1.0)) == 6
+    assert racing.next_reps(2, None) == 6
+
+
+def test_racing_config_validation():
+    with pytest.raises(ValidationError):
+        RacingConfig(initial_reps=4, max_reps=2)
+    with pytest.raises(ValidationError):
+        RacingConfig(confidence=1.0)
+    with pytest.raises(ValidationError):
+        _cfg(scheduling="async")
+
+
+def _cfg(scheduling="generational"):
+    return SearchConfig(
+        strategy="random",
+        search_space={"x": {"type": "float", "low": 0, "high": 1}},
+        extract={"plugin": "failure_rate"},
+        objectives=[{"name": "failure_rate", "direction": "maximize"}],
+        per_batch=3, budget=[{"batches": 1}], seed=1, scheduling=scheduling,
+        racing={"initial_reps": 2, "step": 2},
+    )
+
+
+class ByValueBackend(ExecutionBackend):
+    """x < 0.3 always passes, x > 0.7 always fails, otherwise alternates per run."""
+
+    def __init__(self):
+        self.total_runs = 0
+
+    def run_batch(self, campaign_data, *, campaign_root, batch_tag, runs, options):
+        for cfg in campaign_data["configs"]:
+            for run in range(runs):
+                self.total_runs += 1
+                x = cfg["x"]
+                failed = x > 0.7 or (x >= 0.3 and run % 2 == 1)
+                run_dir = os.path.join(campaign_root, cfg["name"], str(run))
+                os.makedirs(run_dir, exist_ok=True)
+                with open(os.path.join(run_dir, "test.xml"), "w") as f:
+                    f.write(f'<testsuite errors="0" failures="{int(failed)}" tests="1">'
+                            f'<testcase name="t" time="1.0"/></testsuite>')
+
+
+class ValueCompose:
+    def compose(self, param_sets, output_dir):
+        name_by_id = {ps.id: f"c{ps.id}" for ps in param_sets}
+        configs = [{"name": name_by_id[ps.id], "x": ps.values["x"]} for ps in param_sets]
+        return {"execution": {"image": "img", "runs": 1}, "configs": configs}, name_by_id
+
+
+class _Once(SearchStrategy):
+    PARAMS_MODEL = None
+
+    def __init__(self, cfg, param_sets):
+        super().__init__(cfg, {})
+        self._param_sets = param_sets
+        self.told = []
+
+    def ask(self, n):
+        return self._param_sets
+
+    def tell(self, evaluations):
+        self.told = evaluations
+
+    def report(self):
+        return SearchReport(evaluations=self.told)
+
+
+def test_controller_races_only_undecided_candidates(tmp_path):
+    from robovast.search.stopping import build_stop_conditions
+    cfg = _cfg()
+    passing, failing, mixed = (ParamSet(values={"x": 0.1}), ParamSet(values={"x": 0.9}),
+                               ParamSet(values={"x": 0.5}))
+    store = CampaignStore(tmp_path / "camp" / STORE_FILENAME)
+    backend = ByValueBackend()
+    controller = CampaignController(
+        campaign_id="camp", results_dir=str(tmp_path), runs=8, backend=backend,
+        options=RunOptions(), store=store, campaign_config_dump={"version": 1},
+        vast_dir=str(tmp_path), strategy=_Once(cfg, [passing, failing, mixed]),
+        evaluator=Evaluator(cfg, str(tmp_path)), compose=ValueCompose(),
+        per_batch=cfg.per_batch, stop_conditions=build_stop_conditions(cfg),
+        racing=cfg.racing)
+    report = controller.run()
+
+    # The always-failing set overlaps the incumbent (itself, 1.0) and runs to the
+    # cap; the others are decided after the initial two repetitions.
+    samples = {ev.params.values["x"]: ev.n_samples for ev in report.evaluations}
+    assert samples == {0.1: 2, 0.9: 8, 0.5: 2}
+    assert backend.total_runs == 12
+
+    rows = sqlite3.connect(store.db_path).execute(
+        "SELECT paramset_id, n_reps, racing_json FROM unit").fetchall()
+    by_id = {r[0]: (r[1], json.loads(r[2])) for r in rows}
+    reps, log = by_id[failing.id]
+    assert reps == 8
+    assert [e["reps"] for e in log] == [2, 4, 6, 8]
+    assert log[-1] == {**log[-1], "decision": "stop", "reason": "max_reps reached"}
+    assert [e["decision"] for e in by_id[passing.id][1]] == ["stop"]
+    store.close()
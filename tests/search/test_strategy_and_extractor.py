@@ -100,9 +100,13 @@ def test_failure_rate_aggregates_runs(tmp_path):
         (d / "test.xml").write_text(
             f'<testsuite errors="0" failures="{failures}" tests="1">'
             f'<testcase name="t" time="1.0"/></testsuite>')
-    res = FailureRate().extract(config_dir)
+    extractor = FailureRate()
+    res = extractor.extract(config_dir)
     assert res.objectives == {"failure_rate": 2 / 3}
     assert not res.measures
+    # Per-run objectives for racing reuse the summaries read by extract().
+    assert extractor.run_objectives(config_dir / "2") == {"failure_rate": 0.0}
+    assert (extractor.run_cache.hits, extractor.run_cache.misses) == (1, 3)
 
 
 def test_failure_rate_missing_dir_is_zero(tmp_path):
@@ -0,0 +1,126 @@
+# Copyright (C) 2026 Frederik Pasch
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Gaussian-process surrogate strategy: convergence, batching and saved state."""
+
+# pylint: disable=import-outside-toplevel
+
+import os
+import sqlite3
+
+import pytest
+from pydantic import ValidationError
+
+from robovast.common.config import SearchConfig
+from robovast.common.store import STORE_FILENAME, CampaignStore
+from robovast.execution.backends import ExecutionBackend, RunOptions
+from robovast.execution.controller import CampaignController
+from robovast.search.evaluator import Evaluator
+from robovast.search.strategies.surrogate import (SurrogateParams,
+                                                  SurrogateStrategy)
+from robovast.search.types import Evaluation
+
+SPACE = {"x": {"type": "float", "low": 0, "high": 1},
+         "y": {"type": "float", "low": 0, "high": 1}}
+
+
+def _strategy(direction="maximize", **params):
+    cfg = SearchConfig(
+        strategy="surrogate", search_space=SPACE, extract={"plugin": "failure_rate"},
+        objectives=[{"name": "f", "direction": direction}],
+        per_batch=4, budget=[{"batches": 1}], seed=3, strategy_parameters=params)
+    return SurrogateStrategy(cfg, SurrogateParams(**params))
+
+
+def _f(values):
+    return -((values["x"] - 0.7) ** 2 + (values["y"] - 0.2) ** 2)
+
+
+def _drive(strategy, batches, per_batch=4):
+    for _ in range(batches):
+        proposals = strategy.ask(per_batch)
+        assert len({ps.id for ps in proposals}) == per_batch
+        strategy.tell([Evaluation(params=ps, objectives={"f": _f(ps.values)}, n_samples=1)
+                       for ps in proposals])
+    return strategy.report()
+
+
+@pytest.mark.parametrize("acquisition", ["ei", "thompson"])
+def test_surrogate_converges_on_smooth_objective(acquisition):
+    report = _drive(_strategy(acquisition=acquisition, n_initial=8), batches=8)
+    assert report.best.objectives["f"] > -0.01
+    assert report.extra["model"]["n_train"] == 28
+
+
+def test_minimize_objective_is_oriented():
+    strategy = _strategy(direction="minimize", n_initial=4)
+    for _ in range(6):
+        proposals = strategy.ask(4)
+        strategy.tell([Evaluation(params=ps, objectives={"f": -_f(ps.values)}, n_samples=1)
+                       for ps in proposals])
+    assert strategy.report().best.objectives["f"] < 0.02
+
+
+def test_state_roundtrip_reproduces_next_batch():
+    strategy = _strategy(n_initial=4)
+    _drive(strategy, batches=2)
+    restored = _strategy(n_initial=4)
+    restored.set_state(strategy.get_state())
+    assert [ps.id for ps in restored.ask(4)] == [ps.id for ps in strategy.ask(4)]
+    assert len(restored.report().evaluations) == 8
+
+
+def test_pending_proposals_are_not_repeated():
+    strategy = _strategy(n_initial=2)
+    _drive(strategy, batches=1, per_batch=2)
+    first, second = strategy.ask(3), strategy.ask(3)
+    assert not {ps.id for ps in first} & {ps.id for ps in second}
+
+
+def test_params_validation():
+    with pytest.raises(ValidationError):
+        SurrogateParams(acquisition="ucb")
+    with pytest.raises(ValidationError):
+        SurrogateParams(unknown=1)
+
+
+class _PassingBackend(ExecutionBackend):
+    def run_batch(self, campaign_data, *, campaign_root, batch_tag, runs, options):
+        for cfg in campaign_data["configs"]:
+            for run in range(runs):
+                run_dir = os.path.join(campaign_root, cfg["name"], str(run))
+                os.makedirs(run_dir, exist_ok=True)
+                with open(os.path.join(run_dir, "test.xml"), "w") as f:
+                    f.write('<testsuite errors="0" failures="0" tests="1">'
+                            '<testcase name="t" time="1.0"/></testsuite>')
+
+
+class _Compose:
+    def compose(self, param_sets, output_dir):
+        name_by_id = {ps.id: f"c{ps.id}" for ps in param_sets}
+        return ({"execution": {"image": "img", "runs": 1},
+                 "configs": [{"name": n} for n in name_by_id.values()]}, name_by_id)
+
+
+def test_controller_saves_strategy_state(tmp_path):
+    from robovast.search.stopping import build_stop_conditions
+    cfg = SearchConfig(
+        strategy="surrogate", search_space=SPACE, extract={"plugin": "failure_rate"},
+        objectives=[{"name": "failure_rate", "direction": "maximize"}],
+        per_batch=2, budget=[{"batches": 2}], seed=0)
+    store = CampaignStore(tmp_path / "camp" / STORE_FILENAME)
+    controller = CampaignController(
+        campaign_id="camp", results_dir=str(tmp_path), runs=1, backend=_PassingBackend(),
+        options=RunOptions(), store=store, campaign_config_dump={"version": 1},
+        vast_dir=str(tmp_path), strategy=SurrogateStrategy(cfg, SurrogateParams()),
+        evaluator=Evaluator(cfg, str(tmp_path)), compose=_Compose(),
+        per_batch=cfg.per_batch, stop_conditions=build_stop_conditions(cfg))
+    controller.run()
+    store.close()
+
+    (state,) = sqlite3.connect(tmp_path / "camp" / STORE_FILENAME).execute(
+        "SELECT strategy_state FROM campaign").fetchone()
+    restored = SurrogateStrategy(cfg, SurrogateParams())
+    restored.set_state(state)
+    assert len(restored.report().evaluations) == 4